@@ -0,0 +1,154 @@
+"""add_site_catalog
+
+Per-source article counts and published-date ranges, maintained by
+statement-level triggers on articles so every write path (row upserts,
+bulk COPY merges, deletes) keeps it current. PgVectorClient.get_sites reads
+this table instead of SELECT DISTINCT over articles.
+
+Date ranges only widen; deletes lower doc_count and drop a source at zero.
+Mirrors infra/init.sql.
+
+Revision ID: d7a41c9e2b58
+Revises: b5e9d3f71a42
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision: str = 'd7a41c9e2b58'
+down_revision: Union[str, None] = 'b5e9d3f71a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    """Check if table already exists (idempotent migration)."""
+    bind = op.get_bind()
+    insp = inspect(bind)
+    return table_name in insp.get_table_names()
+
+
+def upgrade() -> None:
+    if not _table_exists('site_catalog'):
+        op.execute("""
+            CREATE TABLE site_catalog (
+                source          TEXT PRIMARY KEY,
+                doc_count       BIGINT NOT NULL DEFAULT 0,
+                first_published TIMESTAMPTZ,
+                last_published  TIMESTAMPTZ,
+                updated_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+        """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION site_catalog_on_insert() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO site_catalog AS c (source, doc_count, first_published, last_published)
+            SELECT source, count(*), min(date_published), max(date_published)
+            FROM new_rows
+            GROUP BY source
+            ON CONFLICT (source) DO UPDATE SET
+                doc_count = c.doc_count + EXCLUDED.doc_count,
+                first_published = LEAST(c.first_published, EXCLUDED.first_published),
+                last_published = GREATEST(c.last_published, EXCLUDED.last_published),
+                updated_at = NOW();
+            RETURN NULL;
+        END $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION site_catalog_on_delete() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE site_catalog c
+            SET doc_count = c.doc_count - d.n, updated_at = NOW()
+            FROM (SELECT source, count(*) AS n FROM old_rows GROUP BY source) d
+            WHERE c.source = d.source;
+            DELETE FROM site_catalog WHERE doc_count <= 0;
+            RETURN NULL;
+        END $$
+    """)
+    # Upserts of existing URLs fire UPDATE; only source moves change counts
+    op.execute("""
+        CREATE OR REPLACE FUNCTION site_catalog_on_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE site_catalog c
+            SET doc_count = c.doc_count - d.n, updated_at = NOW()
+            FROM (
+                SELECT o.source, count(*) AS n
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE n.source IS DISTINCT FROM o.source
+                GROUP BY o.source
+            ) d
+            WHERE c.source = d.source;
+
+            INSERT INTO site_catalog AS c (source, doc_count, first_published, last_published)
+            SELECT n.source,
+                   count(*) FILTER (WHERE n.source IS DISTINCT FROM o.source),
+                   min(n.date_published), max(n.date_published)
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE n.source IS DISTINCT FROM o.source
+               OR n.date_published IS DISTINCT FROM o.date_published
+            GROUP BY n.source
+            ON CONFLICT (source) DO UPDATE SET
+                doc_count = c.doc_count + EXCLUDED.doc_count,
+                first_published = LEAST(c.first_published, EXCLUDED.first_published),
+                last_published = GREATEST(c.last_published, EXCLUDED.last_published),
+                updated_at = NOW();
+
+            DELETE FROM site_catalog WHERE doc_count <= 0;
+            RETURN NULL;
+        END $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION site_catalog_on_truncate() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM site_catalog;
+            RETURN NULL;
+        END $$
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS trg_site_catalog_insert ON articles")
+    op.execute("""
+        CREATE TRIGGER trg_site_catalog_insert AFTER INSERT ON articles
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_insert()
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_site_catalog_delete ON articles")
+    op.execute("""
+        CREATE TRIGGER trg_site_catalog_delete AFTER DELETE ON articles
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_delete()
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_site_catalog_update ON articles")
+    op.execute("""
+        CREATE TRIGGER trg_site_catalog_update AFTER UPDATE ON articles
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_update()
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_site_catalog_truncate ON articles")
+    op.execute("""
+        CREATE TRIGGER trg_site_catalog_truncate AFTER TRUNCATE ON articles
+        FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_truncate()
+    """)
+
+    # Seed from existing rows (one full pass, at migration time only)
+    op.execute("DELETE FROM site_catalog")
+    op.execute("""
+        INSERT INTO site_catalog (source, doc_count, first_published, last_published)
+        SELECT source, count(*), min(date_published), max(date_published)
+        FROM articles
+        GROUP BY source
+    """)
+
+
+def downgrade() -> None:
+    for event in ('insert', 'delete', 'update', 'truncate'):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_site_catalog_{event} ON articles")
+        op.execute(f"DROP FUNCTION IF EXISTS site_catalog_on_{event}()")
+    op.execute("DROP TABLE IF EXISTS site_catalog")
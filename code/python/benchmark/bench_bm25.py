@@ -0,0 +1,78 @@
+"""
+Microbenchmark: BM25Scorer (per-query tokenization) vs BM25Index (prebuilt).
+
+Builds a synthetic CJK news corpus, then scores the same candidate sets with:
+  - BM25Scorer: calculate_corpus_stats() + calculate_score() per candidate,
+    as in QdrantVectorClient's hybrid search
+  - BM25Index.score(): vectorized posting-list lookup with corpus-wide stats
+
+Usage (from code/python):
+    python -m benchmark.bench_bm25 --docs 5000 --candidates 500 --queries 50
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from core.bm25 import BM25Index, BM25Scorer
+
+# Common CJK characters used to synthesize article text
+_CHARS = (
+    "台積電營收創新高颱風來襲北停班課經濟部價調漲美國設廠政府總統立法院選舉"
+    "市場股票投資銀行利率通膨物景氣房地產交通捷運高鐵醫療健保疫苗學校教育"
+    "科技人工智慧晶片半導體供應鏈出口貿易能源核綠環境氣候地震警報消防"
+)
+
+
+def _make_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(_CHARS) for _ in range(length))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BM25 scorer vs inverted index microbenchmark')
+    parser.add_argument('--docs', type=int, default=5000, help='Corpus size')
+    parser.add_argument('--doc-length', type=int, default=400, help='Characters per document')
+    parser.add_argument('--candidates', type=int, default=500, help='Candidates scored per query')
+    parser.add_argument('--queries', type=int, default=50, help='Number of queries')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = {f"https://example.com/news/{i}": _make_text(rng, args.doc_length) for i in range(args.docs)}
+    keys = list(corpus)
+
+    t0 = time.perf_counter()
+    index = BM25Index()
+    index.add_documents(corpus.items())
+    index.compact()
+    build_s = time.perf_counter() - t0
+    print(f"Index build: {args.docs} docs in {build_s:.2f}s, vocab={index.vocabulary_size}")
+
+    scorer = BM25Scorer()
+    scorer_times, index_times = [], []
+
+    for _ in range(args.queries):
+        query_tokens = scorer.tokenize(_make_text(rng, 6))
+        cand_keys = rng.sample(keys, args.candidates)
+
+        t0 = time.perf_counter()
+        docs = [{'name': '', 'description': corpus[k]} for k in cand_keys]
+        avg_len, term_doc_counts = scorer.calculate_corpus_stats(docs)
+        for k in cand_keys:
+            scorer.calculate_score(query_tokens, corpus[k], avg_len, len(cand_keys), term_doc_counts)
+        scorer_times.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        index.score(query_tokens, cand_keys)
+        index_times.append(time.perf_counter() - t0)
+
+    s_med = statistics.median(scorer_times) * 1000
+    i_med = statistics.median(index_times) * 1000
+    print(f"BM25Scorer  median: {s_med:8.2f} ms / query ({args.candidates} candidates)")
+    print(f"BM25Index   median: {i_med:8.2f} ms / query ({args.candidates} candidates)")
+    print(f"Speedup: {s_med / i_med:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Microbenchmark: MMR selection loop, scalar vs vectorized.
+
+Reranks the same synthetic candidates with:
+  - scalar: per-round Python loop over unselected × selected candidates
+    (previous MMRReranker.rerank selection)
+  - vectorized: MMRReranker.rerank (running max-similarity + argmax)
+  - batch: MMRReranker.rerank_batch over several λ values at once
+
+Usage (from code/python):
+    python -m benchmark.bench_mmr --candidates 200 --top-k 50 --queries 20
+"""
+
+import argparse
+import statistics
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+from core.mmr import MMRReranker
+
+
+def _scalar_rerank(reranker: MMRReranker, candidates: list[dict], top_k: int) -> list[int]:
+    sim_matrix = reranker._precompute_similarity_matrix([c['vector'] for c in candidates])
+    scores = [c['ranking']['score'] for c in candidates]
+    max_score, min_score = max(scores), min(scores)
+    score_range = max_score - min_score if max_score != min_score else 1.0
+    selected = [0]
+    for _ in range(1, min(top_k, len(candidates))):
+        best_mmr_score, best_idx = -float('inf'), None
+        for idx in range(len(candidates)):
+            if idx in selected:
+                continue
+            relevance = (scores[idx] - min_score) / score_range
+            max_similarity = max([float(sim_matrix[idx, s]) for s in selected] + [0.0])
+            mmr_score = reranker.lambda_param * relevance - (1 - reranker.lambda_param) * max_similarity
+            if mmr_score > best_mmr_score:
+                best_mmr_score, best_idx = mmr_score, idx
+        selected.append(best_idx)
+    return selected
+
+
+def _median_ms(fn, queries: int) -> float:
+    times = []
+    for _ in range(queries):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scalar vs vectorized MMR selection microbenchmark')
+    parser.add_argument('--candidates', type=int, default=200, help='Candidates per query')
+    parser.add_argument('--dim', type=int, default=1024, help='Embedding dimension')
+    parser.add_argument('--top-k', type=int, default=50, help='Results selected per query')
+    parser.add_argument('--queries', type=int, default=20, help='Number of timed queries')
+    parser.add_argument('--lambdas', type=float, nargs='+', default=[0.5, 0.6, 0.7, 0.8])
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.normal(size=(args.candidates, args.dim)).astype(np.float32)
+    scores = sorted(rng.uniform(40, 95, size=args.candidates), reverse=True)
+    candidates = [
+        {'name': f"doc {i}", 'url': f"u{i}", 'ranking': {'score': float(scores[i])}, 'vector': vectors[i]}
+        for i in range(args.candidates)
+    ]
+    reranker = MMRReranker(lambda_param=0.7)
+
+    with patch.object(MMRReranker, '_log_diversity_metrics'):
+        scalar_ms = _median_ms(lambda: _scalar_rerank(reranker, candidates, args.top_k), args.queries)
+        vector_ms = _median_ms(lambda: reranker.rerank(candidates, top_k=args.top_k), args.queries)
+        batch_ms = _median_ms(lambda: reranker.rerank_batch(candidates, args.lambdas, top_k=args.top_k), args.queries)
+
+    print(f"{args.candidates} candidates x {args.dim} dims, top_k={args.top_k}")
+    print(f"scalar     median: {scalar_ms:8.2f} ms / query")
+    print(f"vectorized median: {vector_ms:8.2f} ms / query ({scalar_ms / vector_ms:.1f}x)")
+    print(f"batch      median: {batch_ms:8.2f} ms / query for {len(args.lambdas)} λ values")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Recall vs latency: pgvector ANN search vs exact search on chunks.embedding.
+
+Samples stored chunk embeddings as queries, computes exact top-k with index
+scans disabled (sequential scan), then runs the PgVectorClient vector query
+under each ANN setting and reports recall@k and latency.
+
+Settings swept: every ann_params profile in config_retrieval.yaml, plus any
+--ef-search / --probes values given. --source restricts results to one
+source to measure filtered search (iterative scans on pgvector >= 0.8).
+
+Usage (from code/python):
+    python -m benchmark.bench_pg_ann --queries 100 --k 10 50
+    python -m benchmark.bench_pg_ann --ef-search 40 100 200 400 --source cna
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import psycopg
+from pgvector.psycopg import register_vector
+
+from core.config import CONFIG
+from indexing.pg_vector_index import list_vector_indexes
+from indexing.postgresql_uploader import DEFAULT_CONNECTION_STRING
+from retrieval_providers.postgres_client import ann_settings, parse_pgvector_version, vector_search_sql
+
+# Forces a sequential scan: exact distances for every chunk
+_EXACT_SETTINGS = [("enable_indexscan", "off"), ("enable_bitmapscan", "off")]
+
+
+def _run(conn, settings, sql, params):
+    """Run one vector query in its own transaction; return (chunk ids, seconds)."""
+    with conn.transaction():
+        with conn.cursor() as cur:
+            if settings:
+                cur.execute("SELECT " + ", ".join(["set_config(%s, %s, true)"] * len(settings)),
+                            [value for pair in settings for value in pair])
+            t0 = time.perf_counter()
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            return [row[0] for row in rows], time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pgvector ANN recall/latency benchmark')
+    parser.add_argument('--dsn', default=None, help='PostgreSQL DSN (default: POSTGRES_CONNECTION_STRING)')
+    parser.add_argument('--queries', type=int, default=100, help='Sampled query embeddings')
+    parser.add_argument('--k', type=int, nargs='+', default=[10, 50], help='Result sizes to evaluate')
+    parser.add_argument('--ef-search', type=int, nargs='*', default=[], help='Extra hnsw.ef_search values')
+    parser.add_argument('--probes', type=int, nargs='*', default=[], help='Extra ivfflat.probes values')
+    parser.add_argument('--source', default=None, help='Filter results to this articles.source')
+    args = parser.parse_args()
+
+    dsn = args.dsn or os.environ.get("POSTGRES_CONNECTION_STRING", DEFAULT_CONNECTION_STRING)
+    with psycopg.connect(dsn) as conn:
+        register_vector(conn)
+        with conn.cursor() as cur:
+            cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            version = parse_pgvector_version(cur.fetchone()[0])
+            cur.execute(
+                "SELECT embedding FROM chunks WHERE id IN "
+                "(SELECT id FROM chunks ORDER BY random() LIMIT %s)", (args.queries,))
+            queries = [row[0] for row in cur.fetchall()]
+        conn.commit()
+
+        indexes = ", ".join(f"{i.name} ({i.method})" for i in list_vector_indexes(conn)) or "none"
+        print(f"pgvector {'.'.join(map(str, version or ()))}, indexes: {indexes}, queries: {len(queries)}")
+
+        where_sql, filter_params = ("WHERE a.source = %s", [args.source]) if args.source else ("", [])
+        sql = vector_search_sql(where_sql)
+
+        runs = [(f"profile={name}", {"ann_profile": name}) for name in (CONFIG.ann_params.get("profiles") or {})]
+        runs += [(f"ef_search={ef}", {"ef_search": ef}) for ef in args.ef_search]
+        runs += [(f"probes={p}", {"probes": p}) for p in args.probes]
+
+        print(f"{'setting':22s} {'k':>4s} {'recall':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'exact p50':>10s}")
+        for k in args.k:
+            exact, exact_times = [], []
+            for q in queries:
+                ids, elapsed = _run(conn, _EXACT_SETTINGS, sql, [q] + filter_params + [q, k, -1.0])
+                exact.append(set(ids))
+                exact_times.append(elapsed)
+            exact_p50 = statistics.median(exact_times) * 1000
+
+            for label, overrides in runs:
+                settings = ann_settings(k, version, **overrides)
+                recalls, times = [], []
+                for q, truth in zip(queries, exact):
+                    ids, elapsed = _run(conn, settings, sql, [q] + filter_params + [q, k, -1.0])
+                    times.append(elapsed)
+                    if truth:
+                        recalls.append(len(truth.intersection(ids)) / len(truth))
+                times.sort()
+                p95 = times[min(len(times) - 1, int(len(times) * 0.95))] * 1000
+                recall = statistics.mean(recalls) if recalls else 0.0
+                print(f"{label:22s} {k:4d} {recall:8.3f} {statistics.median(times) * 1000:8.1f} "
+                      f"{p95:8.1f} {exact_p50:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Microbenchmark: candidate vectors from pgvector to the MMR similarity matrix.
+
+Decodes the embeddings of one retrieval statement and builds the MMR
+similarity matrix with:
+  - text path: pgvector text format parsed into Python float lists,
+    stacked as float64 (previous behaviour)
+  - binary path: vector_send payloads decoded by embedding_rows() into
+    float32 views of one matrix, stacked by core.mmr.stack_vectors()
+
+Reports median time per query and tracemalloc peak memory.
+
+Usage (from code/python):
+    python -m benchmark.bench_vector_plumbing --candidates 200 --dim 1024 --queries 20
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+from pgvector import Vector
+
+from core.mmr import MMRReranker
+from retrieval_providers.postgres_client import embedding_rows
+
+
+def _text_path(payloads: list[str]) -> np.ndarray:
+    vectors = [[float(x) for x in p[1:-1].split(',')] for p in payloads]
+    matrix = np.array(vectors)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized = matrix / np.where(norms == 0, 1, norms)
+    return normalized @ normalized.T
+
+
+def _binary_path(payloads: list[bytes], reranker: MMRReranker) -> np.ndarray:
+    return reranker._precompute_similarity_matrix(embedding_rows(payloads))
+
+
+def _measure(fn, queries: int) -> tuple[float, int]:
+    times = []
+    for _ in range(queries):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times) * 1000, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pgvector text vs binary candidate vector decoding')
+    parser.add_argument('--candidates', type=int, default=200, help='Rows per retrieval statement')
+    parser.add_argument('--dim', type=int, default=1024, help='Embedding dimension')
+    parser.add_argument('--queries', type=int, default=20, help='Number of timed queries')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.normal(size=(args.candidates, args.dim)).astype(np.float32)
+    text_payloads = [Vector(v).to_text() for v in vectors]
+    binary_payloads = [Vector(v).to_binary() for v in vectors]
+    reranker = MMRReranker()
+
+    text_ms, text_peak = _measure(lambda: _text_path(text_payloads), args.queries)
+    binary_ms, binary_peak = _measure(lambda: _binary_path(binary_payloads, reranker), args.queries)
+
+    print(f"{args.candidates} candidates x {args.dim} dims")
+    print(f"text   median: {text_ms:8.2f} ms / query, peak {text_peak / 1e6:7.1f} MB")
+    print(f"binary median: {binary_ms:8.2f} ms / query, peak {binary_peak / 1e6:7.1f} MB")
+    print(f"Speedup: {text_ms / binary_ms:.1f}x, peak memory {text_peak / binary_peak:.1f}x lower")
+
+
+if __name__ == '__main__':
+    main()
@@ -263,7 +263,7 @@ class AnalyticsDB:
             logger.error(f"Failed to initialize analytics database: {e}", exc_info=True)
 
     # ── Deprecated sync interface (kept for backward compatibility) ─
-    # These methods are retained for query_logger.py's _write_to_db / _init_database
+    # These methods are retained for query_logger.py's _write_batch / _init_database
     # which run in a worker thread (not the event loop) and cannot use async methods.
     # Do NOT use these from async (event loop) context — use fetchone/fetchall/execute instead.
 
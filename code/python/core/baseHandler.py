@@ -8,7 +8,7 @@ WARNING: This code is under development and may undergo changes in future releas
 Backwards compatibility is not guaranteed at this time.
 """
 
-from core.retriever import search, search_with_expansion
+from core.retriever import search, search_with_expansion, _send_retrieval_count
 import asyncio
 import importlib
 import os
@@ -39,6 +39,7 @@ from misc.logger.logger import get_logger, LogLevel
 from misc.logger.logging_config_helper import get_configured_logger
 from core.config import CONFIG
 from core.query_analysis.query_sanitizer import QuerySanitizer
+from core.speculative_retrieval import SpeculativeRetrieval
 logger = get_configured_logger("nlweb_handler")
 
 # Analytics logging
@@ -379,276 +380,363 @@ class NLWebHandler:
             raise
     
     async def prepare(self):
-        tasks = []
-
-        tasks.append(asyncio.create_task(self.decontextualizeQuery().do()))
-        # FastTrack disabled - all searches now use regular path for unified vector/MMR handling
-        # tasks.append(asyncio.create_task(fastTrack.FastTrack(self).do()))
-        tasks.append(asyncio.create_task(query_understanding.QueryUnderstanding(self).do()))
-
-        # Check if a specific tool is requested via the 'tool' parameter
-        requested_tool = get_param(self.query_params, "tool", str, None)
-        if requested_tool:
-            # Skip tool selection and use the requested tool directly
-            # Set tool_routing_results to use the specified tool
-            self.tool_routing_results = [{
-                "tool": type('Tool', (), {'name': requested_tool, 'handler_class': None})(),
-                "score": 100,
-                "result": {"score": 100, "justification": f"Tool {requested_tool} specified in request"}
-            }]
-        else:
-            # Normal tool selection
-            tasks.append(asyncio.create_task(router.ToolSelector(self).do()))
-
-     #   tasks.append(asyncio.create_task(analyze_query.DetectItemType(self).do()))
-     #   tasks.append(asyncio.create_task(analyze_query.DetectMultiItemTypeQuery(self).do()))
-     #   tasks.append(asyncio.create_task(analyze_query.DetectQueryType(self).do()))
-        tasks.append(asyncio.create_task(relevance_detection.RelevanceDetection(self).do()))
-        tasks.append(asyncio.create_task(prompt_guardrails.PromptGuardrails(self).do()))
-        tasks.append(asyncio.create_task(memory.Memory(self).do()))
-     #   tasks.append(asyncio.create_task(required_info.RequiredInfo(self).do()))
-        
+        prepare_started = time.perf_counter()
+        speculation = self._start_speculative_retrieval()
+
         try:
-            if CONFIG.should_raise_exceptions():
-                # In testing/development mode, raise exceptions to fail tests properly
-                await asyncio.gather(*tasks)
+            tasks = []
+
+            tasks.append(asyncio.create_task(self.decontextualizeQuery().do()))
+            # FastTrack disabled - all searches now use regular path for unified vector/MMR handling
+            # tasks.append(asyncio.create_task(fastTrack.FastTrack(self).do()))
+            tasks.append(asyncio.create_task(query_understanding.QueryUnderstanding(self).do()))
+
+            # Check if a specific tool is requested via the 'tool' parameter
+            requested_tool = get_param(self.query_params, "tool", str, None)
+            if requested_tool:
+                # Skip tool selection and use the requested tool directly
+                # Set tool_routing_results to use the specified tool
+                self.tool_routing_results = [{
+                    "tool": type('Tool', (), {'name': requested_tool, 'handler_class': None})(),
+                    "score": 100,
+                    "result": {"score": 100, "justification": f"Tool {requested_tool} specified in request"}
+                }]
             else:
-                # In production mode, catch exceptions to avoid crashing
-                await asyncio.gather(*tasks, return_exceptions=True)
-        except Exception as e:
-            if CONFIG.should_raise_exceptions():
-                raise  # Re-raise in testing/development mode
-        finally:
-            self.pre_checks_done_event.set()  # Signal completion regardless of errors
-            self.state.set_pre_checks_done()
-
-        # P2-1: Skip retrieval if query was blocked by guardrails
-        if self.query_done:
-            return
-
-        # Wait for retrieval to be done
-        if not self.retrieval_done_event.is_set():
-            # Skip retrieval for sites without embeddings
-            if not site_supports_standard_retrieval(self.site):
-                self.final_retrieved_items = []
-                self.retrieval_done_event.set()
-            # Skip retrieval for free conversation mode - use conversation context only
-            elif self.free_conversation:
-                logger.info("[FREE_CONVERSATION] Skipping public vector search - using conversation context")
-                logger.debug("[FREE_CONVERSATION] Skipping public vector search - using conversation context")
-
-                # Note: Research report is now passed directly from frontend via query_params
-                # in Free Conversation mode, handled by generate_answer.py
-
-                # Check for private sources even in free conversation mode
-                logger.info(f"[FREE_CONVERSATION] include_private_sources={self.include_private_sources}, user_id={self.user_id}")
-                if self.include_private_sources and self.user_id:
-                    try:
-                        from core.user_data_retriever import search_user_documents, format_private_result_for_display
-
-                        logger.info("[FREE_CONVERSATION] Searching user's private documents")
-                        private_results = await search_user_documents(
-                            query=self.decontextualized_query,
-                            user_id=self.user_id,
-                            top_k=10,
-                            query_params=self.query_params,
-                            org_id=self.org_id
-                        )
-
-                        # Format private results to match expected format
-                        if private_results:
-                            formatted_private = []
-                            for result in private_results:
-                                formatted = format_private_result_for_display(result)
-                                import json
-                                private_item = [
-                                    formatted['url'],
-                                    json.dumps({'text': formatted['text'], 'metadata': formatted.get('metadata', {})}),
-                                    formatted['title'],
-                                    formatted['site']
-                                ]
-                                formatted_private.append(private_item)
-
-                            self.final_retrieved_items = formatted_private
-                            logger.info(f"[FREE_CONVERSATION] Found {len(formatted_private)} private documents")
-                        else:
-                            self.final_retrieved_items = []
-                    except Exception as e:
-                        logger.exception(f"[FREE_CONVERSATION] Failed to retrieve private documents: {str(e)}")
-                        self.final_retrieved_items = []
+                # Normal tool selection
+                tasks.append(asyncio.create_task(router.ToolSelector(self).do()))
+
+         #   tasks.append(asyncio.create_task(analyze_query.DetectItemType(self).do()))
+         #   tasks.append(asyncio.create_task(analyze_query.DetectMultiItemTypeQuery(self).do()))
+         #   tasks.append(asyncio.create_task(analyze_query.DetectQueryType(self).do()))
+            tasks.append(asyncio.create_task(relevance_detection.RelevanceDetection(self).do()))
+            tasks.append(asyncio.create_task(prompt_guardrails.PromptGuardrails(self).do()))
+            tasks.append(asyncio.create_task(memory.Memory(self).do()))
+         #   tasks.append(asyncio.create_task(required_info.RequiredInfo(self).do()))
+        
+            try:
+                if CONFIG.should_raise_exceptions():
+                    # In testing/development mode, raise exceptions to fail tests properly
+                    await asyncio.gather(*tasks)
                 else:
+                    # In production mode, catch exceptions to avoid crashing
+                    await asyncio.gather(*tasks, return_exceptions=True)
+            except Exception as e:
+                if CONFIG.should_raise_exceptions():
+                    raise  # Re-raise in testing/development mode
+            finally:
+                self.pre_checks_done_event.set()  # Signal completion regardless of errors
+                self.state.set_pre_checks_done()
+            pre_checks_done = time.perf_counter()
+
+            # P2-1: Skip retrieval if query was blocked by guardrails
+            if self.query_done:
+                if speculation is not None:
+                    speculation.cancel("blocked")
+                return
+
+            # Wait for retrieval to be done
+            if not self.retrieval_done_event.is_set():
+                # Skip retrieval for sites without embeddings
+                if not site_supports_standard_retrieval(self.site):
                     self.final_retrieved_items = []
+                    self.retrieval_done_event.set()
+                # Skip retrieval for free conversation mode - use conversation context only
+                elif self.free_conversation:
+                    logger.info("[FREE_CONVERSATION] Skipping public vector search - using conversation context")
+                    logger.debug("[FREE_CONVERSATION] Skipping public vector search - using conversation context")
+
+                    # Note: Research report is now passed directly from frontend via query_params
+                    # in Free Conversation mode, handled by generate_answer.py
+
+                    # Check for private sources even in free conversation mode
+                    logger.info(f"[FREE_CONVERSATION] include_private_sources={self.include_private_sources}, user_id={self.user_id}")
+                    if self.include_private_sources and self.user_id:
+                        try:
+                            from core.user_data_retriever import search_user_documents, format_private_result_for_display
+
+                            logger.info("[FREE_CONVERSATION] Searching user's private documents")
+                            private_results = await search_user_documents(
+                                query=self.decontextualized_query,
+                                user_id=self.user_id,
+                                top_k=10,
+                                query_params=self.query_params,
+                                org_id=self.org_id
+                            )
 
-                self.retrieval_done_event.set()
-            else:
-                # Progress: Searching database
-                await self.message_sender.send_progress("searching", "搜尋資料庫中...", 15)
-
-                # Get parsed time range (TimeRangeExtractor runs in parallel during prepare())
-                temporal_range = getattr(self, 'temporal_range', None)
-
-                if temporal_range and temporal_range.get('is_temporal'):
-                    # Adjust retrieval volume based on time window
-                    days = temporal_range.get('relative_days') or 365
-                    if days <= 7:
-                        num_to_retrieve = 100  # Recent queries need more candidates
-                    elif days <= 30:
-                        num_to_retrieve = 150
+                            # Format private results to match expected format
+                            if private_results:
+                                formatted_private = []
+                                for result in private_results:
+                                    formatted = format_private_result_for_display(result)
+                                    import json
+                                    private_item = [
+                                        formatted['url'],
+                                        json.dumps({'text': formatted['text'], 'metadata': formatted.get('metadata', {})}),
+                                        formatted['title'],
+                                        formatted['site']
+                                    ]
+                                    formatted_private.append(private_item)
+
+                                self.final_retrieved_items = formatted_private
+                                logger.info(f"[FREE_CONVERSATION] Found {len(formatted_private)} private documents")
+                            else:
+                                self.final_retrieved_items = []
+                        except Exception as e:
+                            logger.exception(f"[FREE_CONVERSATION] Failed to retrieve private documents: {str(e)}")
+                            self.final_retrieved_items = []
                     else:
-                        num_to_retrieve = 200
+                        self.final_retrieved_items = []
 
-                    logger.info(f"[TEMPORAL] Temporal query detected (method: {temporal_range.get('method')})")
-                    logger.info(f"[TEMPORAL] Time range: {temporal_range.get('start_date')} to {temporal_range.get('end_date')} ({days} days)")
-                    logger.info(f"[TEMPORAL] Retrieving {num_to_retrieve} items for date filtering")
+                    self.retrieval_done_event.set()
                 else:
-                    logger.info(f"[TEMPORAL] Non-temporal query: '{self.query}' - retrieving 50 items")
-                    num_to_retrieve = 50
-
-                # Check if MMR is enabled and request vectors if needed
-                include_vectors = CONFIG.mmr_params.get('enabled', True) and CONFIG.mmr_params.get('include_vectors', True)
-
-                # Construct generic filters from temporal_range and author_search
-                search_filters = []
-                self.time_filter_relaxed = False
-                self.author_search_no_results = False
-
-                if temporal_range and temporal_range.get('is_temporal'):
-                    start_date = temporal_range.get('start_date')
-                    end_date = temporal_range.get('end_date')
-                    if start_date:
-                        search_filters.append(
-                            {"field": "datePublished", "operator": "gte", "value": start_date}
+                    # Progress: Searching database
+                    await self.message_sender.send_progress("searching", "搜尋資料庫中...", 15)
+
+                    # Get parsed time range and author (QueryUnderstanding runs in parallel during prepare())
+                    temporal_range = getattr(self, 'temporal_range', None)
+                    author_search = getattr(self, 'author_search', None)
+                    num_to_retrieve, search_filters = self._retrieval_plan(temporal_range, author_search)
+
+                    # Check if MMR is enabled and request vectors if needed
+                    include_vectors = self._include_vectors()
+
+                    self.time_filter_relaxed = False
+                    self.author_search_no_results = False
+
+                    # Adopt the speculative results if they were retrieved for this exact plan
+                    items = None
+                    if speculation is not None:
+                        if speculation.matches(self.decontextualized_query, num_to_retrieve, search_filters, include_vectors):
+                            items = await speculation.take()
+                        else:
+                            speculation.cancel("plan changed")
+                    speculative_ready = time.perf_counter()
+
+                    # Use expansion queries if QueryRewrite produced them
+                    expansion_queries = getattr(self, 'rewritten_queries', [])
+                    if expansion_queries:
+                        logger.info(f"[EXPANSION] Using {len(expansion_queries)} expansion queries: {expansion_queries}")
+                        items = await search_with_expansion(
+                            self.decontextualized_query,
+                            expansion_queries,
+                            self.site,
+                            num_results=num_to_retrieve,
+                            num_per_expansion=20,
+                            query_params=self.query_params,
+                            handler=self,
+                            include_vectors=include_vectors,
+                            filters=search_filters,
+                            primary_results=items
                         )
-                        if end_date:
-                            search_filters.append(
-                                {"field": "datePublished", "operator": "lte", "value": end_date}
+                    elif items is None:
+                        items = await search(
+                            self.decontextualized_query,
+                            self.site,
+                            query_params=self.query_params,
+                            handler=self,
+                            num_results=num_to_retrieve,
+                            include_vectors=include_vectors,
+                            filters=search_filters
+                        )
+                    else:
+                        # Speculative hit: the proxy handler could not send the debug retrieval count
+                        await _send_retrieval_count(self, self.decontextualized_query, self.site,
+                                                    items, num_to_retrieve)
+
+                    # Query user's private files if requested
+                    if self.include_private_sources and self.user_id:
+                        try:
+                            from core.user_data_retriever import search_user_documents, format_private_result_for_display
+
+                            # Search private documents
+                            private_results = await search_user_documents(
+                                query=self.decontextualized_query,
+                                user_id=self.user_id,
+                                top_k=10,  # Retrieve top 10 from private files
+                                query_params=self.query_params,
+                                org_id=self.org_id
                             )
 
-                # Author filter from AuthorIntentDetector
-                author_search = getattr(self, 'author_search', None)
-                if author_search and author_search.get('is_author_search'):
-                    author_name = author_search['author_name']
+                            # Format private results to match public results format
+                            if private_results:
+                                formatted_private = []
+                                for result in private_results:
+                                    # Convert to tuple format [url, json_str, name, site]
+                                    formatted = format_private_result_for_display(result)
+                                    import json
+                                    private_item = [
+                                        formatted['url'],
+                                        json.dumps({'text': formatted['text'], 'metadata': formatted.get('metadata', {})}),
+                                        formatted['title'],
+                                        formatted['site']
+                                    ]
+                                    formatted_private.append(private_item)
+
+                                # Prepend private results (higher priority)
+                                items = formatted_private + items
+                                logger.info(f"Added {len(formatted_private)} private document results to search")
+
+                        except Exception as e:
+                            logger.exception(f"Failed to retrieve private documents: {str(e)}")
+                            # Continue with public results only
+
+                    # Date filtering is now done at the retriever/provider level via generic filters.
+                    # The provider sets self.time_filter_relaxed = True if no results matched the filter.
+                    if self.time_filter_relaxed:
+                        logger.warning(f"[TEMPORAL] Time filter was relaxed — provider found no results matching the date range")
+                        # Notify frontend to display a warning banner
+                        try:
+                            await self.message_sender.send_message({
+                                "message_type": "time_filter_relaxed",
+                                "content": "系統找不到完全符合日期需求的資料，已擴大搜尋範圍"
+                            })
+                        except Exception as e:
+                            logger.warning(f"Failed to send time_filter_relaxed message: {e}")
+
+                    # Author search returned no results — strict filter, don't show unrelated articles
+                    if getattr(self, 'author_search_no_results', False):
+                        author_name = author_search.get('author_name', '') if author_search else ''
+                        logger.warning(f"[AUTHOR] No articles found for author '{author_name}' in retrieved candidates")
+                        try:
+                            await self.message_sender.send_message({
+                                "message_type": "author_search_no_results",
+                                "content": f"在目前的搜尋範圍中找不到作者「{author_name}」的文章，請嘗試限縮資料來源再搜尋"
+                            })
+                        except Exception as e:
+                            logger.warning(f"Failed to send author_search_no_results message: {e}")
+
+                    self.final_retrieved_items = items
+
+                    # For author searches, sort results by date (most recent first)
+                    if author_search and author_search.get('is_author_search') and self.final_retrieved_items:
+                        try:
+                            def _extract_date(item):
+                                """Extract datePublished for sorting. Returns '0000-00-00' if unparseable."""
+                                try:
+                                    sj = item.get('schema_json', '{}') if isinstance(item, dict) else ''
+                                    schema = json.loads(sj) if sj else {}
+                                    d = schema.get('datePublished', '') or ''
+                                    return d.split('T')[0] if 'T' in d else d
+                                except Exception:
+                                    return '0000-00-00'
+
+                            self.final_retrieved_items.sort(key=_extract_date, reverse=True)
+                            logger.info(f"[AUTHOR] Sorted {len(self.final_retrieved_items)} results by date (most recent first)")
+                        except Exception as e:
+                            logger.warning(f"[AUTHOR] Failed to sort by date: {e}")
+
+                    self._report_retrieval_timing(speculation, prepare_started, pre_checks_done, speculative_ready)
+                    self.retrieval_done_event.set()
+        finally:
+            # Also reached when retrieval or ranking prep raises: stop the background search
+            if speculation is not None:
+                speculation.cancel("unused")
+        logger.info("Preparation phase completed")
+
+    def _include_vectors(self) -> bool:
+        """Whether retrieval should return vectors (MMR enabled and configured to use them)."""
+        return CONFIG.mmr_params.get('enabled', True) and CONFIG.mmr_params.get('include_vectors', True)
+
+    def _retrieval_plan(self, temporal_range, author_search, log: bool = True):
+        """
+        Result count and generic retriever filters for a temporal range and
+        author search (handler attribute format).
+
+        Returns:
+            Tuple of (num_to_retrieve, search_filters or None)
+        """
+        if temporal_range and temporal_range.get('is_temporal'):
+            # Adjust retrieval volume based on time window
+            days = temporal_range.get('relative_days') or 365
+            if days <= 7:
+                num_to_retrieve = 100  # Recent queries need more candidates
+            elif days <= 30:
+                num_to_retrieve = 150
+            else:
+                num_to_retrieve = 200
+
+            if log:
+                logger.info(f"[TEMPORAL] Temporal query detected (method: {temporal_range.get('method')})")
+                logger.info(f"[TEMPORAL] Time range: {temporal_range.get('start_date')} to {temporal_range.get('end_date')} ({days} days)")
+                logger.info(f"[TEMPORAL] Retrieving {num_to_retrieve} items for date filtering")
+        else:
+            if log:
+                logger.info(f"[TEMPORAL] Non-temporal query: '{self.query}' - retrieving 50 items")
+            num_to_retrieve = 50
+
+        # Construct generic filters from temporal_range and author_search
+        search_filters = []
+        if temporal_range and temporal_range.get('is_temporal'):
+            start_date = temporal_range.get('start_date')
+            end_date = temporal_range.get('end_date')
+            if start_date:
+                search_filters.append(
+                    {"field": "datePublished", "operator": "gte", "value": start_date}
+                )
+                if end_date:
                     search_filters.append(
-                        {"field": "author", "operator": "contains", "value": author_name}
+                        {"field": "datePublished", "operator": "lte", "value": end_date}
                     )
-                    logger.info(f"[AUTHOR] Added author filter: '{author_name}'")
 
-                if search_filters:
-                    logger.info(f"[FILTER] Constructed retriever filters: {search_filters}")
-                else:
-                    search_filters = None
-
-                # Use expansion queries if QueryRewrite produced them
-                expansion_queries = getattr(self, 'rewritten_queries', [])
-                if expansion_queries:
-                    logger.info(f"[EXPANSION] Using {len(expansion_queries)} expansion queries: {expansion_queries}")
-                    items = await search_with_expansion(
-                        self.decontextualized_query,
-                        expansion_queries,
-                        self.site,
-                        num_results=num_to_retrieve,
-                        num_per_expansion=20,
-                        query_params=self.query_params,
-                        handler=self,
-                        include_vectors=include_vectors,
-                        filters=search_filters
-                    )
-                else:
-                    items = await search(
-                        self.decontextualized_query,
-                        self.site,
-                        query_params=self.query_params,
-                        handler=self,
-                        num_results=num_to_retrieve,
-                        include_vectors=include_vectors,
-                        filters=search_filters
-                    )
+        # Author filter from AuthorIntentDetector
+        if author_search and author_search.get('is_author_search'):
+            author_name = author_search['author_name']
+            search_filters.append(
+                {"field": "author", "operator": "contains", "value": author_name}
+            )
+            if log:
+                logger.info(f"[AUTHOR] Added author filter: '{author_name}'")
 
-                # Query user's private files if requested
-                if self.include_private_sources and self.user_id:
-                    try:
-                        from core.user_data_retriever import search_user_documents, format_private_result_for_display
+        if search_filters:
+            if log:
+                logger.info(f"[FILTER] Constructed retriever filters: {search_filters}")
+        else:
+            search_filters = None
 
-                        # Search private documents
-                        private_results = await search_user_documents(
-                            query=self.decontextualized_query,
-                            user_id=self.user_id,
-                            top_k=10,  # Retrieve top 10 from private files
-                            query_params=self.query_params,
-                            org_id=self.org_id
-                        )
+        return num_to_retrieve, search_filters
 
-                        # Format private results to match public results format
-                        if private_results:
-                            formatted_private = []
-                            for result in private_results:
-                                # Convert to tuple format [url, json_str, name, site]
-                                formatted = format_private_result_for_display(result)
-                                import json
-                                private_item = [
-                                    formatted['url'],
-                                    json.dumps({'text': formatted['text'], 'metadata': formatted.get('metadata', {})}),
-                                    formatted['title'],
-                                    formatted['site']
-                                ]
-                                formatted_private.append(private_item)
-
-                            # Prepend private results (higher priority)
-                            items = formatted_private + items
-                            logger.info(f"Added {len(formatted_private)} private document results to search")
-
-                    except Exception as e:
-                        logger.exception(f"Failed to retrieve private documents: {str(e)}")
-                        # Continue with public results only
-
-                # Date filtering is now done at the retriever/provider level via generic filters.
-                # The provider sets self.time_filter_relaxed = True if no results matched the filter.
-                if self.time_filter_relaxed:
-                    logger.warning(f"[TEMPORAL] Time filter was relaxed — provider found no results matching the date range")
-                    # Notify frontend to display a warning banner
-                    try:
-                        await self.message_sender.send_message({
-                            "message_type": "time_filter_relaxed",
-                            "content": "系統找不到完全符合日期需求的資料，已擴大搜尋範圍"
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to send time_filter_relaxed message: {e}")
-
-                # Author search returned no results — strict filter, don't show unrelated articles
-                if getattr(self, 'author_search_no_results', False):
-                    author_name = author_search.get('author_name', '') if author_search else ''
-                    logger.warning(f"[AUTHOR] No articles found for author '{author_name}' in retrieved candidates")
-                    try:
-                        await self.message_sender.send_message({
-                            "message_type": "author_search_no_results",
-                            "content": f"在目前的搜尋範圍中找不到作者「{author_name}」的文章，請嘗試限縮資料來源再搜尋"
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to send author_search_no_results message: {e}")
-
-                self.final_retrieved_items = items
-
-                # For author searches, sort results by date (most recent first)
-                if author_search and author_search.get('is_author_search') and self.final_retrieved_items:
-                    try:
-                        def _extract_date(item):
-                            """Extract datePublished for sorting. Returns '0000-00-00' if unparseable."""
-                            try:
-                                sj = item.get('schema_json', '{}') if isinstance(item, dict) else ''
-                                schema = json.loads(sj) if sj else {}
-                                d = schema.get('datePublished', '') or ''
-                                return d.split('T')[0] if 'T' in d else d
-                            except Exception:
-                                return '0000-00-00'
-
-                        self.final_retrieved_items.sort(key=_extract_date, reverse=True)
-                        logger.info(f"[AUTHOR] Sorted {len(self.final_retrieved_items)} results by date (most recent first)")
-                    except Exception as e:
-                        logger.warning(f"[AUTHOR] Failed to sort by date: {e}")
-
-                self.retrieval_done_event.set()
+    def _start_speculative_retrieval(self):
+        """
+        Start the vector search on the raw query before the pre-checks finish.
 
-        logger.info("Preparation phase completed")
+        Only for first-turn queries on sites with standard retrieval, where the
+        decontextualized query is the raw query. Filters come from the
+        QueryUnderstanding regex fast path. Returns the SpeculativeRetrieval,
+        or None when speculation does not apply.
+        """
+        if not (CONFIG.speculative_retrieval or {}).get('enabled', True):
+            return None
+        if len(self.prev_queries) > 0 or self.free_conversation:
+            return None
+        if self.decontextualized_query and self.decontextualized_query != self.query:
+            return None
+        if not site_supports_standard_retrieval(self.site):
+            return None
+
+        hints = query_understanding.QueryUnderstanding.regex_hints(self.query)
+        num_to_retrieve, search_filters = self._retrieval_plan(
+            hints['temporal_range'], hints['author_search'], log=False)
+        return SpeculativeRetrieval(
+            self, self.query, num_to_retrieve, search_filters, self._include_vectors()).start()
+
+    def _report_retrieval_timing(self, speculation, prepare_started: float,
+                                 pre_checks_done: float, speculative_ready: float) -> None:
+        """
+        Log time from prepare() start to retrieval results, with and without
+        speculation. For a kept speculation the non-speculative time is
+        estimated as pre-checks + the same search + the work after it.
+        """
+        now = time.perf_counter()
+        outcome = speculation.outcome if speculation is not None else "off"
+        self.retrieval_timing = {
+            "speculation": outcome,
+            "pre_checks_ms": round((pre_checks_done - prepare_started) * 1000, 1),
+            "time_to_results_ms": round((now - prepare_started) * 1000, 1),
+        }
+        if outcome == "hit" and speculation.search_seconds is not None:
+            without = (pre_checks_done - prepare_started) + speculation.search_seconds + (now - speculative_ready)
+            self.retrieval_timing["time_to_results_without_speculation_ms"] = round(without * 1000, 1)
+        logger.info(f"[SPECULATIVE] Retrieval timing: {self.retrieval_timing}")
 
     def decontextualizeQuery(self):
         if (len(self.prev_queries) < 1):
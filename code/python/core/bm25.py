@@ -4,16 +4,27 @@ BM25 (Best Match 25) ranking algorithm for hybrid search.
 This module implements the BM25 probabilistic ranking function for calculating
 keyword relevance scores between queries and documents.
 
+Two entry points:
+- BM25Scorer: stateless scorer that tokenizes candidates per request and
+  derives statistics from the candidate set only.
+- BM25Index: persistent inverted index with corpus-wide document frequencies
+  and average document length; scores a candidate set with NumPy lookups.
+
 References:
 - Robertson, S. E., & Zaragoza, H. (2009). "The Probabilistic Relevance Framework: BM25 and Beyond"
 - https://en.wikipedia.org/wiki/Okapi_BM25
 """
 
+import os
 import re
 import math
-from typing import List, Dict, Tuple
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from collections import Counter
 
+import numpy as np
+
 
 class BM25Scorer:
     """
@@ -267,3 +278,372 @@ class BM25Scorer:
         term_doc_counts = {term: len(doc_set) for term, doc_set in term_doc_presence.items()}
 
         return avg_doc_length, term_doc_counts
+
+
+class BM25Index:
+    """
+    Inverted index over a corpus with integer-ID posting lists.
+
+    Documents are keyed by an external string (article URL) and mapped to
+    dense integer IDs in insertion order, so every posting list is sorted by
+    doc ID. Postings live in two segments:
+
+    - base: CSR NumPy arrays (offsets / doc_ids / tfs), built by compact()
+      or loaded from disk
+    - delta: per-term array('i') lists for documents added since the last
+      compact(), so incremental adds never rewrite the base
+
+    Document frequency, corpus size and average document length are
+    corpus-wide. As in Lucene, removing a document tombstones it: it stops
+    being scored and stops counting toward N / avgdl immediately, but its
+    contribution to document frequency is only dropped at the next compact().
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._scorer = BM25Scorer(k1=k1, b=b)
+        self._lock = threading.RLock()
+
+        self._term_ids: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._df = np.zeros(0, dtype=np.int32)
+
+        self._doc_ids: Dict[str, int] = {}
+        self._doc_keys: List[str] = []
+        self._doc_lengths = np.zeros(0, dtype=np.int32)
+        self._live = np.zeros(0, dtype=bool)
+        self._num_docs = 0          # allocated doc IDs (live + tombstoned)
+        self._live_count = 0
+        self._total_length = 0      # token count over live docs
+
+        self._base_offsets = np.zeros(1, dtype=np.int64)
+        self._base_docs = np.zeros(0, dtype=np.int32)
+        self._base_tfs = np.zeros(0, dtype=np.int32)
+        self._delta: Dict[int, Tuple[array, array]] = {}
+
+    # ----- Statistics -----
+
+    @property
+    def corpus_size(self) -> int:
+        return self._live_count
+
+    @property
+    def avg_doc_length(self) -> float:
+        return self._total_length / self._live_count if self._live_count else 0.0
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._terms)
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._doc_ids
+
+    def doc_frequency(self, term: str) -> int:
+        tid = self._term_ids.get(term)
+        return int(self._df[tid]) if tid is not None else 0
+
+    # ----- Updates -----
+
+    def _ensure_doc_capacity(self, n: int) -> None:
+        if n <= len(self._doc_lengths):
+            return
+        cap = max(n, 2 * len(self._doc_lengths), 1024)
+        lengths = np.zeros(cap, dtype=np.int32)
+        lengths[:self._num_docs] = self._doc_lengths[:self._num_docs]
+        live = np.zeros(cap, dtype=bool)
+        live[:self._num_docs] = self._live[:self._num_docs]
+        self._doc_lengths, self._live = lengths, live
+
+    def _ensure_term_capacity(self, n: int) -> None:
+        if n <= len(self._df):
+            return
+        cap = max(n, 2 * len(self._df), 4096)
+        df = np.zeros(cap, dtype=np.int32)
+        df[:len(self._df)] = self._df
+        self._df = df
+
+    def add_document(self, key: str, text: str) -> None:
+        """
+        Index a document. Re-adding an existing key replaces it.
+
+        Args:
+            key: External document key (e.g. article URL)
+            text: Full document text (title + body)
+        """
+        term_freqs = Counter(self._scorer.tokenize(text))
+        doc_length = sum(term_freqs.values())
+
+        with self._lock:
+            if key in self._doc_ids:
+                self.remove_document(key)
+
+            doc_id = self._num_docs
+            self._ensure_doc_capacity(doc_id + 1)
+            self._num_docs += 1
+            self._doc_ids[key] = doc_id
+            self._doc_keys.append(key)
+            self._doc_lengths[doc_id] = doc_length
+            self._live[doc_id] = True
+            self._live_count += 1
+            self._total_length += doc_length
+
+            for term, tf in term_freqs.items():
+                tid = self._term_ids.get(term)
+                if tid is None:
+                    tid = len(self._terms)
+                    self._term_ids[term] = tid
+                    self._terms.append(term)
+                    self._ensure_term_capacity(tid + 1)
+                postings = self._delta.get(tid)
+                if postings is None:
+                    postings = (array('i'), array('i'))
+                    self._delta[tid] = postings
+                postings[0].append(doc_id)
+                postings[1].append(tf)
+                self._df[tid] += 1
+
+    def add_documents(self, documents: Iterable[Tuple[str, str]]) -> int:
+        """Index (key, text) pairs. Returns the number of documents added."""
+        count = 0
+        for key, text in documents:
+            self.add_document(key, text)
+            count += 1
+        return count
+
+    def remove_document(self, key: str) -> bool:
+        """Tombstone a document. Returns False if the key is not indexed."""
+        with self._lock:
+            doc_id = self._doc_ids.pop(key, None)
+            if doc_id is None:
+                return False
+            self._live[doc_id] = False
+            self._live_count -= 1
+            self._total_length -= int(self._doc_lengths[doc_id])
+            return True
+
+    def compact(self) -> None:
+        """
+        Merge the delta segment into the base CSR arrays.
+
+        Drops tombstoned documents, renumbers doc IDs densely and recomputes
+        document frequencies from the surviving postings.
+        """
+        with self._lock:
+            n_terms = len(self._terms)
+            base_terms = np.repeat(
+                np.arange(len(self._base_offsets) - 1, dtype=np.int32),
+                np.diff(self._base_offsets),
+            )
+            term_parts = [base_terms]
+            doc_parts = [self._base_docs]
+            tf_parts = [self._base_tfs]
+            for tid, (docs, tfs) in self._delta.items():
+                term_parts.append(np.full(len(docs), tid, dtype=np.int32))
+                doc_parts.append(np.frombuffer(docs, dtype=np.intc).astype(np.int32))
+                tf_parts.append(np.frombuffer(tfs, dtype=np.intc).astype(np.int32))
+
+            terms = np.concatenate(term_parts)
+            docs = np.concatenate(doc_parts)
+            tfs = np.concatenate(tf_parts)
+
+            live = self._live[:self._num_docs]
+            keep = live[docs]
+            terms, docs, tfs = terms[keep], docs[keep], tfs[keep]
+
+            remap = np.cumsum(live, dtype=np.int64) - 1
+            docs = remap[docs].astype(np.int32)
+            order = np.lexsort((docs, terms))
+            terms, docs, tfs = terms[order], docs[order], tfs[order]
+
+            counts = np.bincount(terms, minlength=n_terms).astype(np.int64)
+            offsets = np.zeros(n_terms + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+
+            live_ids = np.nonzero(live)[0]
+            self._doc_keys = [self._doc_keys[i] for i in live_ids]
+            self._doc_ids = {k: i for i, k in enumerate(self._doc_keys)}
+            self._num_docs = len(self._doc_keys)
+            self._doc_lengths = self._doc_lengths[live_ids].copy()
+            self._live = np.ones(self._num_docs, dtype=bool)
+            self._live_count = self._num_docs
+            self._total_length = int(self._doc_lengths.sum())
+
+            self._base_offsets, self._base_docs, self._base_tfs = offsets, docs, tfs
+            self._df = counts.astype(np.int32)
+            self._delta = {}
+
+    # ----- Scoring -----
+
+    def _term_postings(self, tid: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Posting segments (doc_ids, tfs) for a term, each sorted by doc ID."""
+        segments = []
+        if tid < len(self._base_offsets) - 1:
+            start, end = self._base_offsets[tid], self._base_offsets[tid + 1]
+            if end > start:
+                segments.append((self._base_docs[start:end], self._base_tfs[start:end]))
+        delta = self._delta.get(tid)
+        if delta is not None:
+            segments.append((
+                np.array(delta[0], dtype=np.int32),
+                np.array(delta[1], dtype=np.int32),
+            ))
+        return segments
+
+    def score(
+        self,
+        query_tokens: List[str],
+        doc_keys: Sequence[str],
+        texts: Optional[Sequence[str]] = None,
+    ) -> np.ndarray:
+        """
+        BM25 scores for a candidate set using corpus-wide statistics.
+
+        Args:
+            query_tokens: Tokens from the query (duplicates are ignored)
+            doc_keys: Candidate document keys
+            texts: Optional candidate texts aligned with doc_keys. Candidates
+                missing from the index are scored by tokenizing their text
+                against the index statistics; without texts they score 0.
+
+        Returns:
+            float64 array of scores aligned with doc_keys
+        """
+        n = len(doc_keys)
+        scores = np.zeros(n, dtype=np.float64)
+        if n == 0 or not query_tokens:
+            return scores
+
+        with self._lock:
+            corpus_size = self._live_count
+            avg_doc_length = self.avg_doc_length
+            if corpus_size == 0 or avg_doc_length == 0:
+                return scores
+
+            term_idfs: Dict[int, float] = {}
+            for term in set(query_tokens):
+                tid = self._term_ids.get(term)
+                if tid is None:
+                    continue
+                df = int(self._df[tid])
+                if df > 0:
+                    term_idfs[tid] = self._scorer.calculate_idf(term, corpus_size, df)
+
+            cand = np.fromiter(
+                (self._doc_ids.get(k, -1) for k in doc_keys), dtype=np.int64, count=n
+            )
+            known_pos = np.nonzero(cand >= 0)[0]
+
+            if len(known_pos) and term_idfs:
+                order = np.argsort(cand[known_pos], kind='stable')
+                known_pos = known_pos[order]
+                doc_ids = cand[known_pos]
+                norm = self.k1 * (
+                    1 - self.b + self.b * (self._doc_lengths[doc_ids] / avg_doc_length)
+                )
+                acc = np.zeros(len(doc_ids), dtype=np.float64)
+                for tid, idf in term_idfs.items():
+                    tf = np.zeros(len(doc_ids), dtype=np.float64)
+                    for seg_docs, seg_tfs in self._term_postings(tid):
+                        idx = np.searchsorted(seg_docs, doc_ids)
+                        idx_c = np.minimum(idx, len(seg_docs) - 1)
+                        hit = seg_docs[idx_c] == doc_ids
+                        tf[hit] = seg_tfs[idx_c[hit]]
+                    acc += idf * (tf * (self.k1 + 1)) / (tf + norm)
+                scores[known_pos] = acc
+
+            if texts is not None:
+                term_doc_counts = {
+                    self._terms[tid]: int(self._df[tid]) for tid in term_idfs
+                }
+                for i in np.nonzero(cand < 0)[0]:
+                    text = texts[i]
+                    if text:
+                        scores[i] = self._scorer.calculate_score(
+                            query_tokens, text, avg_doc_length, corpus_size, term_doc_counts
+                        )
+
+        return scores
+
+    # ----- Persistence -----
+
+    def save(self, path: str) -> None:
+        """Compact and write the index to a .npz file."""
+        with self._lock:
+            self.compact()
+            with open(path, 'wb') as f:
+                np.savez(
+                    f,
+                    version=np.array([self.FORMAT_VERSION], dtype=np.int32),
+                    params=np.array([self.k1, self.b], dtype=np.float64),
+                    terms=np.frombuffer("\n".join(self._terms).encode("utf-8"), dtype=np.uint8),
+                    doc_keys=np.frombuffer("\n".join(self._doc_keys).encode("utf-8"), dtype=np.uint8),
+                    doc_lengths=self._doc_lengths,
+                    offsets=self._base_offsets,
+                    docs=self._base_docs,
+                    tfs=self._base_tfs,
+                )
+
+    @classmethod
+    def load(cls, path: str) -> 'BM25Index':
+        """Load an index written by save()."""
+        with np.load(path) as data:
+            version = int(data["version"][0])
+            if version != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported BM25 index format version: {version}")
+            k1, b = (float(v) for v in data["params"])
+            index = cls(k1=k1, b=b)
+
+            index._base_offsets = data["offsets"].astype(np.int64)
+            index._base_docs = data["docs"].astype(np.int32)
+            index._base_tfs = data["tfs"].astype(np.int32)
+            index._doc_lengths = data["doc_lengths"].astype(np.int32)
+
+            n_terms = len(index._base_offsets) - 1
+            n_docs = len(index._doc_lengths)
+            index._terms = data["terms"].tobytes().decode("utf-8").split("\n") if n_terms else []
+            index._doc_keys = data["doc_keys"].tobytes().decode("utf-8").split("\n") if n_docs else []
+
+        index._term_ids = {t: i for i, t in enumerate(index._terms)}
+        index._doc_ids = {k: i for i, k in enumerate(index._doc_keys)}
+        index._num_docs = len(index._doc_keys)
+        index._live = np.ones(index._num_docs, dtype=bool)
+        index._live_count = index._num_docs
+        index._total_length = int(index._doc_lengths.sum())
+        index._df = np.diff(index._base_offsets).astype(np.int32)
+        return index
+
+
+# path -> (mtime_ns, index); index is None for an unreadable file
+_INDEX_CACHE: Dict[str, Tuple[int, Optional[BM25Index]]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def get_bm25_index(path: Optional[str]) -> Optional[BM25Index]:
+    """
+    Load a prebuilt BM25Index, reloading it when the file changes.
+
+    Returns None if no path is configured or the file is missing/unreadable,
+    so callers can fall back to BM25Scorer. A missing file is not cached, and
+    a rebuilt one (new mtime) replaces the cached index.
+    """
+    if not path:
+        return None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    with _INDEX_CACHE_LOCK:
+        cached = _INDEX_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                index = BM25Index.load(path)
+            except (OSError, ValueError, KeyError):
+                index = None
+            cached = _INDEX_CACHE[path] = (mtime, index)
+        return cached[1]
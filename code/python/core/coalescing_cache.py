@@ -0,0 +1,279 @@
+"""
+Shared building blocks for the in-process response caches.
+
+LLMResponseCache (core/llm_cache.py), EmbeddingCache (core/embedding_cache.py)
+and Tier6Cache (core/tier6_cache.py) all combine:
+
+  - An OrderedDict LRU bounded by entry count and, optionally, bytes
+  - Per-event-loop coalescing: concurrent misses for one key share a single
+    upstream call; callers on another event loop run their own
+  - An optional SQLite tier (WAL) kept across processes and restarts
+
+CoalescingCache implements the first two and SqliteCacheStore the third;
+subclasses choose the entry format, the expiry rule and what the leading
+call shares with the callers that waited on it.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from misc.logger.logging_config_helper import get_configured_logger
+
+logger = get_configured_logger("coalescing_cache")
+
+# Shared by a leading call that has no result its waiters can use (it failed,
+# or the result cannot be cached); waiters then make their own upstream call.
+RETRY = object()
+
+
+class CoalescingCache:
+    """
+    Memory LRU, in-flight coalescing and counters for one cache.
+
+    Memory entries are tuples whose layout the subclass defines; it overrides
+    _expired() and _entry_size() to match.
+
+    Args:
+        max_entries: LRU entry bound
+        max_bytes: LRU size bound (sum of _entry_size), None for no size bound
+        extra_stats: Subclass counters, added to hits/disk_hits/misses/coalesced/evictions
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        extra_stats: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        # key -> (loop, future) for requests currently in flight
+        self._inflight: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+
+        self._stats: Dict[str, float] = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+        }
+        self._stats.update(extra_stats or {})
+
+    # ------------------------------------------------------------------
+    # Subclass hooks
+    # ------------------------------------------------------------------
+
+    def _expired(self, entry: tuple, now: float) -> bool:
+        """True if a memory entry must no longer be served."""
+        return False
+
+    def _entry_size(self, entry: tuple) -> int:
+        """Bytes a memory entry counts against max_bytes."""
+        return 0
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _memory_get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry, time.time()):
+                del self._memory[key]
+                self._memory_bytes -= self._entry_size(entry)
+                return None
+            self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: str, entry: tuple) -> None:
+        size = self._entry_size(entry)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= self._entry_size(old)
+            self._memory[key] = entry
+            self._memory_bytes += size
+            while self._memory and (
+                len(self._memory) > self.max_entries
+                or (self.max_bytes is not None and self._memory_bytes > self.max_bytes)
+            ):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= self._entry_size(evicted)
+                self._stats["evictions"] += 1
+
+    def _clear_memory(self) -> int:
+        """Drop all memory entries; returns how many were dropped."""
+        with self._lock:
+            count = len(self._memory)
+            self._memory.clear()
+            self._memory_bytes = 0
+        return count
+
+    # ------------------------------------------------------------------
+    # Coalescing
+    # ------------------------------------------------------------------
+
+    def _inflight_on_this_loop(self, key: str) -> bool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inflight = self._inflight.get(key)
+            return inflight is not None and inflight[0] is loop
+
+    async def _coalesce(
+        self,
+        key: str,
+        lead: Callable[[], Awaitable[Tuple[Any, Any]]],
+    ) -> Tuple[Any, str]:
+        """
+        Run lead() once per key per event loop.
+
+        lead() returns (result, shared): result goes to the leading caller and
+        shared to the callers that arrived while it ran. Exceptions propagate
+        to the leading caller only. If lead() raised or shared RETRY, waiters
+        get (None, "retry") and must make their own call.
+
+        Returns:
+            (value, role) with role "leader", "coalesced" or "retry"
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None or inflight[0] is not loop:
+                future = loop.create_future()
+                self._inflight[key] = (loop, future)
+                leader = True
+            else:
+                future = inflight[1]
+                leader = False
+
+        if not leader:
+            with self._lock:
+                self._stats["coalesced"] += 1
+            shared = await asyncio.shield(future)
+            if shared is RETRY:
+                return None, "retry"
+            return shared, "coalesced"
+
+        shared = RETRY
+        try:
+            result, shared = await lead()
+            return result, "leader"
+        finally:
+            with self._lock:
+                if self._inflight.get(key, (None, None))[1] is future:
+                    del self._inflight[key]
+            if not future.done():
+                future.set_result(shared)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _count(self, counter: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[counter] += amount
+
+    def _base_stats(self) -> Dict[str, Any]:
+        """Counters plus current memory-tier size and in-flight requests."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._memory)
+            stats["memory_bytes"] = self._memory_bytes
+            stats["inflight"] = len(self._inflight)
+        return stats
+
+
+class SqliteCacheStore:
+    """
+    SQLite tier for caches: one WAL table of (namespace, key, value, stamp).
+
+    Several caches can share a store, separated by namespace. The stamp is a
+    number the cache interprets (expiry time, store time, fetch latency).
+    Read and write errors are logged and treated as misses.
+
+    Args:
+        path: SQLite file, created with its directory if missing
+        table: Table name (fixed per cache type)
+    """
+
+    def __init__(self, path: str, table: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.table = table
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL,"
+            " stamp REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str, namespace: str = "") -> Optional[Tuple[Any, float]]:
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    f"SELECT value, stamp FROM {self.table} WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"{self.table} SQLite read failed: {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, value: Any, stamp: float, namespace: str = "") -> None:
+        try:
+            with self._lock:
+                self._db.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (namespace, key, value, stamp) VALUES (?, ?, ?, ?)",
+                    (namespace, key, value, stamp),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"{self.table} SQLite write failed: {e}")
+
+    def purge(self, stamp_before: float) -> None:
+        """Delete rows whose stamp is at or below stamp_before."""
+        try:
+            with self._lock:
+                self._db.execute(f"DELETE FROM {self.table} WHERE stamp <= ?", (stamp_before,))
+        except sqlite3.Error as e:
+            logger.warning(f"{self.table} SQLite purge failed: {e}")
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Delete one namespace, or every row when namespace is None."""
+        try:
+            with self._lock:
+                if namespace is None:
+                    self._db.execute(f"DELETE FROM {self.table}")
+                else:
+                    self._db.execute(f"DELETE FROM {self.table} WHERE namespace = ?", (namespace,))
+        except sqlite3.Error as e:
+            logger.warning(f"{self.table} SQLite clear failed: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def open_sqlite_store(path: str, table: str) -> Optional[SqliteCacheStore]:
+    """Open a SqliteCacheStore, or return None (memory tier only) if it cannot be opened."""
+    try:
+        return SqliteCacheStore(path, table)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"{table} SQLite tier disabled ({path}): {e}")
+        return None
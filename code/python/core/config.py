@@ -279,6 +279,15 @@ class AppConfig:
                     api_version=api_version
                 )
 
+            # Load ask_llm response cache parameters
+            self.llm_cache_params: Dict[str, Any] = data.get("response_cache", {
+                "enabled": False,
+                "max_entries": 5000,
+                "max_bytes": 50000000,
+                "sqlite_path": "",
+                "ttl_seconds": {"default": 0}
+            })
+
     def load_embedding_config(self, path: str = "config_embedding.yaml"):
         """Load embedding model configuration."""
         # Build the full path to the config file using the config directory
@@ -315,6 +324,13 @@ class AppConfig:
                 config=config
             )
 
+        # Load query embedding cache parameters
+        self.embedding_cache_params: Dict[str, Any] = data.get("query_cache", {
+            "enabled": False,
+            "max_entries": 20000,
+            "sqlite_path": ""
+        })
+
     def load_retrieval_config(self, path: str = "config_retrieval.yaml"):
         # Build the full path to the config file using the config directory
         full_path = os.path.join(self.config_directory, path)
@@ -341,6 +357,29 @@ class AppConfig:
             "vector_similarity_min": 0.40
         })
 
+        # Load pgvector ANN search parameters
+        self.ann_params: Dict[str, Any] = data.get("ann_params", {
+            "profile": "balanced",
+            "profiles": {"balanced": {"probes": 50, "ef_search": 100}},
+            "iterative_scan": "relaxed_order",
+            "max_scan_tuples": 20000,
+            "max_probes": 200
+        })
+
+        # Load PostgreSQL hybrid search fusion parameters
+        self.hybrid_params: Dict[str, Any] = data.get("hybrid_params", {
+            "fusion": "rrf",
+            "rrf_k": 60,
+            "vector_weight": 1.0,
+            "text_weight": 1.0,
+            "text_score_min": 0.05
+        })
+
+        # Load speculative retrieval parameters
+        self.speculative_retrieval: Dict[str, Any] = data.get("speculative_retrieval", {
+            "enabled": True
+        })
+
         # Load BM25 parameters
         self.bm25_params: Dict[str, Any] = data.get("bm25_params", {
             "enabled": True,
@@ -358,6 +397,12 @@ class AppConfig:
             "include_vectors": True
         })
 
+        # Load LLM ranking parameters
+        self.ranking_params: Dict[str, Any] = data.get("ranking_params", {
+            "batch_mode": False,
+            "batch_size": 8
+        })
+
         # Load XGBoost parameters (Phase A - Week 1-2)
         self.xgboost_params: Dict[str, Any] = data.get("xgboost_params", {
             "enabled": False,
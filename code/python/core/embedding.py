@@ -11,8 +11,10 @@ Backwards compatibility is not guaranteed at this time.
 from typing import Optional, List
 import asyncio
 import threading
+import time
 
 from core.config import CONFIG
+from core.embedding_cache import get_embedding_cache
 from misc.logger.logging_config_helper import get_configured_logger, LogLevel
 
 logger = get_configured_logger("embedding_wrapper")
@@ -31,7 +33,8 @@ async def get_embedding(
     provider: Optional[str] = None,
     model: Optional[str] = None,
     timeout: int = 30,
-    query_params: Optional[dict] = None
+    query_params: Optional[dict] = None,
+    use_cache: bool = True
 ) -> List[float]:
     """
     Get embedding for the provided text using the specified provider and model.
@@ -42,6 +45,8 @@ async def get_embedding(
         model: Optional model name, defaults to the provider's configured model
         timeout: Maximum time to wait for embedding response in seconds
         query_params: Optional query parameters from HTTP request
+        use_cache: Set False for document/indexing text so one-off passages
+            don't evict hot query embeddings from the cache
         
     Returns:
         List of floats representing the embedding vector
@@ -85,6 +90,18 @@ async def get_embedding(
     
     logger.debug(f"Using embedding model: {model_id}")
 
+    cache = get_embedding_cache() if use_cache else None
+    if cache is None:
+        return await _compute_embedding(text, provider, model_id, timeout)
+
+    key = cache.make_key(provider, model_id, text)
+    vector = await cache.get_or_compute(
+        key, lambda: _compute_embedding(text, provider, model_id, timeout)
+    )
+    return vector.tolist()
+
+async def _compute_embedding(text: str, provider: str, model_id: str, timeout: int) -> List[float]:
+    """Dispatch one embedding request to the provider implementation."""
     try:
         # Use a timeout wrapper for all embedding calls
         if provider == "openai":
@@ -159,6 +176,65 @@ async def get_embedding(
         )
         raise
 
+async def get_query_embeddings(
+    texts: List[str],
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    timeout: int = 30,
+    query_params: Optional[dict] = None
+) -> List[List[float]]:
+    """
+    Get embeddings for several query texts with one provider request.
+
+    Texts already in the embedding cache are served from it; the remaining
+    distinct texts are embedded in a single batch_get_embeddings call and
+    added to the cache.
+
+    Args:
+        texts: Query texts to embed
+        provider: Optional provider name, defaults to preferred_embedding_provider
+        model: Optional model name, defaults to the provider's configured model
+        timeout: Maximum time to wait for the batch response in seconds
+        query_params: Optional query parameters from HTTP request
+
+    Returns:
+        One embedding (list of floats) per input text, in order
+    """
+    if CONFIG.is_development_mode() and query_params:
+        if 'embedding_provider' in query_params:
+            provider = query_params['embedding_provider']
+    provider = provider or CONFIG.preferred_embedding_provider
+
+    provider_config = CONFIG.get_embedding_provider(provider)
+    if not provider_config:
+        error_msg = f"Missing configuration for embedding provider '{provider}'"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    model_id = model or provider_config.model
+
+    cache = get_embedding_cache()
+    vectors = {}
+    missing = []
+    for text in dict.fromkeys(texts):
+        cached = cache.lookup(cache.make_key(provider, model_id, text)) if cache else None
+        if cached is not None:
+            vectors[text] = cached.tolist()
+        else:
+            missing.append(text)
+
+    if missing:
+        start = time.perf_counter()
+        computed = await batch_get_embeddings(missing, provider=provider, model=model_id, timeout=timeout)
+        latency = (time.perf_counter() - start) / len(missing)
+        for text, vector in zip(missing, computed):
+            vector = [float(v) for v in vector]
+            vectors[text] = vector
+            if cache:
+                await cache.put(cache.make_key(provider, model_id, text), vector, latency)
+    logger.debug(f"Query embeddings: {len(vectors) - len(missing)} cached, {len(missing)} in one batch")
+    return [vectors[text] for text in texts]
+
+
 async def batch_get_embeddings(
     texts: List[str],
     provider: Optional[str] = None,
@@ -266,7 +342,7 @@ async def batch_get_embeddings(
         logger.debug(f"No specific batch implementation for {provider}, processing sequentially")
         results = []
         for text in texts:
-            embedding = await get_embedding(text, provider, model)
+            embedding = await get_embedding(text, provider, model, use_cache=False)
             results.append(embedding)
         
         return results
@@ -0,0 +1,177 @@
+"""
+Query embedding cache for core/embedding.get_embedding.
+
+Entries are keyed on (provider, model, normalized text) and stored as
+read-only float32 arrays (4 bytes/dim instead of a boxed Python float per
+dim). Concurrent identical requests on the same event loop await a single
+provider call. An optional SQLite tier keeps vectors across restarts so a
+deploy does not start cold on the current news topics.
+
+Embeddings are deterministic for a given model, so entries do not expire;
+the memory tier is bounded by LRU entry count. The LRU, coalescing and
+SQLite tier come from core/coalescing_cache.py.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.coalescing_cache import CoalescingCache, open_sqlite_store
+from misc.logger.logging_config_helper import get_configured_logger
+
+logger = get_configured_logger("embedding_cache")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize (full-width -> half-width) and collapse whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class EmbeddingCache(CoalescingCache):
+    """
+    LRU cache of float32 query embeddings with an optional SQLite tier.
+
+    Memory entries are (vector, fetch_latency_seconds). Tracks hits, misses,
+    coalesced waiters and the provider latency saved by hits (the recorded
+    fetch latency of each entry served from cache).
+    """
+
+    def __init__(self, max_entries: int = 20000, sqlite_path: Optional[str] = None):
+        super().__init__(max_entries, extra_stats={"provider_seconds": 0.0, "saved_seconds": 0.0})
+
+        # The SQLite stamp column holds the fetch latency; entries never expire
+        self._db = open_sqlite_store(sqlite_path, "query_embeddings") if sqlite_path else None
+
+        logger.info(
+            f"EmbeddingCache initialized: max_entries={max_entries}, "
+            f"sqlite={'on' if self._db else 'off'}"
+        )
+
+    @staticmethod
+    def make_key(provider: str, model: str, text: str) -> str:
+        material = f"{provider}\x00{model}\x00{normalize_text(text)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[np.ndarray]:
+        """Memory-tier lookup without computing; counts a hit or a miss."""
+        entry = self._memory_get(key)
+        if entry is None:
+            self._count("misses")
+            return None
+        return self._serve(entry, "hits")
+
+    async def put(self, key: str, vector: Sequence[float], latency: float = 0.0) -> np.ndarray:
+        """
+        Cache a vector computed outside get_or_compute (e.g. in a batch request
+        after lookup() missed). latency is the provider time attributed to it.
+        """
+        vector = self._freeze(vector)
+        self._count("provider_seconds", latency)
+        await self._store(key, vector, latency)
+        return vector
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Sequence[float]]],
+    ) -> np.ndarray:
+        """
+        Return the cached vector for key, or run compute() once and cache it.
+
+        Exceptions from compute() propagate to the leading caller; coalesced
+        waiters then issue their own provider call.
+        """
+        entry = self._memory_get(key)
+        if entry is not None:
+            return self._serve(entry, "hits")
+
+        async def lead():
+            if self._db is not None:
+                disk = await asyncio.to_thread(self._db.get, key)
+                if disk is not None:
+                    # frombuffer over immutable bytes yields a read-only array
+                    entry = (np.frombuffer(disk[0], dtype=np.float32), disk[1])
+                    self._memory_put(key, entry)
+                    return self._serve(entry, "disk_hits"), entry[0]
+
+            start = time.perf_counter()
+            result = await compute()
+            latency = time.perf_counter() - start
+
+            vector = self._freeze(result)
+            with self._lock:
+                self._stats["misses"] += 1
+                self._stats["provider_seconds"] += latency
+            await self._store(key, vector, latency)
+            return vector, vector
+
+        vector, role = await self._coalesce(key, lead)
+        if role == "retry":
+            return await self.get_or_compute(key, compute)
+        return vector
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._base_stats()
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["provider_seconds"] = round(stats["provider_seconds"], 3)
+        stats["saved_seconds"] = round(stats["saved_seconds"], 3)
+        return stats
+
+    def clear(self) -> None:
+        self._clear_memory()
+        if self._db is not None:
+            self._db.clear()
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _entry_size(self, entry: tuple) -> int:
+        return entry[0].nbytes
+
+    @staticmethod
+    def _freeze(vector: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        vector.setflags(write=False)
+        return vector
+
+    async def _store(self, key: str, vector: np.ndarray, latency: float) -> None:
+        self._memory_put(key, (vector, latency))
+        if self._db is not None:
+            await asyncio.to_thread(self._db.put, key, vector.tobytes(), latency)
+
+    def _serve(self, entry: Tuple[np.ndarray, float], counter: str) -> np.ndarray:
+        vector, latency = entry
+        with self._lock:
+            self._stats[counter] += 1
+            self._stats["saved_seconds"] += latency
+        return vector
+
+
+# Global cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the global query embedding cache, or None if disabled in config."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        from core.config import CONFIG
+
+        params = getattr(CONFIG, "embedding_cache_params", None) or {}
+        if not params.get("enabled", False):
+            return None
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache(
+                    max_entries=params.get("max_entries", 20000),
+                    sqlite_path=params.get("sqlite_path") or None,
+                )
+    return _embedding_cache
@@ -0,0 +1,250 @@
+"""
+Shared outgoing HTTP client for retrieval_providers API clients.
+
+One aiohttp session per process (per event loop) replaces the session each
+Tier 6 client used to open per request, so stock, weather and company
+lookups reuse pooled keep-alive connections and cached DNS instead of paying
+a TCP/TLS handshake every call. The connector caps concurrent connections
+per host.
+
+Requests share one retry policy: connection errors, timeouts and 429/5xx
+responses are retried with exponential backoff, within the caller's timeout.
+Latency is recorded per provider as a histogram (see get_stats).
+
+Configured under reasoning.tier_6.http_client in config_reasoning.yaml.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from misc.logger.logging_config_helper import get_configured_logger
+
+logger = get_configured_logger("http_client")
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HttpStatusError(aiohttp.ClientError):
+    """Non-success HTTP status from get_json(raise_for_status=True)."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class _Retryable(Exception):
+    """Internal signal: retry the request (retryable HTTP status)."""
+
+
+class HttpClientManager:
+    """
+    Process-wide pooled aiohttp session with retries and per-provider latency stats.
+
+    Args:
+        pool_size: Max open connections across all hosts
+        limit_per_host: Max concurrent connections to one host
+        keepalive_timeout: Seconds an idle connection stays in the pool
+        dns_cache_ttl: Seconds resolved addresses are reused
+        max_retries: Retries after the first attempt for retryable failures
+        retry_backoff: Delay before the first retry, doubled per retry
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 100,
+        limit_per_host: int = 8,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        max_retries: int = 1,
+        retry_backoff: float = 0.2,
+    ):
+        self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # Sessions are bound to the loop they were created on
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+            logger.info(
+                f"Created shared HTTP session (pool={self.pool_size}, "
+                f"per_host={self.limit_per_host}, dns_ttl={self.dns_cache_ttl}s)"
+            )
+        return self._session
+
+    async def get_json(
+        self,
+        provider: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        raise_for_status: bool = False,
+    ) -> Tuple[int, Any]:
+        """
+        GET a JSON endpoint through the shared session.
+
+        Args:
+            provider: Provider name for latency stats (e.g. "twse")
+            url: Request URL
+            params: Query string parameters
+            headers: Request headers
+            timeout: Total seconds for the call, retries included
+            raise_for_status: Raise HttpStatusError instead of returning a non-200 status
+
+        Returns:
+            (status, data) where data is the decoded JSON body for 200, else None
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: When the last attempt fails
+        """
+        deadline = time.monotonic() + timeout
+        start = time.perf_counter()
+        outcome = "error"
+        attempt = 0
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    outcome = "timeout"
+                    raise asyncio.TimeoutError(f"{provider} request exceeded {timeout}s")
+                try:
+                    async with self._get_session().get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=remaining),
+                    ) as response:
+                        status = response.status
+                        if status in RETRY_STATUSES and attempt < self.max_retries:
+                            raise _Retryable(f"HTTP {status}")
+                        if status != 200:
+                            outcome = "http_error"
+                            if raise_for_status:
+                                raise HttpStatusError(status, url)
+                            return status, None
+                        data = await response.json()
+                        outcome = "ok"
+                        return status, data
+                except (_Retryable, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt >= self.max_retries:
+                        if isinstance(e, asyncio.TimeoutError):
+                            outcome = "timeout"
+                        raise
+                    attempt += 1
+                    delay = self.retry_backoff * (2 ** (attempt - 1))
+                    logger.debug(f"{provider} request failed ({e}), retry {attempt} in {delay:.2f}s")
+                    await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        except asyncio.CancelledError:
+            # Caller-side deadline (wait_for, gap resolution budget)
+            outcome = "cancelled"
+            raise
+        finally:
+            self._record(provider, (time.perf_counter() - start) * 1000, outcome, attempt)
+
+    def _record(self, provider: str, latency_ms: float, outcome: str, retries: int) -> None:
+        with self._stats_lock:
+            stats = self._stats.get(provider)
+            if stats is None:
+                stats = self._stats[provider] = {
+                    "requests": 0,
+                    "retries": 0,
+                    "outcomes": {},
+                    "total_ms": 0.0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                }
+            stats["requests"] += 1
+            stats["retries"] += retries
+            stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+            stats["total_ms"] += latency_ms
+            bucket = len(LATENCY_BUCKETS_MS)
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if latency_ms <= bound:
+                    bucket = i
+                    break
+            stats["buckets"][bucket] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-provider request counts, outcomes and latency histograms."""
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        with self._stats_lock:
+            providers = {
+                name: {
+                    "requests": stats["requests"],
+                    "retries": stats["retries"],
+                    "outcomes": dict(stats["outcomes"]),
+                    "avg_ms": round(stats["total_ms"] / stats["requests"], 1),
+                    "latency_histogram": dict(zip(labels, stats["buckets"])),
+                }
+                for name, stats in self._stats.items()
+            }
+        return {
+            "pool_size": self.pool_size,
+            "limit_per_host": self.limit_per_host,
+            "session_open": self._session is not None and not self._session.closed,
+            "providers": providers,
+        }
+
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+            logger.info("Closed shared HTTP session")
+
+
+# Global manager instance
+_http_client: Optional[HttpClientManager] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClientManager:
+    """Get the process-wide HTTP client manager."""
+    global _http_client
+    if _http_client is None:
+        from core.config import CONFIG
+
+        params = CONFIG.reasoning_params.get("tier_6", {}).get("http_client", {})
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClientManager(
+                    pool_size=params.get("pool_size", 100),
+                    limit_per_host=params.get("limit_per_host", 8),
+                    keepalive_timeout=params.get("keepalive_timeout", 30.0),
+                    dns_cache_ttl=params.get("dns_cache_ttl", 300),
+                    max_retries=params.get("max_retries", 1),
+                    retry_backoff=params.get("retry_backoff", 0.2),
+                )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared session if one was created (server shutdown)."""
+    if _http_client is not None:
+        await _http_client.close()
@@ -11,6 +11,7 @@ Backwards compatibility is not guaranteed at this time.
 
 from typing import Optional, Dict, Any
 from core.config import CONFIG
+from core.llm_cache import get_llm_cache
 import asyncio
 import threading
 import subprocess
@@ -161,7 +162,9 @@ async def ask_llm(
     level: str = "low",
     timeout: int = 60,
     query_params: Optional[Dict[str, Any]] = None,
-    max_length: int = 512
+    max_length: int = 512,
+    cache_site: str = "default",
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Route an LLM request to the specified endpoint, with dispatch based on llm_type.
@@ -174,6 +177,9 @@ async def ask_llm(
         timeout: Request timeout in seconds
         query_params: Optional query parameters for development mode provider override
         max_length: Maximum length of the response in tokens (default: 512)
+        cache_site: Call-site name selecting the response cache TTL
+            (response_cache.ttl_seconds in config_llm.yaml)
+        use_cache: Set False to bypass the response cache for this call
         
     Returns:
         Parsed JSON response from the LLM
@@ -221,6 +227,28 @@ async def ask_llm(
     model_id = getattr(provider_config.models, level)
     logger.debug(f"Using model: {model_id}")
     
+    cache = get_llm_cache() if use_cache else None
+    ttl = cache.ttl_for(cache_site) if cache else 0
+    if ttl > 0:
+        key = cache.make_key(provider_name, model_id, prompt, schema, max_length)
+        return await cache.get_or_call(
+            key, ttl,
+            lambda: _get_completion(provider_name, llm_type, model_id, level, prompt, schema, timeout, max_length)
+        )
+    return await _get_completion(provider_name, llm_type, model_id, level, prompt, schema, timeout, max_length)
+
+
+async def _get_completion(
+    provider_name: str,
+    llm_type: str,
+    model_id: str,
+    level: str,
+    prompt: str,
+    schema: Dict[str, Any],
+    timeout: int,
+    max_length: int
+) -> Optional[Dict[str, Any]]:
+    """Call the provider's get_completion; returns None on any failure."""
     # Initialize variables for exception handling
     llm_type_for_error = llm_type
 
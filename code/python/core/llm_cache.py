@@ -0,0 +1,192 @@
+"""
+Content-addressed cache for ask_llm responses.
+
+Entries are keyed on a SHA-256 of (endpoint, model, prompt, schema, max_length)
+so identical prompts against the same model share one response regardless of
+the call site that issued them. Two tiers:
+
+  - In-process LRU bounded by entry count and serialized bytes
+  - Optional SQLite file shared across processes and restarts
+
+TTLs are chosen per call site (config_llm.yaml response_cache.ttl_seconds):
+ranking prompts embed fresh news snippets and expire quickly, static query
+analysis prompts live longer. Sites without an entry fall back to 'default',
+which is 0 (not cached), so only call sites listed there are cached.
+
+Concurrent identical requests on the same event loop are collapsed: the first
+caller runs the upstream call and the others await its result. The LRU,
+coalescing and SQLite tier come from core/coalescing_cache.py.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from core.coalescing_cache import RETRY, CoalescingCache, open_sqlite_store
+from misc.logger.logging_config_helper import get_configured_logger
+
+logger = get_configured_logger("llm_cache")
+
+
+class LLMResponseCache(CoalescingCache):
+    """
+    Two-tier (memory LRU + optional SQLite) TTL cache for LLM responses.
+
+    Values are stored as serialized JSON and deserialized on every hit, so
+    callers that mutate the returned dict (e.g. ranking zeroing a score)
+    never corrupt the cached copy. Memory entries are (payload, expires_at).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        max_bytes: int = 50_000_000,
+        sqlite_path: Optional[str] = None,
+        ttl_seconds: Optional[Dict[str, float]] = None,
+    ):
+        super().__init__(
+            max_entries,
+            max_bytes,
+            extra_stats={"stores": 0, "bytes_served": 0, "bytes_stored": 0},
+        )
+        self.ttl_seconds: Dict[str, float] = dict(ttl_seconds or {"default": 0})
+
+        self._db = open_sqlite_store(sqlite_path, "llm_cache") if sqlite_path else None
+        if self._db is not None:
+            self._db.purge(time.time())
+
+        logger.info(
+            f"LLMResponseCache initialized: max_entries={max_entries}, max_bytes={max_bytes}, "
+            f"sqlite={'on' if self._db else 'off'}, ttl={self.ttl_seconds}"
+        )
+
+    # ------------------------------------------------------------------
+    # Keys and TTLs
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, schema: Any, max_length: int) -> str:
+        """Content address for one LLM request."""
+        material = json.dumps(
+            [provider, model, prompt, schema, max_length],
+            sort_keys=True, ensure_ascii=False, default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, cache_site: Optional[str]) -> float:
+        """TTL in seconds for a call site; unknown sites use 'default'."""
+        default = self.ttl_seconds.get("default", 0)
+        if not cache_site:
+            return default
+        return self.ttl_seconds.get(cache_site, default)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get_or_call(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached response for key, or run fetch() once and cache it.
+
+        Only non-None, JSON-serializable results are cached; ask_llm returns
+        None on timeouts and provider errors and those must not be pinned.
+        """
+        entry = self._memory_get(key)
+        if entry is not None:
+            return self._serve(entry[0], "hits")
+
+        async def lead():
+            if self._db is not None:
+                disk = await asyncio.to_thread(self._db.get, key)
+                if disk is not None and disk[1] > time.time():
+                    self._memory_put(key, disk)
+                    return self._serve(disk[0], "disk_hits"), disk[0]
+
+            self._count("misses")
+            result = await fetch()
+            if result is None:
+                return None, None
+
+            try:
+                payload = json.dumps(result, ensure_ascii=False)
+            except (TypeError, ValueError):
+                logger.debug("LLM response is not JSON-serializable; not caching")
+                return result, RETRY
+
+            expires_at = time.time() + ttl
+            self._memory_put(key, (payload, expires_at))
+            with self._lock:
+                self._stats["stores"] += 1
+                self._stats["bytes_stored"] += len(payload)
+            if self._db is not None:
+                await asyncio.to_thread(self._db.put, key, payload, expires_at)
+            return result, payload
+
+        value, role = await self._coalesce(key, lead)
+        if role == "retry":
+            return await fetch()
+        if role == "coalesced":
+            return json.loads(value) if value is not None else None
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/bytes counters plus current memory-tier size."""
+        stats = self._base_stats()
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers."""
+        self._clear_memory()
+        if self._db is not None:
+            self._db.clear()
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _expired(self, entry: tuple, now: float) -> bool:
+        return entry[1] <= now
+
+    def _entry_size(self, entry: tuple) -> int:
+        return len(entry[0])
+
+    def _serve(self, payload: str, counter: str) -> Any:
+        with self._lock:
+            self._stats[counter] += 1
+            self._stats["bytes_served"] += len(payload)
+        return json.loads(payload)
+
+
+# Global cache instance
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the global LLM response cache, or None if disabled in config."""
+    global _llm_cache
+    if _llm_cache is None:
+        from core.config import CONFIG
+
+        params = getattr(CONFIG, "llm_cache_params", None) or {}
+        if not params.get("enabled", False):
+            return None
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache(
+                    max_entries=params.get("max_entries", 5000),
+                    max_bytes=params.get("max_bytes", 50_000_000),
+                    sqlite_path=params.get("sqlite_path") or None,
+                    ttl_seconds=params.get("ttl_seconds"),
+                )
+    return _llm_cache
@@ -31,6 +31,17 @@ from misc.logger.logging_config_helper import get_configured_logger
 logger = get_configured_logger("mmr")
 
 
+def stack_vectors(vectors: List[Any]) -> np.ndarray:
+    """
+    Stack candidate vectors into one (n, d) float32 matrix.
+
+    float32 ndarray rows (views from postgres_client.embedding_rows) are
+    copied as one block without per-element conversion; lists (e.g. from
+    Qdrant) are converted.
+    """
+    return np.stack([np.asarray(v, dtype=np.float32) for v in vectors])
+
+
 class MMRReranker:
     """
     Maximal Marginal Relevance (MMR) re-ranker for diversifying search results.
@@ -191,7 +202,7 @@ class MMRReranker:
             logger.error(f"Error calculating cosine similarity: {e}")
             return 0.0
 
-    def _precompute_similarity_matrix(self, embeddings: List[List[float]]) -> np.ndarray:
+    def _precompute_similarity_matrix(self, embeddings: List[Any]) -> np.ndarray:
         """
         Pre-compute pairwise cosine similarity matrix for all embeddings.
 
@@ -199,15 +210,15 @@ class MMRReranker:
         in the MMR selection loop by computing all pairs once as a matrix operation.
 
         Args:
-            embeddings: List of embedding vectors
+            embeddings: List of embedding vectors (float32 arrays or lists)
 
         Returns:
-            numpy array of shape (n, n) with pairwise cosine similarities
+            float32 numpy array of shape (n, n) with pairwise cosine similarities
         """
         if not embeddings:
             return np.array([])
 
-        matrix = np.array(embeddings)
+        matrix = stack_vectors(embeddings)
         # Normalize rows
         norms = np.linalg.norm(matrix, axis=1, keepdims=True)
         norms = np.where(norms == 0, 1, norms)  # avoid division by zero
@@ -218,6 +229,88 @@ class MMRReranker:
         np.clip(sim_matrix, 0.0, 1.0, out=sim_matrix)
         return sim_matrix
 
+    def _prepare_candidates(self, ranked_results: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the similarity matrix and normalized relevance for MMR candidates.
+
+        Args:
+            ranked_results: Candidates with 'ranking' scores and 'vector' embeddings
+
+        Returns:
+            Tuple of (sim_matrix (n, n), relevance (n,) normalized to [0, 1])
+        """
+        # Pre-compute pairwise cosine similarity matrix for all candidates
+        sim_matrix = self._precompute_similarity_matrix([c['vector'] for c in ranked_results])
+
+        # Normalize ranking scores to [0, 1] for MMR calculation
+        scores = np.array([r['ranking'].get('score', 0) for r in ranked_results], dtype=np.float64)
+        max_score = scores.max()
+        min_score = scores.min()
+        score_range = max_score - min_score if max_score != min_score else 1.0
+        return sim_matrix, (scores - min_score) / score_range
+
+    def _select(self,
+                sim_matrix: np.ndarray,
+                relevance: np.ndarray,
+                lambdas: List[float],
+                top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Greedy MMR selection for one or more λ values at once.
+
+        Each λ keeps a running max-similarity-to-selected vector, so a round
+        is one O(n) update plus an argmax instead of a Python loop over
+        unselected × selected candidates.
+
+        Args:
+            sim_matrix: (n, n) pairwise cosine similarities
+            relevance: (n,) normalized relevance scores
+            lambdas: λ values to select for
+            top_k: Number of results to select
+
+        Returns:
+            Tuple of (indices, mmr_scores), both of shape (len(lambdas), k)
+        """
+        n = len(relevance)
+        k = max(1, min(top_k, n))
+        lam = np.asarray(lambdas, dtype=np.float64)[:, None]
+        rows = np.arange(len(lam))
+
+        indices = np.zeros((len(lam), k), dtype=np.intp)
+        mmr_scores = np.empty((len(lam), k))
+        selected = np.zeros((len(lam), n), dtype=bool)
+        max_similarity = np.zeros((len(lam), n))
+
+        # Select first result (highest relevance score)
+        selected[:, 0] = True
+        mmr_scores[:, 0] = relevance[0]
+
+        for step in range(1, k):
+            # Fold in similarity to the item picked last round (fmax ignores NaN like the scalar max did)
+            np.fmax(max_similarity, sim_matrix[:, indices[:, step - 1]].T, out=max_similarity)
+
+            # MMR formula: lambda * relevance - (1-lambda) * max_similarity
+            mmr = lam * relevance - (1 - lam) * max_similarity
+            mmr[selected] = -np.inf
+
+            best = np.argmax(mmr, axis=1)
+            indices[:, step] = best
+            mmr_scores[:, step] = mmr[rows, best]
+            selected[rows, best] = True
+
+        return indices, mmr_scores
+
+    def _fill_non_vector(self,
+                         ranked_results: List[Dict[str, Any]],
+                         selected_results: List[Dict[str, Any]],
+                         mmr_scores: List[float],
+                         top_k: int) -> None:
+        """Fill remaining slots with non-vector results if needed."""
+        non_vector_results = [r for r in ranked_results if 'vector' not in r or r['vector'] is None]
+        remaining_count = top_k - len(selected_results)
+        if remaining_count > 0 and non_vector_results:
+            selected_results.extend(non_vector_results[:remaining_count])
+            mmr_scores.extend([0.0] * min(remaining_count, len(non_vector_results)))
+
     def rerank(self,
                ranked_results: List[Dict[str, Any]],
                query_vector: Optional[List[float]] = None,
@@ -250,89 +343,26 @@ class MMRReranker:
 
         logger.info(f"Applying MMR to {len(candidates)} results")
 
-        # Pre-compute pairwise cosine similarity matrix for all candidates
-        embeddings = [c['vector'] for c in candidates]
-        sim_matrix = self._precompute_similarity_matrix(embeddings)
+        sim_matrix, relevance = self._prepare_candidates(candidates)
+        indices, scores = self._select(sim_matrix, relevance, [self.lambda_param], top_k)
+        selected_indices_list = indices[0].tolist()
+        selected_results = [candidates[i] for i in selected_indices_list]
+        mmr_scores = scores[0].tolist()
 
-        # Normalize ranking scores to [0, 1] for MMR calculation
-        scores = [r['ranking'].get('score', 0) for r in candidates]
-        max_score = max(scores) if scores else 1.0
-        min_score = min(scores) if scores else 0.0
-        score_range = max_score - min_score if max_score != min_score else 1.0
-
-        # Initialize
-        selected_results = []
-        selected_indices = set()
-        selected_indices_list = []  # ordered list for matrix lookup
-        mmr_scores = []
-
-        # Select first result (highest relevance score)
-        first_idx = 0
-        selected_results.append(candidates[first_idx])
-        selected_indices.add(first_idx)
-        selected_indices_list.append(first_idx)
-
-        # Normalized relevance score for first item
-        normalized_relevance = (candidates[first_idx]['ranking'].get('score', 0) - min_score) / score_range
-        mmr_scores.append(normalized_relevance)
-
-        logger.debug(f"[MMR] Selected 1st: {candidates[first_idx]['name'][:50]} (score={candidates[first_idx]['ranking'].get('score', 0):.1f})")
-
-        # Iteratively select remaining results
-        for iteration in range(1, min(top_k, len(candidates))):
-            best_mmr_score = -float('inf')
-            best_idx = None
-
-            # Evaluate each unselected candidate
-            for idx in range(len(candidates)):
-                if idx in selected_indices:
-                    continue
-
-                # Calculate relevance score (normalized)
-                relevance = (candidates[idx]['ranking'].get('score', 0) - min_score) / score_range
-
-                # Calculate max similarity to already-selected documents using pre-computed matrix
-                max_similarity = 0.0
-                for sel_idx in selected_indices_list:
-                    similarity = float(sim_matrix[idx, sel_idx])
-                    if similarity > max_similarity:
-                        max_similarity = similarity
-
-                # MMR formula: lambda * relevance - (1-lambda) * max_similarity
-                mmr_score = self.lambda_param * relevance - (1 - self.lambda_param) * max_similarity
-
-                if mmr_score > best_mmr_score:
-                    best_mmr_score = mmr_score
-                    best_idx = idx
-
-            if best_idx is not None:
-                selected_results.append(candidates[best_idx])
-                selected_indices.add(best_idx)
-                selected_indices_list.append(best_idx)
-                mmr_scores.append(best_mmr_score)
-
-                logger.debug(f"[MMR] Selected {iteration + 1}th: {candidates[best_idx]['name'][:50]} "
-                           f"(mmr={best_mmr_score:.3f}, score={candidates[best_idx]['ranking'].get('score', 0):.1f})")
+        for position, idx in enumerate(selected_indices_list):
+            logger.debug(f"[MMR] Selected {position + 1}th: {candidates[idx]['name'][:50]} "
+                         f"(mmr={mmr_scores[position]:.3f}, score={candidates[idx]['ranking'].get('score', 0):.1f})")
 
         # Log diversity improvement using pre-computed matrix
         if len(selected_results) >= 2:
-            # Calculate average similarity before MMR (top-k results)
+            # Average pairwise similarity of the original top-k vs the MMR selection
             orig_k = min(top_k, len(candidates))
-            original_similarities = []
-            for i in range(orig_k):
-                for j in range(i + 1, orig_k):
-                    original_similarities.append(float(sim_matrix[i, j]))
-
-            # Calculate average similarity after MMR using selected indices
-            mmr_similarities = []
-            for i_pos in range(len(selected_indices_list)):
-                for j_pos in range(i_pos + 1, len(selected_indices_list)):
-                    idx_i = selected_indices_list[i_pos]
-                    idx_j = selected_indices_list[j_pos]
-                    mmr_similarities.append(float(sim_matrix[idx_i, idx_j]))
-
-            avg_orig_sim = np.mean(original_similarities) if original_similarities else 0.0
-            avg_mmr_sim = np.mean(mmr_similarities) if mmr_similarities else 0.0
+            original_similarities = sim_matrix[:orig_k, :orig_k][np.triu_indices(orig_k, 1)]
+            selected = np.asarray(selected_indices_list)
+            mmr_similarities = sim_matrix[np.ix_(selected, selected)][np.triu_indices(len(selected), 1)]
+
+            avg_orig_sim = np.mean(original_similarities.astype(np.float64)) if original_similarities.size else 0.0
+            avg_mmr_sim = np.mean(mmr_similarities.astype(np.float64)) if mmr_similarities.size else 0.0
             diversity_reduction = avg_orig_sim - avg_mmr_sim
 
             logger.info(f"[MMR] Diversity improvement: avg similarity {avg_orig_sim:.3f} → {avg_mmr_sim:.3f} "
@@ -341,11 +371,44 @@ class MMRReranker:
             # Log diversity metrics to algo/mmr_metrics.log
             self._log_diversity_metrics(avg_orig_sim, avg_mmr_sim, diversity_reduction)
 
-        # Fill remaining slots with non-vector results if needed
-        non_vector_results = [r for r in ranked_results if 'vector' not in r or r['vector'] is None]
-        remaining_count = top_k - len(selected_results)
-        if remaining_count > 0 and non_vector_results:
-            selected_results.extend(non_vector_results[:remaining_count])
-            mmr_scores.extend([0.0] * min(remaining_count, len(non_vector_results)))
-
+        self._fill_non_vector(ranked_results, selected_results, mmr_scores, top_k)
         return selected_results, mmr_scores
+
+    def rerank_batch(self,
+                     ranked_results: List[Dict[str, Any]],
+                     lambdas: List[float],
+                     top_k: int = 10) -> List[Tuple[List[Dict[str, Any]], List[float]]]:
+        """
+        Apply MMR re-ranking for several λ values in one pass.
+
+        The similarity matrix is built once and all λ selections advance
+        together, so comparing intent λ settings or tuning λ offline costs
+        little more than a single rerank(). Each entry equals what rerank()
+        returns for that λ; diversity metrics are not written to
+        algo/mmr_metrics.log.
+
+        Args:
+            ranked_results: List of ranked documents with 'ranking' scores and 'vector' embeddings
+            lambdas: λ values to evaluate
+            top_k: Number of results to return per λ
+
+        Returns:
+            List of (reranked_results, mmr_scores), one per λ in input order
+        """
+        if not lambdas:
+            return []
+
+        candidates = [r for r in ranked_results if 'vector' in r and r['vector'] is not None]
+        if len(candidates) <= 3:
+            fallback = (ranked_results[:top_k], [0.0] * min(top_k, len(ranked_results)))
+            return [(list(fallback[0]), list(fallback[1])) for _ in lambdas]
+
+        sim_matrix, relevance = self._prepare_candidates(candidates)
+        indices, scores = self._select(sim_matrix, relevance, lambdas, top_k)
+
+        batch = []
+        for row_indices, row_scores in zip(indices.tolist(), scores.tolist()):
+            selected_results = [candidates[i] for i in row_indices]
+            self._fill_non_vector(ranked_results, selected_results, row_scores, top_k)
+            batch.append((selected_results, row_scores))
+        return batch
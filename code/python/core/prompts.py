@@ -416,7 +416,7 @@ class PromptRunner:
     def __init__(self, handler):
         self.handler = handler
 
-    async def run_prompt(self, prompt_name, level="low", verbose=False, timeout=8, max_length=512):
+    async def run_prompt(self, prompt_name, level="low", verbose=False, timeout=8, max_length=512, cache_site="default"):
         prompt_runner_logger.info(f"Running prompt: {prompt_name} with level={level}, timeout={timeout}s, max_length={max_length}")
 
         try:
@@ -434,7 +434,7 @@ class PromptRunner:
             prompt_runner_logger.debug(f"Filled prompt length: {len(prompt)} chars")
 
             prompt_runner_logger.info(f"Calling LLM with level={level}, max_length={max_length}")
-            response = await ask_llm(prompt, ans_struc, level=level, timeout=timeout, query_params=self.handler.query_params, max_length=max_length)
+            response = await ask_llm(prompt, ans_struc, level=level, timeout=timeout, query_params=self.handler.query_params, max_length=max_length, cache_site=cache_site)
             
             if response is None:
                 prompt_runner_logger.warning(f"LLM returned None for prompt '{prompt_name}'")
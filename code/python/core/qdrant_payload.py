@@ -0,0 +1,164 @@
+"""
+qdrant_payload.py - Indexed Qdrant payload fields for server-side filtering
+
+The indexing path stores these top-level payload fields next to schema_json
+so the retriever can filter with native Qdrant conditions instead of parsing
+every point's schema_json after the search:
+
+    date_published  int      epoch seconds of the published date (integer index, Range filters)
+    author          keyword  first author name, stripped and lowercased
+    site            keyword  source identifier (already written by every uploader)
+
+Both sides use the helpers here so stored values and filter values are
+normalized the same way.
+
+Site catalog: each collection has a companion "<collection>__site_catalog"
+collection with one point per site (site, doc_count, first/last
+date_published), updated by the upload paths so get_sites reads O(#sites)
+points instead of scrolling the whole collection.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DATE_FIELD = "date_published"
+AUTHOR_FIELD = "author"
+SOURCE_FIELD = "site"
+
+# field name -> qdrant PayloadSchemaType value
+FILTER_PAYLOAD_INDEXES = {
+    DATE_FIELD: "integer",
+    AUTHOR_FIELD: "keyword",
+    SOURCE_FIELD: "keyword",
+}
+
+SITE_CATALOG_SUFFIX = "__site_catalog"
+
+_DAY_SECONDS = 86400
+
+
+def date_to_epoch(value: Any) -> Optional[int]:
+    """
+    Parse an ISO 8601 date or datetime to epoch seconds.
+
+    The wall-clock time is kept as written and any UTC offset is dropped, so
+    day boundaries follow the article's own calendar date (the same result
+    as comparing YYYY-MM-DD prefixes). Returns None for empty or
+    unparseable input.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    text = value.strip()
+    if text.endswith("Z"):
+        text = text[:-1]
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            parsed = datetime.strptime(text[:10], "%Y-%m-%d")
+        except ValueError:
+            return None
+    return int(parsed.replace(tzinfo=timezone.utc).timestamp())
+
+
+def normalize_author(author: Any) -> Optional[str]:
+    """First author name from a schema.org author value (str, dict or list), lowercased."""
+    if isinstance(author, list):
+        author = author[0] if author else None
+    if isinstance(author, dict):
+        author = author.get("name")
+    if not author:
+        return None
+    name = str(author).strip().lower()
+    return name or None
+
+
+def filter_fields_from_schema(schema: Any) -> Dict[str, Any]:
+    """Normalized date_published/author payload fields from a schema.org dict or JSON string."""
+    if isinstance(schema, str):
+        try:
+            schema = json.loads(schema)
+        except (json.JSONDecodeError, TypeError):
+            schema = {}
+    if not isinstance(schema, dict):
+        schema = {}
+    date_str = schema.get("datePublished") or schema.get("dateCreated") or schema.get("publishDate")
+    return {
+        DATE_FIELD: date_to_epoch(date_str),
+        AUTHOR_FIELD: normalize_author(schema.get("author")),
+    }
+
+
+def split_native_filters(filters: Optional[List[Dict[str, Any]]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Split generic retriever filters into native conditions and post-filters.
+
+    Returns ({"date_gte": epoch, "date_lte": epoch, "author_eq": name}, remaining).
+    A date-only "lte" bound covers the whole day. Author "contains" has no
+    keyword-index equivalent and stays a post-filter, as do unknown fields.
+    """
+    native: Dict[str, Any] = {}
+    remaining: List[Dict[str, Any]] = []
+    for f in filters or []:
+        field, op, value = f.get("field"), f.get("operator"), f.get("value")
+        if field == "datePublished" and op in ("gte", "lte"):
+            epoch = date_to_epoch(value)
+            if epoch is None:
+                remaining.append(f)
+                continue
+            if op == "gte":
+                native["date_gte"] = max(epoch, native.get("date_gte", epoch))
+            else:
+                if len(str(value).strip()) <= 10:
+                    epoch += _DAY_SECONDS - 1
+                native["date_lte"] = min(epoch, native.get("date_lte", epoch))
+        elif field == "author" and op == "eq" and normalize_author(value):
+            native["author_eq"] = normalize_author(value)
+        else:
+            remaining.append(f)
+    return native, remaining
+
+
+def site_catalog_collection(collection_name: str) -> str:
+    """Name of the companion site catalog collection."""
+    return collection_name + SITE_CATALOG_SUFFIX
+
+
+def site_catalog_point_id(site: str) -> str:
+    """Deterministic catalog point id for a site."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "nlweb.site:" + site))
+
+
+def summarize_sites(payloads: Iterable[Dict[str, Any]]) -> Dict[str, Tuple[int, Optional[int], Optional[int]]]:
+    """Per-site (point count, min date_published, max date_published) over payload dicts."""
+    summary: Dict[str, Tuple[int, Optional[int], Optional[int]]] = {}
+    for payload in payloads:
+        site = (payload or {}).get(SOURCE_FIELD)
+        if not site:
+            continue
+        date = payload.get(DATE_FIELD)
+        count, first, last = summary.get(site, (0, None, None))
+        if date is not None:
+            first = date if first is None else min(first, date)
+            last = date if last is None else max(last, date)
+        summary[site] = (count + 1, first, last)
+    return summary
+
+
+def merge_site_entry(existing: Optional[Dict[str, Any]], site: str, doc_count: int,
+                     first: Optional[int], last: Optional[int]) -> Dict[str, Any]:
+    """
+    Catalog payload for a site: doc_count as given (an exact recount), the
+    date range widened by the existing entry's range.
+    """
+    existing = existing or {}
+    firsts = [d for d in (existing.get("first_published"), first) if d is not None]
+    lasts = [d for d in (existing.get("last_published"), last) if d is not None]
+    return {
+        SOURCE_FIELD: site,
+        "doc_count": doc_count,
+        "first_published": min(firsts) if firsts else None,
+        "last_published": max(lasts) if lasts else None,
+    }
@@ -44,7 +44,7 @@ class DetectItemType(PromptRunner):
             await self.handler.state.precheck_step_done(self.STEP_NAME)
             return {"item_type": "Statistics"}
             
-        response = await self.run_prompt(self.ITEM_TYPE_PROMPT_NAME, level="low")
+        response = await self.run_prompt(self.ITEM_TYPE_PROMPT_NAME, level="low", cache_site="query_analysis")
         if (response):
             logger.debug(f"DetectItemType response: {response}")
             self.handler.item_type = response['item_type']
@@ -66,7 +66,7 @@ class DetectMultiItemTypeQuery(PromptRunner):
             await self.handler.state.precheck_step_done(self.STEP_NAME)
             logger.info("Analyze query is disabled in config, skipping DetectMultiItemTypeQuery")
             return
-        response = await self.run_prompt(self.MULTI_ITEM_TYPE_QUERY_PROMPT_NAME, level="low")
+        response = await self.run_prompt(self.MULTI_ITEM_TYPE_QUERY_PROMPT_NAME, level="low", cache_site="query_analysis")
         logger.debug(f"DetectMultiItemTypeQuery response: {response}")
         await self.handler.state.precheck_step_done(self.STEP_NAME)
         return response
@@ -84,7 +84,7 @@ class DetectQueryType(PromptRunner):
             await self.handler.state.precheck_step_done(self.STEP_NAME)
             logger.info("Analyze query is disabled in config, skipping DetectQueryType")
             return
-        response = await self.run_prompt(self.DETECT_QUERY_TYPE_PROMPT_NAME, level="low")
+        response = await self.run_prompt(self.DETECT_QUERY_TYPE_PROMPT_NAME, level="low", cache_site="query_analysis")
         logger.debug(f"DetectQueryType response: {response}")
         await self.handler.state.precheck_step_done(self.STEP_NAME)
         return response
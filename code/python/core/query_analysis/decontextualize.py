@@ -60,7 +60,7 @@ class PrevQueryDecontextualizer(NoOpDecontextualizer):
             return
         
         response = await self.run_prompt(self.DECONTEXTUALIZE_QUERY_PROMPT_NAME, 
-                                         level="high", verbose=True)
+                                         level="high", verbose=True, cache_site="query_analysis")
         logger.info(f"response: {response}")
         if not response:
             logger.info("No response from decontextualizer")
@@ -124,7 +124,7 @@ class ContextUrlDecontextualizer(PrevQueryDecontextualizer):
             await self.handler.state.precheck_step_done(self.STEP_NAME)
             return
         
-        response = await self.run_prompt(self.DECONTEXTUALIZE_QUERY_PROMPT_NAME, level="high", verbose=False)
+        response = await self.run_prompt(self.DECONTEXTUALIZE_QUERY_PROMPT_NAME, level="high", verbose=False, cache_site="query_analysis")
         if not response:
             self.handler.requires_decontextualization = False
             await self.handler.state.precheck_step_done(self.STEP_NAME)
@@ -139,7 +139,7 @@ class ContextUrlDecontextualizer(PrevQueryDecontextualizer):
             (url, schema_json, name, site) = item
             self.context_description = json.dumps(trim_json(schema_json))
             self.handler.context_description = self.context_description
-            response = await self.run_prompt(self.DECONTEXTUALIZE_QUERY_PROMPT_NAME, verbose=True)
+            response = await self.run_prompt(self.DECONTEXTUALIZE_QUERY_PROMPT_NAME, verbose=True, cache_site="query_analysis")
             self.handler.requires_decontextualization = True
             self.handler.abort_fast_track_event.set()  # Use event instead of flag
             self.handler.decontextualized_query = response["decontextualized_query"]
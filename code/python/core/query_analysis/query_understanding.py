@@ -108,45 +108,46 @@ class QueryUnderstanding(PromptRunner):
 
     # --- Regex Fast Path ---
 
-    def _regex_time(self, query: str) -> Optional[Dict]:
+    @classmethod
+    def _regex_time(cls, query: str) -> Optional[Dict]:
         """Try to extract time range via regex. Returns dict or None."""
         today = datetime.now()
         today_str = today.strftime('%Y-%m-%d')
 
-        if re.search(self.TIME_PATTERNS['today_zh'], query):
+        if re.search(cls.TIME_PATTERNS['today_zh'], query):
             return {'is_temporal': True, 'start_date': today_str, 'end_date': today_str,
                     'method': 'regex', 'confidence': 1.0}
 
-        if re.search(self.TIME_PATTERNS['yesterday_zh'], query):
+        if re.search(cls.TIME_PATTERNS['yesterday_zh'], query):
             d = (today - timedelta(days=1)).strftime('%Y-%m-%d')
             return {'is_temporal': True, 'start_date': d, 'end_date': d,
                     'method': 'regex', 'confidence': 1.0}
 
-        if re.search(self.TIME_PATTERNS['this_week_zh'], query):
+        if re.search(cls.TIME_PATTERNS['this_week_zh'], query):
             start = (today - timedelta(days=today.weekday())).strftime('%Y-%m-%d')
             return {'is_temporal': True, 'start_date': start, 'end_date': today_str,
                     'method': 'regex', 'confidence': 0.9, 'relative_days': 7}
 
-        if re.search(self.TIME_PATTERNS['this_month_zh'], query):
+        if re.search(cls.TIME_PATTERNS['this_month_zh'], query):
             start = today.replace(day=1).strftime('%Y-%m-%d')
             return {'is_temporal': True, 'start_date': start, 'end_date': today_str,
                     'method': 'regex', 'confidence': 0.9, 'relative_days': 30}
 
-        m = re.search(self.TIME_PATTERNS['recent_n_days'], query)
+        m = re.search(cls.TIME_PATTERNS['recent_n_days'], query)
         if m:
             days = int(m.group(1))
             start = (today - timedelta(days=days)).strftime('%Y-%m-%d')
             return {'is_temporal': True, 'start_date': start, 'end_date': today_str,
                     'method': 'regex', 'confidence': 0.95, 'relative_days': days}
 
-        m = re.search(self.TIME_PATTERNS['recent_n_months'], query)
+        m = re.search(cls.TIME_PATTERNS['recent_n_months'], query)
         if m:
             months = int(m.group(1))
             start = (today - timedelta(days=months * 30)).strftime('%Y-%m-%d')
             return {'is_temporal': True, 'start_date': start, 'end_date': today_str,
                     'method': 'regex', 'confidence': 0.9, 'relative_days': months * 30}
 
-        m = re.search(self.TIME_PATTERNS['yyyy_mm'], query)
+        m = re.search(cls.TIME_PATTERNS['yyyy_mm'], query)
         if m:
             year, month = int(m.group(1)), int(m.group(2))
             if 1 <= month <= 12 and 2000 <= year <= today.year + 1:
@@ -156,23 +157,37 @@ class QueryUnderstanding(PromptRunner):
                         'method': 'regex', 'confidence': 1.0}
 
         # X月中/初/底 — year ambiguous, let LLM handle
-        if re.search(self.TIME_PATTERNS['month_period_zh'], query):
+        if re.search(cls.TIME_PATTERNS['month_period_zh'], query):
             return None
 
         return None
 
-    def _regex_author(self, query: str) -> Optional[Dict]:
+    @classmethod
+    def _regex_author(cls, query: str) -> Optional[Dict]:
         """Try to extract author name via regex. Returns dict or None."""
-        for pattern_name, pattern in self.AUTHOR_PATTERNS.items():
+        for pattern_name, pattern in cls.AUTHOR_PATTERNS.items():
             m = re.search(pattern, query)
             if m:
                 name = m.group(1).strip()
-                if name in self.AUTHOR_STOPWORDS or len(name) < 2:
+                if name in cls.AUTHOR_STOPWORDS or len(name) < 2:
                     continue
                 return {'is_author_search': True, 'author_name': name,
                         'pattern_matched': pattern_name}
         return None
 
+    @classmethod
+    def regex_hints(cls, query: str) -> Dict[str, Dict]:
+        """
+        Temporal range and author search from the regex fast path alone, in
+        the handler attribute format. Regex results win over the LLM in
+        _set_handler_attributes, so these predict the final values whenever
+        they match.
+        """
+        return {
+            'temporal_range': cls._regex_time(query) or {'is_temporal': False},
+            'author_search': cls._regex_author(query) or {'is_author_search': False},
+        }
+
     # --- Hint Building ---
 
     def _build_hints(self, regex_time: Optional[Dict], regex_author: Optional[Dict]) -> str:
@@ -69,6 +69,23 @@ class QueryLogger:
     4. User interactions (clicks, dwell time, scroll depth)
     """
 
+    # Batch writer tuning
+    QUEUE_MAXSIZE = 10000     # Rows buffered before new rows are dropped
+    BATCH_MAX_ROWS = 500      # Max rows per write transaction
+    FLUSH_INTERVAL = 0.2      # Seconds to keep filling a batch after the first row
+
+    # Parents first: every child table references queries(query_id)
+    TABLE_WRITE_ORDER = (
+        "queries",
+        "retrieved_documents",
+        "ranking_scores",
+        "feature_vectors",
+        "user_interactions",
+        "user_feedback",
+        "tier_6_enrichment",
+        "guardrail_events",
+    )
+
     def __init__(self, db_path: str = None):
         """
         Initialize the query logger.
@@ -81,12 +98,25 @@ class QueryLogger:
         # Always use the shared singleton instance to avoid multiple connection pools
         self.db = AnalyticsDB.get_instance()
 
-        # Async queue for non-blocking logging
-        self.log_queue = Queue()
+        # Bounded queue for non-blocking logging, drained in batches by the worker
+        self.log_queue = Queue(maxsize=self.QUEUE_MAXSIZE)
         self.is_running = False
         self.worker_thread = None
+        self._worker_conn = None
+        self._stats_lock = threading.Lock()
+        self._writer_stats = {
+            "batches": 0,
+            "rows_written": 0,
+            "rows_failed": 0,
+            "dropped": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
 
-        # Lazy init flag: _init_database() is deferred to first _write_to_db()
+        # Lazy init flag: _init_database() is deferred to the first _write_batch()
         # to avoid blocking the event loop with a sync connect() at startup.
         self._db_initialized = False
         self._db_init_lock = threading.Lock()
@@ -322,81 +352,204 @@ class QueryLogger:
         self.worker_thread.start()
         logger.info("Logging worker thread started")
 
+    def _enqueue(self, table_name: str, data: Dict[str, Any]) -> None:
+        """
+        Queue a row insert for the batch writer without blocking the caller.
+
+        When the queue is full the row is dropped (analytics are best-effort;
+        request latency is not) and counted in writer stats.
+        """
+        self._put_entry({"table": table_name, "data": data})
+
+    def _enqueue_update(self, table_name: str, data: Dict[str, Any], where: Dict[str, Any]) -> None:
+        """
+        Queue an UPDATE of table_name SET data WHERE where (all equalities).
+
+        Updates go through the same queue as inserts, so they are applied
+        after the rows they target have been written.
+        """
+        self._put_entry({"table": table_name, "data": data, "where": where})
+
+    def _put_entry(self, entry: Dict[str, Any]) -> None:
+        try:
+            self.log_queue.put_nowait(entry)
+        except queue.Full:
+            with self._stats_lock:
+                self._writer_stats["dropped"] += 1
+                dropped = self._writer_stats["dropped"]
+            # Log the first drop and then every 1000th to avoid log floods
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(
+                    f"Analytics queue full ({self.log_queue.maxsize}); dropped {dropped} rows so far"
+                )
+
     def _worker_loop(self):
-        """Background worker that processes log queue."""
-        while self.is_running:
+        """
+        Background worker that drains the log queue in micro-batches.
+
+        Blocks for the first entry, then keeps pulling until BATCH_MAX_ROWS
+        entries or FLUSH_INTERVAL seconds, and writes the batch in one
+        transaction. Keeps running after shutdown() until the queue is empty.
+        """
+        while self.is_running or not self.log_queue.empty():
             try:
-                log_entry = self.log_queue.get(timeout=1.0)
-                table_name = log_entry.get("table")
-                data = log_entry.get("data")
-                if table_name and data:
-                    self._write_to_db(table_name, data)
-                self.log_queue.task_done()
+                first = self.log_queue.get(timeout=1.0)
             except queue.Empty:
                 continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_MAX_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
             except Exception as e:
                 logger.error(f"Error in logging worker: {e}")
+            finally:
+                for _ in batch:
+                    self.log_queue.task_done()
 
-    def _write_to_db(self, table_name: str, data: Dict[str, Any]):
-        """Write data to database (synchronous, called by worker thread)."""
-        # Lazy init: ensure schema exists before first write (avoids blocking event loop at startup)
-        self._ensure_initialized()
+        self._close_worker_conn()
 
-        # Validate table name against whitelist
-        if table_name not in ALLOWED_TABLES:
-            logger.error(f"Rejected write to invalid table name: {table_name}")
-            return
+    @classmethod
+    def _group_batch(cls, batch: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Group queued entries into (table, columns, where_columns, rows) for executemany.
 
-        # Validate column names against whitelist
-        invalid_cols = set(data.keys()) - ALLOWED_COLUMNS
-        if invalid_cols:
-            logger.error(f"Rejected write with invalid column names: {invalid_cols}")
-            return
+        where_columns is empty for inserts. Insert groups are ordered
+        parents-first (TABLE_WRITE_ORDER) so FK children never precede a
+        queries row written in the same transaction; update groups follow all
+        inserts so they see the rows they target. Within a group, queue order
+        is preserved.
+        """
+        inserts: Dict[tuple, List[list]] = {}
+        updates: Dict[tuple, List[list]] = {}
+        for entry in batch:
+            table_name = entry.get("table")
+            data = entry.get("data")
+            where = entry.get("where") or {}
+            if not table_name or not data:
+                continue
+            if table_name not in ALLOWED_TABLES:
+                logger.error(f"Rejected write to invalid table name: {table_name}")
+                continue
+            invalid_cols = (set(data.keys()) | set(where.keys())) - ALLOWED_COLUMNS
+            if invalid_cols:
+                logger.error(f"Rejected write with invalid column names: {invalid_cols}")
+                continue
+            key = (table_name, tuple(data.keys()), tuple(where.keys()))
+            target = updates if where else inserts
+            target.setdefault(key, []).append(list(data.values()) + list(where.values()))
+
+        order = {name: i for i, name in enumerate(cls.TABLE_WRITE_ORDER)}
+        insert_groups = sorted(
+            ((table, columns, where_columns, rows)
+             for (table, columns, where_columns), rows in inserts.items()),
+            key=lambda g: order.get(g[0], len(order)),
+        )
+        update_groups = [
+            (table, columns, where_columns, rows)
+            for (table, columns, where_columns), rows in updates.items()
+        ]
+        return insert_groups + update_groups
 
-        max_retries = 5  # Increased from 3
-        # Exponential backoff: 0.5s, 1s, 2s, 4s, 8s
-        retry_delays = [0.5, 1.0, 2.0, 4.0, 8.0]
+    def _get_worker_conn(self):
+        """Persistent connection owned by the worker thread (reopened on failure)."""
+        if self._worker_conn is None:
+            self._worker_conn = self.db.connect()
+        return self._worker_conn
 
-        for attempt in range(max_retries):
-            conn = None
+    def _close_worker_conn(self):
+        if self._worker_conn is not None:
             try:
-                conn = self.db.connect()
-                cursor = conn.cursor()
+                self._worker_conn.close()
+            except Exception:
+                pass
+            self._worker_conn = None
 
-                # Build INSERT statement dynamically
-                columns = ", ".join(data.keys())
-                # Use appropriate placeholder for database type
-                placeholder = "%s" if self.db.db_type == 'postgres' else "?"
-                placeholders = ", ".join([placeholder for _ in data])
-                query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a drained batch in one transaction; on failure, retry per group."""
+        self._ensure_initialized()
+        groups = self._group_batch(batch)
+        if not groups:
+            return
 
-                cursor.execute(query, list(data.values()))
-                conn.commit()
-                return  # Success, exit retry loop
+        placeholder = "%s" if self.db.db_type == 'postgres' else "?"
+        start = time.perf_counter()
+        failed_rows = 0
 
-            except Exception as e:
-                error_msg = str(e)
-                # Check if it's a foreign key error
-                if "foreign key constraint" in error_msg.lower() and attempt < max_retries - 1:
-                    # Wait and retry with exponential backoff
-                    delay = retry_delays[attempt]
-                    time.sleep(delay)
-                    logger.warning(
-                        f"Foreign key constraint error on {table_name}, "
-                        f"retrying in {delay}s (attempt {attempt + 2}/{max_retries})"
-                    )
-                else:
-                    # Log error but don't crash
-                    logger.error(
-                        f"Failed to write to {table_name} after {attempt + 1} attempts: {e}"
-                    )
-                    return
-            finally:
-                if conn is not None:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
+        def _execute(cursor, table_name, columns, where_columns, rows):
+            if where_columns:
+                query = (
+                    f"UPDATE {table_name} SET "
+                    f"{', '.join(f'{c} = {placeholder}' for c in columns)} WHERE "
+                    f"{' AND '.join(f'{c} = {placeholder}' for c in where_columns)}"
+                )
+            else:
+                query = (
+                    f"INSERT INTO {table_name} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join([placeholder] * len(columns))})"
+                )
+            cursor.executemany(query, rows)
+
+        try:
+            conn = self._get_worker_conn()
+            cursor = conn.cursor()
+            for group in groups:
+                _execute(cursor, *group)
+            conn.commit()
+        except Exception as e:
+            logger.warning(f"Batch write of {len(batch)} rows failed, retrying per table: {e}")
+            self._rollback_or_reset()
+            # Isolate the failing group so one bad row set doesn't drop the rest
+            for table_name, columns, where_columns, rows in groups:
+                try:
+                    conn = self._get_worker_conn()
+                    _execute(conn.cursor(), table_name, columns, where_columns, rows)
+                    conn.commit()
+                except Exception as group_error:
+                    failed_rows += len(rows)
+                    logger.error(f"Failed to write {len(rows)} rows to {table_name}: {group_error}")
+                    self._rollback_or_reset()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._stats_lock:
+            stats = self._writer_stats
+            stats["batches"] += 1
+            stats["rows_written"] += len(batch) - failed_rows
+            stats["rows_failed"] += failed_rows
+            stats["last_batch_size"] = len(batch)
+            stats["max_batch_size"] = max(stats["max_batch_size"], len(batch))
+            stats["last_flush_ms"] = elapsed_ms
+            stats["max_flush_ms"] = max(stats["max_flush_ms"], elapsed_ms)
+            stats["total_flush_ms"] += elapsed_ms
+
+    def _rollback_or_reset(self):
+        """Roll back the worker connection, or drop it if it's unusable."""
+        if self._worker_conn is None:
+            return
+        try:
+            self._worker_conn.rollback()
+        except Exception:
+            self._close_worker_conn()
+
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Queue depth, batch size and flush latency metrics for the batch writer."""
+        with self._stats_lock:
+            stats = dict(self._writer_stats)
+        batches = stats["batches"]
+        stats["queue_depth"] = self.log_queue.qsize()
+        stats["queue_maxsize"] = self.log_queue.maxsize
+        stats["avg_batch_size"] = (stats["rows_written"] + stats["rows_failed"]) / batches if batches else 0.0
+        stats["avg_flush_ms"] = stats.pop("total_flush_ms") / batches if batches else 0.0
+        return stats
 
     # Regex pattern for detecting temporal indicators in Chinese queries
     # Compiled once at class level for efficiency
@@ -423,7 +576,7 @@ class QueryLogger:
         embedding_model: str = "",
     ) -> None:
         """
-        Log the start of a query (SYNCHRONOUS - ensures queries table is written first).
+        Log the start of a query.
 
         Args:
             query_id: Unique identifier for this query
@@ -466,9 +619,9 @@ class QueryLogger:
             "schema_version": 2,
         }
 
-        # Write synchronously to ensure queries table has the record BEFORE
-        # any child tables (retrieved_documents, ranking_scores, etc.) are written
-        self._write_to_db("queries", data)
+        # Queued like the child rows; the batch writer writes queries rows
+        # before any child table in the same transaction (TABLE_WRITE_ORDER)
+        self._enqueue("queries", data)
 
     def log_query_complete(
         self,
@@ -500,52 +653,20 @@ class QueryLogger:
             error_occurred: Whether an error occurred
             error_message: Error message if any
         """
-        conn = None
-        try:
-            conn = self.db.connect()
-            cursor = conn.cursor()
+        data = {
+            "latency_total_ms": latency_total_ms,
+            "latency_retrieval_ms": latency_retrieval_ms,
+            "latency_ranking_ms": latency_ranking_ms,
+            "latency_generation_ms": latency_generation_ms,
+            "num_results_retrieved": num_results_retrieved,
+            "num_results_ranked": num_results_ranked,
+            "num_results_returned": num_results_returned,
+            "cost_usd": cost_usd,
+            "error_occurred": 1 if error_occurred else 0,
+            "error_message": error_message,
+        }
 
-            # Use appropriate placeholder for database type
-            placeholder = "%s" if self.db.db_type == 'postgres' else "?"
-
-            query_sql = f"""
-                UPDATE queries SET
-                    latency_total_ms = {placeholder},
-                    latency_retrieval_ms = {placeholder},
-                    latency_ranking_ms = {placeholder},
-                    latency_generation_ms = {placeholder},
-                    num_results_retrieved = {placeholder},
-                    num_results_ranked = {placeholder},
-                    num_results_returned = {placeholder},
-                    cost_usd = {placeholder},
-                    error_occurred = {placeholder},
-                    error_message = {placeholder}
-                WHERE query_id = {placeholder}
-            """
-
-            cursor.execute(query_sql, (
-                latency_total_ms,
-                latency_retrieval_ms,
-                latency_ranking_ms,
-                latency_generation_ms,
-                num_results_retrieved,
-                num_results_ranked,
-                num_results_returned,
-                cost_usd,
-                1 if error_occurred else 0,
-                error_message,
-                query_id
-            ))
-
-            conn.commit()
-        except Exception as e:
-            logger.error(f"Error updating query completion: {e}")
-        finally:
-            if conn is not None:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
+        self._enqueue_update("queries", data, {"query_id": query_id})
 
     def log_retrieved_document(
         self,
@@ -618,7 +739,7 @@ class QueryLogger:
         if recency_days is not None:
             data["recency_days"] = recency_days
 
-        self.log_queue.put({"table": "retrieved_documents", "data": data})
+        self._enqueue("retrieved_documents", data)
 
     def log_ranking_score(
         self,
@@ -667,7 +788,7 @@ class QueryLogger:
             "ranking_method": ranking_method,
         }
 
-        self.log_queue.put({"table": "ranking_scores", "data": data})
+        self._enqueue("ranking_scores", data)
 
     def update_ranking_positions(
         self,
@@ -681,29 +802,13 @@ class QueryLogger:
             query_id: Query identifier
             positions: List of (doc_url, position) tuples in final sorted order
         """
-        conn = None
-        try:
-            conn = self.db.connect()
-            cursor = conn.cursor()
-            placeholder = "%s" if self.db.db_type == 'postgres' else "?"
-
-            for doc_url, position in positions:
-                cursor.execute(
-                    f"UPDATE ranking_scores SET ranking_position = {placeholder} "
-                    f"WHERE query_id = {placeholder} AND doc_url = {placeholder} AND ranking_method = 'llm'",
-                    (position, query_id, doc_url)
-                )
-
-            conn.commit()
-            logger.debug(f"Updated ranking_position for {len(positions)} documents in query {query_id}")
-        except Exception as e:
-            logger.error(f"Failed to update ranking positions for query {query_id}: {e}")
-        finally:
-            if conn is not None:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
+        # Queued behind the ranking_scores inserts they update
+        for doc_url, position in positions:
+            self._enqueue_update(
+                "ranking_scores",
+                {"ranking_position": position},
+                {"query_id": query_id, "doc_url": doc_url, "ranking_method": "llm"},
+            )
 
     def log_mmr_score(
         self,
@@ -734,7 +839,7 @@ class QueryLogger:
             "final_ranking_score": mmr_score,
         }
 
-        self.log_queue.put({"table": "ranking_scores", "data": data})
+        self._enqueue("ranking_scores", data)
 
     def log_xgboost_scores(
         self,
@@ -773,7 +878,7 @@ class QueryLogger:
             "final_ranking_score": 0,
         }
 
-        self.log_queue.put({"table": "ranking_scores", "data": data})
+        self._enqueue("ranking_scores", data)
 
     def log_user_interaction(
         self,
@@ -823,7 +928,7 @@ class QueryLogger:
         if org_id is not None:
             data["org_id"] = org_id
 
-        self.log_queue.put({"table": "user_interactions", "data": data})
+        self._enqueue("user_interactions", data)
 
     def log_tier_6_enrichment(
         self,
@@ -859,7 +964,7 @@ class QueryLogger:
             "schema_version": 2
         }
 
-        self.log_queue.put({"table": "tier_6_enrichment", "data": data})
+        self._enqueue("tier_6_enrichment", data)
 
     async def get_query_stats(self, days: int = 7) -> Dict[str, Any]:
         """
@@ -969,7 +1074,7 @@ class QueryLogger:
             data["user_id"] = user_id
         if org_id is not None:
             data["org_id"] = org_id
-        self.log_queue.put({"table": "user_feedback", "data": data})
+        self._enqueue("user_feedback", data)
         logger.info(f"Queued feedback: rating={rating}, query='{(query or '')[:50]}'")
 
     def shutdown(self):
@@ -112,7 +112,20 @@ class Ranking:
      "description" : "項目簡短描述"}]
 
     RANKING_PROMPT_NAME = "RankingPrompt"
-     
+
+    # Default prompt for batched ranking: N items in one call, scored by id.
+    # {item.description} holds all items, so fill_prompt's boundary wrapping still applies.
+    BATCH_RANKING_PROMPT = ["""針對以下多則 {site.itemType}，分別評估每一則與使用者提問的相關程度，各給予 0-100 分。
+若分數高於 50，撰寫一段與使用者提問相關的簡短描述，不提及使用者問題本身。
+每則項目以 [id] 標示。每則項目回傳一筆結果，並保留相同的 id。
+使用者提問：{request.query}
+項目列表：{item.description}""",
+    {"results": [{"id": "項目 id（整數）",
+                  "score": "0-100 整數",
+                  "description": "項目簡短描述"}]}]
+
+    BATCH_RANKING_PROMPT_NAME = "BatchRankingPrompt"
+
     def get_ranking_prompt(self):
         site = self.handler.site
         item_type = self.handler.item_type
@@ -125,6 +138,12 @@ class Ranking:
         else:
             logger.debug(f"Using custom ranking prompt for site: {site}, item_type: {item_type}")
             return prompt_str, ans_struc
+
+    def get_batch_ranking_prompt(self):
+        prompt_str, ans_struc = find_prompt(self.handler.site, self.handler.item_type, self.BATCH_RANKING_PROMPT_NAME)
+        if prompt_str is None:
+            return self.BATCH_RANKING_PROMPT[0], self.BATCH_RANKING_PROMPT[1]
+        return prompt_str, ans_struc
         
     def __init__(self, handler, items, ranking_type=FAST_TRACK, level="low"):
         ll = len(items)
@@ -145,6 +164,26 @@ class Ranking:
         self.ranking_type = ranking_type
         self._sent_title_keys = set()  # Track (name, site) to prevent sending duplicates
 
+        # Batched ranking: pack batch_size items into one LLM call
+        from core.config import CONFIG
+        ranking_params = getattr(CONFIG, 'ranking_params', {}) or {}
+        self.batch_mode = ranking_params.get('batch_mode', False)
+        self.batch_size = max(1, int(ranking_params.get('batch_size', 8)))
+
+    @staticmethod
+    def _unpack_item(item):
+        """Return (url, json_str, name, site, retrieval_scores, vector) for Dict or Tuple items."""
+        # Handle Dict format (new) or Tuple format (legacy)
+        if isinstance(item, dict):
+            return (item.get('url', ''), item.get('schema_json', ''), item.get('title', ''),
+                    item.get('site', ''), item.get('retrieval_scores', {}), item.get('vector'))
+        elif len(item) == 5:
+            url, json_str, name, site, vector = item
+            return url, json_str, name, site, {}, vector  # Legacy format doesn't have retrieval scores
+        else:
+            url, json_str, name, site = item
+            return url, json_str, name, site, {}, None
+
     async def rankItem(self, item):
 
         if (self.ranking_type == Ranking.FAST_TRACK and self.handler.state.should_abort_fast_track()):
@@ -153,84 +192,14 @@ class Ranking:
             return None
         name = "unknown"
         try:
-            # Handle Dict format (new) or Tuple format (legacy)
-            if isinstance(item, dict):
-                url = item.get('url', '')
-                json_str = item.get('schema_json', '')
-                name = item.get('title', '')
-                site = item.get('site', '')
-                retrieval_scores = item.get('retrieval_scores', {})
-                vector = item.get('vector')
-            elif len(item) == 5:
-                url, json_str, name, site, vector = item
-                retrieval_scores = {}  # Legacy format doesn't have retrieval scores
-            else:
-                url, json_str, name, site = item
-                retrieval_scores = {}
-                vector = None
+            url, json_str, name, site, retrieval_scores, vector = self._unpack_item(item)
 
             prompt_str, ans_struc = self.get_ranking_prompt()
             description = trim_json(json_str)
             prompt = fill_prompt(prompt_str, self.handler, {"item.description": description})
-            ranking = await ask_llm(prompt, ans_struc, level=self.level, query_params=self.handler.query_params)
-
-            # Handle both string and dictionary inputs for json_str
-            schema_object = json_str if isinstance(json_str, dict) else json.loads(json_str)
-
-            # If schema_object is an array, set it to the first item
-            if isinstance(schema_object, list) and len(schema_object) > 0:
-                schema_object = schema_object[0]
-
-            ansr = {
-                'url': url,
-                'site': site,
-                'name': name,
-                'ranking': ranking,
-                'schema_object': schema_object,
-                'sent': False,
-                'retrieval_scores': retrieval_scores,  # Preserve retrieval scores for XGBoost
-            }
-
-            # Add vector if available (for MMR)
-            if vector is not None:
-                ansr['vector'] = vector
-            
-            # Check if required_item_type is specified and filter based on @type
-            if self.handler.required_item_type is not None:
-                item_type = schema_object.get('@type', None)
-                if item_type != self.handler.required_item_type:
-                    logger.debug(f"Item type mismatch: expected {self.handler.required_item_type}, got {item_type} - setting score to 0")
-                    ranking["score"] = 0
-            
-            if (ranking.get("score", 0) > self.EARLY_SEND_THRESHOLD):
-                # Skip early send in unified mode — articles sent as batch after ranking
-                if self.handler.generate_mode != 'unified':
-                    logger.info(f"High score item: {name} (score: {ranking['score']}) - sending early {self.ranking_type_str}")
-                    try:
-                        await self.sendAnswers([ansr])
-                    except (BrokenPipeError, ConnectionResetError):
-                        logger.warning(f"Client disconnected while sending early answer for {name}")
-                        self.handler.connection_alive_event.clear()
-                        return
-
-            logger.debug(f"Item {name} ranked successfully")
-
-            # Analytics: Log ranking score (position=-1 = pending; updated in batch after sort)
-            if hasattr(self.handler, 'query_id'):
-                query_logger = get_query_logger()
-                try:
-                    query_logger.log_ranking_score(
-                        query_id=self.handler.query_id,
-                        doc_url=url,
-                        ranking_position=-1,  # Placeholder; updated by update_ranking_positions()
-                        llm_final_score=float(ranking.get("score", 0)),
-                        llm_snippet=ranking.get("description", ""),
-                        ranking_method='llm'
-                    )
-                except Exception as log_err:
-                    logger.warning(f"Failed to log ranking score: {log_err}")
+            ranking = await ask_llm(prompt, ans_struc, level=self.level, query_params=self.handler.query_params, cache_site="ranking")
 
-            return ansr
+            return await self._process_ranking(item, ranking)
 
         except Exception as e:
             logger.error(f"Error in rankItem for {name}: {str(e)}")
@@ -240,6 +209,146 @@ class Ranking:
             if CONFIG.should_raise_exceptions():
                 raise  # Re-raise in testing/development mode
 
+    async def _process_ranking(self, item, ranking):
+        """
+        Build the ranked answer for an item from its LLM ranking, then apply the
+        required-type filter, early send and analytics logging.
+        """
+        url, json_str, name, site, retrieval_scores, vector = self._unpack_item(item)
+
+        # Handle both string and dictionary inputs for json_str
+        schema_object = json_str if isinstance(json_str, dict) else json.loads(json_str)
+
+        # If schema_object is an array, set it to the first item
+        if isinstance(schema_object, list) and len(schema_object) > 0:
+            schema_object = schema_object[0]
+
+        ansr = {
+            'url': url,
+            'site': site,
+            'name': name,
+            'ranking': ranking,
+            'schema_object': schema_object,
+            'sent': False,
+            'retrieval_scores': retrieval_scores,  # Preserve retrieval scores for XGBoost
+        }
+
+        # Add vector if available (for MMR)
+        if vector is not None:
+            ansr['vector'] = vector
+
+        # Check if required_item_type is specified and filter based on @type
+        if self.handler.required_item_type is not None:
+            item_type = schema_object.get('@type', None)
+            if item_type != self.handler.required_item_type:
+                logger.debug(f"Item type mismatch: expected {self.handler.required_item_type}, got {item_type} - setting score to 0")
+                ranking["score"] = 0
+
+        if (ranking.get("score", 0) > self.EARLY_SEND_THRESHOLD):
+            # Skip early send in unified mode — articles sent as batch after ranking
+            if self.handler.generate_mode != 'unified':
+                logger.info(f"High score item: {name} (score: {ranking['score']}) - sending early {self.ranking_type_str}")
+                try:
+                    await self.sendAnswers([ansr])
+                except (BrokenPipeError, ConnectionResetError):
+                    logger.warning(f"Client disconnected while sending early answer for {name}")
+                    self.handler.connection_alive_event.clear()
+                    return
+
+        logger.debug(f"Item {name} ranked successfully")
+
+        # Analytics: Log ranking score (position=-1 = pending; updated in batch after sort)
+        if hasattr(self.handler, 'query_id'):
+            query_logger = get_query_logger()
+            try:
+                query_logger.log_ranking_score(
+                    query_id=self.handler.query_id,
+                    doc_url=url,
+                    ranking_position=-1,  # Placeholder; updated by update_ranking_positions()
+                    llm_final_score=float(ranking.get("score", 0)),
+                    llm_snippet=ranking.get("description", ""),
+                    ranking_method='llm'
+                )
+            except Exception as log_err:
+                logger.warning(f"Failed to log ranking score: {log_err}")
+
+        return ansr
+
+    @staticmethod
+    def _parse_batch_response(response, batch_len):
+        """
+        Map a batched ranking response to {batch_index: {'score', 'description'}}.
+
+        Entries with a missing or out-of-range id, or a non-numeric score, are
+        dropped so those items fall back to per-item ranking.
+        """
+        parsed = {}
+        if not isinstance(response, dict):
+            return parsed
+        entries = response.get('results')
+        if not isinstance(entries, list):
+            return parsed
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                idx = int(entry.get('id'))
+                score = int(float(entry.get('score')))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= idx < batch_len and idx not in parsed:
+                parsed[idx] = {'score': score, 'description': entry.get('description', '') or ''}
+        return parsed
+
+    async def rankBatch(self, items):
+        """
+        Rank several items with a single LLM call.
+
+        Items are listed with [id] markers in one prompt; the response is a
+        list of {id, score, description}. Any item the response drops (or
+        garbles) is re-ranked individually via rankItem.
+
+        Returns:
+            List of ranked answers (same shape as rankItem results).
+        """
+        if (self.ranking_type == Ranking.FAST_TRACK and self.handler.state.should_abort_fast_track()):
+            logger.info("Fast track aborted, skipping batch ranking")
+            return []
+
+        parsed = {}
+        try:
+            prompt_str, ans_struc = self.get_batch_ranking_prompt()
+            descriptions = "\n\n".join(
+                f"[{idx}] {trim_json(self._unpack_item(item)[1])}" for idx, item in enumerate(items)
+            )
+            prompt = fill_prompt(prompt_str, self.handler, {"item.description": descriptions})
+            response = await ask_llm(prompt, ans_struc, level=self.level, query_params=self.handler.query_params, cache_site="ranking")
+            parsed = self._parse_batch_response(response, len(items))
+        except Exception as e:
+            logger.warning(f"Batch ranking call failed for {len(items)} items, falling back to per-item: {e}")
+
+        results = []
+        for idx, ranking in parsed.items():
+            try:
+                ansr = await self._process_ranking(items[idx], ranking)
+            except Exception as e:
+                logger.error(f"Error processing batch ranking for item {idx}: {str(e)}")
+                continue
+            if ansr is not None:
+                results.append(ansr)
+
+        missing = [item for idx, item in enumerate(items) if idx not in parsed]
+        if missing:
+            logger.info(f"Batch ranking dropped {len(missing)}/{len(items)} items, ranking them individually")
+            fallback = await asyncio.gather(*(self.rankItem(item) for item in missing), return_exceptions=True)
+            for result in fallback:
+                if isinstance(result, Exception):
+                    logger.warning(f"Fallback ranking task failed: {result}")
+                elif result is not None:
+                    results.append(result)
+
+        return results
+
     def shouldSend(self, result):
         # Don't send if we've already reached the limit
         if self.num_results_sent >= self.NUM_RESULTS_TO_SEND:
@@ -413,12 +522,21 @@ class Ranking:
             self.handler.url_to_vector = self.url_to_vector
 
         tasks = []
-        for item in self.items:
-            # Pass the full item (Dict or Tuple) to rankItem for better data preservation
-            if self.handler.connection_alive_event.is_set():  # Only add new tasks if connection is still alive
-                tasks.append(asyncio.create_task(self.rankItem(item)))
-            else:
-                logger.warning("Connection lost, not creating new ranking tasks")
+        if self.batch_mode:
+            # One LLM call per batch_size items instead of one per item
+            for start in range(0, len(self.items), self.batch_size):
+                if self.handler.connection_alive_event.is_set():
+                    batch = self.items[start:start + self.batch_size]
+                    tasks.append(asyncio.create_task(self.rankBatch(batch)))
+                else:
+                    logger.warning("Connection lost, not creating new ranking tasks")
+        else:
+            for item in self.items:
+                # Pass the full item (Dict or Tuple) to rankItem for better data preservation
+                if self.handler.connection_alive_event.is_set():  # Only add new tasks if connection is still alive
+                    tasks.append(asyncio.create_task(self.rankItem(item)))
+                else:
+                    logger.warning("Connection lost, not creating new ranking tasks")
 
         await self.sendMessageOnSitesBeingAsked(self.items)
 
@@ -429,6 +547,8 @@ class Ranking:
             for result in task_results:
                 if isinstance(result, Exception):
                     logger.warning(f"Ranking task failed: {result}")
+                elif isinstance(result, list):
+                    self.rankedAnswers.extend(result)  # rankBatch
                 elif result is not None:
                     self.rankedAnswers.append(result)
         except Exception as e:
@@ -471,12 +591,12 @@ class Ranking:
 
         if xgboost_enabled and len(ranked) > 0:
             try:
-                from core.xgboost_ranker import XGBoostRanker
+                from core.xgboost_ranker import get_xgboost_ranker
 
                 logger.info(f"[XGBoost] Starting shadow mode prediction for {len(ranked)} results")
 
-                # Initialize XGBoost ranker
-                xgb_ranker = XGBoostRanker(CONFIG.xgboost_params)
+                # Shared per-process ranker (booster loaded once)
+                xgb_ranker = get_xgboost_ranker(CONFIG.xgboost_params)
 
                 # Prepare ranking results for XGBoost (extract features from ranked results)
                 # Note: ranked is a list of dicts with structure: {'url', 'name', 'schema', 'ranking': {'score', 'snippet'}}
@@ -539,11 +659,6 @@ class Ranking:
 
             self.handler.final_ranked_answers = reranked_results
             logger.info(f"[MMR] Re-ranking complete: {len(reranked_results)} diverse results")
-
-            # Clean up: Remove vectors from results before passing to LLM prompts
-            # Vectors are 1536 floats and will pollute the console output
-            for result in self.handler.final_ranked_answers:
-                result.pop('vector', None)
         else:
             # No MMR: use original ranking
             self.handler.final_ranked_answers = ranked[:self.NUM_RESULTS_TO_SEND]
@@ -554,6 +669,12 @@ class Ranking:
             elif not self.url_to_vector:
                 logger.info("MMR skipped: no vectors available")
 
+        # Clean up: Remove vectors from results before passing to LLM prompts.
+        # Each vector is a view into the retrieval call's embedding matrix, so
+        # cached results would otherwise keep the whole matrix alive.
+        for result in self.handler.final_ranked_answers:
+            result.pop('vector', None)
+
         logger.info(f"Filtered to {len(filtered)} results with score > 51")
         logger.debug(f"Top 3 results: {[(r['name'], r['ranking']['score']) for r in self.handler.final_ranked_answers[:3]]}")
 
@@ -346,6 +346,11 @@ class RetrievalClientBase(VectorDBClientInterface):
                 # Keep using old cache if available
                 return self._sites_cache
     
+    def invalidate_sites_cache(self) -> None:
+        """Drop the cached sites list so the next lookup reads the backend's catalog."""
+        self._sites_cache = None
+        self._sites_cache_time = 0
+
     async def _refresh_sites_cache(self) -> None:
         """Refresh the sites cache in the background."""
         try:
@@ -905,6 +910,83 @@ class VectorDBClient:
                 )
                 raise
     
+    @staticmethod
+    def _configured_site(site: Union[str, List[str]]) -> Union[str, List[str]]:
+        """Replace "all" with the configured site list, if one is set."""
+        if site == "all":
+            sites = CONFIG.nlweb.sites
+            if sites and sites != "all":
+                # Use configured sites instead of "all"
+                return sites
+        return site
+
+    @staticmethod
+    def _normalize_site(site: Union[str, List[str]]) -> Union[str, List[str]]:
+        """Split comma-separated site strings into a list; spaces become underscores."""
+        if isinstance(site, str) and ',' in site:
+            site = site.replace('[', '').replace(']', '')
+            return [s.strip() for s in site.split(',')]
+        if isinstance(site, str):
+            return site.replace(" ", "_")
+        return site
+
+    async def search_multi(self, queries: List[str], site: Union[str, List[str]],
+                           num_results: Union[int, List[int]] = 50,
+                           endpoint_name: Optional[str] = None, **kwargs) -> List[List[List[str]]]:
+        """
+        Search several query variants at once (e.g. a query and its expansions).
+
+        With a single enabled endpoint whose client implements search_multi
+        (PgVectorClient), every variant goes to it in one call: one embedding
+        batch and one SQL statement. Otherwise, or if that call fails, each
+        variant runs through search() in parallel. The handler, if any, is
+        only passed for the first (primary) query.
+
+        Args:
+            queries: Query variants, primary first
+            site: Site identifier or list of sites
+            num_results: Maximum results, one value for all queries or one per query
+            endpoint_name: Optional endpoint name override
+            **kwargs: Additional parameters passed to the search methods
+
+        Returns:
+            One result list per query; a failed query yields an empty list
+        """
+        limits = list(num_results) if isinstance(num_results, (list, tuple)) else [num_results] * len(queries)
+        site = self._configured_site(site)
+
+        if endpoint_name:
+            if endpoint_name not in CONFIG.retrieval_endpoints:
+                raise ValueError(f"Invalid endpoint: {endpoint_name}")
+            temp_client = VectorDBClient(endpoint_name=endpoint_name)
+            return await temp_client.search_multi(queries, site, limits, **kwargs)
+
+        if len(self.enabled_endpoints) == 1:
+            client = await self.get_client(next(iter(self.enabled_endpoints)))
+            if hasattr(client, 'search_multi'):
+                try:
+                    per_query = await client.search_multi(queries, self._normalize_site(site), limits, **kwargs)
+                    # Hybrid clients fuse vector and text branches (up to ~2k rows); cap like search()
+                    return [rows[:k] for rows, k in zip(per_query, limits)]
+                except Exception as e:
+                    logger.warning(f"Multi-query search failed, searching queries separately: {e}")
+
+        # Expansion searches omit handler to avoid concurrent mutations
+        expansion_kwargs = {k: v for k, v in kwargs.items() if k != 'handler'}
+        tasks = [
+            self.search(q, site, k, **(kwargs if i == 0 else expansion_kwargs))
+            for i, (q, k) in enumerate(zip(queries, limits))
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        per_query = []
+        for q, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Search failed for '{q}': {result}")
+                result = []
+            per_query.append(result)
+        return per_query
+
     async def search(self, query: str, site: Union[str, List[str]], 
                     num_results: int = 50, endpoint_name: Optional[str] = None, **kwargs) -> List[List[str]]:
         """
@@ -921,11 +1003,7 @@ class VectorDBClient:
             List of search results
         """
         # Handle configured sites
-        if site == "all":
-            sites = CONFIG.nlweb.sites
-            if sites and sites != "all":
-                # Use configured sites instead of "all"
-                site = sites
+        site = self._configured_site(site)
 
         # If specific endpoint is requested, use only that endpoint
         if endpoint_name:
@@ -935,11 +1013,7 @@ class VectorDBClient:
             return await temp_client.search(query, site, num_results, **kwargs)
         
         # Process site parameter for consistency
-        if isinstance(site, str) and ',' in site:
-            site = site.replace('[', '').replace(']', '')
-            site = [s.strip() for s in site.split(',')]
-        elif isinstance(site, str):
-            site = site.replace(" ", "_")
+        site = self._normalize_site(site)
 
         logger.info(f"Searching for '{query[:50]}...' in site: {site}, num_results: {num_results}")
         logger.info(f"Querying {len(self.enabled_endpoints)} enabled endpoints in parallel")
@@ -1249,8 +1323,12 @@ async def search(query: str,
         kwargs['filters'] = filters
 
     results = await client.search(query, site, num_results, **kwargs)
-    
-    # Send retrieval count message if handler is provided and in debug mode
+    await _send_retrieval_count(handler, query, site, results, num_results)
+    return results
+
+
+async def _send_retrieval_count(handler, query: str, site, results: List[Any], num_results: int) -> None:
+    """Send a retrieval count message if handler is provided and in debug mode."""
     if handler and getattr(handler, 'debug_mode', False) and hasattr(handler, 'http_handler') and hasattr(handler.http_handler, 'write_stream'):
         retrieval_message = {
             "message_type": "retrieval_count",
@@ -1265,8 +1343,6 @@ async def search(query: str,
             logger.info(f"Sent retrieval count message: {len(results)} results for query '{query}' on site '{site}'")
         except Exception as e:
             logger.warning(f"Failed to send retrieval count message: {e}")
-    
-    return results
 
 
 def _extract_url(item) -> Optional[str]:
@@ -1278,6 +1354,19 @@ def _extract_url(item) -> Optional[str]:
     return None
 
 
+def merge_by_url(result_lists: List[List[Any]]) -> List[Any]:
+    """Concatenate result lists in order, keeping the first item seen for each URL."""
+    seen_urls = set()
+    merged = []
+    for results in result_lists:
+        for item in results:
+            url = _extract_url(item)
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                merged.append(item)
+    return merged
+
+
 async def search_with_expansion(
     query: str,
     expansion_queries: List[str],
@@ -1288,10 +1377,12 @@ async def search_with_expansion(
     query_params: Optional[Dict[str, Any]] = None,
     handler: Optional[Any] = None,
     filters: Optional[List[Dict[str, Any]]] = None,
+    primary_results: Optional[List[Any]] = None,
     **kwargs
 ) -> List[Dict[str, Any]]:
     """
-    Search with the original query plus expansion queries in parallel.
+    Search with the original query plus expansion queries in one
+    VectorDBClient.search_multi call (batched where the backend supports it).
     Original query results are prioritised; expansion results are appended
     after URL-based deduplication.
 
@@ -1305,63 +1396,38 @@ async def search_with_expansion(
         query_params: Optional query parameters
         handler: Optional handler for messaging
         filters: Optional generic filters (time range, author, etc.)
+        primary_results: Results already retrieved for the primary query
+            (speculative retrieval); only the expansions are searched
         **kwargs: Additional parameters
 
     Returns:
         Deduplicated list of search results, primary results first.
     """
-    # Primary search gets handler (may mutate handler.time_filter_relaxed etc.)
-    primary_kwargs = dict(
-        site=site,
-        endpoint_name=endpoint_name,
-        query_params=query_params,
-        handler=handler,
-        filters=filters,
-        **kwargs
-    )
-    # Expansion searches omit handler to avoid concurrent mutations
-    expansion_kwargs = dict(
-        site=site,
-        endpoint_name=endpoint_name,
-        query_params=query_params,
-        filters=filters,
-        **kwargs
-    )
-
-    # Launch all searches in parallel
-    primary_task = search(query, num_results=num_results, **primary_kwargs)
-    expansion_tasks = [
-        search(eq, num_results=num_per_expansion, **expansion_kwargs)
-        for eq in expansion_queries
-    ]
-
-    all_results = await asyncio.gather(primary_task, *expansion_tasks, return_exceptions=True)
-
-    # Primary results first
-    primary_items = all_results[0] if not isinstance(all_results[0], Exception) else []
-    if isinstance(all_results[0], Exception):
-        logger.warning(f"Primary search failed: {all_results[0]}")
-
-    # Deduplicate: primary results take priority
-    seen_urls = set()
-    merged = []
-
-    for item in primary_items:
-        url = _extract_url(item)
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            merged.append(item)
+    client = get_vector_db_client(endpoint_name=endpoint_name, query_params=query_params)
+    # Primary query gets handler (may mutate handler.time_filter_relaxed etc.)
+    if handler:
+        kwargs['handler'] = handler
+    if filters:
+        kwargs['filters'] = filters
 
-    # Append expansion results, skipping duplicates
-    for i, result in enumerate(all_results[1:]):
-        if isinstance(result, Exception):
-            logger.warning(f"Expansion search failed for '{expansion_queries[i]}': {result}")
-            continue
-        for item in result:
-            url = _extract_url(item)
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                merged.append(item)
+    if primary_results is not None:
+        kwargs.pop('handler', None)
+        per_query = [primary_results] + await client.search_multi(
+            list(expansion_queries),
+            site,
+            num_per_expansion,
+            **kwargs
+        )
+    else:
+        per_query = await client.search_multi(
+            [query] + list(expansion_queries),
+            site,
+            [num_results] + [num_per_expansion] * len(expansion_queries),
+            **kwargs
+        )
+    primary_items = per_query[0]
+    await _send_retrieval_count(handler, query, site, primary_items, num_results)
+    merged = merge_by_url(per_query)
 
     logger.info(
         f"search_with_expansion: primary={len(primary_items)}, "
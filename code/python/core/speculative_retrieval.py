@@ -0,0 +1,168 @@
+"""
+speculative_retrieval.py - Start retrieval before the query pre-checks finish.
+
+On first-turn queries the decontextualized query is the raw query, and the
+QueryUnderstanding regex fast path already decides most temporal/author
+filters. NLWebHandler.prepare therefore starts the vector search on the raw
+query while the LLM pre-checks (decontextualization, QueryUnderstanding,
+ToolSelector, RelevanceDetection, PromptGuardrails, Memory) run:
+
+    - kept when the final query, filters, result count, vector flag and, on
+      backends that read it, the handler's boost state (boost keywords,
+      temporal flag) match
+    - cancelled when guardrails block the query or the plan changed
+
+The search runs against a SpeculativeHandler, so provider side effects
+(time_filter_relaxed, author_search_no_results, retrieved-document analytics)
+only reach the real handler when the results are kept.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from core.query_logger import get_query_logger
+from core.retriever import get_vector_db_client, search
+from misc.logger.logging_config_helper import get_configured_logger
+
+logger = get_configured_logger("speculative_retrieval")
+
+# Backends whose search reads provider_state() from the handler
+STATEFUL_DB_TYPES = {"qdrant"}
+
+
+def provider_state(handler) -> tuple:
+    """
+    Handler state that retrieval providers read during a search: Qdrant's
+    domain boost keywords (domain_context) and temporal boost (temporal_range).
+    """
+    domain_context = getattr(handler, 'domain_context', None) or {}
+    temporal_range = getattr(handler, 'temporal_range', None) or {}
+    return (tuple(domain_context.get('boost_keywords') or ()),
+            bool(temporal_range.get('is_temporal', False)))
+
+
+def reads_provider_state(query_params: Optional[Dict[str, Any]]) -> bool:
+    """
+    True if a search with these query params reaches a backend that reads
+    provider_state(). Unknown (client cannot be built) counts as True.
+    """
+    try:
+        client = get_vector_db_client(query_params=query_params)
+    except Exception:
+        return True
+    return any(cfg.db_type in STATEFUL_DB_TYPES for cfg in client.enabled_endpoints.values())
+
+
+class SpeculativeHandler:
+    """Stand-in handler for the speculative search: records flags, buffers analytics."""
+
+    def __init__(self, query_id: Optional[str]):
+        if query_id is not None:
+            # Providers only log analytics for handlers with a query_id
+            self.query_id = query_id
+        self.time_filter_relaxed = False
+        self.author_search_no_results = False
+        # Providers log retrieved documents through handler.query_logger when set
+        self.query_logger = self
+        # QueryUnderstanding has not run yet: search without domain or temporal boosts
+        self.domain_context = {'detected': False, 'boost_keywords': []}
+        self.temporal_range = {}
+        self._retrieval_logs: List[Dict[str, Any]] = []
+
+    def log_retrieved_document(self, **kwargs) -> None:
+        self._retrieval_logs.append(kwargs)
+
+
+class SpeculativeRetrieval:
+    """
+    One speculative search for a handler.
+
+    Args:
+        handler: The NLWebHandler the results are for
+        query: Query to search (the raw query)
+        num_results: Result count of the predicted retrieval plan
+        filters: Generic retriever filters of the predicted plan
+        include_vectors: Whether vectors are requested for MMR
+    """
+
+    def __init__(self, handler, query: str, num_results: int,
+                 filters: Optional[List[Dict[str, Any]]], include_vectors: bool):
+        self.handler = handler
+        self.query = query
+        self.num_results = num_results
+        self.filters = filters
+        self.include_vectors = include_vectors
+        self.proxy = SpeculativeHandler(getattr(handler, 'query_id', None))
+        self.task: Optional[asyncio.Task] = None
+        self.search_seconds: Optional[float] = None
+        self.outcome: Optional[str] = None
+
+    def start(self) -> "SpeculativeRetrieval":
+        self.task = asyncio.create_task(self._run())
+        # Retrieve the exception of a discarded task so it is not reported as unhandled
+        self.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        logger.info(f"[SPECULATIVE] Started search for '{self.query[:50]}' "
+                    f"(num_results={self.num_results}, filters={self.filters})")
+        return self
+
+    async def _run(self):
+        started = time.perf_counter()
+        try:
+            return await search(
+                self.query,
+                self.handler.site,
+                query_params=self.handler.query_params,
+                handler=self.proxy,
+                num_results=self.num_results,
+                include_vectors=self.include_vectors,
+                filters=self.filters,
+            )
+        finally:
+            self.search_seconds = time.perf_counter() - started
+
+    def matches(self, query: str, num_results: int, filters: Optional[List[Dict[str, Any]]],
+                include_vectors: bool) -> bool:
+        """
+        True if the final retrieval plan is the one that was speculated, and the
+        handler state providers read (set by QueryUnderstanding meanwhile)
+        would not have changed the ranking. Backends that ignore that state
+        (postgres) keep the speculation regardless of boosts.
+        """
+        return (query == self.query and num_results == self.num_results
+                and (filters or None) == (self.filters or None)
+                and include_vectors == self.include_vectors
+                and (provider_state(self.handler) == provider_state(self.proxy)
+                     or not reads_provider_state(self.handler.query_params)))
+
+    async def take(self) -> Optional[List[Any]]:
+        """
+        Wait for the speculative results and adopt them: copy provider flags to
+        the handler and write the buffered analytics. Returns None (and the
+        caller searches normally) if the speculative search failed.
+        """
+        try:
+            results = await self.task
+        except Exception as e:
+            logger.warning(f"[SPECULATIVE] Search failed, retrieving normally: {e}")
+            self.outcome = "failed"
+            return None
+
+        self.outcome = "hit"
+        self.handler.time_filter_relaxed = self.proxy.time_filter_relaxed
+        self.handler.author_search_no_results = self.proxy.author_search_no_results
+        if self.proxy._retrieval_logs:
+            query_logger = get_query_logger()
+            for entry in self.proxy._retrieval_logs:
+                query_logger.log_retrieved_document(**entry)
+        return results
+
+    def cancel(self, outcome: str) -> None:
+        """Discard the speculation; buffered analytics are dropped."""
+        if self.outcome is not None:
+            return
+        self.outcome = outcome
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.proxy._retrieval_logs.clear()
+        logger.info(f"[SPECULATIVE] Discarded ({outcome})")
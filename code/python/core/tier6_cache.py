@@ -0,0 +1,237 @@
+"""
+Shared stale-while-revalidate cache for Tier 6 data clients.
+
+Tier 6 clients (TWSE, yfinance, Wikipedia, Wikidata, CWB, OpenWeatherMap,
+MOEA company registry) are instantiated per gap resolution, so their data is
+cached here per client name instead of on the client instance. Two tiers:
+
+  - In-process LRU (OrderedDict, O(1) eviction) bounded by entry count
+  - Optional SQLite file shared by all clients and kept across restarts
+
+Each client has its own TTL (quotes minutes, company registrations days)
+plus a stale window: an entry past its TTL but inside the window is served
+immediately while one background fetch refreshes it. Concurrent misses for
+the same key on the same event loop share a single upstream call.
+
+Configured per client under reasoning.tier_6.<client>.cache; the SQLite path
+is reasoning.tier_6.cache_store.sqlite_path. The LRU, coalescing and SQLite
+tier come from core/coalescing_cache.py.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from core.coalescing_cache import RETRY, CoalescingCache, SqliteCacheStore, open_sqlite_store
+from misc.logger.logging_config_helper import get_configured_logger
+
+logger = get_configured_logger("tier6_cache")
+
+
+class Tier6Cache(CoalescingCache):
+    """
+    Two-tier (memory LRU + optional SQLite) TTL cache for one Tier 6 client.
+
+    Values are stored as serialized JSON and deserialized on every read, so
+    callers can modify returned results without touching the cached copy.
+    Memory entries are (payload, stored_at).
+
+    Args:
+        name: Client name (also the SQLite namespace)
+        ttl_seconds: Age until an entry is stale
+        stale_seconds: Extra age during which a stale entry is still served while revalidating
+        max_entries: Memory-tier LRU bound
+        db: Optional shared SQLite store
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        max_entries: int = 200,
+        db: Optional[SqliteCacheStore] = None,
+    ):
+        super().__init__(
+            max_entries,
+            extra_stats={
+                "stale_hits": 0,
+                "revalidations": 0,
+                "revalidation_failures": 0,
+                "stores": 0,
+            },
+        )
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._db = db
+        self._revalidations: set = set()
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, str]:
+        """
+        Return the cached value for key, or run fetch() once and cache it.
+
+        Only truthy, JSON-serializable results are cached; clients return
+        None or [] for lookups that found nothing and those are retried.
+        Exceptions from fetch() propagate to the leading caller.
+
+        Returns:
+            (value, status) with status "hit", "stale", "miss" or "coalesced"
+        """
+        entry = self._memory_get(key)
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._db.get, key, self.name)
+            if entry is not None:
+                self._memory_put(key, entry)
+                self._count("disk_hits")
+
+        if entry is not None:
+            payload, stored_at = entry
+            age = time.time() - stored_at
+            if age < self.ttl_seconds:
+                self._count("hits")
+                return json.loads(payload), "hit"
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._count("stale_hits")
+                self._revalidate(key, fetch)
+                return json.loads(payload), "stale"
+
+        return await self._fetch_shared(key, fetch)
+
+    async def _fetch_shared(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        async def lead():
+            self._count("misses")
+            result = await fetch()
+            if not result:
+                return result, None
+
+            try:
+                payload = json.dumps(result, ensure_ascii=False)
+            except (TypeError, ValueError):
+                logger.debug(f"{self.name} result is not JSON-serializable; not caching")
+                return result, RETRY
+
+            await self._store(key, payload)
+            return result, payload
+
+        value, role = await self._coalesce(key, lead)
+        if role == "retry":
+            return await fetch(), "miss"
+        if role == "coalesced":
+            return (json.loads(value) if value is not None else None), "coalesced"
+        return value, "miss"
+
+    def _revalidate(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh a stale entry in the background unless a fetch is already running."""
+        if self._inflight_on_this_loop(key):
+            return
+        self._count("revalidations")
+
+        async def run():
+            try:
+                await self._fetch_shared(key, fetch)
+            except Exception as e:
+                self._count("revalidation_failures")
+                logger.debug(f"{self.name} revalidation failed for '{key}': {e}")
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._revalidations.add(task)
+        task.add_done_callback(self._revalidations.discard)
+
+    async def _store(self, key: str, payload: str) -> None:
+        stored_at = time.time()
+        self._memory_put(key, (payload, stored_at))
+        self._count("stores")
+        if self._db is not None:
+            await asyncio.to_thread(self._db.put, key, payload, stored_at, self.name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/revalidation counters plus current memory-tier size."""
+        stats = self._base_stats()
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["stale_seconds"] = self.stale_seconds
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> int:
+        """Drop this client's entries from both tiers; returns the memory entries dropped."""
+        count = self._clear_memory()
+        if self._db is not None:
+            self._db.clear(self.name)
+        return count
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _expired(self, entry: tuple, now: float) -> bool:
+        return now - entry[1] >= self.ttl_seconds + self.stale_seconds
+
+    def _entry_size(self, entry: tuple) -> int:
+        return len(entry[0])
+
+
+# Global cache instances, one per client name
+_tier6_caches: Dict[str, Optional[Tier6Cache]] = {}
+_tier6_store: Optional[SqliteCacheStore] = None
+_tier6_lock = threading.Lock()
+
+# Longest a persisted entry is kept regardless of client TTLs
+_STORE_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+
+def _get_store(path: str) -> Optional[SqliteCacheStore]:
+    """SQLite store shared by all Tier 6 caches (stamp = stored_at), namespaced by client."""
+    global _tier6_store
+    if _tier6_store is None:
+        _tier6_store = open_sqlite_store(path, "tier6_cache")
+        if _tier6_store is not None:
+            _tier6_store.purge(time.time() - _STORE_MAX_AGE_SECONDS)
+    return _tier6_store
+
+
+def get_tier6_cache(
+    name: str,
+    default_ttl_hours: float = 1.0,
+    default_max_size: int = 200,
+) -> Optional[Tier6Cache]:
+    """
+    Get the shared cache for a Tier 6 client, or None if its cache is disabled.
+
+    Args:
+        name: Client config section under tier_6 (e.g. "twse", "wikipedia")
+        default_ttl_hours: TTL when the section sets no ttl_hours
+        default_max_size: LRU bound when the section sets no max_size
+    """
+    if name not in _tier6_caches:
+        from core.config import CONFIG
+
+        tier_6_config = CONFIG.reasoning_params.get("tier_6", {})
+        cache_config = tier_6_config.get(name, {}).get("cache", {})
+        with _tier6_lock:
+            if name not in _tier6_caches:
+                if not cache_config.get("enabled", True):
+                    _tier6_caches[name] = None
+                else:
+                    sqlite_path = tier_6_config.get("cache_store", {}).get("sqlite_path") or None
+                    _tier6_caches[name] = Tier6Cache(
+                        name=name,
+                        ttl_seconds=cache_config.get("ttl_hours", default_ttl_hours) * 3600,
+                        stale_seconds=cache_config.get("stale_ttl_hours", 0) * 3600,
+                        max_entries=cache_config.get("max_size", default_max_size),
+                        db=_get_store(sqlite_path) if sqlite_path else None,
+                    )
+    return _tier6_caches[name]
+
+
+def get_tier6_cache_stats() -> Dict[str, Any]:
+    """Stats of every Tier 6 cache created so far, by client name."""
+    return {name: cache.get_stats() for name, cache in _tier6_caches.items() if cache is not None}
@@ -196,7 +196,7 @@ class UserDataProcessor:
 
             for chunk in chunks:
                 # Generate embedding
-                embedding = await get_embedding(chunk['content'])
+                embedding = await get_embedding(chunk['content'], use_cache=False)
 
                 # Create unique point ID
                 point_id = str(uuid.uuid4())
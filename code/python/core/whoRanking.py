@@ -52,7 +52,7 @@ The site's description is: {site_description}
         try:
             description = trim_json(json_str)
             prompt, ans_struc = self.get_ranking_prompt(self.handler.query, description)
-            ranking = await ask_llm(prompt, ans_struc, level=self.level, query_params=self.handler.query_params)
+            ranking = await ask_llm(prompt, ans_struc, level=self.level, query_params=self.handler.query_params, cache_site="ranking")
             
             # Ensure ranking has required fields (handle LLM failures/timeouts)
             if not ranking or not isinstance(ranking, dict):
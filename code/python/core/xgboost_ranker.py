@@ -13,6 +13,7 @@ Backwards compatibility is not guaranteed at this time.
 
 import os
 import json
+import threading
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from misc.logger.logging_config_helper import get_configured_logger
@@ -20,7 +21,8 @@ from misc.logger.logging_config_helper import get_configured_logger
 # Import feature index constants
 from training.feature_engineering import (
     FEATURE_IDX_LLM_FINAL_SCORE,
-    TOTAL_FEATURES_PHASE_A
+    TOTAL_FEATURES_PHASE_A,
+    build_feature_matrix
 )
 
 logger = get_configured_logger("xgboost_ranker")
@@ -28,6 +30,10 @@ logger = get_configured_logger("xgboost_ranker")
 # Global model cache to avoid reloading on every query
 _MODEL_CACHE: Dict[str, Any] = {}
 
+# Process-wide ranker instances keyed by config (see get_xgboost_ranker)
+_RANKER_CACHE: Dict[Tuple, "XGBoostRanker"] = {}
+_RANKER_CACHE_LOCK = threading.Lock()
+
 
 class XGBoostRanker:
     """
@@ -95,14 +101,21 @@ class XGBoostRanker:
             return
 
         try:
-            # Phase A: Placeholder for model loading
-            # Phase C: Load actual XGBoost model
-            # import xgboost as xgb
-            # self.model = xgb.Booster()
-            # self.model.load_model(self.model_path)
+            import xgboost as xgb
+        except ImportError:
+            logger.warning("xgboost not installed; using shadow-mode dummy predictions")
+            if not self.use_shadow_mode:
+                self.enabled = False
+            return
 
-            logger.warning(f"XGBoost model loading not yet implemented (Phase A)")
-            logger.info(f"Model path configured: {self.model_path}")
+        try:
+            booster = xgb.Booster()
+            booster.load_model(self.model_path)
+            # Inference runs from request threads; one thread per predict keeps
+            # small candidate sets from paying OpenMP fan-out overhead
+            booster.set_param({'nthread': 1})
+            self.model = booster
+            logger.info(f"Loaded XGBoost model: {self.model_path}")
 
             # Store in global cache
             _MODEL_CACHE[self.model_path] = self.model
@@ -133,150 +146,65 @@ class XGBoostRanker:
                         relative_score_to_top, score_percentile, position_change
             MMR (2): mmr_diversity_score, detected_intent
         """
-        # Import feature extraction functions
-        from training.feature_engineering import (
-            extract_query_features,
-            extract_document_features,
-            extract_query_doc_features,
-            extract_ranking_features,
-            extract_mmr_features
-        )
-
         n_results = len(ranking_results)
-        features = np.zeros((n_results, 29))
+        titles, descriptions, urls, published_dates, authors = [], [], [], [], []
+        vector_scores, bm25_scores, keyword_boosts, temporal_boosts, final_scores = [], [], [], [], []
+        retrieval_positions, llm_scores, mmr_scores, intents = [], [], [], []
 
-        # Extract query features (same for all documents)
-        query_feats = extract_query_features(query_text)
-
-        # Collect all LLM scores for percentile calculation
-        all_llm_scores = []
-        for result in ranking_results:
-            # Handle Dict format (from ranking.py)
-            if isinstance(result, dict):
-                llm_score = result.get('ranking', {}).get('score', 0.0)
-            # Handle RankingResult dataclass
-            else:
-                llm_score = getattr(result, 'llm_score', 0.0)
-            all_llm_scores.append(llm_score)
-
-        # Extract features for each result
+        # Gather each field into a column; build_feature_matrix computes all
+        # 29 features over the columns at once
         for i, result in enumerate(ranking_results):
             # Handle Dict format (from ranking.py) or RankingResult dataclass
             if isinstance(result, dict):
-                # Extract from Dict format
-                doc_title = result.get('name', '')  # 'name' is the title field
-                doc_url = result.get('url', '')
                 schema_object = result.get('schema_object', {})
-                doc_description = schema_object.get('description', '')
-                published_date = schema_object.get('datePublished')
-                author = schema_object.get('author')
-
-                # Retrieval scores from nested dict
                 retrieval_scores = result.get('retrieval_scores', {})
-                vector_score = retrieval_scores.get('vector_score', 0.0)
-                bm25_score = retrieval_scores.get('bm25_score', 0.0)
-                keyword_boost = retrieval_scores.get('keyword_boost', 0.0)
-                temporal_boost = retrieval_scores.get('temporal_boost', 0.0)
-                final_retrieval_score = retrieval_scores.get('final_retrieval_score', 0.0)
-
-                # Ranking scores
-                retrieval_position = i  # Phase A: we don't track original retrieval position
-                ranking_position = i  # Current position after LLM ranking
-                llm_score = result.get('ranking', {}).get('score', 0.0)
-
-                # MMR scores (not available at this point in the pipeline)
-                mmr_score = None
-                detected_intent = 'BALANCED'  # Default intent
+                titles.append(result.get('name', ''))  # 'name' is the title field
+                descriptions.append(schema_object.get('description', ''))
+                urls.append(result.get('url', ''))
+                published_dates.append(schema_object.get('datePublished'))
+                authors.append(schema_object.get('author'))
+                vector_scores.append(retrieval_scores.get('vector_score', 0.0))
+                bm25_scores.append(retrieval_scores.get('bm25_score', 0.0))
+                keyword_boosts.append(retrieval_scores.get('keyword_boost', 0.0))
+                temporal_boosts.append(retrieval_scores.get('temporal_boost', 0.0))
+                final_scores.append(retrieval_scores.get('final_retrieval_score', 0.0))
+                retrieval_positions.append(i)  # Phase A: we don't track original retrieval position
+                llm_scores.append(result.get('ranking', {}).get('score', 0.0))
+                mmr_scores.append(None)  # MMR runs after XGBoost in the pipeline
+                intents.append('BALANCED')
             else:
-                # Handle RankingResult dataclass format
-                doc_title = getattr(result, 'title', '')
-                doc_description = getattr(result, 'description', '')
-                doc_url = getattr(result, 'url', '')
-                published_date = getattr(result, 'published_date', None)
-                author = getattr(result, 'author', None)
-
-                # Retrieval scores
-                vector_score = getattr(result, 'vector_score', 0.0)
-                bm25_score = getattr(result, 'bm25_score', 0.0)
-                keyword_boost = getattr(result, 'keyword_boost', 0.0)
-                temporal_boost = getattr(result, 'temporal_boost', 0.0)
-                final_retrieval_score = getattr(result, 'final_retrieval_score', 0.0)
-
-                # Ranking scores
-                retrieval_position = getattr(result, 'retrieval_position', i)
-                ranking_position = i  # Current position after LLM ranking
-                llm_score = getattr(result, 'llm_score', 0.0)
-
-                # MMR scores (may not be available yet)
-                mmr_score = getattr(result, 'mmr_score', None)
-                detected_intent = getattr(result, 'detected_intent', 'BALANCED')
-
-            # Extract document features
-            doc_feats = extract_document_features(
-                doc_title, doc_description, published_date, author, doc_url
-            )
-
-            # Extract query-doc features
-            query_doc_feats = extract_query_doc_features(
-                query_text, doc_title, doc_description,
-                bm25_score, vector_score, keyword_boost,
-                temporal_boost, final_retrieval_score
-            )
-
-            # Extract ranking features
-            ranking_feats = extract_ranking_features(
-                retrieval_position, ranking_position,
-                llm_score, all_llm_scores
-            )
-
-            # Extract MMR features
-            mmr_feats = extract_mmr_features(mmr_score, detected_intent)
-
-            # Combine all features (29 total)
-            feature_vector = [
-                # Query features (6)
-                query_feats['query_length'],
-                query_feats['word_count'],
-                query_feats['has_quotes'],
-                query_feats['has_numbers'],
-                query_feats['has_question_words'],
-                query_feats['keyword_count'],
-
-                # Document features (8)
-                doc_feats['doc_length'],
-                doc_feats['recency_days'],
-                doc_feats['has_author'],
-                doc_feats['has_publication_date'],
-                doc_feats['schema_completeness'],
-                doc_feats['title_length'],
-                doc_feats['description_length'],
-                doc_feats['url_length'],
-
-                # Retrieval features (7)
-                query_doc_feats['vector_similarity_score'],
-                query_doc_feats['bm25_score'],
-                query_doc_feats['keyword_boost'],
-                query_doc_feats['temporal_boost'],
-                query_doc_feats['final_retrieval_score'],
-                query_doc_feats['keyword_overlap_ratio'],
-                query_doc_feats['title_exact_match'],
-
-                # Ranking features (6)
-                ranking_feats['retrieval_position'],
-                ranking_feats['ranking_position'],
-                ranking_feats['llm_final_score'],
-                ranking_feats['relative_score_to_top'],
-                ranking_feats['score_percentile'],
-                ranking_feats['position_change'],
-
-                # MMR features (2)
-                mmr_feats['mmr_diversity_score'],
-                mmr_feats['detected_intent']
-            ]
-
-            features[i, :] = feature_vector
-
-        return features
+                titles.append(getattr(result, 'title', ''))
+                descriptions.append(getattr(result, 'description', ''))
+                urls.append(getattr(result, 'url', ''))
+                published_dates.append(getattr(result, 'published_date', None))
+                authors.append(getattr(result, 'author', None))
+                vector_scores.append(getattr(result, 'vector_score', 0.0))
+                bm25_scores.append(getattr(result, 'bm25_score', 0.0))
+                keyword_boosts.append(getattr(result, 'keyword_boost', 0.0))
+                temporal_boosts.append(getattr(result, 'temporal_boost', 0.0))
+                final_scores.append(getattr(result, 'final_retrieval_score', 0.0))
+                retrieval_positions.append(getattr(result, 'retrieval_position', i))
+                llm_scores.append(getattr(result, 'llm_score', 0.0))
+                mmr_scores.append(getattr(result, 'mmr_score', None))
+                intents.append(getattr(result, 'detected_intent', 'BALANCED'))
+
+        return build_feature_matrix(
+            query_text,
+            titles=titles,
+            descriptions=descriptions,
+            urls=urls,
+            published_dates=published_dates,
+            authors=authors,
+            vector_scores=vector_scores,
+            bm25_scores=bm25_scores,
+            keyword_boosts=keyword_boosts,
+            temporal_boosts=temporal_boosts,
+            final_retrieval_scores=final_scores,
+            retrieval_positions=retrieval_positions,
+            llm_scores=llm_scores,
+            mmr_scores=mmr_scores,
+            detected_intents=intents,
+        )
 
     def predict(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -290,7 +218,8 @@ class XGBoostRanker:
             - scores: numpy array (n_results,) - predicted relevance 0-1
             - confidences: numpy array (n_results,) - prediction confidence 0-1
 
-        Note: Phase A returns dummy predictions. Phase C uses actual model.
+        Note: Returns dummy predictions derived from LLM scores when no model
+        is loaded (Phase A shadow mode).
         """
         n_results = features.shape[0]
 
@@ -313,15 +242,14 @@ class XGBoostRanker:
 
             return normalized_scores, confidences
 
-        # Phase C: Actual XGBoost prediction
-        # import xgboost as xgb
-        # dmatrix = xgb.DMatrix(features)
-        # predictions = self.model.predict(dmatrix)
-        # confidences = self.calculate_confidence(predictions)
-        # return predictions, confidences
-
-        # Placeholder for Phase A
-        return np.zeros(n_results), np.zeros(n_results)
+        # One batched call for the whole candidate set; inplace_predict reads
+        # the float32 matrix directly without building a DMatrix
+        predictions = np.asarray(
+            self.model.inplace_predict(features.astype(np.float32, copy=False)),
+            dtype=np.float64
+        )
+        confidences = self.calculate_confidence(predictions)
+        return predictions, confidences
 
     def calculate_confidence(self, predictions: np.ndarray) -> np.ndarray:
         """
@@ -570,6 +498,25 @@ class XGBoostRanker:
         }
 
 
+def get_xgboost_ranker(config: Dict[str, Any]) -> XGBoostRanker:
+    """
+    Get the process-wide XGBoostRanker for a config.
+
+    The ranker (and its booster) is built once and shared by all queries
+    instead of being constructed per request; a changed config (e.g. new
+    model_path) gets its own instance.
+    """
+    key = tuple(sorted((k, repr(v)) for k, v in config.items()))
+    ranker = _RANKER_CACHE.get(key)
+    if ranker is None:
+        with _RANKER_CACHE_LOCK:
+            ranker = _RANKER_CACHE.get(key)
+            if ranker is None:
+                ranker = XGBoostRanker(config)
+                _RANKER_CACHE[key] = ranker
+    return ranker
+
+
 if __name__ == "__main__":
     # Test XGBoost ranker with mock data
     print("Testing XGBoost Ranker Module")
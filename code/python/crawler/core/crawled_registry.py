@@ -7,13 +7,21 @@ crawled_registry.py - 已爬取文章的 SQLite 註冊表
 - content_hash 跨來源去重
 - 統計查詢
 - 失敗 URL 追蹤與重爬管理
+
+mark_crawled() 採 write-behind：先寫入記憶體 buffer，由背景 thread 依時間
+（REGISTRY_FLUSH_INTERVAL）或數量（REGISTRY_FLUSH_BATCH）以單一 transaction
+寫入 SQLite（WAL）。is_crawled() 先查 buffer 與 Bloom filter，只有 Bloom
+判定「可能存在」時才查 SQLite。
 """
 
+import atexit
 import hashlib
 import logging
+import math
 import re
 import sqlite3
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Set
@@ -28,6 +36,31 @@ _RE_UDN_ID = re.compile(r'/story/\d+/(\d+)')
 _RE_DATE_BASED_ID = re.compile(r'/(\d{12,14})(?:[./-]|\.aspx|$)')
 
 
+class _BloomFilter:
+    """Bloom filter for URL membership (no false negatives, ~error_rate false positives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.num_bits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
 class CrawledRegistry:
     """
     SQLite-based registry for tracking crawled articles.
@@ -41,13 +74,22 @@ class CrawledRegistry:
         content_hash: 文章前 500 字的 hash，用於跨來源去重
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        flush_interval: Optional[float] = None,
+        flush_batch: Optional[int] = None,
+    ):
         """
         Initialize the registry.
 
         Args:
             db_path: Path to SQLite database.
                     If None, uses default location in data/crawler/
+            flush_interval: Seconds between background flushes of buffered marks
+                    (default settings.REGISTRY_FLUSH_INTERVAL)
+            flush_batch: Buffered marks that trigger an immediate flush
+                    (default settings.REGISTRY_FLUSH_BATCH)
         """
         if db_path is None:
             db_path = settings.DATA_DIR / "crawled_registry.db"
@@ -60,6 +102,19 @@ class CrawledRegistry:
         self._conn_lock = threading.Lock()
         self._db_lock = threading.RLock()  # Protects all SQL operations (reentrant for nested calls)
 
+        # Write-behind buffer for mark_crawled: url -> row (also the exact-match front for is_crawled)
+        self.flush_interval = settings.REGISTRY_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.flush_batch = settings.REGISTRY_FLUSH_BATCH if flush_batch is None else flush_batch
+        self._pending: Dict[str, tuple] = {}
+        self._buffer_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = threading.Event()
+
+        # Bloom filter over crawled_articles URLs, built on first is_crawled()
+        # and topped up from rows added since (by any process) on each flush
+        self._bloom: Optional[_BloomFilter] = None
+        self._bloom_rowid = 0
+
         self._init_db()
         self.logger.info(f"CrawledRegistry initialized: {self.db_path}")
 
@@ -71,6 +126,8 @@ class CrawledRegistry:
                     str(self.db_path), check_same_thread=False, timeout=30.0
                 )
                 self._conn.execute("PRAGMA journal_mode=WAL")
+                # WAL + NORMAL: committed transactions survive a process crash
+                self._conn.execute("PRAGMA synchronous=NORMAL")
                 self._conn.row_factory = sqlite3.Row
             return self._conn
 
@@ -145,7 +202,16 @@ class CrawledRegistry:
         conn.commit()
 
     def is_crawled(self, url: str) -> bool:
-        """Check if URL has been crawled."""
+        """Check if URL has been crawled (buffer → Bloom filter → SQLite)."""
+        with self._buffer_lock:
+            if url in self._pending:
+                return True
+        if self._bloom is None:
+            self._refresh_bloom()
+            # Keeps the filter current with rows other crawler processes write
+            self._start_flusher()
+        if url not in self._bloom:
+            return False
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -154,6 +220,29 @@ class CrawledRegistry:
             )
             return cursor.fetchone() is not None
 
+    def _refresh_bloom(self) -> None:
+        """Add URLs inserted since the last refresh; rebuild at double capacity when full."""
+        with self._db_lock:
+            conn = self._get_conn()
+            bloom, last_rowid = self._bloom, self._bloom_rowid
+            if bloom is None or bloom.count >= bloom.capacity:
+                total = conn.execute("SELECT COUNT(*) FROM crawled_articles").fetchone()[0]
+                bloom = _BloomFilter(
+                    max(2 * total, settings.REGISTRY_BLOOM_MIN_CAPACITY),
+                    settings.REGISTRY_BLOOM_ERROR_RATE,
+                )
+                last_rowid = 0
+            # INSERT OR REPLACE gives replaced rows a new rowid, so rowid > last covers all changes
+            cursor = conn.execute(
+                "SELECT rowid, url FROM crawled_articles WHERE rowid > ? ORDER BY rowid",
+                (last_rowid,)
+            )
+            for rowid, url in cursor:
+                bloom.add(url)
+                last_rowid = rowid
+            # is_crawled reads the filter without _db_lock: publish a rebuilt one only once filled
+            self._bloom, self._bloom_rowid = bloom, last_rowid
+
     def needs_update(self, url: str, new_date_modified: Optional[str]) -> bool:
         """
         Check if article needs to be re-crawled based on dateModified.
@@ -168,6 +257,12 @@ class CrawledRegistry:
         if new_date_modified is None:
             return False
 
+        with self._buffer_lock:
+            pending = self._pending.get(url)
+        if pending is not None:
+            old_date_modified = pending[3]
+            return old_date_modified is None or new_date_modified > old_date_modified
+
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -196,7 +291,10 @@ class CrawledRegistry:
         batch_id: Optional[str] = None,
     ) -> None:
         """
-        Mark an article as crawled.
+        Mark an article as crawled (buffered; written by the next flush).
+
+        The flush also clears any failed_urls record for the URL that is
+        older than this mark.
 
         Args:
             url: Article URL
@@ -213,15 +311,73 @@ class CrawledRegistry:
             content_hash = hashlib.sha256(content[:500].encode('utf-8')).hexdigest()[:16]
 
         date_crawled = datetime.now().isoformat()
-
+        row = (url, source_id, date_published, date_modified, date_crawled, content_hash, task_id, batch_id)
+
+        with self._buffer_lock:
+            self._pending.pop(url, None)  # keep insertion order = mark order
+            self._pending[url] = row
+            full = len(self._pending) >= self.flush_batch
+        self._start_flusher()
+        if full:
+            self.flush_crawled()
+
+    def flush_crawled(self) -> int:
+        """Write buffered marks in one transaction; returns the number written."""
         with self._db_lock:
+            with self._buffer_lock:
+                if not self._pending:
+                    return 0
+                rows = list(self._pending.values())
             conn = self._get_conn()
-            conn.execute("""
-                INSERT OR REPLACE INTO crawled_articles
-                (url, source_id, date_published, date_modified, date_crawled, content_hash, task_id, batch_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (url, source_id, date_published, date_modified, date_crawled, content_hash, task_id, batch_id))
-            conn.commit()
+            try:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO crawled_articles
+                    (url, source_id, date_published, date_modified, date_crawled, content_hash, task_id, batch_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                conn.executemany(
+                    "DELETE FROM failed_urls WHERE url = ? AND failed_at <= ?",
+                    [(row[0], row[4]) for row in rows]
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                self.logger.error(f"Failed to flush {len(rows)} crawled marks (kept in buffer): {e}")
+                return 0
+            # Bloom first, so is_crawled never sees a flushed URL in neither place
+            if self._bloom is not None:
+                self._refresh_bloom()
+            with self._buffer_lock:
+                for row in rows:
+                    # Drop only rows not re-marked while we were writing
+                    if self._pending.get(row[0]) is row:
+                        del self._pending[row[0]]
+        return len(rows)
+
+    def _start_flusher(self) -> None:
+        """Start the background flusher thread (once per registry)."""
+        with self._buffer_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="CrawledRegistryFlusher", daemon=True
+            )
+        self._flusher.start()
+        atexit.register(self.flush_crawled)
+
+    def _flush_loop(self) -> None:
+        """
+        Background flusher: every flush_interval seconds, write buffered marks
+        and add rows other processes wrote to the shared DB to the Bloom filter.
+        """
+        while not self._flusher_stop.wait(self.flush_interval):
+            try:
+                self.flush_crawled()
+                # flush_crawled only refreshes when this process had marks to write
+                if self._bloom is not None and not self._flusher_stop.is_set():
+                    self._refresh_bloom()
+            except Exception as e:
+                self.logger.error(f"Background registry flush failed: {e}")
 
     def find_duplicate_by_hash(self, content: str, exclude_url: Optional[str] = None) -> Optional[str]:
         """
@@ -234,6 +390,7 @@ class CrawledRegistry:
         Returns:
             URL of duplicate article if found, None otherwise
         """
+        self.flush_crawled()
         content_hash = hashlib.sha256(content[:500].encode('utf-8')).hexdigest()[:16]
 
         with self._db_lock:
@@ -254,6 +411,7 @@ class CrawledRegistry:
 
     def get_count_by_source(self, source_id: str) -> int:
         """Get count of articles from a specific source."""
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -264,6 +422,7 @@ class CrawledRegistry:
 
     def get_count_by_date(self, date: str) -> int:
         """Get count of articles published on a specific date (YYYY-MM-DD)."""
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -274,6 +433,7 @@ class CrawledRegistry:
 
     def get_total_count(self) -> int:
         """Get total count of all crawled articles."""
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute("SELECT COUNT(*) as count FROM crawled_articles")
@@ -281,6 +441,7 @@ class CrawledRegistry:
 
     def get_stats(self) -> dict:
         """Get statistics about crawled articles."""
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
 
@@ -309,6 +470,7 @@ class CrawledRegistry:
         Returns:
             Dict mapping source_id to {oldest, newest, count}
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
 
@@ -344,6 +506,7 @@ class CrawledRegistry:
         Returns:
             List of {month: "YYYY-MM", count: N} sorted by month
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute("""
@@ -368,6 +531,7 @@ class CrawledRegistry:
         Returns:
             Set of URLs
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -470,6 +634,7 @@ class CrawledRegistry:
         Returns:
             List of failed URL records
         """
+        self.flush_crawled()
         query = "SELECT * FROM failed_urls WHERE 1=1"
         params = []
 
@@ -501,6 +666,7 @@ class CrawledRegistry:
         Returns:
             Dict with total count, by source, and by error type
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
 
@@ -544,6 +710,7 @@ class CrawledRegistry:
         Returns:
             Number of records deleted
         """
+        self.flush_crawled()
         query = "DELETE FROM failed_urls WHERE 1=1"
         params = []
         if source_id:
@@ -562,6 +729,7 @@ class CrawledRegistry:
 
     def has_blocked_failures(self, source_id: str) -> bool:
         """Check if there are any blocked failures for the given source."""
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -587,6 +755,7 @@ class CrawledRegistry:
         Returns:
             List of URLs to retry
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute("""
@@ -626,6 +795,9 @@ class CrawledRegistry:
         """
         now = datetime.now().isoformat()
 
+        # Persist buffered marks first so the watermark never runs ahead of them
+        self.flush_crawled()
+
         with self._db_lock:
             conn = self._get_conn()
             existing = self.get_scan_watermark(source_id)
@@ -709,6 +881,7 @@ class CrawledRegistry:
 
         Extracts numeric article IDs from URLs using source-specific patterns.
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -736,6 +909,7 @@ class CrawledRegistry:
         Used to prevent day-level watermark skip from skipping days
         that have blocked (429) URLs needing retry.
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute(
@@ -786,6 +960,7 @@ class CrawledRegistry:
         Returns:
             List of validation results with status
         """
+        self.flush_crawled()
         results = []
 
         with self._db_lock:
@@ -846,6 +1021,7 @@ class CrawledRegistry:
         Returns:
             List of {"url", "date", "date_published"} sorted by date
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute("""
@@ -881,6 +1057,7 @@ class CrawledRegistry:
         Returns:
             Dict mapping "YYYY-MM-DD" to article count
         """
+        self.flush_crawled()
         with self._db_lock:
             conn = self._get_conn()
             cursor = conn.execute("""
@@ -896,6 +1073,13 @@ class CrawledRegistry:
 
     def close(self) -> None:
         """Close database connection, flushing any buffered data first."""
+        self._flusher_stop.set()
+        try:
+            self.flush_crawled()
+        except Exception as e:
+            self.logger.error(f"Error flushing crawled marks during close: {e}")
+        atexit.unregister(self.flush_crawled)
+
         # Flush any remaining not-found buffer before closing
         if hasattr(self, '_nf_buffer') and self._nf_buffer:
             try:
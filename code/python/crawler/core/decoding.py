@@ -0,0 +1,129 @@
+"""
+decoding.py - 回應內容解碼
+
+將 HTTP 回應的 bytes 轉為 str，依序嘗試：
+1. 來源提示編碼（settings.NEWS_SOURCES[source]['charset']）或先前學到的編碼
+2. 嚴格 UTF-8（大多數新聞站）
+3. Content-Type header / <meta charset> 宣告的編碼（成功後記住，供後續回應使用）
+4. charset_normalizer 統計偵測 — CPU 密集，交給 worker thread 執行，不阻塞 event loop
+
+前三步只做一次嚴格 decode，失敗即往下；只有第 4 步需要偵測。
+"""
+
+import codecs
+import re
+import time
+from typing import Optional
+
+from charset_normalizer import from_bytes
+
+
+# 只掃描開頭這麼多 bytes 找 <meta charset>
+META_SNIFF_BYTES = 2048
+
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(
+    rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE
+)
+
+# 單位元組編碼任何 bytes 都能「成功」decode，宣告不可信（常見於伺服器預設值）
+_PERMISSIVE_CODECS = {'latin_1', 'iso8859_1', 'cp1252', 'ascii'}
+
+
+def _normalize(charset: Optional[str]) -> Optional[str]:
+    """回傳 Python codec 正式名稱；未知或不可信的編碼回傳 None"""
+    if not charset:
+        return None
+    try:
+        name = codecs.lookup(charset.strip()).name
+    except LookupError:
+        return None
+    return None if name.replace('-', '_') in _PERMISSIVE_CODECS else name
+
+
+def _try_decode(raw: bytes, charset: Optional[str]) -> Optional[str]:
+    if not charset:
+        return None
+    try:
+        return raw.decode(charset)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+
+def declared_charset(raw: bytes, content_type: Optional[str]) -> Optional[str]:
+    """從 Content-Type header 或 HTML 開頭的 <meta> 取得宣告的編碼"""
+    if content_type:
+        match = _HEADER_CHARSET_RE.search(content_type)
+        if match and _normalize(match.group(1)):
+            return _normalize(match.group(1))
+    match = _META_CHARSET_RE.search(raw[:META_SNIFF_BYTES])
+    if match:
+        return _normalize(match.group(1).decode('ascii', errors='ignore'))
+    return None
+
+
+def detect_and_decode(raw: bytes) -> str:
+    """統計偵測編碼並解碼（CPU 密集，請在 thread pool 執行）"""
+    detected = from_bytes(raw).best()
+    if detected is not None:
+        return str(detected)
+    # Try Big5 for Traditional Chinese sites
+    text = _try_decode(raw, 'big5')
+    if text is not None:
+        return text
+    return raw.decode('utf-8', errors='replace')
+
+
+class ResponseDecoder:
+    """
+    單一來源的回應解碼器，記住該來源實際使用的編碼。
+
+    Args:
+        charset_hint: 來源設定的編碼（可為 None）
+    """
+
+    def __init__(self, charset_hint: Optional[str] = None):
+        self.charset_hint = _normalize(charset_hint)
+        self.learned_charset: Optional[str] = None
+
+    def decode_fast(self, raw: bytes, content_type: Optional[str] = None) -> tuple[Optional[str], str]:
+        """
+        不經統計偵測的解碼。
+
+        Returns:
+            (text, method)；method 為 'hint'、'learned'、'utf-8'、'declared'，
+            皆失敗時回傳 (None, 'detect')，需改用 detect_and_decode()
+        """
+        text = _try_decode(raw, self.charset_hint)
+        if text is not None:
+            return text, 'hint'
+
+        if self.learned_charset != self.charset_hint:
+            text = _try_decode(raw, self.learned_charset)
+            if text is not None:
+                return text, 'learned'
+
+        text = _try_decode(raw, 'utf-8')
+        if text is not None:
+            return text, 'utf-8'
+
+        charset = declared_charset(raw, content_type)
+        text = _try_decode(raw, charset)
+        if text is not None:
+            self.learned_charset = charset
+            return text, 'declared'
+
+        return None, 'detect'
+
+    async def decode(self, raw: bytes, content_type: Optional[str], loop) -> tuple[str, str, float]:
+        """
+        解碼回應；需要統計偵測時在 loop 的預設 executor 執行。
+
+        Returns:
+            (text, method, seconds) — seconds 為解碼總耗時（含 worker 等待）
+        """
+        t0 = time.perf_counter()
+        text, method = self.decode_fast(raw, content_type)
+        if text is None:
+            text = await loop.run_in_executor(None, detect_and_decode, raw)
+        return text, method, time.perf_counter() - t0
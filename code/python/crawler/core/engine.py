@@ -20,40 +20,14 @@ from typing import Dict, List, Optional, Any, Set, Union, Callable
 from datetime import datetime, timedelta
 from enum import Enum
 
-from charset_normalizer import from_bytes
-from htmldate import find_date
-import trafilatura
 
 from . import settings
 from .settings import DEFAULT_HEADERS
 from .interfaces import BaseParser, SessionType
 from .pipeline import Pipeline
 from .crawled_registry import get_registry, CrawledRegistry
-
-
-def _run_parse_in_thread(parser, html, url):
-    """在 thread pool 中執行 parser.parse()，避免 BeautifulSoup 阻塞 event loop。
-
-    所有 parser.parse() 都是 async def 但內部純 sync（BeautifulSoup 操作）。
-    此函式透過手動 exhaust coroutine 來取得回傳值。
-    """
-    coro = parser.parse(html, url)
-    try:
-        coro.send(None)
-        # Coroutine didn't raise StopIteration — should not happen
-        logging.getLogger("CrawlerEngine").warning(
-            f"Parser coroutine for {url} did not complete on first send"
-        )
-        return None
-    except StopIteration as e:
-        return e.value
-    except Exception as e:
-        logging.getLogger("CrawlerEngine").error(
-            f"Parser exception for {url}: {e}", exc_info=True
-        )
-        return None
-    finally:
-        coro.close()
+from .decoding import ResponseDecoder
+from .parse_pool import parse_html, get_parse_pool
 
 
 # ==================== Full Scan Configuration ====================
@@ -108,7 +82,8 @@ class CrawlerEngine:
         chunk_size: int = 0,
         chunk_by_month: bool = False,
         task_id: Optional[str] = None,
-        stop_check: Optional[Callable[[], bool]] = None
+        stop_check: Optional[Callable[[], bool]] = None,
+        parse_workers: Optional[int] = None
     ):
         """
         初始化爬蟲引擎
@@ -120,6 +95,7 @@ class CrawlerEngine:
             progress_callback: 進度回調函數，接收 stats dict
             chunk_size: 每個檔案的最大文章數（0 表示不限制）
             chunk_by_month: 是否按文章發布月份分檔
+            parse_workers: 解析用 process 數（None 使用 settings.PARSE_PROCESS_WORKERS，0 使用 thread pool）
         """
         self.parser = parser
         self.session = session
@@ -129,6 +105,9 @@ class CrawlerEngine:
         self.chunk_by_month = chunk_by_month
         self.task_id = task_id
         self.stop_check = stop_check
+        self.parse_workers = (
+            settings.PARSE_PROCESS_WORKERS if parse_workers is None else parse_workers
+        )
 
         # 載入來源專屬設定
         self._load_source_config()
@@ -160,6 +139,8 @@ class CrawlerEngine:
         self.logger.info(f"   Delay range: {self.min_delay:.1f}s - {self.max_delay:.1f}s")
         if self._use_proxy:
             self.logger.info(f"   Proxy mode: ENABLED")
+        if self.parse_workers > 0:
+            self.logger.info(f"   Parse workers: {self.parse_workers} processes")
         if chunk_size > 0:
             self.logger.info(f"   Chunk size: {chunk_size} articles per file")
         if chunk_by_month:
@@ -217,6 +198,10 @@ class CrawlerEngine:
         self._avg_latency: float = 0.0
         self._current_delay: float = (self.min_delay + self.max_delay) / 2.0
 
+        # Fetch / parse 階段的在途數量（由 _report_progress 回報）
+        self._fetch_inflight = 0
+        self._parse_inflight = 0
+
     def _load_source_config(self) -> None:
         """載入來源專屬設定"""
         source_name = self.parser.source_name
@@ -234,6 +219,7 @@ class CrawlerEngine:
             self._source_blocked_limit = source_config.get('blocked_limit')
             self._source_blocked_cooldown = source_config.get('blocked_cooldown')
             self._source_rate_limit_cooldown = source_config.get('rate_limit_cooldown')
+            charset_hint = source_config.get('charset')
         else:
             self.concurrent_limit = settings.CONCURRENT_REQUESTS
             self.min_delay = settings.MIN_DELAY
@@ -241,6 +227,8 @@ class CrawlerEngine:
             self._source_blocked_limit = None
             self._source_blocked_cooldown = None
             self._source_rate_limit_cooldown = None
+            charset_hint = None
+        self._decoder = ResponseDecoder(charset_hint)
 
     def _setup_logger(self) -> None:
         """設置日誌處理器"""
@@ -426,12 +414,36 @@ class CrawlerEngine:
         from .proxy_pool import remove_from_pool
         remove_from_pool(proxy_url)
 
+    async def _decode_response(self, raw: bytes, content_type: Optional[str]) -> str:
+        """解碼回應內容；統計偵測在 thread pool 執行，耗時記入 stats"""
+        text, method, elapsed = await self._decoder.decode(
+            raw, content_type, asyncio.get_running_loop()
+        )
+        if method == 'detect':
+            self.stats['decode_detected'] = self.stats.get('decode_detected', 0) + 1
+            self.stats['detect_seconds'] = self.stats.get('detect_seconds', 0.0) + elapsed
+        else:
+            self.stats['decode_fast'] = self.stats.get('decode_fast', 0) + 1
+        self.stats['decode_seconds'] = self.stats.get('decode_seconds', 0.0) + elapsed
+        return text
+
     async def _fetch(
         self,
         url: str,
         session: Union[aiohttp.ClientSession, 'CurlSession']
     ) -> tuple[Optional[str], CrawlStatus]:
         """獲取 URL 內容，包含重試機制"""
+        self._fetch_inflight += 1
+        try:
+            return await self._fetch_with_retry(url, session)
+        finally:
+            self._fetch_inflight -= 1
+
+    async def _fetch_with_retry(
+        self,
+        url: str,
+        session: Union[aiohttp.ClientSession, 'CurlSession']
+    ) -> tuple[Optional[str], CrawlStatus]:
         if self.rate_limit_hit:
             wait_time = self.rate_limit_cooldown_until - time.time()
             if wait_time > 0:
@@ -464,17 +476,10 @@ class CrawlerEngine:
                         if final_url != url and hasattr(self.parser, 'is_not_found_redirect'):
                             if self.parser.is_not_found_redirect(url, final_url):
                                 return (None, CrawlStatus.NOT_FOUND)
-                        # charset_normalizer 自動偵測編碼（取代 response.text 避免 Big5/cp950 炸）
-                        detected = from_bytes(response.content).best()
-                        if detected is not None:
-                            text = str(detected)
-                        else:
-                            # Try Big5 for Traditional Chinese sites
-                            try:
-                                response.content.decode('big5')
-                                text = response.content.decode('big5')
-                            except (UnicodeDecodeError, LookupError):
-                                text = response.content.decode('utf-8', errors='replace')
+                        # 自行解碼（取代 response.text 避免 Big5/cp950 炸）
+                        text = await self._decode_response(
+                            response.content, response.headers.get('content-type')
+                        )
                         return (text, CrawlStatus.SUCCESS)
                     elif status == 404:
                         return (None, CrawlStatus.NOT_FOUND)
@@ -506,16 +511,9 @@ class CrawlerEngine:
                                 if self.parser.is_not_found_redirect(url, final_url):
                                     return (None, CrawlStatus.NOT_FOUND)
                             raw = await response.read()
-                            detected = from_bytes(raw).best()
-                            if detected is not None:
-                                text = str(detected)
-                            else:
-                                # Try Big5 for Traditional Chinese sites
-                                try:
-                                    raw.decode('big5')
-                                    text = raw.decode('big5')
-                                except (UnicodeDecodeError, LookupError):
-                                    text = raw.decode('utf-8', errors='replace')
+                            text = await self._decode_response(
+                                raw, response.headers.get('Content-Type')
+                            )
                             return (text, CrawlStatus.SUCCESS)
                         elif response.status == 404:
                             return (None, CrawlStatus.NOT_FOUND)
@@ -631,15 +629,10 @@ class CrawlerEngine:
                         continue
 
                     try:
-                        loop = asyncio.get_running_loop()
-                        c_data = await loop.run_in_executor(
-                            None, _run_parse_in_thread, self.parser, c_html, candidate_url
-                        )
+                        c_data, _ = await self._parse(c_html, candidate_url, fallback=False)
                         if c_data is not None:
-                            c_data = self._ensure_date(c_data, c_html, candidate_url)
-                            if c_data is not None:
-                                self.logger.info(f"ID {article_id:,} found via candidate URL (404 fallback): {candidate_url}")
-                                return await self._handle_successful_parse(article_id, candidate_url, c_data)
+                            self.logger.info(f"ID {article_id:,} found via candidate URL (404 fallback): {candidate_url}")
+                            return await self._handle_successful_parse(article_id, candidate_url, c_data)
                     except Exception as e:
                         self.logger.debug(f"Error parsing candidate {candidate_url}: {e}")
 
@@ -668,25 +661,13 @@ class CrawlerEngine:
             return CrawlStatus.FETCH_ERROR
 
         try:
-            loop = asyncio.get_running_loop()
-            data = await loop.run_in_executor(
-                None, _run_parse_in_thread, self.parser, html, url
-            )
+            # Custom parser, then trafilatura fallback before candidate URLs
+            data, via = await self._parse(html, url)
             if data is not None:
-                data = self._ensure_date(data, html, url)
-                if data is not None:
-                    return await self._handle_successful_parse(article_id, url, data)
-
-            # Custom parser failed — try trafilatura fallback before candidate URLs
-            tf_data = await loop.run_in_executor(
-                None, self._trafilatura_fallback, html, url
-            )
-            if tf_data is not None:
-                tf_data = self._ensure_date(tf_data, html, url)
-                if tf_data is not None:
+                if via == 'trafilatura':
                     self.stats['trafilatura_fallbacks'] = self.stats.get('trafilatura_fallbacks', 0) + 1
                     self.logger.info(f"ID {article_id:,} rescued by trafilatura fallback")
-                    return await self._handle_successful_parse(article_id, url, tf_data)
+                return await self._handle_successful_parse(article_id, url, data)
 
             # Primary URL parse failed — try candidate URLs
             candidate_urls = self.parser.get_candidate_urls(article_id)
@@ -702,14 +683,10 @@ class CrawlerEngine:
                 if c_status != CrawlStatus.SUCCESS or c_html is None:
                     continue
 
-                c_data = await loop.run_in_executor(
-                    None, _run_parse_in_thread, self.parser, c_html, candidate_url
-                )
+                c_data, _ = await self._parse(c_html, candidate_url, fallback=False)
                 if c_data is not None:
-                    c_data = self._ensure_date(c_data, c_html, candidate_url)
-                    if c_data is not None:
-                        self.logger.info(f"ID {article_id:,} found via candidate URL: {candidate_url}")
-                        return await self._handle_successful_parse(article_id, candidate_url, c_data)
+                    self.logger.info(f"ID {article_id:,} found via candidate URL: {candidate_url}")
+                    return await self._handle_successful_parse(article_id, candidate_url, c_data)
 
             # All candidates failed
             self.stats['failed'] += 1
@@ -724,71 +701,25 @@ class CrawlerEngine:
             await self._report_progress()
             return CrawlStatus.FETCH_ERROR
 
-    def _ensure_date(self, data: Dict[str, Any], html: str, url: str = "") -> Optional[Dict[str, Any]]:
-        """Ensure article has a datePublished; use htmldate as fallback.
-
-        Returns the data dict (possibly with datePublished filled in),
-        or None if no date could be determined (article should be discarded).
-        """
-        if data.get('datePublished'):
-            return data
-        try:
-            hd = find_date(html, outputformat='%Y-%m-%d')
-        except Exception as e:
-            self.logger.debug(f"htmldate error: {e}")
-            hd = None
-        if hd:
-            data['datePublished'] = f"{hd}T00:00:00"
-            self.logger.info(f"htmldate fallback filled datePublished: {hd}")
-            return data
-        self.logger.warning(f"No date found (parser + htmldate), discarding: {url or data.get('url', '?')}")
-        return None
-
-    def _trafilatura_fallback(self, html: str, url: str) -> Optional[Dict[str, Any]]:
-        """Last-resort extraction using trafilatura when custom parser returns None.
+    async def _parse(
+        self,
+        html: str,
+        url: str,
+        fallback: bool = True,
+    ) -> tuple[Optional[Dict[str, Any]], str]:
+        """解析文章（parser + htmldate 補日期 + 可選 trafilatura 備援），回傳值同 parse_html()。
 
-        This is a sync method; call via run_in_executor from async context.
-        Returns a standard NewsArticle dict or None.
+        parse_workers > 0 時送到 process pool，否則在 thread pool 執行。
         """
+        self._parse_inflight += 1
         try:
-            result = trafilatura.bare_extraction(
-                html, url=url, favor_precision=True, include_comments=False
-            )
-        except Exception as e:
-            self.logger.debug(f"trafilatura fallback error for {url}: {e}")
-            return None
-
-        if not result:
-            return None
-
-        # trafilatura 2.0+ returns Document object; convert to dict
-        if hasattr(result, 'as_dict'):
-            result = result.as_dict()
-
-        title = result.get('title')
-        body = result.get('text')
-        if not title or not body or len(body) < settings.MIN_ARTICLE_LENGTH:
-            return None
-
-        # Assemble standard NewsArticle dict
-        date_str = result.get('date')  # YYYY-MM-DD format from trafilatura
-        date_published = f"{date_str}T00:00:00" if date_str else None
-
-        data = {
-            '@context': 'https://schema.org',
-            '@type': 'NewsArticle',
-            'headline': title,
-            'articleBody': body[:settings.MAX_ARTICLE_LENGTH],
-            'url': url,
-            '_source': 'trafilatura_fallback',
-        }
-        if date_published:
-            data['datePublished'] = date_published
-        author = result.get('author')
-        if author:
-            data['author'] = {'@type': 'Person', 'name': author}
-
-        return data
+            if self.parse_workers > 0:
+                pool = get_parse_pool(self.parse_workers)
+                return await pool.parse(self.parser.source_name, html, url, fallback)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, parse_html, self.parser, html, url, fallback)
+        finally:
+            self._parse_inflight -= 1
 
     async def _handle_successful_parse(
         self,
@@ -804,9 +735,9 @@ class CrawlerEngine:
                 await self._report_progress()
                 return CrawlStatus.FETCH_ERROR
 
-        # Mark as crawled (after successful save, or immediately if no auto-save)
+        # Mark as crawled (after successful save, or immediately if no auto-save);
+        # the registry flush also clears the URL's older failed_urls record
         self._mark_as_crawled(url, data)
-        self.registry.remove_failed(url)
         self.logger.info(f"Parsed ID: {article_id:,}")
         self.stats['success'] += 1
 
@@ -839,6 +770,11 @@ class CrawlerEngine:
             stats = self.stats.copy()
             stats['avg_latency'] = round(self._avg_latency, 3)
             stats['current_delay'] = round(self._current_delay, 3)
+            for key in ('decode_seconds', 'detect_seconds'):
+                if key in stats:
+                    stats[key] = round(stats[key], 3)
+            stats['fetch_queue'] = self._fetch_inflight
+            stats['parse_queue'] = self._parse_inflight
             self.progress_callback(stats)
         except Exception as e:
             self.logger.warning(f"Progress callback error: {e}")
@@ -1594,18 +1530,14 @@ class CrawlerEngine:
             return CrawlStatus.BLOCKED
 
         try:
-            loop = asyncio.get_running_loop()
-            data = await loop.run_in_executor(
-                None, _run_parse_in_thread, self.parser, html, url
-            )
-            if data is None:
+            # Ensure date exists (matching _process_article behavior)
+            data, via = await self._parse(html, url, fallback=False)
+            if via == 'parse_error':
                 self.stats['failed'] += 1
                 self._mark_failed(url, "parse_error", "Parser returned None on retry")
                 await self._report_progress()
                 return CrawlStatus.NOT_FOUND
 
-            # Ensure date exists (matching _process_article behavior)
-            data = self._ensure_date(data, html, url)
             if data is None:
                 self.stats['failed'] += 1
                 self._mark_failed(url, "no_date", "No date found on retry")
@@ -2222,7 +2154,12 @@ class CrawlerEngine:
         self.logger.info("=" * 50)
 
     async def close(self) -> None:
-        """關閉 Session 和 Logger FileHandlers"""
+        """寫入 registry buffer，關閉 Session 和 Logger FileHandlers"""
+        try:
+            self.registry.flush_crawled()
+        except Exception as e:
+            self.logger.error(f"Error flushing crawled registry: {e}")
+
         if self.session is not None:
             try:
                 await asyncio.wait_for(self.session.close(), timeout=5.0)
@@ -0,0 +1,247 @@
+"""
+parse_pool.py - 文章解析階段
+
+把一篇 HTML 變成文章 dict 的完整流程（parser.parse → htmldate 補日期 →
+trafilatura 備援）集中在 parse_html()，由 CrawlerEngine 送到 executor 執行：
+
+- 預設：event loop 的 thread pool（受 GIL 限制，多篇同時解析實際上只用一核）
+- ParsePool：process pool，每個 worker process 依來源各自建立 parser 實例
+  （parsers/factory.py），只傳入 HTML 與 URL，只傳回解析後的 dict
+
+Process pool 大小由 settings.PARSE_PROCESS_WORKERS 或 CrawlerEngine(parse_workers=...)
+設定，0 表示沿用 thread pool。
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from htmldate import find_date
+import trafilatura
+
+from . import settings
+from .interfaces import BaseParser
+
+
+def run_parser(parser: BaseParser, html: str, url: str) -> Optional[Dict[str, Any]]:
+    """同步執行 parser.parse()。
+
+    所有 parser.parse() 都是 async def 但內部純 sync（BeautifulSoup 操作）。
+    此函式透過手動 exhaust coroutine 來取得回傳值。
+    """
+    coro = parser.parse(html, url)
+    try:
+        coro.send(None)
+        # Coroutine didn't raise StopIteration — should not happen
+        logging.getLogger("CrawlerEngine").warning(
+            f"Parser coroutine for {url} did not complete on first send"
+        )
+        return None
+    except StopIteration as e:
+        return e.value
+    except Exception as e:
+        logging.getLogger("CrawlerEngine").error(
+            f"Parser exception for {url}: {e}", exc_info=True
+        )
+        return None
+    finally:
+        coro.close()
+
+
+def ensure_date(
+    data: Dict[str, Any],
+    html: str,
+    url: str,
+    logger: logging.Logger,
+) -> Optional[Dict[str, Any]]:
+    """Ensure article has a datePublished; use htmldate as fallback.
+
+    Returns the data dict (possibly with datePublished filled in),
+    or None if no date could be determined (article should be discarded).
+    """
+    if data.get('datePublished'):
+        return data
+    try:
+        hd = find_date(html, outputformat='%Y-%m-%d')
+    except Exception as e:
+        logger.debug(f"htmldate error: {e}")
+        hd = None
+    if hd:
+        data['datePublished'] = f"{hd}T00:00:00"
+        logger.info(f"htmldate fallback filled datePublished: {hd}")
+        return data
+    logger.warning(f"No date found (parser + htmldate), discarding: {url or data.get('url', '?')}")
+    return None
+
+
+def trafilatura_extract(html: str, url: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
+    """Last-resort extraction using trafilatura when custom parser returns None.
+
+    Returns a standard NewsArticle dict or None.
+    """
+    try:
+        result = trafilatura.bare_extraction(
+            html, url=url, favor_precision=True, include_comments=False
+        )
+    except Exception as e:
+        logger.debug(f"trafilatura fallback error for {url}: {e}")
+        return None
+
+    if not result:
+        return None
+
+    # trafilatura 2.0+ returns Document object; convert to dict
+    if hasattr(result, 'as_dict'):
+        result = result.as_dict()
+
+    title = result.get('title')
+    body = result.get('text')
+    if not title or not body or len(body) < settings.MIN_ARTICLE_LENGTH:
+        return None
+
+    # Assemble standard NewsArticle dict
+    date_str = result.get('date')  # YYYY-MM-DD format from trafilatura
+    date_published = f"{date_str}T00:00:00" if date_str else None
+
+    data = {
+        '@context': 'https://schema.org',
+        '@type': 'NewsArticle',
+        'headline': title,
+        'articleBody': body[:settings.MAX_ARTICLE_LENGTH],
+        'url': url,
+        '_source': 'trafilatura_fallback',
+    }
+    if date_published:
+        data['datePublished'] = date_published
+    author = result.get('author')
+    if author:
+        data['author'] = {'@type': 'Person', 'name': author}
+
+    return data
+
+
+def parse_html(
+    parser: BaseParser,
+    html: str,
+    url: str,
+    fallback: bool = True,
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    解析一篇文章（同步，於 executor 中執行）。
+
+    Args:
+        parser: 來源 parser
+        html: 已解碼的 HTML
+        url: 文章 URL
+        fallback: parser 失敗時是否嘗試 trafilatura
+
+    Returns:
+        (data, via)；via 為 'parser'、'trafilatura'，
+        失敗時 data 為 None、via 為 'no_date'（有內容但無日期）或 'parse_error'
+    """
+    logger = logging.getLogger(f"CrawlerEngine_{parser.source_name}")
+    via = 'parse_error'
+
+    data = run_parser(parser, html, url)
+    if data is not None:
+        if ensure_date(data, html, url, logger) is not None:
+            return data, 'parser'
+        via = 'no_date'
+
+    if fallback:
+        data = trafilatura_extract(html, url, logger)
+        if data is not None and ensure_date(data, html, url, logger) is not None:
+            return data, 'trafilatura'
+
+    return None, via
+
+
+# ==================== Worker process ====================
+
+# 每個 worker process 各自持有的 parser 實例（依來源）
+_worker_parsers: Dict[str, Optional[BaseParser]] = {}
+
+
+def _parse_in_worker(
+    source_name: str,
+    html: str,
+    url: str,
+    fallback: bool,
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Worker process 入口：取得（或建立）該來源的 parser 後解析"""
+    if source_name not in _worker_parsers:
+        from ..parsers.factory import CrawlerFactory
+        _worker_parsers[source_name] = CrawlerFactory.get_parser(source_name)
+    parser = _worker_parsers[source_name]
+    if parser is None:
+        return None, 'parse_error'
+    return parse_html(parser, html, url, fallback)
+
+
+class ParsePool:
+    """
+    以 process pool 執行文章解析，繞過 GIL。
+
+    Args:
+        workers: worker process 數量
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """已送出但尚未完成的解析數（含排隊中）"""
+        return self._pending
+
+    async def parse(
+        self,
+        source_name: str,
+        html: str,
+        url: str,
+        fallback: bool = True,
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """在 worker process 解析文章，回傳值同 parse_html()"""
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            return await loop.run_in_executor(
+                self._executor, _parse_in_worker, source_name, html, url, fallback
+            )
+        finally:
+            self._pending -= 1
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """停止 worker；cancel_pending=False 時已送出的解析仍會跑完"""
+        self._executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+
+# Process 內共用一個 pool（worker 啟動成本高，不隨 engine 建立/關閉）
+_parse_pool: Optional[ParsePool] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool(workers: int) -> ParsePool:
+    """取得共用的 ParsePool；大小取各 engine 要求的最大值，要求較少時沿用現有 pool"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None or _parse_pool.workers < workers:
+            if _parse_pool is not None:
+                # 其他 engine 可能仍在使用舊 pool：不取消已送出的解析，讓它們跑完
+                _parse_pool.shutdown(cancel_pending=False)
+            _parse_pool = ParsePool(workers)
+            logging.getLogger("CrawlerEngine").info(f"Started parse process pool ({workers} workers)")
+        return _parse_pool
+
+
+def close_parse_pool() -> None:
+    """關閉共用的 ParsePool"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
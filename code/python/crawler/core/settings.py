@@ -49,6 +49,15 @@ CONCURRENT_REQUESTS = 3
 MIN_DELAY = 0.8
 MAX_DELAY = 2.9
 
+# 解析 process pool：BeautifulSoup/htmldate/trafilatura 在多個 process 執行（0 = 使用 thread pool）
+PARSE_PROCESS_WORKERS = int(os.environ.get("CRAWLER_PARSE_WORKERS", "0"))
+
+# Crawled registry write-behind：已爬取標記先進 buffer，依時間或數量批次寫入 SQLite
+REGISTRY_FLUSH_INTERVAL = 2.0        # 背景 flush 間隔（秒）
+REGISTRY_FLUSH_BATCH = 200           # buffer 達此數量立即 flush
+REGISTRY_BLOOM_ERROR_RATE = 0.01     # is_crawled Bloom filter 誤判率
+REGISTRY_BLOOM_MIN_CAPACITY = 100_000
+
 # 429 降速設定
 RATE_LIMIT_COOLDOWN = 10.0
 RATE_LIMIT_BACKOFF = 2.0
@@ -100,6 +109,7 @@ CURL_CFFI_SOURCES = [
 ]
 
 # ==================== 新聞來源設定 ====================
+# 可選 'charset'：該來源的頁面編碼（如 "big5"），解碼時優先嘗試，省去統計偵測
 NEWS_SOURCES = {
     "ltn": {
         "name": "自由時報",
@@ -32,6 +32,7 @@ from typing import Optional
 from .core import settings
 from .parsers.factory import CrawlerFactory, list_available_sources
 from .core.engine import CrawlerEngine
+from .core.parse_pool import close_parse_pool
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -129,6 +130,12 @@ Examples:
         type=int,
         help='Maximum pages to crawl (for list-based parsers)'
     )
+    parser_group.add_argument(
+        '--parse-workers',
+        type=int,
+        default=None,
+        help='Parse articles in N worker processes (0 = thread pool; default from CRAWLER_PARSE_WORKERS)'
+    )
 
     # 其他選項
     parser.add_argument(
@@ -227,7 +234,7 @@ async def main_async(args: argparse.Namespace) -> int:
     try:
         # 創建引擎
         auto_save = (not args.no_auto_save) and (not args.dry_run)
-        engine = CrawlerEngine(parser, auto_save=auto_save)
+        engine = CrawlerEngine(parser, auto_save=auto_save, parse_workers=args.parse_workers)
         logger.info(f"Engine initialized (auto_save={auto_save})")
 
         stats = None
@@ -301,6 +308,8 @@ def main() -> int:
     except KeyboardInterrupt:
         print("\nInterrupted by user")
         return 130
+    finally:
+        close_parse_pool()
 
 
 if __name__ == '__main__':
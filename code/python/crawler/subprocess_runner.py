@@ -50,6 +50,7 @@ def _send(msg: dict):
 async def main(params: dict, task_id: str, signal_dir: str):
     from crawler.parsers.factory import CrawlerFactory
     from crawler.core.engine import CrawlerEngine
+    from crawler.core.parse_pool import close_parse_pool
 
     source = params["source"]
     mode = params.get("mode")
@@ -92,6 +93,7 @@ async def main(params: dict, task_id: str, signal_dir: str):
         chunk_by_month=params.get("chunk_by_month", False),
         task_id=task_id,
         stop_check=check_stop,
+        parse_workers=params.get("parse_workers"),
     )
 
     try:
@@ -157,6 +159,10 @@ async def main(params: dict, task_id: str, signal_dir: str):
         sys.stdout.close()
         sys.exit(1)
 
+    finally:
+        # The parse process pool is shared per process; this task owns the process
+        close_parse_pool()
+
 
 if __name__ == "__main__":
     arg_parser = argparse.ArgumentParser(description="Crawler subprocess runner")
@@ -1,6 +1,8 @@
+import asyncio
 import os
+import weakref
 import httpx
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from misc.logger.logging_config_helper import get_configured_logger, LogLevel
 
@@ -12,6 +14,32 @@ MODEL = "qwen/qwen3-embedding-4b"
 TRUNCATE_DIM = 1024
 
 
+# One client per event loop, reused so batch runs keep their connections
+# alive. Each client is closed when its loop shuts down.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+
+
+async def _client_lifetime(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    """Stays suspended until the loop's shutdown_asyncgens() (run by asyncio.run) closes it."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20))
+        lifetime = _client_lifetime(client)
+        _clients[loop] = (client, lifetime)
+        # First iteration registers the generator with this loop
+        await lifetime.__anext__()
+        return client
+    return entry[0]
+
+
 def _get_api_key() -> str:
     key = os.environ.get("OPENROUTER_API_KEY")
     if not key:
@@ -27,17 +55,18 @@ async def get_openrouter_embedding(
 
     logger.debug(f"OpenRouter embedding request, model={use_model}, text_length={len(text)}")
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {_get_api_key()}",
-                "Content-Type": "application/json",
-            },
-            json={"model": use_model, "input": [prefixed]},
-        )
-        response.raise_for_status()
-        data = response.json()
+    client = await _get_client()
+    response = await client.post(
+        OPENROUTER_URL,
+        headers={
+            "Authorization": f"Bearer {_get_api_key()}",
+            "Content-Type": "application/json",
+        },
+        json={"model": use_model, "input": [prefixed]},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    data = response.json()
 
     embedding = data["data"][0]["embedding"]
     truncated = embedding[:TRUNCATE_DIM]
@@ -58,17 +87,18 @@ async def get_openrouter_batch_embeddings(
 
     logger.debug(f"OpenRouter batch embedding request, model={use_model}, batch_size={len(texts)}")
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {_get_api_key()}",
-                "Content-Type": "application/json",
-            },
-            json={"model": use_model, "input": prefixed},
-        )
-        response.raise_for_status()
-        data = response.json()
+    client = await _get_client()
+    response = await client.post(
+        OPENROUTER_URL,
+        headers={
+            "Authorization": f"Bearer {_get_api_key()}",
+            "Content-Type": "application/json",
+        },
+        json={"model": use_model, "input": prefixed},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    data = response.json()
 
     sorted_data = sorted(data["data"], key=lambda x: x["index"])
     results = [item["embedding"][:TRUNCATE_DIM] for item in sorted_data]
@@ -12,7 +12,8 @@ from .chunking_engine import ChunkingEngine, Chunk, make_chunk_id, parse_chunk_i
 # Phase 3: Storage & Safety
 from .dual_storage import VaultStorage, VaultConfig, MapPayload
 from .rollback_manager import RollbackManager, MigrationRecord
-from .pipeline import IndexingPipeline, PipelineResult, PipelineCheckpoint
+from .checkpoint_log import PipelineCheckpoint
+from .pipeline import IndexingPipeline, PipelineResult
 
 # Phase 4: Integration Helpers
 from .vault_helpers import (
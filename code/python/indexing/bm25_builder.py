@@ -0,0 +1,108 @@
+"""
+BM25 Index Builder.
+
+Builds a prebuilt BM25Index (core/bm25.py) over the article corpus so that
+retrieval-time BM25 uses corpus-wide document frequencies and average
+document length instead of statistics from the retrieved candidate set.
+
+Documents are keyed by article URL; text is "title content".
+
+Usage:
+    python -m indexing.bm25_builder --out data/indexing/bm25_index.npz
+    python -m indexing.bm25_builder --out idx.npz --tsv data/crawler/articles/*.tsv
+    python -m indexing.bm25_builder --out idx.npz --update new.tsv   (incremental)
+
+Point config_retrieval.yaml bm25_params.index_path at the output file.
+"""
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterator
+
+from core.bm25 import BM25Index
+
+from .ingestion_engine import IngestionEngine
+from .postgresql_uploader import DEFAULT_CONNECTION_STRING
+
+logger = logging.getLogger(__name__)
+
+PG_FETCH_SIZE = 2000  # rows per server-side cursor fetch
+
+
+def iter_postgres_articles(connection_string: str = None) -> Iterator[tuple[str, str]]:
+    """Stream (url, "title content") from the articles table."""
+    import psycopg
+
+    dsn = connection_string or os.environ.get("POSTGRES_CONNECTION_STRING", DEFAULT_CONNECTION_STRING)
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor(name="bm25_builder") as cur:
+            cur.itersize = PG_FETCH_SIZE
+            cur.execute("SELECT url, title, content FROM articles")
+            for url, title, content in cur:
+                yield url, f"{title or ''} {content or ''}"
+
+
+def iter_tsv_articles(tsv_paths: list[Path]) -> Iterator[tuple[str, str]]:
+    """Stream (url, "headline body") from crawler TSV files."""
+    ingestion = IngestionEngine()
+    for tsv_path in tsv_paths:
+        for cdm in ingestion.parse_tsv_file(tsv_path):
+            if cdm.is_valid:
+                yield cdm.url, f"{cdm.headline or ''} {cdm.article_body or ''}"
+
+
+def build_index(documents: Iterator[tuple[str, str]], index: BM25Index = None) -> BM25Index:
+    """Add documents to index (new index if None) and log throughput."""
+    index = index or BM25Index()
+    t0 = time.time()
+    count = 0
+    for url, text in documents:
+        index.add_document(url, text)
+        count += 1
+        if count % 50000 == 0:
+            logger.info(f"  indexed {count} documents ({count / (time.time() - t0):.0f} docs/s)")
+
+    elapsed = time.time() - t0
+    logger.info(
+        f"Indexed {count} documents in {elapsed:.1f}s -- "
+        f"corpus={index.corpus_size}, vocab={index.vocabulary_size}, "
+        f"avgdl={index.avg_doc_length:.1f}"
+    )
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a BM25 inverted index over the article corpus')
+    parser.add_argument('--out', type=Path, required=True, help='Output .npz path')
+    parser.add_argument('--tsv', type=Path, nargs='*', help='Build from TSV files instead of PostgreSQL')
+    parser.add_argument('--update', type=Path, nargs='*',
+                        help='Load --out and add/replace articles from these TSV files')
+    parser.add_argument('--k1', type=float, default=1.5, help='BM25 k1')
+    parser.add_argument('--b', type=float, default=0.75, help='BM25 b')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+        datefmt='%H:%M:%S',
+    )
+
+    if args.update:
+        index = BM25Index.load(str(args.out))
+        build_index(iter_tsv_articles(args.update), index)
+    elif args.tsv:
+        index = build_index(iter_tsv_articles(args.tsv), BM25Index(k1=args.k1, b=args.b))
+    else:
+        index = build_index(iter_postgres_articles(), BM25Index(k1=args.k1, b=args.b))
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    index.save(str(args.out))
+    logger.info(f"Saved BM25 index to {args.out} ({args.out.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+Append-only checkpoint for IndexingPipeline.
+
+A checkpoint is two files:
+
+  <checkpoint>.json  Small header: next line number, byte offset into the TSV,
+                     which log generation is current and how much of it the
+                     header covers. Rewritten atomically.
+  <checkpoint>.json.log (generation 0), <checkpoint>.json.log.<N>
+                     Append-only log, one entry per processed or failed
+                     article: a 64-bit URL hash plus its line number.
+
+Each save appends the entries recorded since the previous save, then replaces
+the header, so the cost per checkpoint interval does not depend on how many
+articles were processed before. Log bytes beyond the header's log_size (a
+crash between append and header write) are ignored and truncated on resume,
+as is an incomplete last line.
+
+Compaction writes a new log generation keeping only entries at or past the
+checkpointed line (articles finished ahead of the resume point) plus
+failures, then switches the header to it and deletes the old generation. A
+crash at any point leaves the header pointing at a complete log. Lines
+before the resume point are never re-read, since resume seeks straight to the
+byte offset.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+
+
+def url_key(url: str) -> str:
+    """64-bit hex hash of a URL as stored in the log."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class PipelineCheckpoint:
+    """
+    Resumable-processing checkpoint with an append-only URL log.
+
+    Args:
+        path: Header file path (the log is path + ".log", or ".log.<N>" after compactions)
+        tsv_path: TSV file being processed
+        compact_threshold: Log entries appended since the last compaction
+            that trigger the next one
+    """
+
+    def __init__(self, path: Path, tsv_path: str, compact_threshold: int = 10000):
+        self.path = Path(path)
+        self.log_generation = 0
+        self.log_path = self._log_path_for(0)
+        self.tsv_path = tsv_path
+        self.compact_threshold = compact_threshold
+
+        now = datetime.utcnow().isoformat()
+        self.started_at = now
+        self.updated_at = now
+        self.line_num = 0  # Next line to process
+        self.byte_offset: Optional[int] = 0  # None for legacy checkpoints (offset unknown)
+
+        self._processed: dict[str, int] = {}  # url hash -> line number
+        self._failed: dict[str, tuple[int, str]] = {}  # url hash -> (line number, error)
+        self._pending: list[str] = []  # Log lines recorded since the last save
+        self._log_size = 0
+        self._entries_since_compaction = 0
+
+    def _log_path_for(self, generation: int) -> Path:
+        suffix = ".log" if generation == 0 else f".log.{generation}"
+        return self.path.with_name(self.path.name + suffix)
+
+    def _stale_logs(self) -> list[Path]:
+        """Log files of other generations (left by an interrupted compaction)."""
+        pattern = self.path.name + ".log*"
+        return [p for p in self.path.parent.glob(pattern) if p != self.log_path]
+
+    # ---------------------------------------------------------------- queries
+
+    def is_processed(self, url: str) -> bool:
+        return url_key(url) in self._processed
+
+    @property
+    def processed_count(self) -> int:
+        return len(self._processed)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self._failed)
+
+    # ---------------------------------------------------------------- updates
+
+    def mark_processed(self, url: str, line_num: int) -> None:
+        key = url_key(url)
+        self._processed[key] = line_num
+        self._pending.append(f"P\t{line_num}\t{key}\n")
+
+    def mark_failed(self, url: str, line_num: int, error: str) -> None:
+        key = url_key(url)
+        self._failed[key] = (line_num, error)
+        self._pending.append(f"F\t{line_num}\t{key}\t{json.dumps(error, ensure_ascii=False)}\n")
+
+    def save(self, line_num: int, byte_offset: Optional[int]) -> None:
+        """
+        Persist progress: append new log entries, then replace the header.
+
+        Args:
+            line_num: Next line to process on resume
+            byte_offset: Byte offset of that line in the TSV
+        """
+        self.line_num = line_num
+        self.byte_offset = byte_offset
+        self.updated_at = datetime.utcnow().isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._pending:
+            data = "".join(self._pending).encode('utf-8')
+            with open(self.log_path, 'ab') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_size += len(data)
+            self._entries_since_compaction += len(self._pending)
+            self._pending = []
+
+        if self._entries_since_compaction >= self.compact_threshold:
+            self.compact()
+        self._write_header()
+
+    def compact(self) -> None:
+        """Write a new log generation with entries at or past the checkpointed line, plus failures."""
+        lines = [
+            f"P\t{line}\t{key}\n" for key, line in self._processed.items() if line >= self.line_num
+        ]
+        lines += [
+            f"F\t{line}\t{key}\t{json.dumps(error, ensure_ascii=False)}\n"
+            for key, (line, error) in self._failed.items()
+        ]
+        data = "".join(lines).encode('utf-8')
+        generation = self.log_generation + 1
+        new_log = self._log_path_for(generation)
+        with open(new_log, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # The header switch is the commit point; until then the old log stays current
+        old_log = self.log_path
+        self.log_generation = generation
+        self.log_path = new_log
+        self._log_size = len(data)
+        self._entries_since_compaction = 0
+        self._write_header()
+        old_log.unlink(missing_ok=True)
+        logger.debug(f"Compacted checkpoint log to {len(lines)} entries (generation {generation})")
+
+    def _write_header(self) -> None:
+        header = {
+            'version': FORMAT_VERSION,
+            'tsv_path': self.tsv_path,
+            'line_num': self.line_num,
+            'byte_offset': self.byte_offset,
+            'log_generation': self.log_generation,
+            'log_size': self._log_size,
+            'processed_count': len(self._processed),
+            'failed_count': len(self._failed),
+            'started_at': self.started_at,
+            'updated_at': self.updated_at,
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(header, f)
+        os.replace(tmp, self.path)
+
+    def delete(self) -> None:
+        """Remove header and log after successful completion."""
+        for p in [self.path, self.log_path] + self._stale_logs():
+            p.unlink(missing_ok=True)
+
+    # ---------------------------------------------------------------- loading
+
+    @classmethod
+    def open(cls, path: Path, tsv_path: str, compact_threshold: int = 10000) -> 'PipelineCheckpoint':
+        """Load the checkpoint at path if present, else start a new one."""
+        checkpoint = cls(path, tsv_path, compact_threshold)
+        if not checkpoint.path.exists():
+            # A log without a header was never committed; start it afresh
+            for p in [checkpoint.log_path] + checkpoint._stale_logs():
+                p.unlink(missing_ok=True)
+            return checkpoint
+
+        with open(checkpoint.path, 'r', encoding='utf-8') as f:
+            header = json.load(f)
+
+        checkpoint.started_at = header.get('started_at', checkpoint.started_at)
+        checkpoint.updated_at = header.get('updated_at', checkpoint.updated_at)
+
+        if header.get('version') != FORMAT_VERSION:
+            checkpoint._load_legacy(header)
+            return checkpoint
+
+        checkpoint.line_num = header.get('line_num', 0)
+        checkpoint.byte_offset = header.get('byte_offset')
+        checkpoint.log_generation = header.get('log_generation', 0)
+        checkpoint.log_path = checkpoint._log_path_for(checkpoint.log_generation)
+        checkpoint._load_log(header.get('log_size', 0))
+        return checkpoint
+
+    def _load_log(self, log_size: int) -> None:
+        for stale in self._stale_logs():
+            stale.unlink(missing_ok=True)
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, 'rb') as f:
+            data = f.read(log_size)
+        # Keep whole lines only: a torn write can leave a partial last entry
+        data = data[:data.rfind(b'\n') + 1]
+        if os.path.getsize(self.log_path) > len(data):
+            # Drop entries appended after the last header write
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(len(data))
+        self._log_size = len(data)
+
+        skipped = 0
+        for entry in data.split(b'\n')[:-1]:
+            try:
+                parts = entry.decode('utf-8').split('\t', 3)
+                if parts[0] == 'P' and len(parts) == 3:
+                    self._processed[parts[2]] = int(parts[1])
+                elif parts[0] == 'F' and len(parts) == 4:
+                    self._failed[parts[2]] = (int(parts[1]), json.loads(parts[3]))
+                else:
+                    skipped += 1
+            except ValueError:
+                skipped += 1
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable entries in {self.log_path}")
+
+    def _load_legacy(self, data: dict) -> None:
+        """Convert a version-1 checkpoint (full JSON sets); its byte offset is unknown."""
+        self.line_num = data.get('last_processed_line', 0)
+        self.byte_offset = None
+        for url in data.get('processed_urls', []):
+            self.mark_processed(url, self.line_num)
+        for url, error in data.get('failed_urls', {}).items():
+            self.mark_failed(url, self.line_num, error)
+        logger.info(f"Converting legacy checkpoint {self.path} ({len(self._processed)} processed URLs)")
@@ -3,15 +3,21 @@ Dual-Tier Storage for M0 Indexing Module.
 
 - The Map (Qdrant): Stores chunk summaries + embeddings for search
 - The Vault (SQLite): Stores compressed full text for retrieval
+
+Vault row versions:
+- 2: Zstd frame without dictionary (or raw UTF-8 when zstd is unavailable)
+- 3: Zstd frame compressed with the per-source dictionary in dict_id
 """
 
 import json
+import logging
 import sqlite3
 import threading
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
 try:
     import zstandard as zstd
@@ -19,8 +25,26 @@ try:
 except ImportError:
     ZSTD_AVAILABLE = False
 
+# multi_decompress_to_buffer is only provided by the C backend
+MULTI_DECOMPRESS_AVAILABLE = ZSTD_AVAILABLE and hasattr(zstd.ZstdDecompressor, 'multi_decompress_to_buffer')
+
+from core.qdrant_payload import filter_fields_from_schema
+
 from .chunking_engine import Chunk
 
+logger = logging.getLogger(__name__)
+
+VERSION_ZSTD = 2
+VERSION_ZSTD_DICT = 3
+
+
+def source_of(url: str) -> str:
+    """Source key for dictionaries: URL domain without www. (same as CanonicalDataModel.source_id)."""
+    domain = urlparse(url).netloc.lower()
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
 
 @dataclass
 class VaultConfig:
@@ -31,13 +55,19 @@ class VaultConfig:
     long_threshold: int = 5000
     short_compression: int = 1
     long_compression: int = 5
+    dict_size: int = 32768           # Trained dictionary size (bytes)
+    dict_min_samples: int = 100      # Minimum chunks to train a source dictionary
+    dict_max_samples: int = 5000     # Most recent chunks used for training
+    decompress_threads: int = 0      # Batched reads: 0 = calling thread, -1 = one per CPU
 
 
 class VaultStorage:
     """
     SQLite-based storage for compressed full text.
 
-    Uses Zstd compression with adaptive compression levels.
+    Uses Zstd compression with adaptive compression levels. Sources with a
+    trained dictionary (train_dictionary) are compressed with it; the
+    dictionary id is stored per row so older rows keep decoding.
     """
 
     SCHEMA = """
@@ -49,11 +79,20 @@ class VaultStorage:
         original_length INTEGER,
         compressed_length INTEGER,
         version INTEGER DEFAULT 2,
+        dict_id INTEGER,
         is_deleted INTEGER DEFAULT 0,
         created_at TEXT DEFAULT CURRENT_TIMESTAMP,
         deleted_at TEXT
     );
 
+    CREATE TABLE IF NOT EXISTS compression_dicts (
+        dict_id INTEGER PRIMARY KEY,
+        source TEXT NOT NULL,
+        dict_data BLOB NOT NULL,
+        sample_count INTEGER,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
     CREATE INDEX IF NOT EXISTS idx_article_url ON article_chunks(article_url);
     CREATE INDEX IF NOT EXISTS idx_version ON article_chunks(version);
     CREATE INDEX IF NOT EXISTS idx_is_deleted ON article_chunks(is_deleted);
@@ -74,7 +113,13 @@ class VaultStorage:
         self.config = config
         self._conn: Optional[sqlite3.Connection] = None
         self._conn_lock = threading.Lock()
-        self._decompressor = zstd.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+        # Dictionaries by dict_id, and the dict_id new writes use per source
+        self._dicts: dict[int, 'zstd.ZstdCompressionDict'] = {}
+        self._active_dicts: dict[str, int] = {}
+        self._dict_lock = threading.Lock()
+        # Per-thread ZstdCompressor/ZstdDecompressor reuse (instances are not thread-safe)
+        self._local = threading.local()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection (thread-safe)."""
@@ -85,9 +130,63 @@ class VaultStorage:
                 # check_same_thread=False for async compatibility
                 self._conn = sqlite3.connect(str(self.config.db_path), check_same_thread=False)
                 self._conn.execute("PRAGMA journal_mode=WAL")
+                self._migrate(self._conn)
                 self._conn.executescript(self.SCHEMA)
+                self._load_dicts(self._conn)
             return self._conn
 
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Add dict_id to vaults created before dictionary compression."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(article_chunks)")}
+        if columns and 'dict_id' not in columns:
+            conn.execute("ALTER TABLE article_chunks ADD COLUMN dict_id INTEGER")
+            conn.commit()
+
+    def _load_dicts(self, conn: sqlite3.Connection) -> None:
+        """Load stored dictionaries; the newest per source is used for writes."""
+        if not ZSTD_AVAILABLE:
+            return
+        rows = conn.execute(
+            "SELECT dict_id, source, dict_data FROM compression_dicts ORDER BY dict_id"
+        ).fetchall()
+        with self._dict_lock:
+            for dict_id, source, data in rows:
+                if dict_id not in self._dicts:
+                    self._dicts[dict_id] = zstd.ZstdCompressionDict(data)
+                self._active_dicts[source] = dict_id
+
+    def _get_dict(self, dict_id: int) -> 'zstd.ZstdCompressionDict':
+        if dict_id not in self._dicts:
+            # Trained by another process after we loaded
+            self._load_dicts(self._get_connection())
+        return self._dicts[dict_id]
+
+    def _compressor(self, level: int, dict_id: Optional[int]) -> 'zstd.ZstdCompressor':
+        cache = getattr(self._local, 'compressors', None)
+        if cache is None:
+            cache = self._local.compressors = {}
+        compressor = cache.get((level, dict_id))
+        if compressor is None:
+            if dict_id is None:
+                compressor = zstd.ZstdCompressor(level=level)
+            else:
+                compressor = zstd.ZstdCompressor(level=level, dict_data=self._get_dict(dict_id))
+            cache[(level, dict_id)] = compressor
+        return compressor
+
+    def _decompressor(self, dict_id: Optional[int]) -> 'zstd.ZstdDecompressor':
+        cache = getattr(self._local, 'decompressors', None)
+        if cache is None:
+            cache = self._local.decompressors = {}
+        decompressor = cache.get(dict_id)
+        if decompressor is None:
+            if dict_id is None:
+                decompressor = zstd.ZstdDecompressor()
+            else:
+                decompressor = zstd.ZstdDecompressor(dict_data=self._get_dict(dict_id))
+            cache[dict_id] = decompressor
+        return decompressor
+
     def _get_compression_level(self, text_length: int) -> int:
         """Get adaptive compression level based on text length."""
         if text_length < self.config.short_threshold:
@@ -96,27 +195,60 @@ class VaultStorage:
             return self.config.long_compression
         return self.config.compression_level
 
-    def _compress(self, text: str) -> bytes:
-        """Compress text using Zstd or fallback to raw bytes."""
+    def _compress(self, text: str, source: Optional[str] = None) -> tuple[bytes, int, Optional[int]]:
+        """
+        Compress text using Zstd (with the source's dictionary if trained) or fallback to raw bytes.
+
+        Returns:
+            (data, version, dict_id)
+        """
         text_bytes = text.encode('utf-8')
         if not ZSTD_AVAILABLE:
-            return text_bytes
+            return text_bytes, VERSION_ZSTD, None
 
         level = self._get_compression_level(len(text))
-        compressor = zstd.ZstdCompressor(level=level)
-        return compressor.compress(text_bytes)
+        dict_id = self._active_dicts.get(source) if source else None
+        data = self._compressor(level, dict_id).compress(text_bytes)
+        return data, (VERSION_ZSTD if dict_id is None else VERSION_ZSTD_DICT), dict_id
 
-    def _decompress(self, data: bytes) -> str:
+    def _decompress(self, data: bytes, dict_id: Optional[int] = None) -> str:
         """Decompress data using Zstd or treat as raw bytes."""
         if not ZSTD_AVAILABLE:
             return data.decode('utf-8')
 
         try:
-            return self._decompressor.decompress(data).decode('utf-8')
+            return self._decompressor(dict_id).decompress(data).decode('utf-8')
         except zstd.ZstdError:
             # Fallback: maybe it's not compressed
             return data.decode('utf-8')
 
+    def _decompress_many(self, rows: list[tuple[bytes, Optional[int]]]) -> list[str]:
+        """
+        Decompress many (data, dict_id) blobs, one multi-frame call per dictionary.
+
+        Falls back to per-blob decompression without the C backend or when a
+        group contains a frame it cannot batch (e.g. uncompressed rows).
+        """
+        if not MULTI_DECOMPRESS_AVAILABLE or len(rows) < 2:
+            return [self._decompress(data, dict_id) for data, dict_id in rows]
+
+        groups: dict[Optional[int], list[int]] = {}
+        for i, (_, dict_id) in enumerate(rows):
+            groups.setdefault(dict_id, []).append(i)
+
+        texts: list[Optional[str]] = [None] * len(rows)
+        for dict_id, indexes in groups.items():
+            try:
+                segments = self._decompressor(dict_id).multi_decompress_to_buffer(
+                    [rows[i][0] for i in indexes], threads=self.config.decompress_threads
+                )
+                for i, segment in zip(indexes, segments):
+                    texts[i] = segment.tobytes().decode('utf-8')
+            except (zstd.ZstdError, ValueError):
+                for i in indexes:
+                    texts[i] = self._decompress(rows[i][0], dict_id)
+        return texts
+
     def store_chunk(self, chunk: Chunk) -> None:
         """
         Store a chunk in the vault.
@@ -125,13 +257,13 @@ class VaultStorage:
             chunk: Chunk to store
         """
         conn = self._get_connection()
-        compressed = self._compress(chunk.full_text)
+        compressed, version, dict_id = self._compress(chunk.full_text, source_of(chunk.article_url))
 
         conn.execute("""
             INSERT OR REPLACE INTO article_chunks
             (chunk_id, article_url, chunk_index, full_text_compressed,
-             original_length, compressed_length, version, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, 2, ?)
+             original_length, compressed_length, version, dict_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             chunk.chunk_id,
             chunk.article_url,
@@ -139,6 +271,8 @@ class VaultStorage:
             compressed,
             len(chunk.full_text),
             len(compressed),
+            version,
+            dict_id,
             datetime.utcnow().isoformat()
         ))
         conn.commit()
@@ -150,7 +284,7 @@ class VaultStorage:
 
         data = []
         for chunk in chunks:
-            compressed = self._compress(chunk.full_text)
+            compressed, version, dict_id = self._compress(chunk.full_text, source_of(chunk.article_url))
             data.append((
                 chunk.chunk_id,
                 chunk.article_url,
@@ -158,15 +292,16 @@ class VaultStorage:
                 compressed,
                 len(chunk.full_text),
                 len(compressed),
-                2,
+                version,
+                dict_id,
                 now
             ))
 
         conn.executemany("""
             INSERT OR REPLACE INTO article_chunks
             (chunk_id, article_url, chunk_index, full_text_compressed,
-             original_length, compressed_length, version, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+             original_length, compressed_length, version, dict_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, data)
         conn.commit()
 
@@ -182,7 +317,7 @@ class VaultStorage:
         """
         conn = self._get_connection()
         cursor = conn.execute("""
-            SELECT full_text_compressed FROM article_chunks
+            SELECT full_text_compressed, dict_id FROM article_chunks
             WHERE chunk_id = ? AND is_deleted = 0
         """, (chunk_id,))
 
@@ -190,7 +325,7 @@ class VaultStorage:
         if row is None:
             return None
 
-        return self._decompress(row[0])
+        return self._decompress(row[0], row[1])
 
     def get_article_chunks(self, article_url: str) -> list[str]:
         """
@@ -204,12 +339,12 @@ class VaultStorage:
         """
         conn = self._get_connection()
         cursor = conn.execute("""
-            SELECT full_text_compressed FROM article_chunks
+            SELECT full_text_compressed, dict_id FROM article_chunks
             WHERE article_url = ? AND is_deleted = 0
             ORDER BY chunk_index
         """, (article_url,))
 
-        return [self._decompress(row[0]) for row in cursor.fetchall()]
+        return self._decompress_many(cursor.fetchall())
 
     def iter_chunk_ids(self, site: Optional[str] = None, batch_size: int = 10000):
         """
@@ -254,17 +389,18 @@ class VaultStorage:
         for i in range(0, len(chunk_ids_list), 500):
             batch = chunk_ids_list[i:i + 500]
             placeholders = ",".join("?" * len(batch))
-            cursor = conn.execute(f"""
-                SELECT chunk_id, article_url, chunk_index, full_text_compressed
+            rows = conn.execute(f"""
+                SELECT chunk_id, article_url, chunk_index, full_text_compressed, dict_id
                 FROM article_chunks
                 WHERE chunk_id IN ({placeholders}) AND is_deleted = 0
-            """, batch)
-            for row in cursor:
+            """, batch).fetchall()
+            texts = self._decompress_many([(row[3], row[4]) for row in rows])
+            for row, text in zip(rows, texts):
                 results.append({
                     'chunk_id': row[0],
                     'article_url': row[1],
                     'chunk_index': row[2],
-                    'full_text': self._decompress(row[3]),
+                    'full_text': text,
                 })
         return results
 
@@ -280,6 +416,136 @@ class VaultStorage:
         """, [(now, cid) for cid in chunk_ids])
         conn.commit()
 
+    def list_sources(self) -> list[str]:
+        """Distinct sources (URL domains) with stored chunks."""
+        conn = self._get_connection()
+        urls = conn.execute("SELECT DISTINCT article_url FROM article_chunks WHERE is_deleted = 0")
+        return sorted({source_of(row[0]) for row in urls})
+
+    def source_chunk_ids(self, source: str, limit: Optional[int] = None) -> list[str]:
+        """Chunk IDs of a source, most recent first."""
+        conn = self._get_connection()
+        cursor = conn.execute("""
+            SELECT chunk_id, article_url FROM article_chunks
+            WHERE article_url LIKE ? AND is_deleted = 0
+            ORDER BY created_at DESC
+        """, (f"%{source}%",))
+        chunk_ids = []
+        for chunk_id, url in cursor:
+            if source_of(url) == source:
+                chunk_ids.append(chunk_id)
+                if limit is not None and len(chunk_ids) >= limit:
+                    break
+        return chunk_ids
+
+    def train_dictionary(self, source: str) -> Optional[int]:
+        """
+        Train a Zstd dictionary from a source's most recent chunks.
+
+        The new dictionary is used for that source's subsequent writes;
+        earlier dictionaries stay stored so their rows keep decoding.
+
+        Args:
+            source: Source key (URL domain without www.)
+
+        Returns:
+            New dict_id, or None if zstd is unavailable or there are too few samples
+        """
+        if not ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed, cannot train dictionary")
+            return None
+
+        chunk_ids = self.source_chunk_ids(source, self.config.dict_max_samples)
+        if len(chunk_ids) < self.config.dict_min_samples:
+            logger.info(f"{source}: {len(chunk_ids)} chunks, need {self.config.dict_min_samples} to train")
+            return None
+
+        samples = [c['full_text'].encode('utf-8') for c in self.get_chunks_by_ids(chunk_ids)]
+        try:
+            trained = zstd.train_dictionary(self.config.dict_size, samples)
+        except zstd.ZstdError as e:
+            logger.warning(f"{source}: dictionary training failed: {e}")
+            return None
+
+        conn = self._get_connection()
+        cursor = conn.execute("""
+            INSERT INTO compression_dicts (source, dict_data, sample_count, created_at)
+            VALUES (?, ?, ?, ?)
+        """, (source, trained.as_bytes(), len(samples), datetime.utcnow().isoformat()))
+        conn.commit()
+
+        dict_id = cursor.lastrowid
+        with self._dict_lock:
+            self._dicts[dict_id] = trained
+            self._active_dicts[source] = dict_id
+        logger.info(f"{source}: trained dictionary {dict_id} ({len(trained.as_bytes())} bytes, {len(samples)} samples)")
+        return dict_id
+
+    def recompress_source(self, source: str, batch_size: int = 500) -> int:
+        """
+        Rewrite a source's rows with its active dictionary (e.g. version 2 rows to version 3).
+
+        Returns:
+            Number of rows rewritten
+        """
+        dict_id = self._active_dicts.get(source)
+        if dict_id is None:
+            return 0
+
+        conn = self._get_connection()
+        chunk_ids = self.source_chunk_ids(source)
+        rewritten = 0
+        for i in range(0, len(chunk_ids), batch_size):
+            batch = chunk_ids[i:i + batch_size]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(f"""
+                SELECT chunk_id, full_text_compressed, dict_id FROM article_chunks
+                WHERE chunk_id IN ({placeholders}) AND (dict_id IS NULL OR dict_id != ?)
+            """, batch + [dict_id]).fetchall()
+            if not rows:
+                continue
+
+            texts = self._decompress_many([(row[1], row[2]) for row in rows])
+            updates = []
+            for row, text in zip(rows, texts):
+                compressed, version, new_dict_id = self._compress(text, source)
+                updates.append((compressed, len(compressed), version, new_dict_id, row[0]))
+            conn.executemany("""
+                UPDATE article_chunks
+                SET full_text_compressed = ?, compressed_length = ?, version = ?, dict_id = ?
+                WHERE chunk_id = ?
+            """, updates)
+            conn.commit()
+            rewritten += len(updates)
+        return rewritten
+
+    def get_compression_stats(self, source: Optional[str] = None) -> dict:
+        """
+        Row counts and stored (compressed) bytes.
+
+        Returns:
+            {'rows', 'original_chars', 'stored_bytes', 'versions': {version: rows}}
+        """
+        conn = self._get_connection()
+        query = """
+            SELECT article_url, version, original_length, compressed_length
+            FROM article_chunks WHERE is_deleted = 0
+        """
+        params = []
+        if source:
+            query += " AND article_url LIKE ?"
+            params.append(f"%{source}%")
+
+        stats = {'rows': 0, 'original_chars': 0, 'stored_bytes': 0, 'versions': {}}
+        for url, version, original, stored in conn.execute(query, params):
+            if source and source_of(url) != source:
+                continue
+            stats['rows'] += 1
+            stats['original_chars'] += original or 0
+            stats['stored_bytes'] += stored or 0
+            stats['versions'][version] = stats['versions'].get(version, 0) + 1
+        return stats
+
     def close(self) -> None:
         """Close database connection."""
         if self._conn:
@@ -297,7 +563,9 @@ class MapPayload:
         site: source identifier
         schema_json: article-level metadata (NOT chunk metadata)
 
-    Chunk-specific fields at top level for Qdrant native filtering.
+    Chunk-specific fields at top level for Qdrant native filtering, plus
+    normalized date_published (epoch int) and author (keyword) from
+    core.qdrant_payload for server-side date/author filters.
     """
     url: str           # article URL (NOT chunk_id)
     name: str          # chunk summary
@@ -312,6 +580,8 @@ class MapPayload:
     indexed_at: str
     task_id: str
     version: int = 2
+    date_published: Optional[int] = None
+    author: Optional[str] = None
 
     @classmethod
     def from_chunk(
@@ -366,6 +636,7 @@ class MapPayload:
             indexed_at=datetime.utcnow().isoformat(),
             task_id=task_id,
             version=2,
+            **filter_fields_from_schema(schema),
         )
 
     def to_dict(self) -> dict:
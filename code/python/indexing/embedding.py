@@ -8,6 +8,8 @@ Profile-aware: 根據 QDRANT_PROFILE 決定使用哪個 embedding provider。
 
 import asyncio
 import logging
+import threading
+from pathlib import Path
 
 import numpy as np
 
@@ -17,7 +19,15 @@ logger = logging.getLogger(__name__)
 _model = None
 _model_name = "BAAI/bge-m3"
 
-_CORE_EMBED_CONCURRENCY = 10  # Max concurrent API calls
+# Defaults for the core-provider batch path; overridden by config_indexing.yaml `api:`
+_CORE_EMBED_CONCURRENCY = 10        # Max concurrent batch requests
+_CORE_EMBED_BATCH_SIZE = 64         # Max texts per provider request
+_CORE_EMBED_TOKEN_BUDGET = 32000    # Max estimated tokens per provider request
+_CORE_EMBED_RETRY_ATTEMPTS = 3
+_CORE_EMBED_RETRY_DELAY_MS = 1000
+
+_api_config = None
+_runner = None
 
 
 def _get_active_profile():
@@ -53,23 +63,181 @@ def get_embedding_dimension() -> int:
     return 1024  # bge-m3 default
 
 
-def _embed_texts_via_core(texts: list[str]) -> np.ndarray:
+def _get_api_config() -> dict:
+    """Load the `api:` section of config_indexing.yaml (cached)."""
+    global _api_config
+    if _api_config is None:
+        import yaml
+
+        config_path = Path(__file__).parents[3] / "config" / "config_indexing.yaml"
+        api = {}
+        if config_path.exists():
+            with open(config_path, 'r', encoding='utf-8') as f:
+                api = (yaml.safe_load(f) or {}).get('api', {}) or {}
+        _api_config = {
+            'concurrency': api.get('embedding_concurrent_limit', _CORE_EMBED_CONCURRENCY),
+            'batch_size': api.get('embedding_batch_size', _CORE_EMBED_BATCH_SIZE),
+            'token_budget': api.get('embedding_batch_token_budget', _CORE_EMBED_TOKEN_BUDGET),
+            'retry_attempts': api.get('embedding_retry_attempts', _CORE_EMBED_RETRY_ATTEMPTS),
+            'retry_delay_ms': api.get('embedding_retry_delay_ms', _CORE_EMBED_RETRY_DELAY_MS),
+        }
+    return _api_config
+
+
+def _estimate_tokens(text: str) -> int:
+    """Conservative token estimate: CJK text is roughly one token per character."""
+    return len(text) + 1
+
+
+def _pack_batches(texts: list[str], batch_size: int, token_budget: int) -> list[tuple[int, int]]:
     """
-    Delegate embedding to core/embedding.py (async providers like OpenAI).
-    Uses asyncio.gather with concurrency control for batch efficiency.
+    Split texts into contiguous [start, end) ranges bounded by batch_size
+    and token_budget. A single text over budget gets a batch of its own.
+    """
+    batches = []
+    start = 0
+    tokens = 0
+    for i, text in enumerate(texts):
+        cost = _estimate_tokens(text)
+        if i > start and (i - start >= batch_size or tokens + cost > token_budget):
+            batches.append((start, i))
+            start, tokens = i, 0
+        tokens += cost
+    if start < len(texts):
+        batches.append((start, len(texts)))
+    return batches
+
+
+def _is_throttle_error(e: BaseException) -> bool:
+    """True for 429 / timeout errors that should shrink concurrency."""
+    if isinstance(e, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status = getattr(e, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(e, 'response', None), 'status_code', None)
+    return status == 429 or 'timeout' in type(e).__name__.lower()
+
+
+class _AdaptiveLimiter:
+    """
+    AIMD concurrency limit for provider requests: halve on 429/timeout,
+    grow by one after `limit` consecutive successes, never above max_limit.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+        return False
+
+    def on_success(self):
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_limit:
+            self.limit += 1
+            self._successes = 0
+
+    def on_throttle(self):
+        self._successes = 0
+        new_limit = max(1, self.limit // 2)
+        if new_limit != self.limit:
+            logger.warning(f"Embedding provider throttled; concurrency {self.limit} -> {new_limit}")
+        self.limit = new_limit
+
+
+class _CoreEmbedRunner:
     """
-    from core.embedding import get_embedding
+    One event loop on a daemon thread for the whole indexing run, so provider
+    clients (and their HTTP connection pools) are reused across batches
+    instead of being torn down by a fresh asyncio.run() per call.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def run(self, coro):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="core-embed-loop", daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+def _get_runner() -> _CoreEmbedRunner:
+    global _runner
+    if _runner is None:
+        _runner = _CoreEmbedRunner()
+    return _runner
+
 
-    semaphore = asyncio.Semaphore(_CORE_EMBED_CONCURRENCY)
+async def _embed_batches(texts: list[str], config: dict) -> np.ndarray:
+    """Embed texts with provider-native batch requests into one float32 matrix."""
+    from core.embedding import batch_get_embeddings
+
+    if not texts:
+        return np.empty((0, get_embedding_dimension()), dtype=np.float32)
+
+    batches = _pack_batches(texts, config['batch_size'], config['token_budget'])
+    limiter = _AdaptiveLimiter(config['concurrency'])
+    out = None
+
+    async def _run_batch(start: int, end: int):
+        nonlocal out
+        attempts = max(1, config['retry_attempts'])
+        for attempt in range(attempts):
+            try:
+                async with limiter:
+                    vectors = await batch_get_embeddings(texts[start:end])
+                limiter.on_success()
+                break
+            except Exception as e:
+                if _is_throttle_error(e):
+                    limiter.on_throttle()
+                if attempt == attempts - 1:
+                    raise
+                delay = config['retry_delay_ms'] / 1000 * (2 ** attempt)
+                logger.warning(
+                    f"Embedding batch [{start}:{end}] failed (attempt {attempt + 1}/{attempts}), "
+                    f"retrying in {delay:.1f}s: {type(e).__name__}: {e}"
+                )
+                await asyncio.sleep(delay)
+
+        if len(vectors) != end - start:
+            raise ValueError(f"Embedding count mismatch: got {len(vectors)} for {end - start} texts")
+        block = np.asarray(vectors, dtype=np.float32)
+        if out is None:
+            out = np.empty((len(texts), block.shape[1]), dtype=np.float32)
+        out[start:end] = block
+
+    await asyncio.gather(*[_run_batch(start, end) for start, end in batches])
+    return out
 
-    async def _embed_with_limit(text: str):
-        async with semaphore:
-            return await get_embedding(text)
 
-    async def _batch():
-        return await asyncio.gather(*[_embed_with_limit(t) for t in texts])
+def _embed_texts_via_core(texts: list[str]) -> np.ndarray:
+    """
+    Delegate embedding to core/embedding.py (async providers like OpenAI).
 
-    return np.array(asyncio.run(_batch()))
+    Texts are packed into provider-native batch requests (bounded by
+    embedding_batch_size and embedding_batch_token_budget), run with adaptive
+    concurrency on a persistent event loop, and written into a preallocated
+    float32 matrix of shape (len(texts), dimension).
+    """
+    return _get_runner().run(_embed_batches(texts, _get_api_config()))
 
 
 def embed_texts(texts: list[str], batch_size: int = 32) -> np.ndarray:
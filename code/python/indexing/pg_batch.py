@@ -7,6 +7,7 @@ Processes TSV files through the full pipeline into PostgreSQL:
 Usage:
     python -m indexing.pg_batch <tsv_path> --resume
     python -m indexing.pg_batch <tsv_path>  (no checkpoint)
+    python -m indexing.pg_batch file <tsv_path> --resume --bulk  (binary COPY loader)
 
 PostgreSQLUploader handles embedding (Qwen3-4B INT8) + DB insert with
 ON CONFLICT upsert for idempotency.
@@ -24,7 +25,7 @@ from typing import Optional
 
 from .chunking_engine import ChunkingEngine
 from .ingestion_engine import IngestionEngine
-from .postgresql_uploader import PostgreSQLUploader
+from .postgresql_uploader import BULK_ARTICLE_BATCH_SIZE, PostgreSQLUploader
 from .quality_gate import QualityGate
 
 logger = logging.getLogger(__name__)
@@ -95,6 +96,7 @@ def process_tsv(
     tsv_path: Path,
     resume: bool = True,
     pre_indexed_urls: Optional[set[str]] = None,
+    bulk: bool = False,
 ) -> BatchResult:
     """
     Process a single TSV file into PostgreSQL.
@@ -103,6 +105,9 @@ def process_tsv(
         tsv_path: Path to TSV file.
         resume: Whether to use checkpoint for resumption.
         pre_indexed_urls: Set of URLs already in PG (skip embedding).
+        bulk: Buffer BULK_ARTICLE_BATCH_SIZE articles and load them with
+            PostgreSQLUploader's binary COPY path. URLs are checkpointed
+            only after their batch commits.
     """
     ingestion = IngestionEngine()
     quality_gate = QualityGate()
@@ -125,6 +130,24 @@ def process_tsv(
     # Keep pre-indexed URLs as separate set (don't bloat checkpoint file)
     already_in_db = pre_indexed_urls or set()
 
+    pending: list = []
+
+    def flush_pending() -> None:
+        if not pending:
+            return
+        ok = uploader.upload_batch(pending, bulk=True) > 0
+        for cdm, chunks in pending:
+            if ok:
+                result.success += 1
+                result.total_chunks += len(chunks)
+                checkpoint.processed_urls.add(cdm.url)
+            else:
+                result.failed += 1
+                checkpoint.failed_urls[cdm.url] = "bulk_upload_batch failed"
+        pending.clear()
+        checkpoint.updated_at = datetime.utcnow().isoformat()
+        checkpoint.save(checkpoint_path)
+
     try:
         for cdm in ingestion.parse_tsv_file(tsv_path):
             if not cdm.is_valid:
@@ -153,6 +176,12 @@ def process_tsv(
                 checkpoint.processed_urls.add(cdm.url)
                 continue
 
+            if bulk:
+                pending.append((cdm, chunks))
+                if len(pending) >= BULK_ARTICLE_BATCH_SIZE:
+                    flush_pending()
+                continue
+
             # Upload to PG (handles embedding internally)
             try:
                 ok = uploader.upload_article(cdm, chunks)
@@ -174,6 +203,8 @@ def process_tsv(
                 checkpoint.updated_at = datetime.utcnow().isoformat()
                 checkpoint.save(checkpoint_path)
 
+        flush_pending()
+
     except KeyboardInterrupt:
         logger.warning("Interrupted — saving checkpoint")
         checkpoint.save(checkpoint_path)
@@ -209,7 +240,7 @@ def get_indexed_urls(uploader: PostgreSQLUploader) -> set[str]:
 # Batch mode: process all TSV files in a directory (single process)
 # ---------------------------------------------------------------------------
 
-def run_batch(tsv_dir: Path, done_file: Path, log_file: Path) -> None:
+def run_batch(tsv_dir: Path, done_file: Path, log_file: Path, bulk: bool = False) -> None:
     """
     Process all TSV files in tsv_dir, tracking completion in done_file.
     Model loads once and persists across all files.
@@ -279,7 +310,7 @@ def run_batch(tsv_dir: Path, done_file: Path, log_file: Path) -> None:
         t0 = time.time()
         try:
             result = process_tsv(
-                Path(tsv_file), resume=True, pre_indexed_urls=indexed,
+                Path(tsv_file), resume=True, pre_indexed_urls=indexed, bulk=bulk,
             )
             elapsed = time.time() - t0
 
@@ -340,6 +371,8 @@ def main():
     single = subparsers.add_parser('file', help='Process a single TSV file')
     single.add_argument('tsv_path', type=Path, help='Path to TSV file')
     single.add_argument('--resume', action='store_true', help='Resume from checkpoint')
+    single.add_argument('--bulk', action='store_true',
+                        help='Load articles in batches via binary COPY')
 
     # Batch mode
     batch = subparsers.add_parser('batch', help='Process all TSV files in a directory')
@@ -352,6 +385,8 @@ def main():
     batch.add_argument('--log-file', type=Path,
                        default=Path("C:/users/user/NLWeb/data/pg_indexing.log"),
                        help='Log file path')
+    batch.add_argument('--bulk', action='store_true',
+                       help='Load articles in batches via binary COPY')
 
     args = parser.parse_args()
 
@@ -376,7 +411,9 @@ def main():
         logger.info(f"Found {len(indexed)} already-indexed URLs in {time.time()-t0:.1f}s")
 
         t0 = time.time()
-        result = process_tsv(args.tsv_path, resume=args.resume, pre_indexed_urls=indexed)
+        result = process_tsv(
+            args.tsv_path, resume=args.resume, pre_indexed_urls=indexed, bulk=args.bulk,
+        )
         elapsed = time.time() - t0
 
         print(f"Success: {result.success}")
@@ -396,7 +433,7 @@ def main():
             uploader2.close()
 
     elif args.command == 'batch':
-        run_batch(args.dir, args.done_file, args.log_file)
+        run_batch(args.dir, args.done_file, args.log_file, bulk=args.bulk)
 
     else:
         # Default: batch mode
@@ -0,0 +1,163 @@
+"""
+pgvector ANN index management for chunks.embedding.
+
+Builds HNSW or IVFFlat indexes with CREATE INDEX CONCURRENTLY so search
+keeps serving from the existing index during the build, and optionally
+drops the other ANN indexes once the new one is valid. Keep only one ANN
+index on chunks.embedding: with both present the planner picks one silently
+(see docs/zoe/lessons-general.md).
+
+Query-time recall/latency (probes, ef_search, iterative scans) is set per
+search from config_retrieval.yaml ann_params.
+
+Usage:
+    python -m indexing.pg_vector_index status
+    python -m indexing.pg_vector_index build --type hnsw --m 16 --ef-construction 64 --drop-others
+    python -m indexing.pg_vector_index build --type ivfflat --lists 1000
+"""
+
+import argparse
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+from .postgresql_uploader import DEFAULT_CONNECTION_STRING
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAMES = {
+    "hnsw": "idx_chunks_embedding_hnsw",
+    "ivfflat": "idx_chunks_embedding_ivf",
+}
+
+
+@dataclass
+class VectorIndex:
+    name: str
+    method: str
+    size_bytes: int
+    valid: bool
+
+
+def list_vector_indexes(conn) -> list[VectorIndex]:
+    """ANN indexes on the chunks table, including invalid leftovers of failed concurrent builds."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT i.relname, am.amname, pg_relation_size(i.oid), x.indisvalid
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            JOIN pg_class t ON t.oid = x.indrelid
+            JOIN pg_am am ON am.oid = i.relam
+            WHERE t.relname = 'chunks' AND am.amname IN ('hnsw', 'ivfflat')
+            ORDER BY i.relname
+        """)
+        return [VectorIndex(*row) for row in cur.fetchall()]
+
+
+def _drop_index(conn, name: str) -> None:
+    from psycopg import sql
+
+    logger.info(f"Dropping index {name}")
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(sql.Identifier(name)))
+
+
+def build_vector_index(conn, index_type: str = "hnsw", m: int = 16, ef_construction: int = 64,
+                       lists: int = 1000, maintenance_work_mem: str = None,
+                       parallel_workers: int = None, drop_others: bool = False) -> VectorIndex:
+    """
+    Build an ANN index on chunks.embedding without blocking writes.
+
+    conn must be in autocommit mode (CONCURRENTLY cannot run in a
+    transaction). An invalid index left by an interrupted build is dropped
+    and rebuilt; a valid one is kept. With drop_others, the remaining ANN
+    indexes are dropped after the new one is valid.
+    """
+    from psycopg import sql
+
+    if index_type not in INDEX_NAMES:
+        raise ValueError(f"Unknown index type {index_type!r}; expected one of {sorted(INDEX_NAMES)}")
+    name = INDEX_NAMES[index_type]
+
+    existing = {idx.name: idx for idx in list_vector_indexes(conn)}
+    current = existing.get(name)
+    if current is not None and not current.valid:
+        logger.warning(f"Index {name} is invalid (interrupted build), rebuilding")
+        _drop_index(conn, name)
+        current = None
+
+    if current is None:
+        with conn.cursor() as cur:
+            if maintenance_work_mem:
+                cur.execute("SELECT set_config('maintenance_work_mem', %s, false)", (maintenance_work_mem,))
+            if parallel_workers is not None:
+                cur.execute("SELECT set_config('max_parallel_maintenance_workers', %s, false)",
+                            (str(parallel_workers),))
+
+            if index_type == "hnsw":
+                options = sql.SQL("m = {}, ef_construction = {}").format(
+                    sql.Literal(int(m)), sql.Literal(int(ef_construction)))
+            else:
+                options = sql.SQL("lists = {}").format(sql.Literal(int(lists)))
+
+            logger.info(f"Building {index_type} index {name} ({options.as_string(conn)})")
+            t0 = time.time()
+            cur.execute(sql.SQL(
+                "CREATE INDEX CONCURRENTLY {} ON chunks USING {} (embedding vector_cosine_ops) WITH ({})"
+            ).format(sql.Identifier(name), sql.SQL(index_type), options))
+            cur.execute("ANALYZE chunks")
+            logger.info(f"Built {name} in {time.time() - t0:.0f}s")
+    else:
+        logger.info(f"Index {name} already exists")
+
+    if drop_others:
+        for other in existing.values():
+            if other.name != name:
+                _drop_index(conn, other.name)
+
+    return next(idx for idx in list_vector_indexes(conn) if idx.name == name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage pgvector ANN indexes on chunks.embedding')
+    parser.add_argument('--dsn', default=None, help='PostgreSQL DSN (default: POSTGRES_CONNECTION_STRING)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('status', help='List ANN indexes on chunks')
+
+    build = subparsers.add_parser('build', help='Build an ANN index concurrently')
+    build.add_argument('--type', choices=sorted(INDEX_NAMES), default='hnsw')
+    build.add_argument('--m', type=int, default=16, help='HNSW max connections per layer')
+    build.add_argument('--ef-construction', type=int, default=64, help='HNSW build candidate list size')
+    build.add_argument('--lists', type=int, default=1000, help='IVFFlat lists')
+    build.add_argument('--maintenance-work-mem', default=None, help="e.g. '8GB' (HNSW builds fastest in memory)")
+    build.add_argument('--workers', type=int, default=None, help='max_parallel_maintenance_workers')
+    build.add_argument('--drop-others', action='store_true',
+                       help='Drop the other ANN indexes once the new one is valid')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+        datefmt='%H:%M:%S',
+    )
+
+    import psycopg
+
+    dsn = args.dsn or os.environ.get("POSTGRES_CONNECTION_STRING", DEFAULT_CONNECTION_STRING)
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        if args.command == 'build':
+            build_vector_index(
+                conn, args.type, m=args.m, ef_construction=args.ef_construction, lists=args.lists,
+                maintenance_work_mem=args.maintenance_work_mem, parallel_workers=args.workers,
+                drop_others=args.drop_others,
+            )
+        for idx in list_vector_indexes(conn):
+            print(f"{idx.name:32s} {idx.method:8s} {idx.size_bytes / 1e6:10.1f} MB  "
+                  f"{'valid' if idx.valid else 'INVALID'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,10 @@ Indexing Pipeline for M0 Indexing Module.
 Orchestrates the full indexing flow with checkpoint support.
 """
 
+import heapq
 import json
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -13,50 +15,20 @@ from typing import Optional
 
 import yaml
 
+from core.bm25 import BM25Index
+
 from .chunking_engine import ChunkingEngine, Chunk
 from .dual_storage import VaultStorage, MapPayload
 from .ingestion_engine import CanonicalDataModel, IngestionEngine
 from .quality_gate import QualityGate
 from .source_manager import SourceManager
 from .qdrant_uploader import QdrantUploader, QdrantConfig
+from .pipeline_stages import Stage, StageRunner
+from .checkpoint_log import PipelineCheckpoint
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class PipelineCheckpoint:
-    """Checkpoint for resumable processing."""
-    tsv_path: str
-    processed_urls: set[str] = field(default_factory=set)
-    failed_urls: dict[str, str] = field(default_factory=dict)  # url -> error
-    last_processed_line: int = 0
-    started_at: str = ""
-    updated_at: str = ""
-
-    def to_dict(self) -> dict:
-        """Convert to JSON-serializable dict."""
-        return {
-            'tsv_path': self.tsv_path,
-            'processed_urls': list(self.processed_urls),
-            'failed_urls': self.failed_urls,
-            'last_processed_line': self.last_processed_line,
-            'started_at': self.started_at,
-            'updated_at': self.updated_at
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> 'PipelineCheckpoint':
-        """Create from dict."""
-        return cls(
-            tsv_path=data['tsv_path'],
-            processed_urls=set(data.get('processed_urls', [])),
-            failed_urls=data.get('failed_urls', {}),
-            last_processed_line=data.get('last_processed_line', 0),
-            started_at=data.get('started_at', ''),
-            updated_at=data.get('updated_at', '')
-        )
-
-
 @dataclass
 class PipelineResult:
     """Result of pipeline execution."""
@@ -65,6 +37,97 @@ class PipelineResult:
     skipped: int = 0
     buffered: int = 0  # Quality gate failures
     total_chunks: int = 0
+    stage_stats: dict = field(default_factory=dict)  # Pipelined mode: per-stage counters
+
+
+@dataclass
+class _ArticleWork:
+    """One article flowing through the pipelined stages."""
+    line_num: int
+    cdm: CanonicalDataModel
+    site: str
+    chunks: list[Chunk]
+    payloads: list[MapPayload] = field(default_factory=list)
+    embeddings: Optional[object] = None  # numpy array, set by the embed stage
+
+
+class _CompletionTracker:
+    """
+    Records finished lines for the pipelined mode and keeps the checkpoint safe.
+
+    Articles finish out of order across stages. The checkpoint's resume line
+    (and its byte offset) only advances over a contiguous prefix of finished
+    lines, and a URL is marked processed only once it has reached its final
+    stage, so resuming never skips an article that was still in flight.
+    """
+
+    def __init__(self, pipeline: 'IndexingPipeline', result: PipelineResult):
+        self.pipeline = pipeline
+        self.result = result
+        self._lock = threading.Lock()
+        self._in_flight: list[tuple[int, int]] = []  # heap of submitted (line number, byte offset)
+        self._finished: set[int] = set()
+        self._next_line = pipeline.checkpoint.line_num
+        self._next_offset = pipeline.checkpoint.byte_offset
+        self._since_save = 0
+
+    def submit(self, line_num: int, offset: Optional[int], next_offset: Optional[int]) -> None:
+        with self._lock:
+            heapq.heappush(self._in_flight, (line_num, offset))
+            self._next_line = line_num + 1
+            self._next_offset = next_offset
+
+    def finish(
+        self,
+        line_num: int,
+        outcome: str,
+        url: Optional[str] = None,
+        chunks: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Mark a line finished.
+
+        Args:
+            outcome: 'success', 'buffered', 'failed', 'skipped' or 'ignored' (unparseable line)
+        """
+        checkpoint = self.pipeline.checkpoint
+        with self._lock:
+            if outcome == 'success':
+                self.result.success += 1
+                self.result.total_chunks += chunks
+            elif outcome == 'buffered':
+                self.result.buffered += 1
+            elif outcome == 'failed':
+                self.result.failed += 1
+            elif outcome == 'skipped':
+                self.result.skipped += 1
+
+            if outcome in ('success', 'buffered') and url:
+                checkpoint.mark_processed(url, line_num)
+            elif outcome == 'failed' and url:
+                checkpoint.mark_failed(url, line_num, error or "")
+
+            self._finished.add(line_num)
+            while self._in_flight and self._in_flight[0][0] in self._finished:
+                self._finished.discard(heapq.heappop(self._in_flight)[0])
+
+            if outcome in ('success', 'buffered', 'failed'):
+                self._since_save += 1
+                if self._since_save >= self.pipeline.checkpoint_interval:
+                    self._since_save = 0
+                    self._save_locked()
+
+    def save(self) -> None:
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        if self._in_flight:
+            line_num, offset = self._in_flight[0]
+        else:
+            line_num, offset = self._next_line, self._next_offset
+        self.pipeline.checkpoint.save(line_num, offset)
 
 
 class IndexingPipeline:
@@ -81,6 +144,7 @@ class IndexingPipeline:
         upload_to_qdrant: bool = False,
         qdrant_config: Optional[QdrantConfig] = None,
         task_id: str = "",
+        bm25_index: Optional[BM25Index] = None,
     ):
         """
         Initialize pipeline.
@@ -91,6 +155,8 @@ class IndexingPipeline:
             upload_to_qdrant: Whether to upload vectors to Qdrant
             qdrant_config: Qdrant configuration (uses env vars if None)
             task_id: Originating task ID for data lineage
+            bm25_index: Optional BM25Index updated incrementally with each
+                stored article (caller is responsible for saving it)
         """
         self.ingestion = IngestionEngine()
         self.quality_gate = QualityGate(config_path)
@@ -98,6 +164,7 @@ class IndexingPipeline:
         self.source_manager = SourceManager(config_path)
         self.vault = vault or VaultStorage()
         self.task_id = task_id
+        self.bm25_index = bm25_index
 
         # Qdrant uploader (optional)
         self.upload_to_qdrant = upload_to_qdrant
@@ -112,10 +179,15 @@ class IndexingPipeline:
         # Batch buffer for Qdrant upload: (chunk, site, MapPayload)
         self._chunk_buffer: list[tuple[Chunk, str, MapPayload]] = []
 
+        # buffer.jsonl appends from concurrent prepare workers (pipelined mode)
+        self._buffer_lock = threading.Lock()
+
     def _load_config(self, config_path: Optional[Path]) -> None:
         """Load pipeline config."""
         self.checkpoint_interval = 10
+        self.checkpoint_compact_threshold = 10000
         self.batch_size = 100
+        self.stage_config: dict = {}
 
         if config_path is None:
             config_path = Path(__file__).parents[3] / "config" / "config_indexing.yaml"
@@ -128,7 +200,9 @@ class IndexingPipeline:
 
         pipeline_config = config.get('pipeline', {})
         self.checkpoint_interval = pipeline_config.get('checkpoint_interval', 10)
+        self.checkpoint_compact_threshold = pipeline_config.get('checkpoint_compact_threshold', 10000)
         self.batch_size = pipeline_config.get('batch_size', 100)
+        self.stage_config = pipeline_config.get('stages', {}) or {}
 
     def process_tsv(
         self,
@@ -190,33 +264,25 @@ class IndexingPipeline:
         """
         # Setup checkpoint
         self.checkpoint_file = checkpoint_file or Path(f"{tsv_path}.checkpoint.json")
-        self.checkpoint = self._load_checkpoint() or PipelineCheckpoint(
-            tsv_path=str(tsv_path),
-            started_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat()
-        )
+        self.checkpoint = self._load_checkpoint(tsv_path)
 
         result = PipelineResult()
 
         try:
-            with open(tsv_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f):
-                    # Skip already processed lines
-                    if line_num < self.checkpoint.last_processed_line:
-                        continue
-
+            with open(tsv_path, 'rb') as f:
+                for line_num, _, next_offset, line in self._iter_tsv_from_checkpoint(f):
                     cdm = self.ingestion.parse_tsv_line(line)
                     if cdm is None:
                         continue
 
                     # Skip already processed URLs
-                    if cdm.url in self.checkpoint.processed_urls:
+                    if self.checkpoint.is_processed(cdm.url):
                         result.skipped += 1
                         continue
 
                     try:
                         chunks_created = self._process_article(cdm, site_override)
-                        self.checkpoint.processed_urls.add(cdm.url)
+                        self.checkpoint.mark_processed(cdm.url, line_num)
 
                         if chunks_created > 0:
                             result.success += 1
@@ -226,7 +292,7 @@ class IndexingPipeline:
 
                     except Exception as e:
                         logger.error(f"Failed to process article {cdm.url}: {e}")
-                        self.checkpoint.failed_urls[cdm.url] = str(e)
+                        self.checkpoint.mark_failed(cdm.url, line_num, str(e))
                         result.failed += 1
 
                     # Flush to Qdrant periodically
@@ -241,9 +307,7 @@ class IndexingPipeline:
                     # Save checkpoint periodically
                     processed = result.success + result.failed + result.buffered
                     if processed % self.checkpoint_interval == 0:
-                        self.checkpoint.last_processed_line = line_num + 1  # Next line to process
-                        self.checkpoint.updated_at = datetime.utcnow().isoformat()
-                        self._save_checkpoint()
+                        self._save_checkpoint(line_num + 1, next_offset)  # Next line to process
 
         except Exception as e:
             # Save checkpoint on error
@@ -257,6 +321,164 @@ class IndexingPipeline:
         self._delete_checkpoint()
         return result
 
+    def process_tsv_pipelined(
+        self,
+        tsv_path: Path,
+        checkpoint_file: Optional[Path] = None,
+        site_override: Optional[str] = None
+    ) -> PipelineResult:
+        """
+        Process TSV with checkpoint support, running the steps as concurrent stages.
+
+        Stages (each with its own workers and a bounded input queue, see
+        pipeline.stages in config_indexing.yaml):
+            prepare: parse line → QualityGate → chunk → payloads
+            vault:   one vault transaction (+ BM25 update) per batch
+            embed:   one embedding call per batch of up to batch_size chunks
+            upload:  Qdrant upsert
+        Without Qdrant upload the pipeline ends at the vault stage.
+
+        Args:
+            tsv_path: Path to TSV file
+            checkpoint_file: Path to checkpoint file (default: tsv_path.checkpoint.json)
+            site_override: Override site for all articles
+
+        Returns:
+            PipelineResult with statistics, including per-stage stage_stats
+        """
+        self.checkpoint_file = checkpoint_file or Path(f"{tsv_path}.checkpoint.json")
+        self.checkpoint = self._load_checkpoint(tsv_path)
+
+        result = PipelineResult()
+        tracker = _CompletionTracker(self, result)
+        runner = StageRunner(self._build_stages(tracker, site_override))
+        runner.start()
+
+        try:
+            with open(tsv_path, 'rb') as f:
+                for line_num, offset, next_offset, line in self._iter_tsv_from_checkpoint(f):
+                    tracker.submit(line_num, offset, next_offset)
+                    if not runner.submit((line_num, line)):
+                        break  # A stage failed; finish() re-raises its error
+        except BaseException as e:
+            runner.abort(e)
+
+        try:
+            runner.finish()
+        except BaseException:
+            # Save checkpoint on error (in-flight articles are not marked processed)
+            result.stage_stats = runner.get_stats()
+            tracker.save()
+            raise
+
+        result.stage_stats = runner.get_stats()
+        if self.upload_to_qdrant:
+            self._truncate_buffer_file()
+
+        # Success: delete checkpoint
+        self._delete_checkpoint()
+        return result
+
+    def _build_stages(self, tracker: _CompletionTracker, site_override: Optional[str]) -> list[Stage]:
+        """Create the pipelined-mode stages from pipeline.stages config."""
+        cfg = self.stage_config
+        queue_size = cfg.get('queue_size', 8)
+        upload = self.upload_to_qdrant and self.qdrant is not None
+
+        def chunk_count(work: _ArticleWork) -> int:
+            return len(work.chunks)
+
+        def prepare(items: list) -> list:
+            out = []
+            for line_num, line in items:
+                cdm = self.ingestion.parse_tsv_line(line)
+                if cdm is None:
+                    tracker.finish(line_num, 'ignored')
+                    continue
+
+                # Skip already processed URLs
+                if self.checkpoint.is_processed(cdm.url):
+                    tracker.finish(line_num, 'skipped', cdm.url)
+                    continue
+
+                try:
+                    prepared = self._prepare_article(cdm, site_override)
+                    if prepared is None:
+                        tracker.finish(line_num, 'buffered', cdm.url)
+                        continue
+                    site, chunks = prepared
+                    payloads = self._build_payloads(cdm, site, chunks) if upload else []
+                except Exception as e:
+                    logger.error(f"Failed to process article {cdm.url}: {e}")
+                    tracker.finish(line_num, 'failed', cdm.url, error=str(e))
+                    continue
+                out.append(_ArticleWork(line_num, cdm, site, chunks, payloads))
+            return out
+
+        def store(works: list) -> list:
+            try:
+                self.vault.store_chunks([c for w in works for c in w.chunks])
+                stored = works
+            except Exception as e:
+                # Retry one by one so a bad article does not fail the batch
+                logger.warning(f"Vault batch write failed ({e}), retrying per article")
+                stored = []
+                for w in works:
+                    try:
+                        self.vault.store_chunks(w.chunks)
+                        stored.append(w)
+                    except Exception as article_error:
+                        logger.error(f"Failed to process article {w.cdm.url}: {article_error}")
+                        tracker.finish(w.line_num, 'failed', w.cdm.url, error=str(article_error))
+
+            if self.bm25_index is not None:
+                for w in stored:
+                    self.bm25_index.add_document(
+                        w.cdm.url, f"{w.cdm.headline or ''} {w.cdm.article_body or ''}"
+                    )
+
+            if upload:
+                return stored
+            for w in stored:
+                tracker.finish(w.line_num, 'success', w.cdm.url, chunks=len(w.chunks))
+            return []
+
+        def embed(works: list) -> list:
+            embeddings = self.qdrant.embed_chunks([c for w in works for c in w.chunks])
+            offset = 0
+            for w in works:
+                w.embeddings = embeddings[offset:offset + len(w.chunks)]
+                offset += len(w.chunks)
+            return works
+
+        def upsert(works: list) -> list:
+            by_site: dict[str, list[_ArticleWork]] = {}
+            for w in works:
+                by_site.setdefault(w.site, []).append(w)
+            for site, site_works in by_site.items():
+                self.qdrant.upsert_embedded(
+                    [c for w in site_works for c in w.chunks],
+                    [v for w in site_works for v in w.embeddings],
+                    site,
+                    payloads=[p for w in site_works for p in w.payloads],
+                )
+            for w in works:
+                tracker.finish(w.line_num, 'success', w.cdm.url, chunks=len(w.chunks))
+            return []
+
+        stages = [
+            Stage('prepare', prepare, workers=cfg.get('prepare_workers', 2), queue_size=queue_size),
+            # Single vault writer: VaultStorage shares one SQLite connection
+            Stage('vault', store, workers=1, queue_size=queue_size,
+                  batch_limit=self.batch_size, weight=chunk_count),
+        ]
+        if upload:
+            stages.append(Stage('embed', embed, workers=cfg.get('embed_workers', 1), queue_size=queue_size,
+                                batch_limit=self.batch_size, weight=chunk_count))
+            stages.append(Stage('upload', upsert, workers=cfg.get('upload_workers', 1), queue_size=queue_size,
+                                batch_limit=self.batch_size, weight=chunk_count))
+        return stages
+
     def _process_article(
         self,
         cdm: CanonicalDataModel,
@@ -268,11 +490,40 @@ class IndexingPipeline:
         Returns:
             Number of chunks created, 0 if buffered, -1 if skipped
         """
+        prepared = self._prepare_article(cdm, site_override)
+        if prepared is None:
+            return 0
+        site, chunks = prepared
+
+        # Store in vault
+        self.vault.store_chunks(chunks)
+
+        if self.bm25_index is not None:
+            self.bm25_index.add_document(cdm.url, f"{cdm.headline or ''} {cdm.article_body or ''}")
+
+        # Buffer chunks for Qdrant upload with article-level metadata
+        if self.upload_to_qdrant:
+            for chunk, payload in zip(chunks, self._build_payloads(cdm, site, chunks)):
+                self._chunk_buffer.append((chunk, site, payload))
+
+        return len(chunks)
+
+    def _prepare_article(
+        self,
+        cdm: CanonicalDataModel,
+        site_override: Optional[str]
+    ) -> Optional[tuple[str, list[Chunk]]]:
+        """
+        Quality gate and chunking for one article.
+
+        Returns:
+            (site, chunks), or None if the article was buffered or produced no chunks
+        """
         # Quality gate
         qr = self.quality_gate.validate(cdm)
         if not qr.passed:
             self._buffer_article(cdm, qr.failure_reasons)
-            return 0
+            return None
 
         # Determine site
         site = site_override or cdm.source_id
@@ -280,31 +531,33 @@ class IndexingPipeline:
         # Chunk article
         chunks = self.chunker.chunk_article(cdm)
         if not chunks:
-            return 0
+            return None
+        return site, chunks
 
-        # Store in vault
-        self.vault.store_chunks(chunks)
-
-        # Buffer chunks for Qdrant upload with article-level metadata
-        if self.upload_to_qdrant:
-            date_published_str = cdm.date_published.isoformat() if cdm.date_published else ""
-            description = cdm.article_body[:200] if cdm.article_body else ""
-
-            for chunk in chunks:
-                payload = MapPayload.from_chunk(
-                    chunk=chunk,
-                    site=site,
-                    headline=cdm.headline or "",
-                    date_published=date_published_str,
-                    author=cdm.author or "",
-                    publisher=cdm.publisher or "",
-                    keywords=cdm.keywords or [],
-                    description=description,
-                    task_id=self.task_id,
-                )
-                self._chunk_buffer.append((chunk, site, payload))
-
-        return len(chunks)
+    def _build_payloads(
+        self,
+        cdm: CanonicalDataModel,
+        site: str,
+        chunks: list[Chunk]
+    ) -> list[MapPayload]:
+        """Build Qdrant payloads with article-level metadata, 1:1 with chunks."""
+        date_published_str = cdm.date_published.isoformat() if cdm.date_published else ""
+        description = cdm.article_body[:200] if cdm.article_body else ""
+
+        return [
+            MapPayload.from_chunk(
+                chunk=chunk,
+                site=site,
+                headline=cdm.headline or "",
+                date_published=date_published_str,
+                author=cdm.author or "",
+                publisher=cdm.publisher or "",
+                keywords=cdm.keywords or [],
+                description=description,
+                task_id=self.task_id,
+            )
+            for chunk in chunks
+        ]
 
     def _flush_qdrant_buffer(self) -> int:
         """
@@ -331,16 +584,19 @@ class IndexingPipeline:
         self._chunk_buffer.clear()
 
         # Truncate buffer.jsonl after successful flush to prevent unbounded growth
+        self._truncate_buffer_file()
+
+        return total_uploaded
+
+    def _truncate_buffer_file(self) -> None:
         buffer_path = Path(__file__).parents[3] / "data" / "indexing" / "buffer.jsonl"
         if buffer_path.exists():
             try:
-                with open(buffer_path, 'w') as f:
+                with self._buffer_lock, open(buffer_path, 'w') as f:
                     pass  # Truncate
             except Exception as e:
                 logger.warning(f"Failed to truncate buffer.jsonl: {e}")
 
-        return total_uploaded
-
     def _buffer_article(self, cdm: CanonicalDataModel, reasons: list[str]) -> None:
         """Save failed article to buffer for review."""
         buffer_path = Path(__file__).parents[3] / "data" / "indexing" / "buffer.jsonl"
@@ -354,28 +610,69 @@ class IndexingPipeline:
             'timestamp': datetime.utcnow().isoformat()
         }
 
-        with open(buffer_path, 'a', encoding='utf-8') as f:
+        with self._buffer_lock, open(buffer_path, 'a', encoding='utf-8') as f:
             f.write(json.dumps(entry, ensure_ascii=False) + '\n')
 
-    def _load_checkpoint(self) -> Optional[PipelineCheckpoint]:
-        """Load checkpoint from file."""
-        if self.checkpoint_file and self.checkpoint_file.exists():
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return PipelineCheckpoint.from_dict(data)
-        return None
+    def _load_checkpoint(self, tsv_path: Path) -> PipelineCheckpoint:
+        """Load checkpoint from file, or start a new one."""
+        return PipelineCheckpoint.open(
+            self.checkpoint_file, str(tsv_path), compact_threshold=self.checkpoint_compact_threshold
+        )
 
-    def _save_checkpoint(self) -> None:
-        """Save checkpoint to file."""
+    def _save_checkpoint(self, line_num: Optional[int] = None, byte_offset: Optional[int] = None) -> None:
+        """
+        Save checkpoint to file.
+
+        Without arguments only new log entries are persisted; the resume
+        position stays where it was.
+        """
         if self.checkpoint_file and self.checkpoint:
-            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.checkpoint.to_dict(), f, ensure_ascii=False, indent=2)
+            if line_num is None:
+                line_num, byte_offset = self.checkpoint.line_num, self.checkpoint.byte_offset
+            self.checkpoint.save(line_num, byte_offset)
 
     def _delete_checkpoint(self) -> None:
-        """Delete checkpoint file after successful completion."""
-        if self.checkpoint_file and self.checkpoint_file.exists():
-            self.checkpoint_file.unlink()
+        """Delete checkpoint files after successful completion."""
+        if self.checkpoint:
+            self.checkpoint.delete()
+
+    def _iter_tsv_from_checkpoint(self, f):
+        """
+        Yield (line_num, offset, next_offset, line) from the checkpoint's resume line.
+
+        Args:
+            f: TSV file opened in binary mode
+        """
+        line_num = self.checkpoint.line_num
+        offset = self.checkpoint.byte_offset
+        if offset is not None and not self._offset_at_line_start(f, offset):
+            logger.warning(f"Checkpoint offset {offset} does not match {self.checkpoint.tsv_path}, rescanning lines")
+            offset = None
+
+        if offset is None:
+            # Legacy checkpoint (or changed file): skip lines to find the offset
+            f.seek(0)
+            offset = 0
+            for _ in range(line_num):
+                raw = f.readline()
+                if not raw:
+                    break
+                offset += len(raw)
+        else:
+            f.seek(offset)
+
+        for raw in f:
+            next_offset = offset + len(raw)
+            yield line_num, offset, next_offset, raw.decode('utf-8')
+            line_num += 1
+            offset = next_offset
+
+    @staticmethod
+    def _offset_at_line_start(f, offset: int) -> bool:
+        if offset == 0:
+            return True
+        f.seek(offset - 1)
+        return f.read(1) == b'\n'
 
     def reconcile(self, site: str = None, batch_size: int = 10000) -> dict:
         """
@@ -444,6 +741,8 @@ def main():
     parser.add_argument('--resume', action='store_true', help='Resume from checkpoint')
     parser.add_argument('--checkpoint', type=Path, help='Custom checkpoint file path')
     parser.add_argument('--upload', action='store_true', help='Upload vectors to Qdrant')
+    parser.add_argument('--pipelined', action='store_true',
+                        help='Run parse/vault/embed/upload as concurrent stages (resumable)')
     parser.add_argument('--reconcile', action='store_true',
                         help='Compare Vault vs Qdrant and re-upload missing chunks')
 
@@ -465,7 +764,13 @@ def main():
     pipeline = IndexingPipeline(upload_to_qdrant=args.upload)
 
     try:
-        if args.resume or args.checkpoint:
+        if args.pipelined:
+            result = pipeline.process_tsv_pipelined(
+                args.tsv_path,
+                checkpoint_file=args.checkpoint,
+                site_override=args.site
+            )
+        elif args.resume or args.checkpoint:
             result = pipeline.process_tsv_resumable(
                 args.tsv_path,
                 checkpoint_file=args.checkpoint,
@@ -479,6 +784,9 @@ def main():
         print(f"Buffered: {result.buffered}")
         print(f"Skipped: {result.skipped}")
         print(f"Total chunks: {result.total_chunks}")
+        for stage, stats in result.stage_stats.items():
+            print(f"Stage {stage}: {stats['items']} items, {stats['items_per_second']}/s, "
+                  f"avg batch {stats['avg_batch_ms']}ms, blocked {stats['blocked_seconds']}s")
 
         # Show Qdrant info if uploaded
         if args.upload and pipeline.qdrant:
@@ -0,0 +1,220 @@
+"""
+Threaded stages for the pipelined indexing mode.
+
+Each Stage owns a bounded input queue drained by its own worker threads and
+feeds the next stage's queue, so a slow stage blocks its producers instead of
+buffering without limit (backpressure). Workers can drain several queued items
+into one call (e.g. one embedding request or one vault transaction per batch).
+
+Per-stage counters: items, batches, busy time, average batch latency,
+time blocked on the next stage's full queue, and peak queue depth.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = 0.1
+
+
+class _Done:
+    """Queue sentinel: one per worker when the upstream stage has finished."""
+
+
+_DONE = _Done()
+
+
+class Stage:
+    """
+    One pipeline stage.
+
+    Args:
+        name: Stage name (used in stats and thread names)
+        handler: Called with a list of items; returns the items for the next stage.
+            Exceptions abort the whole pipeline.
+        workers: Worker thread count
+        queue_size: Input queue bound
+        batch_limit: Max total weight of items passed to one handler call
+        weight: Item weight for batch_limit (default 1 per item)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[list], list],
+        workers: int = 1,
+        queue_size: int = 8,
+        batch_limit: int = 1,
+        weight: Optional[Callable[[Any], int]] = None,
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.batch_limit = max(1, batch_limit)
+        self.weight = weight or (lambda item: 1)
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+
+        self.next: Optional["Stage"] = None
+        self._runner: Optional["StageRunner"] = None
+        self._threads: list[threading.Thread] = []
+        self._live_workers = 0
+        self._lock = threading.Lock()
+
+        self._items = 0
+        self._batches = 0
+        self._busy_seconds = 0.0
+        self._blocked_seconds = 0.0
+        self._max_depth = 0
+
+    def put(self, item: Any) -> bool:
+        """Enqueue an item, blocking while the queue is full; False if the pipeline aborted."""
+        while not self._runner.aborted.is_set():
+            try:
+                self.queue.put(item, timeout=_POLL_SECONDS)
+            except queue.Full:
+                continue
+            depth = self.queue.qsize()
+            if depth > self._max_depth:
+                self._max_depth = depth
+            return True
+        return False
+
+    def _get(self) -> Any:
+        while not self._runner.aborted.is_set():
+            try:
+                return self.queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _work(self) -> None:
+        try:
+            finished = False
+            while not finished:
+                item = self._get()
+                if item is _DONE:
+                    break
+
+                batch = [item]
+                total = self.weight(item)
+                while total < self.batch_limit:
+                    try:
+                        item = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _DONE:
+                        finished = True
+                        break
+                    batch.append(item)
+                    total += self.weight(item)
+
+                started = time.perf_counter()
+                outputs = self.handler(batch)
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._items += len(batch)
+                    self._batches += 1
+                    self._busy_seconds += elapsed
+
+                if self.next is not None and outputs:
+                    started = time.perf_counter()
+                    for output in outputs:
+                        if not self.next.put(output):
+                            return
+                    with self._lock:
+                        self._blocked_seconds += time.perf_counter() - started
+        except Exception as e:
+            logger.error(f"Stage '{self.name}' failed: {e}")
+            self._runner.abort(e)
+        finally:
+            with self._lock:
+                self._live_workers -= 1
+                last = self._live_workers == 0
+            if last and self.next is not None:
+                # Upstream exhausted: let each downstream worker finish
+                for _ in range(self.next.workers):
+                    if not self.next.put(_DONE):
+                        break
+
+    def start(self, runner: "StageRunner") -> None:
+        self._runner = runner
+        self._live_workers = self.workers
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"stage-{self.name}-{i}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def get_stats(self, wall_seconds: float) -> dict:
+        """Throughput and latency counters for this stage."""
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'items': self._items,
+                'batches': self._batches,
+                'busy_seconds': round(self._busy_seconds, 3),
+                'avg_batch_ms': round(self._busy_seconds / self._batches * 1000, 1) if self._batches else 0.0,
+                'items_per_second': round(self._items / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+                'blocked_seconds': round(self._blocked_seconds, 3),
+                'max_queue_depth': self._max_depth,
+            }
+
+
+class StageRunner:
+    """
+    Runs a chain of stages: submit() items to the first stage, then finish().
+
+    Args:
+        stages: Stages in flow order; each feeds the next
+    """
+
+    def __init__(self, stages: list[Stage]):
+        self.stages = stages
+        for upstream, downstream in zip(stages, stages[1:]):
+            upstream.next = downstream
+        self.aborted = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+        self._started_at = 0.0
+        self._finished_at = 0.0
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+        for stage in self.stages:
+            stage.start(self)
+
+    def submit(self, item: Any) -> bool:
+        """Feed the first stage (blocks under backpressure); False once aborted."""
+        return self.stages[0].put(item)
+
+    def abort(self, error: BaseException) -> None:
+        """Stop all stages; the first error is re-raised by finish()."""
+        with self._error_lock:
+            if self.error is None:
+                self.error = error
+        self.aborted.set()
+
+    def finish(self) -> None:
+        """Signal end of input, wait for every stage to drain, re-raise a stage failure."""
+        first = self.stages[0]
+        for _ in range(first.workers):
+            if not first.put(_DONE):
+                break
+        for stage in self.stages:
+            stage.join()
+        self._finished_at = time.perf_counter()
+        if self.error is not None:
+            raise self.error
+
+    def get_stats(self) -> dict:
+        """Per-stage stats keyed by stage name."""
+        end = self._finished_at or time.perf_counter()
+        wall = end - self._started_at
+        return {stage.name: stage.get_stats(wall) for stage in self.stages}
@@ -2,8 +2,16 @@
 qdrant_uploader.py - Qdrant 向量上傳模組
 
 負責將 chunks 的 embedding 上傳到 Qdrant。
+
+Backfill date_published/author filter fields on an existing collection,
+then create the payload indexes that turn on native filtering:
+    python -m indexing.qdrant_uploader backfill-filters
+
+Rebuild the per-site catalog collection used by get_sites:
+    python -m indexing.qdrant_uploader rebuild-site-catalog
 """
 
+import argparse
 import logging
 import os
 import time
@@ -17,6 +25,15 @@ from qdrant_client.models import (
     VectorParams,
     PointStruct,
     OptimizersConfigDiff,
+    PayloadSchemaType,
+    Filter,
+    FieldCondition,
+    MatchValue,
+)
+
+from core.qdrant_payload import (
+    DATE_FIELD, FILTER_PAYLOAD_INDEXES, SOURCE_FIELD, filter_fields_from_schema,
+    merge_site_entry, site_catalog_collection, site_catalog_point_id, summarize_sites,
 )
 
 from .embedding import embed_texts, get_embedding_dimension
@@ -90,9 +107,139 @@ class QdrantUploader:
                 ),
             )
             self.logger.info(f"Collection created: {self.config.collection_name}")
+            # Empty collection: every point will carry the filter fields
+            self._ensure_filter_indexes()
+            self.rebuild_site_catalog()
         else:
+            # Existing points may predate date_published/author. Retrieval filters
+            # natively as soon as an index exists, so backfill-filters creates them.
             self.logger.info(f"Collection exists: {self.config.collection_name}")
 
+    def _ensure_filter_indexes(self) -> None:
+        """Create payload indexes for server-side date/author/site filtering (idempotent)."""
+        for field_name, schema_type in FILTER_PAYLOAD_INDEXES.items():
+            try:
+                self.client.create_payload_index(
+                    collection_name=self.config.collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType(schema_type),
+                )
+            except Exception as e:
+                self.logger.warning(f"Could not create payload index on '{field_name}': {e}")
+
+    def backfill_filter_fields(self, batch_size: int = 256) -> int:
+        """
+        Add normalized date_published/author to points indexed before those
+        fields existed, parsed from their schema_json, then create the filter
+        payload indexes. Indexes come last because retrieval filters natively
+        once they exist, which would drop points not yet backfilled.
+
+        Returns:
+            Number of points updated
+        """
+        from qdrant_client.models import Filter, IsEmptyCondition, PayloadField
+
+        missing = Filter(must=[IsEmptyCondition(is_empty=PayloadField(key=DATE_FIELD))])
+        updated = 0
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.config.collection_name,
+                scroll_filter=missing,
+                limit=batch_size,
+                offset=offset,
+                with_payload=["schema_json"],
+                with_vectors=False,
+            )
+            for point in points:
+                fields = filter_fields_from_schema((point.payload or {}).get("schema_json"))
+                if fields[DATE_FIELD] is None and fields["author"] is None:
+                    continue
+                self.client.set_payload(
+                    collection_name=self.config.collection_name,
+                    payload=fields,
+                    points=[point.id],
+                )
+                updated += 1
+            if offset is None:
+                break
+        self.logger.info(f"Backfilled filter fields on {updated} points")
+        self._ensure_filter_indexes()
+        return updated
+
+    def rebuild_site_catalog(self, batch_size: int = 1000) -> int:
+        """
+        Recreate the site catalog collection from a full scroll of the
+        document collection.
+
+        Returns:
+            Number of sites in the catalog
+        """
+        payloads = []
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.config.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=[SOURCE_FIELD, DATE_FIELD],
+                with_vectors=False,
+            )
+            payloads.extend(point.payload or {} for point in points)
+            if offset is None:
+                break
+
+        summary = summarize_sites(payloads)
+        catalog = site_catalog_collection(self.config.collection_name)
+        if self.client.collection_exists(catalog):
+            self.client.delete_collection(catalog)
+        # Payload-only collection; the 1-d vector is a placeholder
+        self.client.create_collection(
+            collection_name=catalog,
+            vectors_config=VectorParams(size=1, distance=Distance.DOT),
+        )
+        if summary:
+            self.client.upsert(collection_name=catalog, points=[
+                PointStruct(id=site_catalog_point_id(site), vector=[0.0],
+                            payload=merge_site_entry(None, site, count, first, last))
+                for site, (count, first, last) in summary.items()
+            ])
+        self.logger.info(f"Site catalog rebuilt: {len(summary)} sites")
+        return len(summary)
+
+    def _update_site_catalog(self, payloads: list[dict]) -> None:
+        """
+        Refresh catalog entries for the uploaded sites: exact per-site count,
+        widened date range. Skipped when the catalog does not exist yet.
+        """
+        summary = summarize_sites(payloads)
+        catalog = site_catalog_collection(self.config.collection_name)
+        try:
+            if not summary or not self.client.collection_exists(catalog):
+                return
+            existing = {
+                point.payload.get(SOURCE_FIELD): point.payload
+                for point in self.client.retrieve(
+                    collection_name=catalog,
+                    ids=[site_catalog_point_id(site) for site in summary],
+                    with_payload=True,
+                )
+            }
+            points = []
+            for site, (_, first, last) in summary.items():
+                count = self.client.count(
+                    collection_name=self.config.collection_name,
+                    count_filter=Filter(must=[FieldCondition(key=SOURCE_FIELD, match=MatchValue(value=site))]),
+                    exact=True,
+                ).count
+                points.append(PointStruct(
+                    id=site_catalog_point_id(site), vector=[0.0],
+                    payload=merge_site_entry(existing.get(site), site, count, first, last),
+                ))
+            self.client.upsert(collection_name=catalog, points=points)
+        except Exception as e:
+            self.logger.warning(f"Could not update site catalog: {e}")
+
     def upload_chunks(
         self,
         chunks: list[Chunk],
@@ -117,72 +264,120 @@ class QdrantUploader:
             return 0
 
         total_uploaded = 0
+        uploaded_payloads = []
 
         # Process in batches
         for i in range(0, len(chunks), batch_size):
             batch_chunks = chunks[i:i + batch_size]
             batch_payloads = payloads[i:i + batch_size] if payloads else None
 
-            # Get texts for embedding (use embedding_text if available, else full_text)
-            texts = [
-                c.embedding_text if c.embedding_text else c.full_text
-                for c in batch_chunks
-            ]
-
-            # Generate embeddings with retry
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    embeddings = embed_texts(texts)
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        wait = 2 ** attempt  # 1s, 2s, 4s
-                        self.logger.warning(f"embed_texts failed (attempt {attempt+1}), retrying in {wait}s: {e}")
-                        time.sleep(wait)
-                    else:
-                        self.logger.error(f"embed_texts failed after {max_retries} attempts: {e}")
-                        raise
-
-            # Validate embedding count matches input
-            if len(embeddings) != len(texts):
-                raise ValueError(f"Embedding count mismatch: got {len(embeddings)} embeddings for {len(texts)} texts")
-
-            # Create points
-            points = []
-            for j, chunk in enumerate(batch_chunks):
-                if batch_payloads:
-                    payload_dict = batch_payloads[j].to_dict()
-                else:
-                    payload_dict = {
-                        "url": chunk.article_url,
-                        "name": chunk.summary,
-                        "site": site,
-                        "chunk_id": chunk.chunk_id,
-                        "article_url": chunk.article_url,
-                        "chunk_index": chunk.chunk_index,
-                        "char_start": chunk.char_start,
-                        "char_end": chunk.char_end,
-                        "version": 2,
-                    }
-
-                points.append(PointStruct(
-                    id=self._generate_point_id(chunk.chunk_id),
-                    vector=embeddings[j].tolist(),
-                    payload=payload_dict,
-                ))
-
-            # Upsert to Qdrant
+            embeddings = self.embed_chunks(batch_chunks)
+            points = self._build_points(batch_chunks, embeddings, site, batch_payloads)
             self.client.upsert(
                 collection_name=self.config.collection_name,
                 points=points,
             )
 
             total_uploaded += len(batch_chunks)
+            uploaded_payloads.extend(point.payload for point in points)
             self.logger.info(f"Uploaded {total_uploaded}/{len(chunks)} chunks")
 
+        self._update_site_catalog(uploaded_payloads)
         return total_uploaded
 
+    def embed_chunks(self, chunks: list[Chunk]):
+        """
+        Embed chunks (embedding_text if available, else full_text), with retry.
+
+        Returns:
+            numpy array of shape (len(chunks), dimension)
+        """
+        texts = [
+            c.embedding_text if c.embedding_text else c.full_text
+            for c in chunks
+        ]
+
+        # Generate embeddings with retry
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                embeddings = embed_texts(texts)
+                break
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    wait = 2 ** attempt  # 1s, 2s, 4s
+                    self.logger.warning(f"embed_texts failed (attempt {attempt+1}), retrying in {wait}s: {e}")
+                    time.sleep(wait)
+                else:
+                    self.logger.error(f"embed_texts failed after {max_retries} attempts: {e}")
+                    raise
+
+        # Validate embedding count matches input
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Embedding count mismatch: got {len(embeddings)} embeddings for {len(texts)} texts")
+
+        return embeddings
+
+    def upsert_embedded(
+        self,
+        chunks: list[Chunk],
+        embeddings,
+        site: str,
+        payloads: Optional[list[MapPayload]] = None,
+    ) -> int:
+        """
+        Upsert chunks whose embeddings were computed by embed_chunks().
+
+        Args:
+            chunks: Chunks to upload
+            embeddings: Vectors 1:1 with chunks
+            site: Site identifier (used when payloads is None)
+            payloads: Optional pre-built MapPayload list (1:1 with chunks)
+
+        Returns:
+            Number of chunks uploaded
+        """
+        if not chunks:
+            return 0
+        points = self._build_points(chunks, embeddings, site, payloads)
+        self.client.upsert(
+            collection_name=self.config.collection_name,
+            points=points,
+        )
+        self._update_site_catalog([point.payload for point in points])
+        return len(points)
+
+    def _build_points(
+        self,
+        chunks: list[Chunk],
+        embeddings,
+        site: str,
+        payloads: Optional[list[MapPayload]],
+    ) -> list[PointStruct]:
+        points = []
+        for j, chunk in enumerate(chunks):
+            if payloads:
+                payload_dict = payloads[j].to_dict()
+            else:
+                payload_dict = {
+                    "url": chunk.article_url,
+                    "name": chunk.summary,
+                    "site": site,
+                    "chunk_id": chunk.chunk_id,
+                    "article_url": chunk.article_url,
+                    "chunk_index": chunk.chunk_index,
+                    "char_start": chunk.char_start,
+                    "char_end": chunk.char_end,
+                    "version": 2,
+                }
+
+            points.append(PointStruct(
+                id=self._generate_point_id(chunk.chunk_id),
+                vector=embeddings[j].tolist(),
+                payload=payload_dict,
+            ))
+        return points
+
     # Deterministic namespace for UUID5 generation (stable across restarts)
     _UUID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "nlweb.chunk")
 
@@ -273,3 +468,32 @@ class QdrantUploader:
     def close(self) -> None:
         """Close the client connection."""
         self.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Qdrant collection maintenance')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('backfill-filters',
+                          help='Backfill date_published/author, then create filter payload indexes')
+    subparsers.add_parser('rebuild-site-catalog',
+                          help='Rebuild the per-site catalog collection from a full scroll')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+        datefmt='%H:%M:%S',
+    )
+
+    uploader = QdrantUploader()
+    try:
+        if args.command == 'backfill-filters':
+            uploader.backfill_filter_fields()
+        elif args.command == 'rebuild-site-catalog':
+            uploader.rebuild_site_catalog()
+    finally:
+        uploader.close()
+
+
+if __name__ == '__main__':
+    main()
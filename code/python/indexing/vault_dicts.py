@@ -0,0 +1,126 @@
+"""
+Vault Dictionary Trainer.
+
+Trains per-source Zstd dictionaries for the Vault (dual_storage.VaultStorage)
+and reports stored bytes, compression ratio and decompression throughput for
+a sample of each source's chunks, before and after. New writes for a source
+use its newest dictionary; --recompress also rewrites existing rows.
+
+Usage:
+    python -m indexing.vault_dicts                                  (all sources)
+    python -m indexing.vault_dicts --source cna.com.tw --recompress
+    python -m indexing.vault_dicts --db data/vault/full_texts.db --recompress --vacuum
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+from .dual_storage import VaultConfig, VaultStorage
+
+logger = logging.getLogger(__name__)
+
+
+def sample_rows(vault: VaultStorage, source: str, limit: int) -> list[tuple[bytes, Optional[int]]]:
+    """Stored (data, dict_id) pairs for a source's most recent chunks."""
+    conn = vault._get_connection()
+    chunk_ids = vault.source_chunk_ids(source, limit)
+    rows = []
+    for i in range(0, len(chunk_ids), 500):
+        batch = chunk_ids[i:i + 500]
+        placeholders = ",".join("?" * len(batch))
+        rows.extend(conn.execute(f"""
+            SELECT full_text_compressed, dict_id FROM article_chunks
+            WHERE chunk_id IN ({placeholders})
+        """, batch).fetchall())
+    return rows
+
+
+def measure(vault: VaultStorage, rows: list[tuple[bytes, Optional[int]]]) -> dict:
+    """Decompress rows in one batch and report size and throughput."""
+    started = time.perf_counter()
+    texts = vault._decompress_many(rows)
+    elapsed = time.perf_counter() - started
+
+    text_bytes = sum(len(t.encode('utf-8')) for t in texts)
+    stored_bytes = sum(len(row[0]) for row in rows)
+    return {
+        'chunks': len(rows),
+        'text_bytes': text_bytes,
+        'stored_bytes': stored_bytes,
+        'ratio': round(text_bytes / stored_bytes, 2) if stored_bytes else 0.0,
+        'decompress_mb_per_s': round(text_bytes / 1e6 / elapsed, 1) if elapsed > 0 else 0.0,
+        'texts': texts,
+    }
+
+
+def _log_measurement(label: str, m: dict) -> None:
+    logger.info(
+        f"  {label:<6} {m['chunks']} chunks, {m['stored_bytes']:,} bytes stored, "
+        f"ratio {m['ratio']}x, decompress {m['decompress_mb_per_s']} MB/s"
+    )
+
+
+def train_source(vault: VaultStorage, source: str, sample: int, recompress: bool) -> Optional[dict]:
+    """Train one source's dictionary; returns before/after sample measurements or None if skipped."""
+    before = measure(vault, sample_rows(vault, source, sample))
+    dict_id = vault.train_dictionary(source)
+    if dict_id is None:
+        return None
+
+    # Same sample re-encoded with the new dictionary
+    rows = [(vault._compress(text, source)[0], dict_id) for text in before['texts']]
+    after = measure(vault, rows)
+
+    logger.info(f"{source}: dictionary {dict_id}")
+    _log_measurement('before', before)
+    _log_measurement('after', after)
+
+    if recompress:
+        rewritten = vault.recompress_source(source)
+        logger.info(f"  recompressed {rewritten} rows")
+    return {'dict_id': dict_id, 'before': before, 'after': after}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train per-source Zstd dictionaries for the Vault')
+    parser.add_argument('--db', type=Path, help='Vault DB path (default: data/vault/full_texts.db)')
+    parser.add_argument('--source', nargs='*', help='Sources (URL domains) to train; default all')
+    parser.add_argument('--sample', type=int, default=2000, help='Chunks per source for the before/after report')
+    parser.add_argument('--recompress', action='store_true', help='Rewrite existing rows with the new dictionaries')
+    parser.add_argument('--vacuum', action='store_true', help='VACUUM the vault afterwards to release freed pages')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+        datefmt='%H:%M:%S',
+    )
+
+    vault = VaultStorage(VaultConfig(db_path=args.db)) if args.db else VaultStorage()
+    db_path = vault.config.db_path
+    stats_before = vault.get_compression_stats()
+    size_before = db_path.stat().st_size if db_path.exists() else 0
+
+    for source in args.source or vault.list_sources():
+        train_source(vault, source, args.sample, args.recompress)
+
+    if args.vacuum:
+        conn = vault._get_connection()
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    stats_after = vault.get_compression_stats()
+    size_after = db_path.stat().st_size
+    logger.info(
+        f"Vault: {stats_before['stored_bytes']:,} → {stats_after['stored_bytes']:,} bytes stored, "
+        f"file {size_before:,} → {size_after:,} bytes, row versions {stats_after['versions']}"
+    )
+    vault.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -223,7 +223,9 @@ class BaseReasoningAgent:
                         filled_prompt,
                         schema={},
                         level=level,
-                        query_params=getattr(self.handler, 'query_params', {})
+                        query_params=getattr(self.handler, 'query_params', {}),
+                        cache_site="analysis",
+                        use_cache=attempt == 0
                     ),
                     timeout=self.timeout
                 )
@@ -384,7 +386,9 @@ class BaseReasoningAgent:
                         level=level,
                         timeout=inner_timeout,  # Inner timeout fires first
                         query_params=getattr(self.handler, 'query_params', {}),
-                        max_length=16384  # Large buffer for research outputs
+                        max_length=16384,  # Large buffer for research outputs
+                        cache_site="analysis",
+                        use_cache=attempt == 0  # Retries must not replay a cached bad response
                     ),
                     timeout=self.timeout  # Outer timeout as safety net
                 )
@@ -1613,6 +1613,10 @@ class DeepResearchOrchestrator:
         4. Stock APIs: STOCK_TW (TWSE/TPEX), STOCK_GLOBAL (yfinance)
         5. Wikipedia: Direct Wikipedia API call
 
+        API-backed resolutions run concurrently under the tier_6.gap_resolution
+        time budget (see GapResolutionScheduler); their results are merged in a
+        fixed order so citation IDs do not depend on API latency.
+
         Args:
             response: Analyst output with gap_resolutions
             mode: Research mode
@@ -1622,6 +1626,7 @@ class DeepResearchOrchestrator:
             query_id: Query ID for analytics logging
         """
         from reasoning.schemas_enhanced import GapResolutionType
+        from reasoning.utils.gap_scheduler import GapResolutionScheduler
 
         web_search_gaps = []
         llm_knowledge_items = []
@@ -1685,47 +1690,79 @@ class DeepResearchOrchestrator:
 
         # Add LLM knowledge items to context
         if llm_knowledge_items:
-            current_context.extend(llm_knowledge_items)
-            # Update source_map with new items
-            start_idx = len(self.source_map) + 1
-            for i, item in enumerate(llm_knowledge_items):
-                self.source_map[start_idx + i] = item
+            self._add_to_context(llm_knowledge_items, current_context)
             self.logger.info(f"Added {len(llm_knowledge_items)} LLM knowledge items to context")
 
-        # Execute stock API calls
+        # Schedule API calls; the add order below is the merge order
+        scheduler = GapResolutionScheduler.from_config(CONFIG.reasoning_params.get("tier_6", {}))
+
         if stock_tw_gaps:
-            await self._execute_stock_tw_searches(stock_tw_gaps, current_context, tracer, query_id)
+            scheduler.add("STOCK_TW", self._execute_stock_tw_searches(stock_tw_gaps, scheduler, tracer, query_id))
 
         if stock_global_gaps:
-            await self._execute_stock_global_searches(stock_global_gaps, current_context, tracer, query_id)
+            scheduler.add("STOCK_GLOBAL", self._execute_stock_global_searches(stock_global_gaps, scheduler, tracer, query_id))
 
-        # Execute weather API calls
         if weather_tw_gaps:
-            await self._execute_weather_tw_searches(weather_tw_gaps, current_context, tracer, query_id)
+            scheduler.add("WEATHER_TW", self._execute_weather_tw_searches(weather_tw_gaps, scheduler, tracer, query_id))
 
         if weather_global_gaps:
-            await self._execute_weather_global_searches(weather_global_gaps, current_context, tracer, query_id)
+            scheduler.add("WEATHER_GLOBAL", self._execute_weather_global_searches(weather_global_gaps, scheduler, tracer, query_id))
 
-        # Execute company API calls
         if company_tw_gaps:
-            await self._execute_company_tw_searches(company_tw_gaps, current_context, tracer, query_id)
+            scheduler.add("COMPANY_TW", self._execute_company_tw_searches(company_tw_gaps, scheduler, tracer, query_id))
 
         if company_global_gaps:
-            await self._execute_company_global_searches(company_global_gaps, current_context, tracer, query_id)
+            scheduler.add("COMPANY_GLOBAL", self._execute_company_global_searches(company_global_gaps, scheduler, tracer, query_id))
 
-        # Execute Wikipedia searches
         if wikipedia_gaps:
-            await self._execute_wikipedia_searches(wikipedia_gaps, current_context, tracer, query_id)
+            scheduler.add("WIKIPEDIA", self._execute_wikipedia_searches(wikipedia_gaps, scheduler, tracer, query_id))
 
-        # Execute web searches in parallel if enabled
         if web_search_gaps and enable_web_search:
-            await self._execute_web_searches(web_search_gaps, mode, current_context, tracer, query_id)
+            scheduler.add("WEB_SEARCH", self._execute_web_searches(web_search_gaps, mode, scheduler, tracer, query_id))
+
+        gap_results = await scheduler.run()
+        if gap_results:
+            self._add_to_context(gap_results, current_context)
+            self.logger.info(f"Added {len(gap_results)} Tier 6 API results to context")
+
+        if scheduler.timed_out and tracer:
+            tracer.context_update(
+                "GAP_RESOLUTION_TIMEOUT",
+                {
+                    "time_budget": scheduler.time_budget,
+                    "cancelled": scheduler.timed_out,
+                    "results_kept": len(gap_results)
+                }
+            )
+
+    def _add_to_context(self, items: List[Dict[str, Any]], current_context: List[Dict[str, Any]]) -> None:
+        """Append items to the context and assign them the next source_map citation IDs."""
+        current_context.extend(items)
+        start_idx = len(self.source_map) + 1
+        for i, item in enumerate(items):
+            self.source_map[start_idx + i] = item
+
+    @staticmethod
+    def _wikipedia_doc(result: Dict[str, Any], gap_query: str) -> Dict[str, Any]:
+        """Convert a WikipediaClient result to a Tier 6 encyclopedia document."""
+        return {
+            "url": result.get("link", ""),
+            "title": result.get("title", "Wikipedia"),
+            "site": "Wikipedia",
+            "description": f"[Tier 6 | encyclopedia] {result.get('snippet', '')}",
+            "_reasoning_metadata": {
+                "tier": 6,
+                "type": "encyclopedia",
+                "original_source": "Wikipedia",
+                "gap_query": gap_query
+            }
+        }
 
     async def _execute_web_searches(
         self,
         gaps: List[Any],
         mode: str,
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -1735,12 +1772,10 @@ class DeepResearchOrchestrator:
         Args:
             gaps: List of GapResolution objects requiring web search
             mode: Research mode
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
-        import asyncio
-
         # Get configuration
         tier_6_config = CONFIG.reasoning_params.get("tier_6", {})
         web_config = tier_6_config.get("web_search", {})
@@ -1774,121 +1809,71 @@ class DeepResearchOrchestrator:
                 except ImportError:
                     self.logger.debug("Wikipedia library not installed")
 
-            # Build search tasks
-            search_tasks = []
-            for gap in gaps:
-                if gap.search_query:
-                    # Google Search task
-                    google_task = google_client.search_all_sites(
+            async def google_search(gap):
+                try:
+                    results = await google_client.search_all_sites(
                         query=gap.search_query,
                         num_results=max_results,
                         query_id=query_id
                     )
-                    search_tasks.append(("google", gap, google_task))
-
-                    # Wikipedia task (parallel strategy)
-                    if wiki_client and enrichment_strategy == "parallel":
-                        wiki_task = wiki_client.search(
-                            query=gap.search_query,
-                            query_id=query_id
-                        )
-                        search_tasks.append(("wikipedia", gap, wiki_task))
-
-            # Gather results
-            all_results = []
-            google_count = 0
-            wiki_count = 0
+                    self.logger.info(f"google search for '{gap.search_query}': {len(results)} results")
+                except Exception as e:
+                    self.logger.error(f"google search failed for '{gap.search_query}': {e}")
+                    return []
+
+                # Process Google results (tuple format)
+                docs = []
+                for result in results:
+                    if isinstance(result, (list, tuple)) and len(result) >= 4:
+                        schema_json = result[1] if len(result) > 1 else "{}"
+                        try:
+                            schema_obj = json.loads(schema_json) if isinstance(schema_json, str) else schema_json
+                        except json.JSONDecodeError:
+                            schema_obj = {}
+
+                        docs.append({
+                            "url": result[0],
+                            "title": result[2] if len(result) > 2 else "Web Result",
+                            "site": result[3] if len(result) > 3 else "Web",
+                            "description": f"[Tier 6 | web_reference] {schema_obj.get('description', '')}",
+                            "_reasoning_metadata": {
+                                "tier": 6,
+                                "type": "web_reference",
+                                "original_source": result[3] if len(result) > 3 else "Web",
+                                "gap_query": gap.search_query
+                            }
+                        })
+                return docs
 
-            for source_type, gap, task in search_tasks:
+            async def wikipedia_search(gap):
                 try:
-                    results = await task
-
-                    if source_type == "google":
-                        # Process Google results (tuple format)
-                        for result in results:
-                            if isinstance(result, (list, tuple)) and len(result) >= 4:
-                                schema_json = result[1] if len(result) > 1 else "{}"
-                                try:
-                                    schema_obj = json.loads(schema_json) if isinstance(schema_json, str) else schema_json
-                                except json.JSONDecodeError:
-                                    schema_obj = {}
-
-                                web_doc = {
-                                    "url": result[0],
-                                    "title": result[2] if len(result) > 2 else "Web Result",
-                                    "site": result[3] if len(result) > 3 else "Web",
-                                    "description": f"[Tier 6 | web_reference] {schema_obj.get('description', '')}",
-                                    "_reasoning_metadata": {
-                                        "tier": 6,
-                                        "type": "web_reference",
-                                        "original_source": result[3] if len(result) > 3 else "Web",
-                                        "gap_query": gap.search_query
-                                    }
-                                }
-                                all_results.append(web_doc)
-                                google_count += 1
-
-                    elif source_type == "wikipedia":
-                        # Process Wikipedia results (dict format)
-                        for result in results:
-                            if isinstance(result, dict):
-                                wiki_doc = {
-                                    "url": result.get("link", ""),
-                                    "title": result.get("title", "Wikipedia"),
-                                    "site": "Wikipedia",
-                                    "description": f"[Tier 6 | encyclopedia] {result.get('snippet', '')}",
-                                    "_reasoning_metadata": {
-                                        "tier": 6,
-                                        "type": "encyclopedia",
-                                        "original_source": "Wikipedia",
-                                        "gap_query": gap.search_query
-                                    }
-                                }
-                                all_results.append(wiki_doc)
-                                wiki_count += 1
+                    results = await wiki_client.search(query=gap.search_query, query_id=query_id)
+                    self.logger.info(f"wikipedia search for '{gap.search_query}': {len(results)} results")
+                except Exception as e:
+                    self.logger.error(f"wikipedia search failed for '{gap.search_query}': {e}")
+                    return []
+                # Process Wikipedia results (dict format)
+                return [self._wikipedia_doc(r, gap.search_query) for r in results if isinstance(r, dict)]
 
-                    self.logger.info(f"{source_type} search for '{gap.search_query}': {len(results)} results")
+            query_gaps = [gap for gap in gaps if gap.search_query]
 
-                except Exception as e:
-                    self.logger.error(f"{source_type} search failed for '{gap.search_query}': {e}")
+            # Google and (parallel strategy) Wikipedia run side by side, each under its own cap
+            searches = [scheduler.map("WEB_SEARCH", "web_search", query_gaps, google_search)]
+            if wiki_client and enrichment_strategy == "parallel":
+                searches.append(scheduler.map("WEB_SEARCH", "wikipedia", query_gaps, wikipedia_search))
+            per_source = await asyncio.gather(*searches)
+
+            google_count = sum(len(docs) for docs in per_source[0])
+            wiki_count = sum(len(docs) for docs in per_source[1]) if len(per_source) > 1 else 0
 
             # Sequential fallback: Try Wikipedia if Google returned few results
             if wiki_client and enrichment_strategy == "sequential" and google_count < 3:
                 self.logger.info("Sequential fallback: trying Wikipedia for additional context")
-                for gap in gaps:
-                    if gap.search_query:
-                        try:
-                            wiki_results = await wiki_client.search(
-                                query=gap.search_query,
-                                query_id=query_id
-                            )
-                            for result in wiki_results:
-                                if isinstance(result, dict):
-                                    wiki_doc = {
-                                        "url": result.get("link", ""),
-                                        "title": result.get("title", "Wikipedia"),
-                                        "site": "Wikipedia",
-                                        "description": f"[Tier 6 | encyclopedia] {result.get('snippet', '')}",
-                                        "_reasoning_metadata": {
-                                            "tier": 6,
-                                            "type": "encyclopedia",
-                                            "original_source": "Wikipedia",
-                                            "gap_query": gap.search_query
-                                        }
-                                    }
-                                    all_results.append(wiki_doc)
-                                    wiki_count += 1
-                        except Exception as e:
-                            self.logger.error(f"Wikipedia fallback failed: {e}")
+                fallback = await scheduler.map("WEB_SEARCH", "wikipedia", query_gaps, wikipedia_search)
+                wiki_count += sum(len(docs) for docs in fallback)
 
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                # Update source_map
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} Tier 6 results (Google: {google_count}, Wikipedia: {wiki_count})")
+            if google_count or wiki_count:
+                self.logger.info(f"Collected {google_count + wiki_count} Tier 6 results (Google: {google_count}, Wikipedia: {wiki_count})")
 
                 # Tracing
                 if tracer:
@@ -1896,7 +1881,7 @@ class DeepResearchOrchestrator:
                         "WEB_SEARCH",
                         {
                             "queries_executed": [g.search_query for g in gaps],
-                            "results_found": len(all_results),
+                            "results_found": google_count + wiki_count,
                             "google_count": google_count,
                             "wikipedia_count": wiki_count
                         }
@@ -1910,7 +1895,7 @@ class DeepResearchOrchestrator:
     async def _execute_stock_tw_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -1919,7 +1904,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring STOCK_TW
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -1931,7 +1916,7 @@ class DeepResearchOrchestrator:
                 self.logger.debug("TWSE client not enabled")
                 return
 
-            all_results = []
+            symbols = []
             for gap in gaps:
                 # Extract symbol from api_params
                 symbol = None
@@ -1945,27 +1930,29 @@ class DeepResearchOrchestrator:
                         symbol = match.group(1)
 
                 if symbol:
-                    try:
-                        results = await client.search(symbol, query_id=query_id)
-                        all_results.extend(results)
-                        self.logger.info(f"TWSE search for '{symbol}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"TWSE search failed for '{symbol}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} Taiwan stock results")
+                    symbols.append(symbol)
+
+            async def fetch(symbol):
+                try:
+                    results = await client.search(symbol, query_id=query_id)
+                    self.logger.info(f"TWSE search for '{symbol}': {len(results)} results")
+                    return results
+                except Exception as e:
+                    self.logger.error(f"TWSE search failed for '{symbol}': {e}")
+                    return []
+
+            per_symbol = await scheduler.map("STOCK_TW", "twse", symbols, fetch)
+            result_count = sum(len(results) for results in per_symbol)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} Taiwan stock results")
 
                 if tracer:
                     tracer.context_update(
                         "STOCK_TW",
                         {
                             "symbols_queried": [g.api_params.get("symbol") if g.api_params else None for g in gaps],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -1977,7 +1964,7 @@ class DeepResearchOrchestrator:
     async def _execute_stock_global_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -1986,7 +1973,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring STOCK_GLOBAL
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -1998,7 +1985,7 @@ class DeepResearchOrchestrator:
                 self.logger.debug("yFinance client not enabled or library not available")
                 return
 
-            all_results = []
+            symbols = []
             for gap in gaps:
                 # Extract symbol from api_params
                 symbol = None
@@ -2012,27 +1999,29 @@ class DeepResearchOrchestrator:
                         symbol = match.group(1)
 
                 if symbol:
-                    try:
-                        results = await client.search(symbol, query_id=query_id)
-                        all_results.extend(results)
-                        self.logger.info(f"yFinance search for '{symbol}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"yFinance search failed for '{symbol}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} global stock results")
+                    symbols.append(symbol)
+
+            async def fetch(symbol):
+                try:
+                    results = await client.search(symbol, query_id=query_id)
+                    self.logger.info(f"yFinance search for '{symbol}': {len(results)} results")
+                    return results
+                except Exception as e:
+                    self.logger.error(f"yFinance search failed for '{symbol}': {e}")
+                    return []
+
+            per_symbol = await scheduler.map("STOCK_GLOBAL", "yfinance", symbols, fetch)
+            result_count = sum(len(results) for results in per_symbol)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} global stock results")
 
                 if tracer:
                     tracer.context_update(
                         "STOCK_GLOBAL",
                         {
                             "symbols_queried": [g.api_params.get("symbol") if g.api_params else None for g in gaps],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -2044,7 +2033,7 @@ class DeepResearchOrchestrator:
     async def _execute_wikipedia_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -2053,7 +2042,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring WIKIPEDIA
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -2065,46 +2054,34 @@ class DeepResearchOrchestrator:
                 self.logger.debug("Wikipedia client not enabled or library not available")
                 return
 
-            all_results = []
+            queries = []
             for gap in gaps:
                 query = gap.search_query or (gap.api_params.get("query") if gap.api_params else None)
                 if query:
-                    try:
-                        results = await client.search(query, query_id=query_id)
-                        # Convert to standard format
-                        for result in results:
-                            if isinstance(result, dict):
-                                wiki_doc = {
-                                    "url": result.get("link", ""),
-                                    "title": result.get("title", "Wikipedia"),
-                                    "site": "Wikipedia",
-                                    "description": f"[Tier 6 | encyclopedia] {result.get('snippet', '')}",
-                                    "_reasoning_metadata": {
-                                        "tier": 6,
-                                        "type": "encyclopedia",
-                                        "original_source": "Wikipedia",
-                                        "gap_query": query
-                                    }
-                                }
-                                all_results.append(wiki_doc)
-                        self.logger.info(f"Wikipedia search for '{query}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"Wikipedia search failed for '{query}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} Wikipedia results")
+                    queries.append(query)
+
+            async def fetch(query):
+                try:
+                    results = await client.search(query, query_id=query_id)
+                    self.logger.info(f"Wikipedia search for '{query}': {len(results)} results")
+                except Exception as e:
+                    self.logger.error(f"Wikipedia search failed for '{query}': {e}")
+                    return []
+                # Convert to standard format
+                return [self._wikipedia_doc(result, query) for result in results if isinstance(result, dict)]
+
+            per_query = await scheduler.map("WIKIPEDIA", "wikipedia", queries, fetch)
+            result_count = sum(len(results) for results in per_query)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} Wikipedia results")
 
                 if tracer:
                     tracer.context_update(
                         "WIKIPEDIA",
                         {
                             "queries_executed": [g.search_query for g in gaps if g.search_query],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -2116,7 +2093,7 @@ class DeepResearchOrchestrator:
     async def _execute_weather_tw_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -2125,7 +2102,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring WEATHER_TW
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -2137,7 +2114,7 @@ class DeepResearchOrchestrator:
                 self.logger.debug("CWB Weather client not enabled or API key not configured")
                 return
 
-            all_results = []
+            locations = []
             for gap in gaps:
                 # Extract location from api_params
                 location = None
@@ -2148,27 +2125,29 @@ class DeepResearchOrchestrator:
                     location = gap.search_query
 
                 if location:
-                    try:
-                        results = await client.search(location, query_id=query_id)
-                        all_results.extend(results)
-                        self.logger.info(f"CWB Weather search for '{location}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"CWB Weather search failed for '{location}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} Taiwan weather results")
+                    locations.append(location)
+
+            async def fetch(location):
+                try:
+                    results = await client.search(location, query_id=query_id)
+                    self.logger.info(f"CWB Weather search for '{location}': {len(results)} results")
+                    return results
+                except Exception as e:
+                    self.logger.error(f"CWB Weather search failed for '{location}': {e}")
+                    return []
+
+            per_location = await scheduler.map("WEATHER_TW", "cwb_weather", locations, fetch)
+            result_count = sum(len(results) for results in per_location)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} Taiwan weather results")
 
                 if tracer:
                     tracer.context_update(
                         "WEATHER_TW",
                         {
                             "locations_queried": [g.api_params.get("location") if g.api_params else g.search_query for g in gaps],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -2180,7 +2159,7 @@ class DeepResearchOrchestrator:
     async def _execute_weather_global_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -2189,7 +2168,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring WEATHER_GLOBAL
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -2201,7 +2180,7 @@ class DeepResearchOrchestrator:
                 self.logger.debug("Global Weather client not enabled or API key not configured")
                 return
 
-            all_results = []
+            cities = []
             for gap in gaps:
                 # Extract city from api_params
                 city = None
@@ -2212,27 +2191,29 @@ class DeepResearchOrchestrator:
                     city = gap.search_query
 
                 if city:
-                    try:
-                        results = await client.search(city, query_id=query_id)
-                        all_results.extend(results)
-                        self.logger.info(f"Global Weather search for '{city}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"Global Weather search failed for '{city}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} global weather results")
+                    cities.append(city)
+
+            async def fetch(city):
+                try:
+                    results = await client.search(city, query_id=query_id)
+                    self.logger.info(f"Global Weather search for '{city}': {len(results)} results")
+                    return results
+                except Exception as e:
+                    self.logger.error(f"Global Weather search failed for '{city}': {e}")
+                    return []
+
+            per_city = await scheduler.map("WEATHER_GLOBAL", "openweathermap", cities, fetch)
+            result_count = sum(len(results) for results in per_city)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} global weather results")
 
                 if tracer:
                     tracer.context_update(
                         "WEATHER_GLOBAL",
                         {
                             "cities_queried": [g.api_params.get("city") if g.api_params else g.search_query for g in gaps],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -2244,7 +2225,7 @@ class DeepResearchOrchestrator:
     async def _execute_company_tw_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -2253,7 +2234,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring COMPANY_TW
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -2265,7 +2246,7 @@ class DeepResearchOrchestrator:
                 self.logger.debug("TW Company client not enabled")
                 return
 
-            all_results = []
+            queries = []
             for gap in gaps:
                 # Extract company name from api_params
                 query = None
@@ -2275,27 +2256,29 @@ class DeepResearchOrchestrator:
                     query = gap.search_query
 
                 if query:
-                    try:
-                        results = await client.search(query, query_id=query_id)
-                        all_results.extend(results)
-                        self.logger.info(f"TW Company search for '{query}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"TW Company search failed for '{query}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} Taiwan company results")
+                    queries.append(query)
+
+            async def fetch(query):
+                try:
+                    results = await client.search(query, query_id=query_id)
+                    self.logger.info(f"TW Company search for '{query}': {len(results)} results")
+                    return results
+                except Exception as e:
+                    self.logger.error(f"TW Company search failed for '{query}': {e}")
+                    return []
+
+            per_query = await scheduler.map("COMPANY_TW", "tw_company", queries, fetch)
+            result_count = sum(len(results) for results in per_query)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} Taiwan company results")
 
                 if tracer:
                     tracer.context_update(
                         "COMPANY_TW",
                         {
                             "queries_executed": [g.api_params.get("name") if g.api_params else g.search_query for g in gaps],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -2307,7 +2290,7 @@ class DeepResearchOrchestrator:
     async def _execute_company_global_searches(
         self,
         gaps: List[Any],
-        current_context: List[Dict[str, Any]],
+        scheduler: Any,
         tracer: Any = None,
         query_id: str = None
     ) -> None:
@@ -2316,7 +2299,7 @@ class DeepResearchOrchestrator:
 
         Args:
             gaps: List of GapResolution objects requiring COMPANY_GLOBAL
-            current_context: Current context list (modified in place)
+            scheduler: GapResolutionScheduler collecting the results
             tracer: Optional console tracer
             query_id: Query ID for analytics logging
         """
@@ -2328,7 +2311,7 @@ class DeepResearchOrchestrator:
                 self.logger.debug("Wikidata client not enabled")
                 return
 
-            all_results = []
+            lookups = []
             for gap in gaps:
                 # Extract name from api_params
                 name = None
@@ -2340,27 +2323,30 @@ class DeepResearchOrchestrator:
                     name = gap.search_query
 
                 if name:
-                    try:
-                        results = await client.search(name, entity_type=entity_type, query_id=query_id)
-                        all_results.extend(results)
-                        self.logger.info(f"Wikidata search for '{name}': {len(results)} results")
-                    except Exception as e:
-                        self.logger.error(f"Wikidata search failed for '{name}': {e}")
-
-            # Add to context
-            if all_results:
-                current_context.extend(all_results)
-                start_idx = len(self.source_map) + 1
-                for i, item in enumerate(all_results):
-                    self.source_map[start_idx + i] = item
-                self.logger.info(f"Added {len(all_results)} global company results")
+                    lookups.append((name, entity_type))
+
+            async def fetch(lookup):
+                name, entity_type = lookup
+                try:
+                    results = await client.search(name, entity_type=entity_type, query_id=query_id)
+                    self.logger.info(f"Wikidata search for '{name}': {len(results)} results")
+                    return results
+                except Exception as e:
+                    self.logger.error(f"Wikidata search failed for '{name}': {e}")
+                    return []
+
+            per_name = await scheduler.map("COMPANY_GLOBAL", "wikidata", lookups, fetch)
+            result_count = sum(len(results) for results in per_name)
+
+            if result_count:
+                self.logger.info(f"Collected {result_count} global company results")
 
                 if tracer:
                     tracer.context_update(
                         "COMPANY_GLOBAL",
                         {
                             "queries_executed": [g.api_params.get("name") if g.api_params else g.search_query for g in gaps],
-                            "results_found": len(all_results)
+                            "results_found": result_count
                         }
                     )
 
@@ -0,0 +1,145 @@
+"""
+Gap resolution scheduler for Stage 5 Tier 6 enrichment.
+
+Runs the resolution steps of one Analyst iteration (stock, weather, company,
+Wikipedia, web search) concurrently under a shared time budget, with a
+concurrency cap per provider. Each provider call stores its documents in its
+own slot as soon as it returns, so steps still running at the deadline are
+cancelled without losing what they already fetched.
+
+Results come back in the order the steps were added, and in gap order within
+a step, independent of which API answered first - source_map citation IDs
+stay stable across runs.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from misc.logger.logging_config_helper import get_configured_logger
+
+
+logger = get_configured_logger("reasoning.gap_scheduler")
+
+
+class GapResolutionScheduler:
+    """
+    Per-iteration scheduler for gap resolution steps.
+
+    Args:
+        time_budget: Seconds all steps share; None or <= 0 waits for every step
+        provider_limits: Max concurrent calls per provider (tier_6 section name)
+        default_limit: Cap for providers without an explicit limit
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        provider_limits: Optional[Dict[str, int]] = None,
+        default_limit: int = 4
+    ):
+        self.time_budget = time_budget if time_budget and time_budget > 0 else None
+        self.provider_limits = provider_limits or {}
+        self.default_limit = max(1, default_limit)
+        self.timed_out: List[str] = []
+        self._steps: List[tuple] = []
+        self._slots: Dict[str, List[Optional[List[Dict[str, Any]]]]] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_config(cls, tier_6_config: Dict[str, Any]) -> "GapResolutionScheduler":
+        """Build from reasoning.tier_6: gap_resolution budget plus per-provider max_concurrency."""
+        gap_config = tier_6_config.get("gap_resolution", {})
+        provider_limits = {
+            name: section["max_concurrency"]
+            for name, section in tier_6_config.items()
+            if isinstance(section, dict) and section.get("max_concurrency")
+        }
+        return cls(
+            time_budget=gap_config.get("time_budget", 8.0),
+            provider_limits=provider_limits,
+            default_limit=gap_config.get("default_max_concurrency", 4),
+        )
+
+    def add(self, kind: str, step: Awaitable[None]) -> None:
+        """Queue a resolution step; its results are merged in the order steps are added."""
+        self._slots.setdefault(kind, [])
+        self._steps.append((kind, step))
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        if provider not in self._semaphores:
+            limit = self.provider_limits.get(provider, self.default_limit)
+            self._semaphores[provider] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[provider]
+
+    async def map(
+        self,
+        kind: str,
+        provider: str,
+        items: Sequence[Any],
+        fetch: Callable[[Any], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run fetch(item) for every item concurrently, at most the provider's
+        cap at a time. Each call's documents are kept in the item's slot as
+        soon as the call returns.
+
+        Returns:
+            Documents per item, in item order (empty list for failed calls)
+        """
+        slots = self._slots.setdefault(kind, [])
+        base = len(slots)
+        slots.extend([None] * len(items))
+        semaphore = self._semaphore(provider)
+
+        async def run(index: int, item: Any) -> None:
+            async with semaphore:
+                try:
+                    slots[base + index] = await fetch(item) or []
+                except Exception as e:
+                    logger.error(f"{provider} call failed for {kind}: {e}")
+
+        await asyncio.gather(*(run(i, item) for i, item in enumerate(items)))
+        return [slot or [] for slot in slots[base:]]
+
+    async def run(self) -> List[Dict[str, Any]]:
+        """
+        Run all queued steps until they finish or the time budget runs out.
+
+        Steps still running at the deadline are cancelled; documents from
+        their completed calls are kept.
+
+        Returns:
+            Documents from all steps, in step order then item order
+        """
+        if not self._steps:
+            return []
+
+        tasks = [asyncio.create_task(step) for _, step in self._steps]
+        _, pending = await asyncio.wait(tasks, timeout=self.time_budget)
+
+        for (kind, _), task in zip(self._steps, tasks):
+            if task in pending:
+                task.cancel()
+                self.timed_out.append(kind)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(
+                f"Gap resolution budget ({self.time_budget}s) exceeded, "
+                f"cancelled: {', '.join(self.timed_out)}"
+            )
+
+        for (kind, _), task in zip(self._steps, tasks):
+            if task not in pending and task.exception() is not None:
+                logger.error(f"{kind} gap resolution failed: {task.exception()}")
+
+        return self.results()
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Documents collected so far, in step order then item order."""
+        return [
+            doc
+            for slots in self._slots.values()
+            for slot in slots
+            if slot
+            for doc in slot
+        ]
@@ -16,9 +16,10 @@ import asyncio
 import os
 import time
 import aiohttp
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 from core.config import CONFIG
+from core.tier6_cache import get_tier6_cache
+from core.http_client import get_http_client
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("cwb_weather_client")
@@ -110,12 +111,8 @@ class CwbWeatherClient:
         # API key from config or environment
         self._api_key = cwb_config.get("api_key") or os.getenv("CWB_API_KEY")
 
-        # Cache configuration
-        cache_config = cwb_config.get("cache", {})
-        self._cache: Dict[str, Tuple[Dict, datetime]] = {}
-        self._cache_enabled = cache_config.get("enabled", True)
-        self._cache_ttl = timedelta(hours=cache_config.get("ttl_hours", 1))
-        self._cache_max_size = cache_config.get("max_size", 100)
+        # Shared cache (core/tier6_cache.py): per-client TTL, stale-while-revalidate
+        self._cache = get_tier6_cache("cwb_weather", default_ttl_hours=1, default_max_size=100)
 
         if not self._api_key:
             logger.warning("CWB API key not configured. Set CWB_API_KEY environment variable.")
@@ -123,7 +120,7 @@ class CwbWeatherClient:
 
         logger.info(
             f"Initialized CwbWeatherClient (enabled={self._enabled}, "
-            f"cache={self._cache_enabled}, ttl={self._cache_ttl})"
+            f"cache={self._cache is not None})"
         )
 
     async def search(
@@ -162,41 +159,28 @@ class CwbWeatherClient:
         results = []
 
         try:
-            # Check cache first
+            # Shared cache: fresh or stale hits (stale ones refresh in the background),
+            # concurrent misses for the same key share one upstream call
             cache_key = normalized_location
-            if self._cache_enabled and cache_key in self._cache:
-                cached_result, timestamp = self._cache[cache_key]
-                if datetime.now() - timestamp < self._cache_ttl:
-                    cache_hit = True
-                    logger.info(f"CWB cache HIT for location: '{normalized_location}'")
-                    results = [cached_result]
-                else:
-                    del self._cache[cache_key]
-                    logger.debug(f"CWB cache EXPIRED for location: '{normalized_location}'")
 
-            # Cache miss - fetch data with timeout
-            if not cache_hit:
-                try:
-                    result = await asyncio.wait_for(
-                        self._fetch_weather_data(normalized_location),
-                        timeout=timeout
-                    )
+            async def fetch():
+                return await asyncio.wait_for(self._fetch_weather_data(normalized_location), timeout=timeout)
 
-                    if result:
-                        results = [result]
-                        # Update cache
-                        if self._cache_enabled:
-                            self._update_cache(cache_key, result)
+            try:
+                if self._cache is not None:
+                    result, cache_status = await self._cache.get_or_fetch(cache_key, fetch)
+                    cache_hit = cache_status in ("hit", "stale")
+                    if cache_hit:
+                        logger.info(f"CWB cache {cache_status.upper()} for location: '{normalized_location}'")
+                else:
+                    result = await fetch()
 
-                except asyncio.TimeoutError:
-                    timeout_occurred = True
-                    logger.warning(f"CWB TIMEOUT after {timeout}s for location: '{normalized_location}'")
+                if result:
+                    results = [result]
 
-                    # Try to return stale cache as fallback
-                    if cache_key in self._cache:
-                        stale_result, _ = self._cache[cache_key]
-                        logger.info(f"Returning stale CWB cache for '{normalized_location}'")
-                        results = [stale_result]
+            except asyncio.TimeoutError:
+                timeout_occurred = True
+                logger.warning(f"CWB TIMEOUT after {timeout}s for location: '{normalized_location}'")
 
             return results
 
@@ -264,71 +248,66 @@ class CwbWeatherClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout)
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"CWB API returned status {response.status}")
-                        return None
-
-                    data = await response.json()
-
-                    # Parse response
-                    records = data.get("records", {})
-                    locations = records.get("locations", [])
-
-                    if not locations:
-                        logger.warning(f"CWB: No data for location '{location}'")
-                        return None
-
-                    # Get first matching location
-                    loc_data = locations[0].get("location", [])
-                    if not loc_data:
-                        return None
-
-                    # Use city-level data (first location in the list)
-                    weather_info = loc_data[0]
-                    loc_name = weather_info.get("locationName", location)
-
-                    # Extract weather elements
-                    weather_elements = {}
-                    for element in weather_info.get("weatherElement", []):
-                        element_name = element.get("elementName")
-                        time_data = element.get("time", [])
-                        if time_data:
-                            # Get the first (current/nearest) time period
-                            current = time_data[0]
-                            element_value = current.get("elementValue", [])
-                            if element_value:
-                                weather_elements[element_name] = element_value[0].get("value", "")
-
-                    # Build snippet
-                    wx = weather_elements.get("Wx", "")  # 天氣現象
-                    min_t = weather_elements.get("MinT", "")  # 最低溫
-                    max_t = weather_elements.get("MaxT", "")  # 最高溫
-                    pop = weather_elements.get("PoP12h", "")  # 降雨機率
-
-                    snippet_parts = []
-                    if wx:
-                        snippet_parts.append(f"天氣: {wx}")
-                    if min_t and max_t:
-                        snippet_parts.append(f"溫度: {min_t}-{max_t}°C")
-                    if pop:
-                        snippet_parts.append(f"降雨機率: {pop}%")
-
-                    snippet = " | ".join(snippet_parts) if snippet_parts else "無資料"
-
-                    return {
-                        'title': f"[氣象] {loc_name} 天氣預報",
-                        'snippet': snippet,
-                        'link': f"https://www.cwa.gov.tw/V8/C/W/County/County.html?CID={location}",
-                        'tier': 6,
-                        'type': 'weather_tw',
-                        'source': 'cwb'
-                    }
+            status, data = await get_http_client().get_json(
+                "cwb_weather", url, params=params, timeout=self._timeout
+            )
+            if status != 200:
+                logger.warning(f"CWB API returned status {status}")
+                return None
+
+            # Parse response
+            records = data.get("records", {})
+            locations = records.get("locations", [])
+
+            if not locations:
+                logger.warning(f"CWB: No data for location '{location}'")
+                return None
+
+            # Get first matching location
+            loc_data = locations[0].get("location", [])
+            if not loc_data:
+                return None
+
+            # Use city-level data (first location in the list)
+            weather_info = loc_data[0]
+            loc_name = weather_info.get("locationName", location)
+
+            # Extract weather elements
+            weather_elements = {}
+            for element in weather_info.get("weatherElement", []):
+                element_name = element.get("elementName")
+                time_data = element.get("time", [])
+                if time_data:
+                    # Get the first (current/nearest) time period
+                    current = time_data[0]
+                    element_value = current.get("elementValue", [])
+                    if element_value:
+                        weather_elements[element_name] = element_value[0].get("value", "")
+
+            # Build snippet
+            wx = weather_elements.get("Wx", "")  # 天氣現象
+            min_t = weather_elements.get("MinT", "")  # 最低溫
+            max_t = weather_elements.get("MaxT", "")  # 最高溫
+            pop = weather_elements.get("PoP12h", "")  # 降雨機率
+
+            snippet_parts = []
+            if wx:
+                snippet_parts.append(f"天氣: {wx}")
+            if min_t and max_t:
+                snippet_parts.append(f"溫度: {min_t}-{max_t}°C")
+            if pop:
+                snippet_parts.append(f"降雨機率: {pop}%")
+
+            snippet = " | ".join(snippet_parts) if snippet_parts else "無資料"
+
+            return {
+                'title': f"[氣象] {loc_name} 天氣預報",
+                'snippet': snippet,
+                'link': f"https://www.cwa.gov.tw/V8/C/W/County/County.html?CID={location}",
+                'tier': 6,
+                'type': 'weather_tw',
+                'source': 'cwb'
+            }
 
         except aiohttp.ClientError as e:
             logger.warning(f"CWB API client error: {e}")
@@ -337,23 +316,6 @@ class CwbWeatherClient:
             logger.error(f"CWB API error: {e}")
             return None
 
-    def _update_cache(self, cache_key: str, result: Dict) -> None:
-        """
-        Update cache with LRU eviction if needed.
-
-        Args:
-            cache_key: Cache key (location)
-            result: Weather data to cache
-        """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug("CWB cache evicted oldest entry")
-
-        self._cache[cache_key] = (result, datetime.now())
-        logger.debug(f"CWB cache UPDATED: '{cache_key}'")
-
     def clear_cache(self) -> int:
         """
         Clear all cached results.
@@ -361,8 +323,7 @@ class CwbWeatherClient:
         Returns:
             Number of entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self._cache.clear() if self._cache is not None else 0
         logger.info(f"CWB cache cleared ({count} entries)")
         return count
 
@@ -373,12 +334,9 @@ class CwbWeatherClient:
         Returns:
             Dict with cache stats
         """
-        return {
-            "enabled": self._cache_enabled,
-            "size": len(self._cache),
-            "max_size": self._cache_max_size,
-            "ttl_hours": self._cache_ttl.total_seconds() / 3600
-        }
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
 
     def is_available(self) -> bool:
         """
@@ -16,9 +16,10 @@ import asyncio
 import os
 import time
 import aiohttp
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 from core.config import CONFIG
+from core.tier6_cache import get_tier6_cache
+from core.http_client import get_http_client
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("global_weather_client")
@@ -53,12 +54,8 @@ class GlobalWeatherClient:
         # API key from config or environment
         self._api_key = owm_config.get("api_key") or os.getenv("OPENWEATHERMAP_API_KEY")
 
-        # Cache configuration
-        cache_config = owm_config.get("cache", {})
-        self._cache: Dict[str, Tuple[Dict, datetime]] = {}
-        self._cache_enabled = cache_config.get("enabled", True)
-        self._cache_ttl = timedelta(hours=cache_config.get("ttl_hours", 1))
-        self._cache_max_size = cache_config.get("max_size", 100)
+        # Shared cache (core/tier6_cache.py): per-client TTL, stale-while-revalidate
+        self._cache = get_tier6_cache("openweathermap", default_ttl_hours=1, default_max_size=100)
 
         if not self._api_key:
             logger.warning("OpenWeatherMap API key not configured. Set OPENWEATHERMAP_API_KEY environment variable.")
@@ -66,7 +63,7 @@ class GlobalWeatherClient:
 
         logger.info(
             f"Initialized GlobalWeatherClient (enabled={self._enabled}, "
-            f"cache={self._cache_enabled}, ttl={self._cache_ttl})"
+            f"cache={self._cache is not None})"
         )
 
     async def search(
@@ -102,41 +99,28 @@ class GlobalWeatherClient:
         results = []
 
         try:
-            # Check cache first
+            # Shared cache: fresh or stale hits (stale ones refresh in the background),
+            # concurrent misses for the same key share one upstream call
             cache_key = city.lower()
-            if self._cache_enabled and cache_key in self._cache:
-                cached_result, timestamp = self._cache[cache_key]
-                if datetime.now() - timestamp < self._cache_ttl:
-                    cache_hit = True
-                    logger.info(f"Global Weather cache HIT for city: '{city}'")
-                    results = [cached_result]
-                else:
-                    del self._cache[cache_key]
-                    logger.debug(f"Global Weather cache EXPIRED for city: '{city}'")
 
-            # Cache miss - fetch data with timeout
-            if not cache_hit:
-                try:
-                    result = await asyncio.wait_for(
-                        self._fetch_weather_data(city),
-                        timeout=timeout
-                    )
+            async def fetch():
+                return await asyncio.wait_for(self._fetch_weather_data(city), timeout=timeout)
 
-                    if result:
-                        results = [result]
-                        # Update cache
-                        if self._cache_enabled:
-                            self._update_cache(cache_key, result)
+            try:
+                if self._cache is not None:
+                    result, cache_status = await self._cache.get_or_fetch(cache_key, fetch)
+                    cache_hit = cache_status in ("hit", "stale")
+                    if cache_hit:
+                        logger.info(f"Global Weather cache {cache_status.upper()} for city: '{city}'")
+                else:
+                    result = await fetch()
 
-                except asyncio.TimeoutError:
-                    timeout_occurred = True
-                    logger.warning(f"Global Weather TIMEOUT after {timeout}s for city: '{city}'")
+                if result:
+                    results = [result]
 
-                    # Try to return stale cache as fallback
-                    if cache_key in self._cache:
-                        stale_result, _ = self._cache[cache_key]
-                        logger.info(f"Returning stale Global Weather cache for '{city}'")
-                        results = [stale_result]
+            except asyncio.TimeoutError:
+                timeout_occurred = True
+                logger.warning(f"Global Weather TIMEOUT after {timeout}s for city: '{city}'")
 
             return results
 
@@ -181,68 +165,63 @@ class GlobalWeatherClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    OWM_API_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout)
-                ) as response:
-                    if response.status == 404:
-                        logger.debug(f"Global Weather: City '{city}' not found")
-                        return None
-                    elif response.status != 200:
-                        logger.warning(f"OpenWeatherMap API returned status {response.status}")
-                        return None
-
-                    data = await response.json()
-
-                    # Extract weather information
-                    city_name = data.get("name", city)
-                    country = data.get("sys", {}).get("country", "")
-
-                    # Main weather data
-                    main = data.get("main", {})
-                    temp = main.get("temp", "")
-                    feels_like = main.get("feels_like", "")
-                    humidity = main.get("humidity", "")
-                    temp_min = main.get("temp_min", "")
-                    temp_max = main.get("temp_max", "")
-
-                    # Weather description
-                    weather_list = data.get("weather", [])
-                    description = weather_list[0].get("description", "") if weather_list else ""
-                    icon = weather_list[0].get("icon", "") if weather_list else ""
-
-                    # Wind
-                    wind = data.get("wind", {})
-                    wind_speed = wind.get("speed", "")
-
-                    # Build snippet
-                    snippet_parts = []
-                    if description:
-                        snippet_parts.append(f"天氣: {description}")
-                    if temp:
-                        snippet_parts.append(f"溫度: {temp:.1f}°C")
-                    if temp_min and temp_max:
-                        snippet_parts.append(f"最低/最高: {temp_min:.1f}°C / {temp_max:.1f}°C")
-                    if humidity:
-                        snippet_parts.append(f"濕度: {humidity}%")
-                    if wind_speed:
-                        snippet_parts.append(f"風速: {wind_speed} m/s")
-
-                    snippet = " | ".join(snippet_parts) if snippet_parts else "無資料"
-
-                    # Location label
-                    location_label = f"{city_name}, {country}" if country else city_name
-
-                    return {
-                        'title': f"[國際天氣] {location_label}",
-                        'snippet': snippet,
-                        'link': f"https://openweathermap.org/city/{data.get('id', '')}",
-                        'tier': 6,
-                        'type': 'weather_global',
-                        'source': 'openweathermap'
-                    }
+            status, data = await get_http_client().get_json(
+                "openweathermap", OWM_API_URL, params=params, timeout=self._timeout
+            )
+            if status == 404:
+                logger.debug(f"Global Weather: City '{city}' not found")
+                return None
+            elif status != 200:
+                logger.warning(f"OpenWeatherMap API returned status {status}")
+                return None
+
+            # Extract weather information
+            city_name = data.get("name", city)
+            country = data.get("sys", {}).get("country", "")
+
+            # Main weather data
+            main = data.get("main", {})
+            temp = main.get("temp", "")
+            feels_like = main.get("feels_like", "")
+            humidity = main.get("humidity", "")
+            temp_min = main.get("temp_min", "")
+            temp_max = main.get("temp_max", "")
+
+            # Weather description
+            weather_list = data.get("weather", [])
+            description = weather_list[0].get("description", "") if weather_list else ""
+            icon = weather_list[0].get("icon", "") if weather_list else ""
+
+            # Wind
+            wind = data.get("wind", {})
+            wind_speed = wind.get("speed", "")
+
+            # Build snippet
+            snippet_parts = []
+            if description:
+                snippet_parts.append(f"天氣: {description}")
+            if temp:
+                snippet_parts.append(f"溫度: {temp:.1f}°C")
+            if temp_min and temp_max:
+                snippet_parts.append(f"最低/最高: {temp_min:.1f}°C / {temp_max:.1f}°C")
+            if humidity:
+                snippet_parts.append(f"濕度: {humidity}%")
+            if wind_speed:
+                snippet_parts.append(f"風速: {wind_speed} m/s")
+
+            snippet = " | ".join(snippet_parts) if snippet_parts else "無資料"
+
+            # Location label
+            location_label = f"{city_name}, {country}" if country else city_name
+
+            return {
+                'title': f"[國際天氣] {location_label}",
+                'snippet': snippet,
+                'link': f"https://openweathermap.org/city/{data.get('id', '')}",
+                'tier': 6,
+                'type': 'weather_global',
+                'source': 'openweathermap'
+            }
 
         except aiohttp.ClientError as e:
             logger.warning(f"OpenWeatherMap API client error: {e}")
@@ -251,23 +230,6 @@ class GlobalWeatherClient:
             logger.error(f"OpenWeatherMap API error: {e}")
             return None
 
-    def _update_cache(self, cache_key: str, result: Dict) -> None:
-        """
-        Update cache with LRU eviction if needed.
-
-        Args:
-            cache_key: Cache key (city name, lowercase)
-            result: Weather data to cache
-        """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug("Global Weather cache evicted oldest entry")
-
-        self._cache[cache_key] = (result, datetime.now())
-        logger.debug(f"Global Weather cache UPDATED: '{cache_key}'")
-
     def clear_cache(self) -> int:
         """
         Clear all cached results.
@@ -275,8 +237,7 @@ class GlobalWeatherClient:
         Returns:
             Number of entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self._cache.clear() if self._cache is not None else 0
         logger.info(f"Global Weather cache cleared ({count} entries)")
         return count
 
@@ -287,12 +248,9 @@ class GlobalWeatherClient:
         Returns:
             Dict with cache stats
         """
-        return {
-            "enabled": self._cache_enabled,
-            "size": len(self._cache),
-            "max_size": self._cache_max_size,
-            "ttl_hours": self._cache_ttl.total_seconds() / 3600
-        }
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
 
     def is_available(self) -> bool:
         """
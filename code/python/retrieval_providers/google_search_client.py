@@ -15,13 +15,13 @@ Features:
 """
 
 import json
-import httpx
 import asyncio
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
 from core.config import CONFIG
+from core.http_client import get_http_client
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("google_search_client")
@@ -192,33 +192,31 @@ class GoogleSearchClient:
         Returns:
             List of tuples: (url, schema_json, title, site, [])
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            params = {
-                'key': self.api_key,
-                'cx': self.search_engine_id,
-                'q': query,
-                'num': num_results
-            }
-
-            logger.info(f"Google Search API call: '{query}' (num_results={num_results})")
+        params = {
+            'key': self.api_key,
+            'cx': self.search_engine_id,
+            'q': query,
+            'num': num_results
+        }
 
-            response = await client.get(self.api_endpoint, params=params)
-            response.raise_for_status()
+        logger.info(f"Google Search API call: '{query}' (num_results={num_results})")
 
-            data = response.json()
+        _, data = await get_http_client().get_json(
+            "google_search", self.api_endpoint, params=params, timeout=30.0, raise_for_status=True
+        )
 
-            # Parse results
-            results = []
-            items = data.get('items', [])
+        # Parse results
+        results = []
+        items = data.get('items', [])
 
-            logger.info(f"Google Search returned {len(items)} results")
+        logger.info(f"Google Search returned {len(items)} results")
 
-            for item in items:
-                processed = self._process_search_result(item)
-                if processed:
-                    results.append(processed)
+        for item in items:
+            processed = self._process_search_result(item)
+            if processed:
+                results.append(processed)
 
-            return results
+        return results
 
     def _process_search_result(self, item: dict) -> Optional[tuple]:
         """
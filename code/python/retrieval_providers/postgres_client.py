@@ -4,12 +4,15 @@
 import json
 import os
 import asyncio
+import struct
 import time
 from datetime import datetime, timezone
 from typing import List, Dict, Union, Optional, Any, Tuple, Set
 
 from urllib.parse import urlparse, parse_qs
 
+import numpy as np
+
 # PostgreSQL client library (psycopg3)
 import psycopg
 from psycopg.rows import dict_row
@@ -18,7 +21,7 @@ import pgvector.psycopg
 
 from core.config import CONFIG
 from core.retriever import RetrievalClientBase
-from core.embedding import get_embedding
+from core.embedding import get_embedding, get_query_embeddings
 from misc.logger.logging_config_helper  import get_configured_logger
 from misc.logger.logger import LogLevel
 
@@ -27,13 +30,320 @@ from core.query_logger import get_query_logger
 
 logger = get_configured_logger("postgres_client")
 
+# pgvector rejects hnsw.ef_search above this
+HNSW_EF_SEARCH_MAX = 1000
+
+# ivfflat.iterative_scan accepts off and relaxed_order; strict_order is HNSW-only
+IVFFLAT_ITERATIVE_SCAN = {"strict_order": "relaxed_order"}
+
+# Embeddings in pgvector's binary send format (uint16 dim, uint16 unused, big-endian float32s)
+EMBEDDING_COL = ", vector_send(c.embedding) AS embedding"
+
+
+def parse_pgvector_version(extversion: Optional[str]) -> Optional[Tuple[int, ...]]:
+    """'0.8.0' -> (0, 8, 0); None if missing or unparseable."""
+    try:
+        return tuple(int(part) for part in extversion.split("."))
+    except (AttributeError, ValueError):
+        return None
+
+
+def ann_settings(num_results: int, pgvector_version: Optional[Tuple[int, ...]] = None,
+                 ann_profile: Optional[str] = None, ef_search: Optional[int] = None,
+                 probes: Optional[int] = None) -> List[Tuple[str, str]]:
+    """
+    pgvector settings for one ANN query, from CONFIG.ann_params.
+
+    Both the IVFFlat and HNSW knobs are returned so search works whichever
+    index is present (e.g. while migrating from one to the other). Explicit
+    ef_search/probes override the profile. Iterative scans are only enabled
+    on pgvector >= 0.8, where the settings exist.
+    """
+    params = CONFIG.ann_params or {}
+    profile_name = ann_profile or params.get("profile", "balanced")
+    profile = (params.get("profiles") or {}).get(profile_name)
+    if profile is None:
+        logger.warning(f"Unknown ANN profile '{profile_name}', using defaults")
+        profile = {}
+
+    probes = int(probes or profile.get("probes", 50))
+    # An HNSW scan returns at most ef_search rows, so never go below the LIMIT
+    ef_search = int(ef_search or profile.get("ef_search", 100))
+    ef_search = min(max(ef_search, int(num_results)), HNSW_EF_SEARCH_MAX)
+
+    settings = [("ivfflat.probes", probes), ("hnsw.ef_search", ef_search)]
+
+    iterative_scan = params.get("iterative_scan")
+    if iterative_scan and pgvector_version and pgvector_version >= (0, 8):
+        settings += [
+            ("hnsw.iterative_scan", iterative_scan),
+            ("hnsw.max_scan_tuples", params.get("max_scan_tuples", 20000)),
+            ("ivfflat.iterative_scan", IVFFLAT_ITERATIVE_SCAN.get(iterative_scan, iterative_scan)),
+            ("ivfflat.max_probes", max(probes, int(params.get("max_probes", 200)))),
+        ]
+    return [(name, str(value)) for name, value in settings]
+
+
+async def apply_ann_settings(cur, settings: List[Tuple[str, str]]) -> None:
+    """Apply settings transaction-locally in one round trip (pooled connections stay clean)."""
+    if not settings:
+        return
+    sql = "SELECT " + ", ".join(["set_config(%s, %s, true)"] * len(settings))
+    await cur.execute(sql, [value for pair in settings for value in pair])
+
+
+def _ann_candidates_sql(filter_where_sql: str = "") -> str:
+    """
+    Inner ANN query: a plain ORDER BY distance LIMIT k so the planner can use
+    the HNSW/IVFFlat index. Source/date filters stay on the joined articles
+    row (iterative scans keep reading the index until k rows pass).
+
+    Params: query embedding, *filter params, query embedding, k.
+    """
+    return f"""
+            SELECT c.id AS chunk_id, c.article_id, c.embedding <=> %s::vector AS distance
+            FROM chunks c
+            JOIN articles a ON a.id = c.article_id
+            {filter_where_sql}
+            ORDER BY c.embedding <=> %s::vector
+            LIMIT %s
+    """
+
+
+def vector_search_sql(filter_where_sql: str = "") -> str:
+    """
+    Vector-only ANN search returning (chunk_id, vector_score).
+
+    The similarity threshold is applied to the k ANN candidates afterwards,
+    not inside the index scan.
+
+    Params: query embedding, *filter params, query embedding, k, similarity min.
+    """
+    return f"""
+        SELECT ann.chunk_id, 1 - ann.distance AS vector_score
+        FROM ({_ann_candidates_sql(filter_where_sql)}) ann
+        WHERE 1 - ann.distance >= %s
+        ORDER BY ann.distance
+    """
+
+
+def _fusion_score_sql(fusion: str = "rrf", rrf_k: float = 60.0,
+                      vector_weight: float = 1.0, text_weight: float = 1.0) -> str:
+    """Per-chunk fused score over the vec (v) and txt (t) branches."""
+    # Constants are coerced to float before formatting into the SQL text
+    vector_weight, text_weight, rrf_k = float(vector_weight), float(text_weight), float(rrf_k)
+    if fusion == "weighted":
+        return (f"{vector_weight!r} * COALESCE(v.vector_score, 0) "
+                f"+ {text_weight!r} * COALESCE(t.text_score, 0)")
+    return (f"COALESCE({vector_weight!r} / ({rrf_k!r} + v.vector_rank), 0) "
+            f"+ COALESCE({text_weight!r} / ({rrf_k!r} + t.text_rank), 0)")
+
+
+def hybrid_search_sql(filter_clauses: List[str], include_vectors: bool = False,
+                      with_text: bool = True, fusion: str = "rrf", rrf_k: float = 60.0,
+                      vector_weight: float = 1.0, text_weight: float = 1.0) -> str:
+    """
+    Vector + pg_bigm hybrid search in one statement.
+
+    Each branch keeps only ids and scores under its own LIMIT and threshold.
+    The branches are fused per chunk (RRF over branch ranks, or a weighted
+    sum of scores) and reduced to the best chunk per article with
+    DISTINCT ON. Article columns (including metadata) are joined only for
+    the surviving rows, ordered by fused score.
+
+    with_text=False drops the text branch (pg_bigm not installed).
+
+    Params: query embedding, *filter params, query embedding, vector limit,
+    similarity min, then (with_text) query, query, *filter params,
+    text limit, text score min.
+    """
+    filter_where_sql = ("WHERE " + " AND ".join(filter_clauses)) if filter_clauses else ""
+    if with_text:
+        text_where_sql = "WHERE " + " AND ".join(["c.tsv LIKE '%%' || likequery(%s) || '%%'"] + filter_clauses)
+        txt_cte = f"""
+            SELECT t.chunk_id, t.article_id, t.text_score,
+                   row_number() OVER (ORDER BY t.text_score DESC) AS text_rank
+            FROM (
+                SELECT c.id AS chunk_id, c.article_id, bigm_similarity(c.tsv, %s) AS text_score
+                FROM chunks c
+                JOIN articles a ON a.id = c.article_id
+                {text_where_sql}
+                ORDER BY text_score DESC
+                LIMIT %s
+            ) t
+            WHERE t.text_score >= %s
+        """
+    else:
+        txt_cte = """
+            SELECT c.id AS chunk_id, c.article_id, 0::real AS text_score, 0::bigint AS text_rank
+            FROM chunks c
+            WHERE false
+        """
+
+    score_sql = _fusion_score_sql(fusion, rrf_k, vector_weight, text_weight)
+
+    embedding_col = EMBEDDING_COL if include_vectors else ""
+    return f"""
+        WITH vec AS (
+            SELECT ann.chunk_id, ann.article_id, 1 - ann.distance AS vector_score,
+                   row_number() OVER (ORDER BY ann.distance) AS vector_rank
+            FROM ({_ann_candidates_sql(filter_where_sql)}) ann
+            WHERE 1 - ann.distance >= %s
+        ),
+        txt AS ({txt_cte}),
+        fused AS (
+            SELECT DISTINCT ON (m.article_id) m.chunk_id, m.article_id, m.vector_score, m.text_score, m.score
+            FROM (
+                SELECT COALESCE(v.chunk_id, t.chunk_id) AS chunk_id,
+                       COALESCE(v.article_id, t.article_id) AS article_id,
+                       COALESCE(v.vector_score, 0) AS vector_score,
+                       COALESCE(t.text_score, 0) AS text_score,
+                       {score_sql} AS score
+                FROM vec v
+                FULL OUTER JOIN txt t ON t.chunk_id = v.chunk_id
+            ) m
+            ORDER BY m.article_id, m.score DESC
+        )
+        SELECT f.chunk_id, f.vector_score, f.text_score, f.score, c.chunk_text,
+               a.url, a.title, a.author, a.source, a.date_published, a.metadata{embedding_col}
+        FROM fused f
+        JOIN chunks c ON c.id = f.chunk_id
+        JOIN articles a ON a.id = f.article_id
+        ORDER BY f.score DESC
+    """
+
+
+def multi_hybrid_search_sql(filter_clauses: List[str], include_vectors: bool = False,
+                            with_text: bool = True, fusion: str = "rrf", rrf_k: float = 60.0,
+                            vector_weight: float = 1.0, text_weight: float = 1.0) -> str:
+    """
+    hybrid_search_sql for several query variants in one statement.
+
+    The variants are unnested from arrays (embedding literal, text, k) with
+    their 1-based ordinal; each runs its own ANN and pg_bigm top-k through
+    LATERAL subqueries, and ranks, fusion and the best-chunk-per-article
+    reduction are all partitioned by ordinal. Rows come back ordered by
+    (ord, score DESC).
+
+    Params: embeddings text[], query texts text[], limits int[], *filter
+    params, similarity min, then (with_text) *filter params, text score min.
+    """
+    filter_where_sql = ("WHERE " + " AND ".join(filter_clauses)) if filter_clauses else ""
+    if with_text:
+        text_where_sql = "WHERE " + " AND ".join(["c.tsv LIKE '%%' || likequery(q.query_text) || '%%'"] + filter_clauses)
+        txt_cte = f"""
+            SELECT q.ord, t.chunk_id, t.article_id, t.text_score,
+                   row_number() OVER (PARTITION BY q.ord ORDER BY t.text_score DESC) AS text_rank
+            FROM q
+            CROSS JOIN LATERAL (
+                SELECT c.id AS chunk_id, c.article_id, bigm_similarity(c.tsv, q.query_text) AS text_score
+                FROM chunks c
+                JOIN articles a ON a.id = c.article_id
+                {text_where_sql}
+                ORDER BY text_score DESC
+                LIMIT q.k
+            ) t
+            WHERE t.text_score >= %s
+        """
+    else:
+        txt_cte = """
+            SELECT 0::bigint AS ord, c.id AS chunk_id, c.article_id, 0::real AS text_score, 0::bigint AS text_rank
+            FROM chunks c
+            WHERE false
+        """
+
+    score_sql = _fusion_score_sql(fusion, rrf_k, vector_weight, text_weight)
+    embedding_col = EMBEDDING_COL if include_vectors else ""
+    return f"""
+        WITH q AS (
+            SELECT u.ord, u.emb::vector AS emb, u.query_text, u.k
+            FROM unnest(%s::text[], %s::text[], %s::int[]) WITH ORDINALITY AS u(emb, query_text, k, ord)
+        ),
+        vec AS (
+            SELECT q.ord, ann.chunk_id, ann.article_id, 1 - ann.distance AS vector_score,
+                   row_number() OVER (PARTITION BY q.ord ORDER BY ann.distance) AS vector_rank
+            FROM q
+            CROSS JOIN LATERAL (
+                SELECT c.id AS chunk_id, c.article_id, c.embedding <=> q.emb AS distance
+                FROM chunks c
+                JOIN articles a ON a.id = c.article_id
+                {filter_where_sql}
+                ORDER BY c.embedding <=> q.emb
+                LIMIT q.k
+            ) ann
+            WHERE 1 - ann.distance >= %s
+        ),
+        txt AS ({txt_cte}),
+        fused AS (
+            SELECT DISTINCT ON (m.ord, m.article_id) m.ord, m.chunk_id, m.article_id,
+                   m.vector_score, m.text_score, m.score
+            FROM (
+                SELECT COALESCE(v.ord, t.ord) AS ord,
+                       COALESCE(v.chunk_id, t.chunk_id) AS chunk_id,
+                       COALESCE(v.article_id, t.article_id) AS article_id,
+                       COALESCE(v.vector_score, 0) AS vector_score,
+                       COALESCE(t.text_score, 0) AS text_score,
+                       {score_sql} AS score
+                FROM vec v
+                FULL OUTER JOIN txt t ON t.ord = v.ord AND t.chunk_id = v.chunk_id
+            ) m
+            ORDER BY m.ord, m.article_id, m.score DESC
+        )
+        SELECT f.ord, f.chunk_id, f.vector_score, f.text_score, f.score, c.chunk_text,
+               a.url, a.title, a.author, a.source, a.date_published, a.metadata{embedding_col}
+        FROM fused f
+        JOIN chunks c ON c.id = f.chunk_id
+        JOIN articles a ON a.id = f.article_id
+        ORDER BY f.ord, f.score DESC
+    """
+
+
+def embedding_rows(values: List[Any]) -> List[Optional[np.ndarray]]:
+    """
+    Decode one result set's embeddings into rows of a single float32 matrix.
+
+    Binary payloads (EMBEDDING_COL) are joined and converted in one step, so
+    no per-element Python floats are created; each returned row is a view
+    into the shared (n, dim) matrix. Other values (lists, pgvector objects)
+    are converted row by row. None stays None.
+    """
+    present = [i for i, v in enumerate(values) if v is not None]
+    rows: List[Optional[np.ndarray]] = [None] * len(values)
+    if not present:
+        return rows
+
+    if all(isinstance(values[i], (bytes, bytearray, memoryview)) for i in present):
+        dim = struct.unpack_from('>H', values[present[0]])[0]
+        payload = b"".join(memoryview(values[i])[4:] for i in present)
+        if len(payload) != 4 * dim * len(present):
+            raise ValueError(f"Embeddings are not all {dim}-dimensional")
+        matrix = np.frombuffer(payload, dtype='>f4').reshape(len(present), dim).astype(np.float32)
+    else:
+        matrix = np.stack([
+            np.asarray(v.to_numpy() if hasattr(v, 'to_numpy') else v, dtype=np.float32)
+            for v in (values[i] for i in present)
+        ])
+
+    for row, i in enumerate(present):
+        rows[i] = matrix[row]
+    return rows
+
+
+def _vector_literal(embedding: List[float]) -> str:
+    """pgvector text form '[x,y,...]' (repr keeps full float precision)."""
+    return "[" + ",".join(repr(float(v)) for v in embedding) + "]"
+
+
 class PgVectorClient(RetrievalClientBase):
 
     def __init__(self, endpoint_name: Optional[str] = None):
+        super().__init__()  # Initialize the base class with caching
         self.endpoint_name = endpoint_name or CONFIG.write_endpoint
         self._conn_lock = asyncio.Lock()
         self._pool = None
         self._pool_init_lock = asyncio.Lock()
+        self._pgvector_version = None
+        self._site_catalog_available = True
         
         logger.info(f"Initializing PgVectorClient for endpoint: {self.endpoint_name}")
         
@@ -162,10 +472,13 @@ class PgVectorClient(RetrievalClientBase):
                             await pgvector.psycopg.register_vector_async(conn)
                             
                             async with conn.cursor() as cur:
-                                await cur.execute("SELECT * FROM pg_extension WHERE extname = 'vector'")
+                                await cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
                                 row = await cur.fetchone()
                                 if not row:
                                     logger.warning("pgvector extension not found in the database")
+                                else:
+                                    self._pgvector_version = parse_pgvector_version(row[0])
+                                    logger.info(f"pgvector version: {row[0]}")
                     
                     except Exception as e:
                         logger.error(
@@ -236,6 +549,8 @@ class PgVectorClient(RetrievalClientBase):
 
         try:
             count = await self._execute_with_retry(_delete)
+            # site_catalog is updated by the articles delete trigger
+            self.invalidate_sites_cache()
             logger.info(f"Deleted {count} articles for source: {site}")
             return count
         except Exception as e:
@@ -340,6 +655,8 @@ class PgVectorClient(RetrievalClientBase):
                 logger.exception(f"Error uploading batch {i//batch_size + 1}: {e}")
                 raise
 
+        if inserted_count:
+            self.invalidate_sites_cache()
         logger.info(f"Successfully uploaded {inserted_count} documents")
         return inserted_count
     
@@ -420,6 +737,90 @@ class PgVectorClient(RetrievalClientBase):
 
         return json.dumps(schema, ensure_ascii=False)
 
+    def _row_to_item(self, row: Dict[str, Any], include_vectors: bool = False,
+                     vector: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Result dict for one hybrid search row; vector is its row from embedding_rows()."""
+        item = {
+            'url': row["url"],
+            'schema_str': self._build_schema_json(row),
+            'title': row["title"],
+            'source': row["source"],
+            'author': row.get("author") or "",
+            'date_published': row["date_published"].isoformat() if row.get("date_published") else "",
+            'vector_score': float(row.get("vector_score") or 0.0),
+            'text_score': float(row.get("text_score") or 0.0),
+            'score': float(row.get("score") or 0.0),
+        }
+        if include_vectors:
+            item['vector'] = vector
+        return item
+
+    def _log_retrieved_documents(self, handler, raw_results: List[Dict[str, Any]]) -> None:
+        """Analytics: log retrieved documents with scores for the handler's query."""
+        if handler and hasattr(handler, 'query_id'):
+            # A speculative handler buffers these until its results are kept
+            query_logger = getattr(handler, 'query_logger', None) or get_query_logger()
+            try:
+                for position, item in enumerate(raw_results):
+                    url = item['url']
+                    author = item.get('author', '')
+                    date_published = item.get('date_published', '')
+                    vector_score = item.get('vector_score', 0.0)
+                    text_score = item.get('text_score', 0.0)
+                    # Fused hybrid score (RRF or weighted, see hybrid_params)
+                    final_score = item.get('score', 0.0)
+
+                    # Compute derived fields
+                    schema_str = item.get('schema_str', '')
+                    doc_length = len(schema_str)
+                    has_author = 1 if author else 0
+
+                    # Compute recency_days from date_published
+                    recency_days = None
+                    if date_published:
+                        try:
+                            date_str = date_published.split('T')[0] if 'T' in date_published else date_published
+                            pub_date = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+                            recency_days = (datetime.now(timezone.utc) - pub_date).days
+                        except Exception:
+                            pass
+
+                    query_logger.log_retrieved_document(
+                        query_id=handler.query_id,
+                        doc_url=url,
+                        doc_title=item.get('title', ''),
+                        doc_description='',
+                        retrieval_position=position,
+                        vector_similarity_score=vector_score,
+                        bm25_score=text_score,
+                        keyword_boost_score=0.0,
+                        final_retrieval_score=final_score,
+                        doc_published_date=date_published,
+                        doc_author=author,
+                        doc_source=item.get('source', ''),
+                        retrieval_algorithm='postgres_hybrid',
+                        doc_length=doc_length,
+                        has_author=has_author,
+                        recency_days=recency_days,
+                    )
+                logger.info(f"Analytics: Logged {len(raw_results)} retrieved documents for query {handler.query_id}")
+            except Exception as log_err:
+                logger.warning(f"Failed to log retrieved documents: {log_err}")
+
+    def _to_result_rows(self, raw_results: List[Dict[str, Any]], include_vectors: bool = False) -> List[List[Any]]:
+        """
+        List-of-lists format expected by downstream code. When
+        include_vectors=True, emit 5-tuples so ranking.py can extract vectors
+        for MMR: [url, schema_str, title, source, vector]
+        """
+        results = []
+        for item in raw_results:
+            row = [item['url'], item['schema_str'], item['title'], item['source']]
+            if include_vectors and 'vector' in item and item['vector'] is not None:
+                row.append(item['vector'])
+            results.append(row)
+        return results
+
     async def search(self, query: str, site: Union[str, List[str]],
                     num_results: int = 50, query_params: Optional[Dict[str, Any]] = None, **kwargs) -> List[List[str]]:
         start_time = time.time()
@@ -449,198 +850,160 @@ class PgVectorClient(RetrievalClientBase):
             CONFIG.retrieval_threshold.get('vector_similarity_min', 0.40)
         )
 
+        settings = ann_settings(
+            num_results,
+            getattr(self, "_pgvector_version", None),
+            ann_profile=kwargs.get('ann_profile'),
+            ef_search=kwargs.get('ef_search'),
+            probes=kwargs.get('probes'),
+        )
+
+        hybrid_params = CONFIG.hybrid_params or {}
+        text_score_min = float(hybrid_params.get('text_score_min', 0.05))
+        fusion_options = {
+            'fusion': hybrid_params.get('fusion', 'rrf'),
+            'rrf_k': hybrid_params.get('rrf_k', 60),
+            'vector_weight': hybrid_params.get('vector_weight', 1.0),
+            'text_weight': hybrid_params.get('text_weight', 1.0),
+        }
+        vector_params = [query_embedding] + filter_params + [query_embedding, num_results, vector_similarity_min]
+        text_params = [query, query] + filter_params + [num_results, text_score_min]
+
         async def _search_docs(conn):
             async with conn.cursor(row_factory=dict_row) as cur:
-                await cur.execute("SET ivfflat.probes = 50")
-
-                # --- Vector search ---
-                # Build filter WHERE clauses; cosine threshold is added separately below
-                filter_where_sql = ("WHERE " + " AND ".join(filter_clauses)) if filter_clauses else ""
-                embedding_col = ", c.embedding" if include_vectors else ""
-                # Combine filter clauses with cosine threshold filter
-                threshold_clause = "1 - (c.embedding <=> %s::vector) >= %s"
-                if filter_clauses:
-                    where_sql = "WHERE " + " AND ".join(filter_clauses) + f" AND {threshold_clause}"
-                else:
-                    where_sql = f"WHERE {threshold_clause}"
-                vector_sql = f"""
-                    SELECT c.id AS chunk_id, c.article_id, c.chunk_text,
-                           a.url, a.title, a.author, a.source, a.date_published, a.metadata,
-                           1 - (c.embedding <=> %s::vector) AS vector_score{embedding_col}
-                    FROM chunks c
-                    JOIN articles a ON a.id = c.article_id
-                    {where_sql}
-                    ORDER BY c.embedding <=> %s::vector
-                    LIMIT %s
-                """
-                # Params: score SELECT embedding, filter params, threshold embedding, threshold value,
-                #         ORDER BY embedding, LIMIT
-                vector_params = [query_embedding] + filter_params + [query_embedding, vector_similarity_min, query_embedding, num_results]
-                await cur.execute(vector_sql, vector_params)
-                vector_rows = await cur.fetchall()
-
-                # --- Text search (pg_bigm) ---
-                text_where_parts = ["c.tsv LIKE '%%' || likequery(%s) || '%%'"] + filter_clauses
-                text_where_sql = "WHERE " + " AND ".join(text_where_parts)
-                # Text search does not select embedding to avoid double retrieval;
-                # vectors from vector_rows are merged in below.
-                text_sql = f"""
-                    SELECT c.id AS chunk_id, c.article_id, c.chunk_text,
-                           a.url, a.title, a.author, a.source, a.date_published, a.metadata,
-                           bigm_similarity(c.tsv, %s) AS text_score
-                    FROM chunks c
-                    JOIN articles a ON a.id = c.article_id
-                    {text_where_sql}
-                    ORDER BY text_score DESC
-                    LIMIT %s
-                """
-                text_params = [query, query] + filter_params + [num_results]
-
+                # --- Hybrid search: vector + pg_bigm text, fused and deduped per article ---
+                await apply_ann_settings(cur, settings)
                 try:
-                    await cur.execute(text_sql, text_params)
-                    text_rows = await cur.fetchall()
-                except Exception as e:
+                    await cur.execute(
+                        hybrid_search_sql(filter_clauses, include_vectors, **fusion_options),
+                        vector_params + text_params,
+                        binary=include_vectors,
+                    )
+                except psycopg.ProgrammingError as e:
+                    # pg_bigm missing or broken: the transaction is aborted, retry vector-only
                     logger.warning(f"Text search failed, using vector-only: {e}")
-                    text_rows = []
-
-                # --- Union merge (deduplicate by chunk_id) ---
-                # Build lookup: chunk_id → embedding for vector-searched rows
-                vector_row_embeddings: dict = {}
-                if include_vectors:
-                    for row in vector_rows:
-                        cid = row["chunk_id"]
-                        emb = row.get("embedding")
-                        if emb is not None:
-                            # pgvector returns numpy arrays or lists; normalise to list[float]
-                            if hasattr(emb, 'tolist'):
-                                emb = emb.tolist()
-                            else:
-                                emb = [float(v) for v in emb]
-                            vector_row_embeddings[cid] = emb
-
-                seen_chunk_ids = set()
-                merged = []
-                for row in vector_rows:
-                    if row["chunk_id"] not in seen_chunk_ids:
-                        seen_chunk_ids.add(row["chunk_id"])
-                        merged.append(row)
-                for row in text_rows:
-                    if row["chunk_id"] not in seen_chunk_ids:
-                        seen_chunk_ids.add(row["chunk_id"])
-                        merged.append(row)
-
-                # --- URL dedup: keep only the highest-score chunk per article URL ---
-                url_best: dict = {}
-                for row in merged:
-                    url = row["url"]
-                    score = float(row.get("vector_score") or row.get("text_score") or 0.0)
-                    if url not in url_best or score > url_best[url]["_best_score"]:
-                        url_best[url] = {"row": row, "_best_score": score}
-                merged = [entry["row"] for entry in url_best.values()]
-
-                # --- Quality gate: filter out results below minimum thresholds ---
-                # Prevents gibberish queries from returning irrelevant results via text search path
-                TEXT_SCORE_MIN = 0.05  # minimum pg_bigm similarity for text-only results
-                merged = [
-                    row for row in merged
-                    if float(row.get("vector_score") or 0.0) >= vector_similarity_min
-                    or float(row.get("text_score") or 0.0) >= TEXT_SCORE_MIN
-                ]
-
-                results = []
-                for row in merged:
-                    schema_str = self._build_schema_json(row)
-                    item = {
-                        'url': row["url"],
-                        'schema_str': schema_str,
-                        'title': row["title"],
-                        'source': row["source"],
-                        'author': row.get("author") or "",
-                        'date_published': row["date_published"].isoformat() if row.get("date_published") else "",
-                        'vector_score': float(row.get("vector_score") or 0.0),
-                        'text_score': float(row.get("text_score") or 0.0),
-                    }
-                    if include_vectors:
-                        cid = row["chunk_id"]
-                        emb = vector_row_embeddings.get(cid)
-                        if emb is None:
-                            # Row came from text-only path; embedding not fetched
-                            emb = None
-                        item['vector'] = emb
-                    results.append(item)
-
-                return results
+                    await conn.rollback()
+                    await apply_ann_settings(cur, settings)
+                    await cur.execute(
+                        hybrid_search_sql(filter_clauses, include_vectors, with_text=False, **fusion_options),
+                        vector_params,
+                        binary=include_vectors,
+                    )
+                rows = await cur.fetchall()
+                vectors = embedding_rows([row.get("embedding") for row in rows]) if include_vectors else [None] * len(rows)
+                return [self._row_to_item(row, include_vectors, vector) for row, vector in zip(rows, vectors)]
 
         try:
             raw_results = await self._execute_with_retry(_search_docs)
             duration = time.time() - start_time
             logger.info(f"Search completed in {duration:.2f}s, found {len(raw_results)} results")
 
-            # Analytics: Log retrieved documents with scores
-            handler = kwargs.get('handler')
-            if handler and hasattr(handler, 'query_id'):
-                query_logger = get_query_logger()
-                try:
-                    for position, item in enumerate(raw_results):
-                        url = item['url']
-                        author = item.get('author', '')
-                        date_published = item.get('date_published', '')
-                        vector_score = item.get('vector_score', 0.0)
-                        text_score = item.get('text_score', 0.0)
-                        # Combined hybrid score (vector + text)
-                        final_score = vector_score if vector_score > 0 else text_score
-
-                        # Compute derived fields
-                        schema_str = item.get('schema_str', '')
-                        doc_length = len(schema_str)
-                        has_author = 1 if author else 0
-
-                        # Compute recency_days from date_published
-                        recency_days = None
-                        if date_published:
-                            try:
-                                date_str = date_published.split('T')[0] if 'T' in date_published else date_published
-                                pub_date = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                                recency_days = (datetime.now(timezone.utc) - pub_date).days
-                            except Exception:
-                                pass
-
-                        query_logger.log_retrieved_document(
-                            query_id=handler.query_id,
-                            doc_url=url,
-                            doc_title=item.get('title', ''),
-                            doc_description='',
-                            retrieval_position=position,
-                            vector_similarity_score=vector_score,
-                            bm25_score=text_score,
-                            keyword_boost_score=0.0,
-                            final_retrieval_score=final_score,
-                            doc_published_date=date_published,
-                            doc_author=author,
-                            doc_source=item.get('source', ''),
-                            retrieval_algorithm='postgres_hybrid',
-                            doc_length=doc_length,
-                            has_author=has_author,
-                            recency_days=recency_days,
-                        )
-                    logger.info(f"Analytics: Logged {len(raw_results)} retrieved documents for query {handler.query_id}")
-                except Exception as log_err:
-                    logger.warning(f"Failed to log retrieved documents: {log_err}")
-
-            # Convert back to list-of-lists format expected by downstream code.
-            # When include_vectors=True, emit 5-tuples so ranking.py can extract
-            # vectors for MMR: [url, schema_str, title, source, vector]
-            results = []
-            for item in raw_results:
-                row = [item['url'], item['schema_str'], item['title'], item['source']]
-                if include_vectors and 'vector' in item and item['vector'] is not None:
-                    row.append(item['vector'])
-                results.append(row)
-            return results
+            self._log_retrieved_documents(kwargs.get('handler'), raw_results)
+            return self._to_result_rows(raw_results, include_vectors)
         except Exception as e:
             logger.exception(f"Error in search: {e}")
             raise
     
+    async def search_multi(self, queries: List[str], site: Union[str, List[str]],
+                           num_results: Union[int, List[int]] = 50,
+                           query_params: Optional[Dict[str, Any]] = None, **kwargs) -> List[List[List[str]]]:
+        """
+        Hybrid search for several query variants (e.g. a query and its
+        QueryRewrite expansions) in one round trip.
+
+        All variants are embedded in one batch request and searched by one
+        multi_hybrid_search_sql statement. num_results is a single limit or one
+        per query. Analytics are logged for the first query only (the
+        primary), as search() would for that query alone.
+
+        Returns:
+            One result list per query, in the same format as search()
+        """
+        if not queries:
+            return []
+        start_time = time.time()
+        limits = list(num_results) if isinstance(num_results, (list, tuple)) else [num_results] * len(queries)
+        if len(limits) != len(queries):
+            raise ValueError(f"Got {len(limits)} limits for {len(queries)} queries")
+        logger.info(f"Multi-query search: {len(queries)} queries in site: {site}, num_results: {limits}")
+
+        include_vectors = kwargs.get('include_vectors', False)
+
+        try:
+            embeddings = await get_query_embeddings(queries, query_params=query_params)
+        except Exception as e:
+            logger.exception(f"Error generating embeddings for queries: {e}")
+            raise
+
+        sites = []
+        if isinstance(site, list):
+            sites = site
+        elif isinstance(site, str) and site != "all":
+            sites = [site]
+
+        filter_clauses, filter_params = self._build_filters(sites, query_params, kwargs_filters=kwargs.get('filters', []))
+
+        vector_similarity_min = float(
+            CONFIG.retrieval_threshold.get('vector_similarity_min', 0.40)
+        )
+
+        settings = ann_settings(
+            max(limits),
+            getattr(self, "_pgvector_version", None),
+            ann_profile=kwargs.get('ann_profile'),
+            ef_search=kwargs.get('ef_search'),
+            probes=kwargs.get('probes'),
+        )
+
+        hybrid_params = CONFIG.hybrid_params or {}
+        text_score_min = float(hybrid_params.get('text_score_min', 0.05))
+        fusion_options = {
+            'fusion': hybrid_params.get('fusion', 'rrf'),
+            'rrf_k': hybrid_params.get('rrf_k', 60),
+            'vector_weight': hybrid_params.get('vector_weight', 1.0),
+            'text_weight': hybrid_params.get('text_weight', 1.0),
+        }
+        vector_params = ([[_vector_literal(e) for e in embeddings], list(queries), [int(k) for k in limits]]
+                         + filter_params + [vector_similarity_min])
+        text_params = filter_params + [text_score_min]
+
+        async def _search_docs(conn):
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await apply_ann_settings(cur, settings)
+                try:
+                    await cur.execute(
+                        multi_hybrid_search_sql(filter_clauses, include_vectors, **fusion_options),
+                        vector_params + text_params,
+                        binary=include_vectors,
+                    )
+                except psycopg.ProgrammingError as e:
+                    # pg_bigm missing or broken: the transaction is aborted, retry vector-only
+                    logger.warning(f"Text search failed, using vector-only: {e}")
+                    await conn.rollback()
+                    await apply_ann_settings(cur, settings)
+                    await cur.execute(
+                        multi_hybrid_search_sql(filter_clauses, include_vectors, with_text=False, **fusion_options),
+                        vector_params,
+                        binary=include_vectors,
+                    )
+                rows = await cur.fetchall()
+                vectors = embedding_rows([row.get("embedding") for row in rows]) if include_vectors else [None] * len(rows)
+                per_query = [[] for _ in queries]
+                for row, vector in zip(rows, vectors):
+                    per_query[int(row["ord"]) - 1].append(self._row_to_item(row, include_vectors, vector))
+                return per_query
+
+        try:
+            raw_per_query = await self._execute_with_retry(_search_docs)
+            duration = time.time() - start_time
+            logger.info(f"Multi-query search completed in {duration:.2f}s, "
+                        f"found {[len(r) for r in raw_per_query]} results")
+            self._log_retrieved_documents(kwargs.get('handler'), raw_per_query[0])
+            return [self._to_result_rows(raw, include_vectors) for raw in raw_per_query]
+        except Exception as e:
+            logger.exception(f"Error in multi-query search: {e}")
+            raise
+
     async def search_by_url(self, url: str, **kwargs) -> Optional[List[str]]:
         logger.info(f"Retrieving article with URL: {url}")
 
@@ -780,6 +1143,44 @@ class PgVectorClient(RetrievalClientBase):
             logger.exception(f"Failed to check table schema: {e}")
             return {"error": str(e), "needs_corrections": [str(e)]}
 
+    async def get_site_catalog(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Per-source document counts and published-date ranges from site_catalog.
+
+        The table is maintained by triggers on articles, so this reads one row
+        per source. Returns None when the table does not exist yet (database
+        not migrated); get_sites then falls back to scanning articles.
+        """
+        if not self._site_catalog_available:
+            return None
+
+        async def _get(conn):
+            async with conn.cursor() as cur:
+                try:
+                    await cur.execute("""
+                        SELECT source, doc_count, first_published, last_published
+                        FROM site_catalog
+                        ORDER BY source
+                    """)
+                except psycopg.errors.UndefinedTable:
+                    await conn.rollback()
+                    return None
+                return [
+                    {
+                        "site": row[0],
+                        "doc_count": row[1],
+                        "first_published": row[2].isoformat() if row[2] else None,
+                        "last_published": row[3].isoformat() if row[3] else None,
+                    }
+                    for row in await cur.fetchall()
+                ]
+
+        catalog = await self._execute_with_retry(_get)
+        if catalog is None:
+            logger.warning("site_catalog table not found; run alembic upgrade. Using SELECT DISTINCT for get_sites")
+            self._site_catalog_available = False
+        return catalog
+
     async def get_sites(self, **kwargs) -> Optional[List[str]]:
         async def _get(conn):
             async with conn.cursor() as cur:
@@ -787,6 +1188,9 @@ class PgVectorClient(RetrievalClientBase):
                 return [row[0] for row in await cur.fetchall()]
 
         try:
+            catalog = await self.get_site_catalog()
+            if catalog is not None:
+                return [entry["site"] for entry in catalog]
             return await self._execute_with_retry(_get)
         except Exception as e:
             logger.exception(f"Error getting sites: {e}")
@@ -20,7 +20,12 @@ from qdrant_client.http.exceptions import UnexpectedResponse
 from core.config import CONFIG
 from core.embedding import get_embedding
 from core.retriever import RetrievalClientBase
-from core.bm25 import BM25Scorer
+from core.bm25 import BM25Scorer, get_bm25_index
+from core.qdrant_payload import (
+    AUTHOR_FIELD, DATE_FIELD, FILTER_PAYLOAD_INDEXES, SOURCE_FIELD,
+    filter_fields_from_schema, merge_site_entry, site_catalog_collection,
+    site_catalog_point_id, split_native_filters, summarize_sites,
+)
 from misc.logger.logging_config_helper import get_configured_logger
 from misc.logger.logger import LogLevel
 
@@ -55,6 +60,7 @@ class QdrantVectorClient(RetrievalClientBase):
         self.endpoint_name = endpoint_name or CONFIG.write_endpoint
         self._client_lock = threading.Lock()
         self._qdrant_clients = {}  # Cache for Qdrant clients
+        self._indexed_fields: Dict[str, Set[str]] = {}  # collection -> indexed payload fields
         
         # Get endpoint configuration
         self.endpoint_config = self._get_endpoint_config()
@@ -304,6 +310,107 @@ class QdrantVectorClient(RetrievalClientBase):
             else:
                 logger.warning(f"Could not create text index on 'schema_json': {e}")
 
+    async def _ensure_filter_indexes(self, collection_name: str):
+        """
+        Ensure payload indexes exist for server-side date/author/site filters.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        client = await self._get_qdrant_client()
+
+        for field_name, schema_type in FILTER_PAYLOAD_INDEXES.items():
+            try:
+                await client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=models.PayloadSchemaType(schema_type),
+                )
+            except Exception as e:
+                logger.warning(f"Could not create payload index on '{field_name}': {e}")
+        self._indexed_fields.pop(collection_name, None)
+
+    async def _get_indexed_fields(self, collection_name: str) -> Set[str]:
+        """Payload fields with an index in this collection (cached per collection)."""
+        fields = self._indexed_fields.get(collection_name)
+        if fields is None:
+            try:
+                client = await self._get_qdrant_client()
+                info = await client.get_collection(collection_name)
+                fields = set((info.payload_schema or {}).keys())
+            except Exception as e:
+                logger.warning(f"Could not read payload schema for '{collection_name}': {e}")
+                return set()
+            self._indexed_fields[collection_name] = fields
+        return fields
+
+    async def _reset_site_catalog(self, collection_name: str,
+                                  summary: Optional[Dict[str, Tuple[int, Optional[int], Optional[int]]]] = None):
+        """
+        (Re)create the companion site catalog collection, optionally seeded
+        with a per-site summary from summarize_sites().
+
+        Args:
+            collection_name: Name of the document collection
+            summary: site -> (doc_count, first date_published, last date_published)
+        """
+        client = await self._get_qdrant_client()
+        catalog = site_catalog_collection(collection_name)
+        if await client.collection_exists(catalog):
+            await client.delete_collection(catalog)
+        # Payload-only collection; the 1-d vector is a placeholder
+        await client.create_collection(
+            collection_name=catalog,
+            vectors_config=models.VectorParams(size=1, distance=models.Distance.DOT),
+        )
+        if summary:
+            await client.upsert(collection_name=catalog, points=[
+                models.PointStruct(id=site_catalog_point_id(site), vector=[0.0],
+                                   payload=merge_site_entry(None, site, count, first, last))
+                for site, (count, first, last) in summary.items()
+            ])
+
+    async def _update_site_catalog(self, collection_name: str, payloads: List[Dict[str, Any]]):
+        """
+        Update catalog entries for the sites in freshly uploaded payloads:
+        exact per-site count on the indexed site field, widened date range.
+        No-op when the catalog does not exist yet (get_sites rebuilds it).
+
+        Args:
+            collection_name: Name of the document collection
+            payloads: Payloads of the uploaded points
+        """
+        summary = summarize_sites(payloads)
+        if not summary:
+            return
+        catalog = site_catalog_collection(collection_name)
+        try:
+            client = await self._get_qdrant_client()
+            if not await client.collection_exists(catalog):
+                return
+            existing = {
+                point.payload.get(SOURCE_FIELD): point.payload
+                for point in await client.retrieve(
+                    collection_name=catalog,
+                    ids=[site_catalog_point_id(site) for site in summary],
+                    with_payload=True,
+                )
+            }
+            points = []
+            for site, (_, first, last) in summary.items():
+                count = (await client.count(
+                    collection_name=collection_name,
+                    count_filter=self._create_site_filter(site),
+                    exact=True,
+                )).count
+                points.append(models.PointStruct(
+                    id=site_catalog_point_id(site), vector=[0.0],
+                    payload=merge_site_entry(existing.get(site), site, count, first, last),
+                ))
+            await client.upsert(collection_name=catalog, points=points)
+        except Exception as e:
+            logger.warning(f"Could not update site catalog for '{collection_name}': {e}")
+
     async def create_collection(self, collection_name: Optional[str] = None,
                               vector_size: int = 1536) -> bool:
         """
@@ -327,7 +434,9 @@ class QdrantVectorClient(RetrievalClientBase):
             # Check if collection exists
             if await client.collection_exists(collection_name):
                 logger.info(f"Collection '{collection_name}' already exists")
-                # Ensure text indexes exist for hybrid search
+                # Ensure text indexes exist for hybrid search. Filter indexes are left to
+                # `indexing.qdrant_uploader backfill-filters`: search filters natively once
+                # they exist, which would drop points indexed before date_published/author.
                 await self._ensure_text_indexes(collection_name)
                 return False
 
@@ -341,6 +450,8 @@ class QdrantVectorClient(RetrievalClientBase):
 
             # Create text indexes for hybrid search
             await self._ensure_text_indexes(collection_name)
+            await self._ensure_filter_indexes(collection_name)
+            await self._reset_site_catalog(collection_name)
 
             return True
 
@@ -356,6 +467,7 @@ class QdrantVectorClient(RetrievalClientBase):
                     )
                     logger.info(f"Successfully created collection '{collection_name}' on second attempt")
                     await self._ensure_text_indexes(collection_name)
+                    await self._ensure_filter_indexes(collection_name)
                     return True
                 except Exception as e2:
                     logger.error(f"Error creating collection on second attempt: {str(e2)}")
@@ -389,6 +501,8 @@ class QdrantVectorClient(RetrievalClientBase):
                 collection_name=collection_name,
                 vectors_config=models.VectorParams(size=vector_size, distance=models.Distance.COSINE),
             )
+            await self._reset_site_catalog(collection_name)
+            self.invalidate_sites_cache()
             
             logger.info(f"Successfully recreated collection '{collection_name}'")
             return True
@@ -466,6 +580,13 @@ class QdrantVectorClient(RetrievalClientBase):
         await client.delete(
             collection_name=collection_name, points_selector=filter_condition
         )
+        catalog = site_catalog_collection(collection_name)
+        if await client.collection_exists(catalog):
+            await client.delete(
+                collection_name=catalog,
+                points_selector=models.PointIdsList(points=[site_catalog_point_id(site)]),
+            )
+        self.invalidate_sites_cache()
         logger.info(f"Deleted {count} points")
 
         return count
@@ -522,7 +643,8 @@ class QdrantVectorClient(RetrievalClientBase):
                         "url": doc.get("url"),
                         "name": doc.get("name"),
                         "site": doc.get("site"),
-                        "schema_json": doc.get("schema_json")
+                        "schema_json": doc.get("schema_json"),
+                        **filter_fields_from_schema(doc.get("schema_json")),
                     }
                 ))
             
@@ -554,6 +676,8 @@ class QdrantVectorClient(RetrievalClientBase):
                             raise
                 
                 logger.info(f"Successfully uploaded {total_uploaded} points to collection '{collection_name}'")
+                await self._update_site_catalog(collection_name, [point.payload for point in points])
+                self.invalidate_sites_cache()
                 return total_uploaded
             
             return 0
@@ -584,9 +708,55 @@ class QdrantVectorClient(RetrievalClientBase):
             sites = []
 
         return models.Filter(
-            must=[models.FieldCondition(key="site", match=models.MatchAny(any=sites))]
+            must=[models.FieldCondition(key=SOURCE_FIELD, match=models.MatchAny(any=sites))]
         )
 
+    def _build_search_filter(self, site: Union[str, List[str]], filters: Optional[List[Dict[str, Any]]],
+                             indexed_fields: Set[str], relax_dates: bool = False
+                             ) -> Tuple[Optional[models.Filter], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Translate site and generic filters into a native Qdrant filter.
+
+        Date ranges and exact author matches become Range/MatchValue
+        conditions on the normalized payload fields when those fields are
+        indexed in the collection; everything else (author "contains", or
+        collections indexed before the fields existed) is returned for
+        post-filtering with _point_passes_filters.
+
+        Args:
+            site: Site or list of sites to filter by
+            filters: Generic filter dicts from the handler
+            indexed_fields: Payload fields indexed in the collection
+            relax_dates: Drop date conditions (retry after an empty filtered search)
+
+        Returns:
+            (filter or None, post-filters, native conditions applied)
+        """
+        native, remaining = split_native_filters(filters)
+        if DATE_FIELD not in indexed_fields and ("date_gte" in native or "date_lte" in native):
+            remaining += [f for f in filters if f.get('field') == 'datePublished']
+            native.pop("date_gte", None)
+            native.pop("date_lte", None)
+        if AUTHOR_FIELD not in indexed_fields and "author_eq" in native:
+            remaining += [f for f in filters if f.get('field') == 'author' and f.get('operator') == 'eq']
+            native.pop("author_eq")
+        if relax_dates:
+            remaining = [f for f in remaining if f.get('field') != 'datePublished']
+            native.pop("date_gte", None)
+            native.pop("date_lte", None)
+
+        site_filter = self._create_site_filter(site)
+        must = list(site_filter.must) if site_filter else []
+        if "date_gte" in native or "date_lte" in native:
+            must.append(models.FieldCondition(
+                key=DATE_FIELD,
+                range=models.Range(gte=native.get("date_gte"), lte=native.get("date_lte")),
+            ))
+        if "author_eq" in native:
+            must.append(models.FieldCondition(key=AUTHOR_FIELD, match=models.MatchValue(value=native["author_eq"])))
+
+        return (models.Filter(must=must) if must else None), remaining, native
+
     def _point_passes_filters(self, point, filters: List[Dict[str, Any]]) -> bool:
         """
         Check if a Qdrant ScoredPoint passes all generic filters.
@@ -594,8 +764,9 @@ class QdrantVectorClient(RetrievalClientBase):
         Generic filter format:
             [{"field": "datePublished", "operator": "gte", "value": "2026-01-01"}, ...]
 
-        Since datePublished/author are stored inside schema_json (a JSON string),
-        this performs post-search filtering by parsing the payload.
+        Used for filters that cannot run natively (see _build_search_filter).
+        Reads the normalized author payload field when present and parses
+        schema_json (a JSON string) otherwise.
 
         Args:
             point: Qdrant ScoredPoint
@@ -604,11 +775,13 @@ class QdrantVectorClient(RetrievalClientBase):
         Returns:
             True if the point passes all filters
         """
-        schema_json_str = point.payload.get('schema_json', '{}')
-        try:
-            schema = json.loads(schema_json_str)
-        except (json.JSONDecodeError, TypeError):
-            return False
+        payload = point.payload or {}
+        schema = {}
+        if any(f.get('field') == 'datePublished' or not payload.get(AUTHOR_FIELD) for f in filters):
+            try:
+                schema = json.loads(payload.get('schema_json', '{}'))
+            except (json.JSONDecodeError, TypeError):
+                return False
 
         for f in filters:
             field = f.get('field', '')
@@ -632,7 +805,7 @@ class QdrantVectorClient(RetrievalClientBase):
                     return False
 
             elif field == 'author':
-                author_data = schema.get('author', '')
+                author_data = payload.get(AUTHOR_FIELD) or schema.get('author', '')
                 if isinstance(author_data, dict):
                     author = author_data.get('name', '')
                 elif isinstance(author_data, list) and author_data:
@@ -838,7 +1011,6 @@ class QdrantVectorClient(RetrievalClientBase):
             
             # Get client and prepare filter
             client = await self._get_qdrant_client()
-            filter_condition = self._create_site_filter(site)
 
             # Ensure collection exists before searching
             collection_created = not await self.ensure_collection_exists(collection_name, len(embedding))
@@ -894,7 +1066,15 @@ class QdrantVectorClient(RetrievalClientBase):
                 # CRITICAL: Need to retrieve many more results because vector search alone
                 # ranks keyword-matching articles very low (e.g., retail articles at rank 127+)
                 # With keywords, we need a much larger pool for boosting to work effectively
-                _has_author_filter = any(f.get('field') == 'author' for f in (kwargs.get('filters') or []))
+                # Date ranges and exact author matches run inside Qdrant on indexed
+                # payload fields; only the rest is post-filtered below
+                _indexed_fields = await self._get_indexed_fields(collection_name) if kwargs.get('filters') else set()
+                filter_condition, _payload_filters, _native_filters = self._build_search_filter(
+                    site, kwargs.get('filters'), _indexed_fields)
+                if _native_filters:
+                    logger.info(f"[FILTER] Native Qdrant filter conditions: {_native_filters}")
+
+                _has_author_filter = any(f.get('field') == 'author' for f in _payload_filters)
                 if _has_author_filter:
                     # Author metadata is NOT in embeddings — need much larger pool for post-filter
                     retrieval_limit = min(3000, num_results * 60)
@@ -912,6 +1092,29 @@ class QdrantVectorClient(RetrievalClientBase):
                     with_vectors=include_vectors,  # Include vectors for MMR if requested
                 )
 
+                if not search_result and _native_filters:
+                    _handler = kwargs.get('handler')
+                    if "author_eq" in _native_filters:
+                        # Author filter is strict — return empty, don't show unrelated articles
+                        if _handler:
+                            _handler.author_search_no_results = True
+                        logger.warning("[FILTER] Native author filter returned 0 results — returning empty (strict filter)")
+                    else:
+                        # Date-only filter — relax and show unfiltered results
+                        filter_condition, _payload_filters, _ = self._build_search_filter(
+                            site, kwargs.get('filters'), _indexed_fields, relax_dates=True)
+                        search_result = await client.search(
+                            collection_name=collection_name,
+                            query_vector=embedding,
+                            limit=retrieval_limit,
+                            query_filter=filter_condition,
+                            with_payload=True,
+                            with_vectors=include_vectors,
+                        )
+                        if _handler:
+                            _handler.time_filter_relaxed = True
+                        logger.warning(f"[FILTER] No results inside date range, relaxed to {len(search_result)} unfiltered results")
+
                 # Check if Qdrant returned vectors
                 if search_result:
                     logger.debug(f"Retrieved {len(search_result)} points, include_vectors={include_vectors}")
@@ -941,8 +1144,24 @@ class QdrantVectorClient(RetrievalClientBase):
                     avg_doc_length = 0
                     term_doc_counts = {}
                     corpus_size = len(search_result)
+                    index_scores = None
+
+                    # Prebuilt corpus-wide index (optional): scores the whole
+                    # candidate set in one vectorized lookup
+                    bm25_index = get_bm25_index(bm25_config.get('index_path')) if use_bm25 else None
+
+                    if use_bm25 and corpus_size > 0 and bm25_index is not None:
+                        index_scores = bm25_index.score(
+                            all_keywords,
+                            [point.payload.get("url", "") for point in search_result],
+                            texts=[
+                                f"{point.payload.get('name', '')} {point.payload.get('schema_json', '')}"
+                                for point in search_result
+                            ],
+                        )
+                        logger.debug(f"BM25 index stats - corpus: {bm25_index.corpus_size}, avg_length: {bm25_index.avg_doc_length:.1f}")
 
-                    if use_bm25 and corpus_size > 0:
+                    elif use_bm25 and corpus_size > 0:
 
                         bm25_scorer = BM25Scorer(k1=k1, b=b)
 
@@ -960,7 +1179,7 @@ class QdrantVectorClient(RetrievalClientBase):
                         avg_doc_length, term_doc_counts = bm25_scorer.calculate_corpus_stats(documents)
                         logger.debug(f"BM25 corpus stats - avg_length: {avg_doc_length}, unique_terms: {len(term_doc_counts)}")
 
-                    for point in search_result:
+                    for point_idx, point in enumerate(search_result):
                         base_score = point.score
                         keyword_boost = 0
                         bm25_score = 0.0
@@ -972,7 +1191,10 @@ class QdrantVectorClient(RetrievalClientBase):
                         schema_json = payload.get("schema_json", "").lower()
 
                         # Calculate BM25 score or fallback to keyword boost
-                        if use_bm25 and bm25_scorer:
+                        if index_scores is not None:
+                            bm25_score = float(index_scores[point_idx])
+                            final_score = alpha * base_score + beta * bm25_score
+                        elif use_bm25 and bm25_scorer:
                             # BM25 scoring - combine title and description
                             doc_title = payload.get("name", "")
                             doc_description = payload.get("schema_json", "")
@@ -1078,8 +1300,7 @@ class QdrantVectorClient(RetrievalClientBase):
 
                     scored_results.sort(key=lambda x: x[0], reverse=True)
 
-                    # Apply generic payload filters (date range, author, etc.)
-                    _payload_filters = kwargs.get('filters')
+                    # Apply remaining payload filters (author contains, unindexed fields)
                     if _payload_filters and scored_results:
                         _pre_filter_count = len(scored_results)
                         _filtered_scored = [(s, p) for s, p in scored_results
@@ -1125,8 +1346,7 @@ class QdrantVectorClient(RetrievalClientBase):
                         logger.info("=" * 50)
                 else:
                     # No keywords, use vector results as-is
-                    # Apply generic payload filters if provided
-                    _payload_filters = kwargs.get('filters')
+                    # Apply remaining payload filters if any
                     if _payload_filters and search_result:
                         _pre_count = len(search_result)
                         _filtered_points = [p for p in search_result if self._point_passes_filters(p, _payload_filters)]
@@ -1160,7 +1380,8 @@ class QdrantVectorClient(RetrievalClientBase):
                 # Analytics: Log retrieved documents with scores
                 handler = kwargs.get('handler')
                 if handler and hasattr(handler, 'query_id'):
-                    query_logger = get_query_logger()
+                    # A speculative handler buffers these until its results are kept
+                    query_logger = getattr(handler, 'query_logger', None) or get_query_logger()
                     try:
                         # Map scores back to results by URL
                         # Handle both keyword-boosted and pure vector search cases
@@ -1412,9 +1633,38 @@ class QdrantVectorClient(RetrievalClientBase):
         # This is just a convenience wrapper around the regular search method with site="all"
         return await self.search(query, "all", num_results, collection_name, query_params, **kwargs)
     
+    async def get_site_catalog(self, collection_name: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Per-site point counts and date_published ranges (epoch seconds) from
+        the companion catalog collection.
+
+        Args:
+            collection_name: Optional collection name (defaults to configured name)
+
+        Returns:
+            List of catalog entries, or None if the catalog does not exist
+        """
+        catalog = site_catalog_collection(collection_name or self.default_collection_name)
+        client = await self._get_qdrant_client()
+        if not await client.collection_exists(catalog):
+            return None
+
+        entries = []
+        offset = None
+        while True:
+            points, offset = await client.scroll(
+                collection_name=catalog, limit=1000, offset=offset, with_payload=True)
+            entries.extend(point.payload for point in points)
+            if offset is None:
+                break
+        return entries
+
     async def get_sites(self, collection_name: Optional[str] = None) -> List[str]:
         """
         Get a list of unique site names from the Qdrant collection.
+
+        Reads the companion site catalog (one point per site). If the catalog
+        is missing, scrolls the collection once and rebuilds it.
         
         Args:
             collection_name: Optional collection name (defaults to configured name)
@@ -1433,8 +1683,12 @@ class QdrantVectorClient(RetrievalClientBase):
                 logger.warning(f"Collection '{collection_name}' does not exist")
                 return []
             
-            # Use scroll to get all points with site field
-            sites = set()
+            catalog = await self.get_site_catalog(collection_name)
+            if catalog is not None:
+                return sorted(entry["site"] for entry in catalog)
+
+            # No catalog yet: scroll all points once and rebuild it
+            payloads = []
             offset = None
             batch_size = 1000
             
@@ -1443,24 +1697,26 @@ class QdrantVectorClient(RetrievalClientBase):
                     collection_name=collection_name,
                     limit=batch_size,
                     offset=offset,
-                    with_payload=["site"]
+                    with_payload=[SOURCE_FIELD, DATE_FIELD]
                 )
                 
                 if not points:
                     break
                 
-                # Extract site values
-                for point in points:
-                    site = point.payload.get("site")
-                    if site:
-                        sites.add(site)
+                payloads.extend(point.payload for point in points)
                 
                 offset = next_offset
                 if offset is None:
                     break
             
+            summary = summarize_sites(payloads)
+            try:
+                await self._reset_site_catalog(collection_name, summary)
+            except Exception as e:
+                logger.warning(f"Could not rebuild site catalog for '{collection_name}': {e}")
+            
             # Convert to sorted list
-            site_list = sorted(list(sites))
+            site_list = sorted(summary)
             logger.info(f"Found {len(site_list)} unique sites in collection '{collection_name}'")
             return site_list
             
@@ -16,9 +16,10 @@ import asyncio
 import time
 import re
 import aiohttp
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 from core.config import CONFIG
+from core.tier6_cache import get_tier6_cache
+from core.http_client import get_http_client
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("tw_company_client")
@@ -50,16 +51,12 @@ class TwCompanyClient:
         self._enabled = tw_company_config.get("enabled", False)
         self._timeout = tw_company_config.get("timeout", 5.0)
 
-        # Cache configuration
-        cache_config = tw_company_config.get("cache", {})
-        self._cache: Dict[str, Tuple[Dict, datetime]] = {}
-        self._cache_enabled = cache_config.get("enabled", True)
-        self._cache_ttl = timedelta(hours=cache_config.get("ttl_hours", 168))  # 7 days
-        self._cache_max_size = cache_config.get("max_size", 200)
+        # Shared cache (core/tier6_cache.py): per-client TTL, stale-while-revalidate
+        self._cache = get_tier6_cache("tw_company", default_ttl_hours=168, default_max_size=200)
 
         logger.info(
             f"Initialized TwCompanyClient (enabled={self._enabled}, "
-            f"cache={self._cache_enabled}, ttl={self._cache_ttl})"
+            f"cache={self._cache is not None})"
         )
 
     async def search(
@@ -98,41 +95,28 @@ class TwCompanyClient:
         results = []
 
         try:
-            # Check cache first
+            # Shared cache: fresh or stale hits (stale ones refresh in the background),
+            # concurrent misses for the same key share one upstream call
             cache_key = query
-            if self._cache_enabled and cache_key in self._cache:
-                cached_result, timestamp = self._cache[cache_key]
-                if datetime.now() - timestamp < self._cache_ttl:
-                    cache_hit = True
-                    logger.info(f"TW Company cache HIT for: '{query}'")
-                    results = [cached_result]
-                else:
-                    del self._cache[cache_key]
-                    logger.debug(f"TW Company cache EXPIRED for: '{query}'")
 
-            # Cache miss - fetch data with timeout
-            if not cache_hit:
-                try:
-                    result = await asyncio.wait_for(
-                        self._fetch_company_data(query, is_ubn),
-                        timeout=timeout
-                    )
+            async def fetch():
+                return await asyncio.wait_for(self._fetch_company_data(query, is_ubn), timeout=timeout)
 
-                    if result:
-                        results = [result]
-                        # Update cache
-                        if self._cache_enabled:
-                            self._update_cache(cache_key, result)
+            try:
+                if self._cache is not None:
+                    result, cache_status = await self._cache.get_or_fetch(cache_key, fetch)
+                    cache_hit = cache_status in ("hit", "stale")
+                    if cache_hit:
+                        logger.info(f"TW Company cache {cache_status.upper()} for: '{query}'")
+                else:
+                    result = await fetch()
 
-                except asyncio.TimeoutError:
-                    timeout_occurred = True
-                    logger.warning(f"TW Company TIMEOUT after {timeout}s for: '{query}'")
+                if result:
+                    results = [result]
 
-                    # Try to return stale cache as fallback
-                    if cache_key in self._cache:
-                        stale_result, _ = self._cache[cache_key]
-                        logger.info(f"Returning stale TW Company cache for '{query}'")
-                        results = [stale_result]
+            except asyncio.TimeoutError:
+                timeout_occurred = True
+                logger.warning(f"TW Company TIMEOUT after {timeout}s for: '{query}'")
 
             return results
 
@@ -188,75 +172,70 @@ class TwCompanyClient:
             params["$filter"] = f"contains(Company_Name,'{query}')"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    MOEA_API_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout)
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"TW Company API returned status {response.status}")
-                        return None
-
-                    data = await response.json()
-
-                    # Check if we got results
-                    if not data or len(data) == 0:
-                        logger.debug(f"TW Company: No results for '{query}'")
-                        return None
-
-                    # Get first result
-                    company = data[0]
-
-                    # Extract fields
-                    company_name = company.get("Company_Name", query)
-                    ubn = company.get("Business_Accounting_NO", "")
-                    capital = company.get("Capital_Stock_Amount", "")
-                    representative = company.get("Responsible_Name", "")
-                    address = company.get("Company_Location", "")
-                    status = company.get("Company_Status_Desc", "")
-                    established_date = company.get("Approved_Date", "")
-
-                    # Format capital (add commas)
-                    if capital:
-                        try:
-                            capital_int = int(capital)
-                            if capital_int >= 100000000:  # 億
-                                capital_formatted = f"{capital_int / 100000000:.2f}億"
-                            elif capital_int >= 10000:  # 萬
-                                capital_formatted = f"{capital_int / 10000:.0f}萬"
-                            else:
-                                capital_formatted = f"{capital_int:,}"
-                        except ValueError:
-                            capital_formatted = capital
+            status, data = await get_http_client().get_json(
+                "tw_company", MOEA_API_URL, params=params, timeout=self._timeout
+            )
+            if status != 200:
+                logger.warning(f"TW Company API returned status {status}")
+                return None
+
+            # Check if we got results
+            if not data or len(data) == 0:
+                logger.debug(f"TW Company: No results for '{query}'")
+                return None
+
+            # Get first result
+            company = data[0]
+
+            # Extract fields
+            company_name = company.get("Company_Name", query)
+            ubn = company.get("Business_Accounting_NO", "")
+            capital = company.get("Capital_Stock_Amount", "")
+            representative = company.get("Responsible_Name", "")
+            address = company.get("Company_Location", "")
+            status = company.get("Company_Status_Desc", "")
+            established_date = company.get("Approved_Date", "")
+
+            # Format capital (add commas)
+            if capital:
+                try:
+                    capital_int = int(capital)
+                    if capital_int >= 100000000:  # 億
+                        capital_formatted = f"{capital_int / 100000000:.2f}億"
+                    elif capital_int >= 10000:  # 萬
+                        capital_formatted = f"{capital_int / 10000:.0f}萬"
                     else:
-                        capital_formatted = ""
-
-                    # Build snippet
-                    snippet_parts = []
-                    if ubn:
-                        snippet_parts.append(f"統編: {ubn}")
-                    if capital_formatted:
-                        snippet_parts.append(f"資本額: {capital_formatted}")
-                    if representative:
-                        snippet_parts.append(f"代表人: {representative}")
-                    if status:
-                        snippet_parts.append(f"狀態: {status}")
-
-                    snippet = " | ".join(snippet_parts) if snippet_parts else "無詳細資料"
-
-                    # Add address if available
-                    if address:
-                        snippet += f"\n地址: {address}"
-
-                    return {
-                        'title': f"[公司登記] {company_name}",
-                        'snippet': snippet,
-                        'link': f"https://findbiz.nat.gov.tw/fts/query/QueryBar/queryInit.do?banNo={ubn}" if ubn else "https://findbiz.nat.gov.tw/",
-                        'tier': 6,
-                        'type': 'company_tw',
-                        'source': 'moea'
-                    }
+                        capital_formatted = f"{capital_int:,}"
+                except ValueError:
+                    capital_formatted = capital
+            else:
+                capital_formatted = ""
+
+            # Build snippet
+            snippet_parts = []
+            if ubn:
+                snippet_parts.append(f"統編: {ubn}")
+            if capital_formatted:
+                snippet_parts.append(f"資本額: {capital_formatted}")
+            if representative:
+                snippet_parts.append(f"代表人: {representative}")
+            if status:
+                snippet_parts.append(f"狀態: {status}")
+
+            snippet = " | ".join(snippet_parts) if snippet_parts else "無詳細資料"
+
+            # Add address if available
+            if address:
+                snippet += f"\n地址: {address}"
+
+            return {
+                'title': f"[公司登記] {company_name}",
+                'snippet': snippet,
+                'link': f"https://findbiz.nat.gov.tw/fts/query/QueryBar/queryInit.do?banNo={ubn}" if ubn else "https://findbiz.nat.gov.tw/",
+                'tier': 6,
+                'type': 'company_tw',
+                'source': 'moea'
+            }
 
         except aiohttp.ClientError as e:
             logger.warning(f"TW Company API client error: {e}")
@@ -265,23 +244,6 @@ class TwCompanyClient:
             logger.error(f"TW Company API error: {e}")
             return None
 
-    def _update_cache(self, cache_key: str, result: Dict) -> None:
-        """
-        Update cache with LRU eviction if needed.
-
-        Args:
-            cache_key: Cache key
-            result: Company data to cache
-        """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug("TW Company cache evicted oldest entry")
-
-        self._cache[cache_key] = (result, datetime.now())
-        logger.debug(f"TW Company cache UPDATED: '{cache_key}'")
-
     def clear_cache(self) -> int:
         """
         Clear all cached results.
@@ -289,8 +251,7 @@ class TwCompanyClient:
         Returns:
             Number of entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self._cache.clear() if self._cache is not None else 0
         logger.info(f"TW Company cache cleared ({count} entries)")
         return count
 
@@ -301,12 +262,9 @@ class TwCompanyClient:
         Returns:
             Dict with cache stats
         """
-        return {
-            "enabled": self._cache_enabled,
-            "size": len(self._cache),
-            "max_size": self._cache_max_size,
-            "ttl_hours": self._cache_ttl.total_seconds() / 3600
-        }
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
 
     def is_available(self) -> bool:
         """
@@ -16,9 +16,10 @@ Features:
 import asyncio
 import time
 import aiohttp
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 from core.config import CONFIG
+from core.tier6_cache import get_tier6_cache
+from core.http_client import get_http_client
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("twse_client")
@@ -50,16 +51,12 @@ class TwseClient:
         self._enabled = twse_config.get("enabled", False)
         self._timeout = twse_config.get("timeout", 3.0)
 
-        # Cache configuration
-        cache_config = twse_config.get("cache", {})
-        self._cache: Dict[str, Tuple[Dict, datetime]] = {}
-        self._cache_enabled = cache_config.get("enabled", True)
-        self._cache_ttl = timedelta(hours=cache_config.get("ttl_hours", 0.083))  # 5 min default
-        self._cache_max_size = cache_config.get("max_size", 200)
+        # Shared cache (core/tier6_cache.py): per-client TTL, stale-while-revalidate
+        self._cache = get_tier6_cache("twse", default_ttl_hours=0.083, default_max_size=200)
 
         logger.info(
             f"Initialized TwseClient (enabled={self._enabled}, "
-            f"cache={self._cache_enabled}, ttl={self._cache_ttl})"
+            f"cache={self._cache is not None})"
         )
 
     async def search(
@@ -95,41 +92,28 @@ class TwseClient:
         results = []
 
         try:
-            # Check cache first
+            # Shared cache: fresh or stale hits (stale ones refresh in the background),
+            # concurrent misses for the same key share one upstream call
             cache_key = symbol
-            if self._cache_enabled and cache_key in self._cache:
-                cached_result, timestamp = self._cache[cache_key]
-                if datetime.now() - timestamp < self._cache_ttl:
-                    cache_hit = True
-                    logger.info(f"TWSE cache HIT for symbol: '{symbol}'")
-                    results = [cached_result]
-                else:
-                    del self._cache[cache_key]
-                    logger.debug(f"TWSE cache EXPIRED for symbol: '{symbol}'")
 
-            # Cache miss - fetch data with timeout
-            if not cache_hit:
-                try:
-                    result = await asyncio.wait_for(
-                        self._fetch_stock_data(symbol),
-                        timeout=timeout
-                    )
+            async def fetch():
+                return await asyncio.wait_for(self._fetch_stock_data(symbol), timeout=timeout)
 
-                    if result:
-                        results = [result]
-                        # Update cache
-                        if self._cache_enabled:
-                            self._update_cache(cache_key, result)
+            try:
+                if self._cache is not None:
+                    result, cache_status = await self._cache.get_or_fetch(cache_key, fetch)
+                    cache_hit = cache_status in ("hit", "stale")
+                    if cache_hit:
+                        logger.info(f"TWSE cache {cache_status.upper()} for symbol: '{symbol}'")
+                else:
+                    result = await fetch()
 
-                except asyncio.TimeoutError:
-                    timeout_occurred = True
-                    logger.warning(f"TWSE TIMEOUT after {timeout}s for symbol: '{symbol}'")
+                if result:
+                    results = [result]
 
-                    # Try to return stale cache as fallback
-                    if cache_key in self._cache:
-                        stale_result, _ = self._cache[cache_key]
-                        logger.info(f"Returning stale TWSE cache for '{symbol}'")
-                        results = [stale_result]
+            except asyncio.TimeoutError:
+                timeout_occurred = True
+                logger.warning(f"TWSE TIMEOUT after {timeout}s for symbol: '{symbol}'")
 
             return results
 
@@ -200,58 +184,57 @@ class TwseClient:
         params = {"ex_ch": ex_ch, "json": "1", "delay": "0"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url, params=params, timeout=aiohttp.ClientTimeout(total=self._timeout)) as response:
-                    if response.status != 200:
-                        logger.debug(f"{exchange} API returned status {response.status}")
-                        return None
-
-                    data = await response.json()
-
-                    # Check if we got valid data
-                    if not data or "msgArray" not in data or not data["msgArray"]:
-                        return None
-
-                    stock_info = data["msgArray"][0]
-
-                    # Extract fields
-                    stock_name = stock_info.get("n", symbol)  # Name
-                    last_price = stock_info.get("z", "-")      # Last trade price
-                    yesterday_close = stock_info.get("y", "0") # Yesterday close
-                    volume = stock_info.get("v", "0")          # Volume (in lots)
-
-                    # Handle "-" for no trade
-                    if last_price == "-":
-                        last_price = stock_info.get("o", yesterday_close)  # Use open or yesterday close
-
-                    try:
-                        last_price_float = float(last_price)
-                        yesterday_float = float(yesterday_close)
-                        change = last_price_float - yesterday_float
-                        change_pct = (change / yesterday_float * 100) if yesterday_float else 0
-                        change_sign = "+" if change >= 0 else ""
-
-                        # Format volume (convert to 張)
-                        volume_int = int(float(volume))
-
-                        snippet = (
-                            f"最新價: {last_price_float:,.2f} | "
-                            f"漲跌: {change_sign}{change:,.2f} ({change_sign}{change_pct:.2f}%) | "
-                            f"成交量: {volume_int:,} 張"
-                        )
-                    except (ValueError, TypeError):
-                        snippet = f"最新價: {last_price} | 昨收: {yesterday_close}"
-
-                    exchange_label = "上市" if exchange == "TWSE" else "上櫃"
-
-                    return {
-                        'title': f"[台股-{exchange_label}] {stock_name} ({symbol})",
-                        'snippet': snippet,
-                        'link': f"https://www.twse.com.tw/zh/page/trading/exchange/STOCK_DAY.html?stockNo={symbol}",
-                        'tier': 6,
-                        'type': 'stock_tw',
-                        'source': exchange.lower()
-                    }
+            status, data = await get_http_client().get_json(
+                "twse", api_url, params=params, timeout=self._timeout
+            )
+            if status != 200:
+                logger.debug(f"{exchange} API returned status {status}")
+                return None
+
+            # Check if we got valid data
+            if not data or "msgArray" not in data or not data["msgArray"]:
+                return None
+
+            stock_info = data["msgArray"][0]
+
+            # Extract fields
+            stock_name = stock_info.get("n", symbol)  # Name
+            last_price = stock_info.get("z", "-")      # Last trade price
+            yesterday_close = stock_info.get("y", "0") # Yesterday close
+            volume = stock_info.get("v", "0")          # Volume (in lots)
+
+            # Handle "-" for no trade
+            if last_price == "-":
+                last_price = stock_info.get("o", yesterday_close)  # Use open or yesterday close
+
+            try:
+                last_price_float = float(last_price)
+                yesterday_float = float(yesterday_close)
+                change = last_price_float - yesterday_float
+                change_pct = (change / yesterday_float * 100) if yesterday_float else 0
+                change_sign = "+" if change >= 0 else ""
+
+                # Format volume (convert to 張)
+                volume_int = int(float(volume))
+
+                snippet = (
+                    f"最新價: {last_price_float:,.2f} | "
+                    f"漲跌: {change_sign}{change:,.2f} ({change_sign}{change_pct:.2f}%) | "
+                    f"成交量: {volume_int:,} 張"
+                )
+            except (ValueError, TypeError):
+                snippet = f"最新價: {last_price} | 昨收: {yesterday_close}"
+
+            exchange_label = "上市" if exchange == "TWSE" else "上櫃"
+
+            return {
+                'title': f"[台股-{exchange_label}] {stock_name} ({symbol})",
+                'snippet': snippet,
+                'link': f"https://www.twse.com.tw/zh/page/trading/exchange/STOCK_DAY.html?stockNo={symbol}",
+                'tier': 6,
+                'type': 'stock_tw',
+                'source': exchange.lower()
+            }
 
         except aiohttp.ClientError as e:
             logger.debug(f"{exchange} API client error: {e}")
@@ -260,23 +243,6 @@ class TwseClient:
             logger.debug(f"{exchange} API error: {e}")
             return None
 
-    def _update_cache(self, cache_key: str, result: Dict) -> None:
-        """
-        Update cache with LRU eviction if needed.
-
-        Args:
-            cache_key: Cache key (symbol)
-            result: Stock data to cache
-        """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug(f"TWSE cache evicted oldest entry")
-
-        self._cache[cache_key] = (result, datetime.now())
-        logger.debug(f"TWSE cache UPDATED: '{cache_key}'")
-
     def clear_cache(self) -> int:
         """
         Clear all cached results.
@@ -284,8 +250,7 @@ class TwseClient:
         Returns:
             Number of entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self._cache.clear() if self._cache is not None else 0
         logger.info(f"TWSE cache cleared ({count} entries)")
         return count
 
@@ -296,12 +261,9 @@ class TwseClient:
         Returns:
             Dict with cache stats
         """
-        return {
-            "enabled": self._cache_enabled,
-            "size": len(self._cache),
-            "max_size": self._cache_max_size,
-            "ttl_hours": self._cache_ttl.total_seconds() / 3600
-        }
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
 
     def is_available(self) -> bool:
         """
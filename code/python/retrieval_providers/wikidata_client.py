@@ -15,9 +15,10 @@ Features:
 import asyncio
 import time
 import aiohttp
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 from core.config import CONFIG
+from core.tier6_cache import get_tier6_cache
+from core.http_client import get_http_client
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("wikidata_client")
@@ -51,16 +52,12 @@ class WikidataClient:
         self._enabled = wikidata_config.get("enabled", False)
         self._timeout = wikidata_config.get("timeout", 8.0)
 
-        # Cache configuration
-        cache_config = wikidata_config.get("cache", {})
-        self._cache: Dict[str, Tuple[Dict, datetime]] = {}
-        self._cache_enabled = cache_config.get("enabled", True)
-        self._cache_ttl = timedelta(hours=cache_config.get("ttl_hours", 24))
-        self._cache_max_size = cache_config.get("max_size", 200)
+        # Shared cache (core/tier6_cache.py): per-client TTL, stale-while-revalidate
+        self._cache = get_tier6_cache("wikidata", default_ttl_hours=24, default_max_size=200)
 
         logger.info(
             f"Initialized WikidataClient (enabled={self._enabled}, "
-            f"cache={self._cache_enabled}, ttl={self._cache_ttl})"
+            f"cache={self._cache is not None})"
         )
 
     async def search(
@@ -98,41 +95,28 @@ class WikidataClient:
         results = []
 
         try:
-            # Check cache first
+            # Shared cache: fresh or stale hits (stale ones refresh in the background),
+            # concurrent misses for the same key share one upstream call
             cache_key = f"{entity_type}:{name}"
-            if self._cache_enabled and cache_key in self._cache:
-                cached_result, timestamp = self._cache[cache_key]
-                if datetime.now() - timestamp < self._cache_ttl:
-                    cache_hit = True
-                    logger.info(f"Wikidata cache HIT for: '{name}'")
-                    results = [cached_result]
-                else:
-                    del self._cache[cache_key]
-                    logger.debug(f"Wikidata cache EXPIRED for: '{name}'")
 
-            # Cache miss - fetch data with timeout
-            if not cache_hit:
-                try:
-                    result = await asyncio.wait_for(
-                        self._fetch_entity_data(name, entity_type),
-                        timeout=timeout
-                    )
+            async def fetch():
+                return await asyncio.wait_for(self._fetch_entity_data(name, entity_type), timeout=timeout)
 
-                    if result:
-                        results = [result]
-                        # Update cache
-                        if self._cache_enabled:
-                            self._update_cache(cache_key, result)
+            try:
+                if self._cache is not None:
+                    result, cache_status = await self._cache.get_or_fetch(cache_key, fetch)
+                    cache_hit = cache_status in ("hit", "stale")
+                    if cache_hit:
+                        logger.info(f"Wikidata cache {cache_status.upper()} for: '{name}'")
+                else:
+                    result = await fetch()
 
-                except asyncio.TimeoutError:
-                    timeout_occurred = True
-                    logger.warning(f"Wikidata TIMEOUT after {timeout}s for: '{name}'")
+                if result:
+                    results = [result]
 
-                    # Try to return stale cache as fallback
-                    if cache_key in self._cache:
-                        stale_result, _ = self._cache[cache_key]
-                        logger.info(f"Returning stale Wikidata cache for '{name}'")
-                        results = [stale_result]
+            except asyncio.TimeoutError:
+                timeout_occurred = True
+                logger.warning(f"Wikidata TIMEOUT after {timeout}s for: '{name}'")
 
             return results
 
@@ -183,92 +167,90 @@ class WikidataClient:
             sparql = self._build_generic_query(name)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Accept": "application/sparql-results+json",
-                    "User-Agent": USER_AGENT
-                }
-
-                async with session.get(
-                    WIKIDATA_SPARQL_URL,
-                    params={"query": sparql, "format": "json"},
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout)
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"Wikidata API returned status {response.status}")
-                        return None
-
-                    data = await response.json()
-
-                    # Parse results
-                    bindings = data.get("results", {}).get("bindings", [])
-                    if not bindings:
-                        logger.debug(f"Wikidata: No results for '{name}'")
-                        return None
-
-                    # Get first result
-                    result = bindings[0]
-
-                    # Extract fields
-                    entity_label = result.get("itemLabel", {}).get("value", name)
-                    description = result.get("itemDescription", {}).get("value", "")
-                    entity_uri = result.get("item", {}).get("value", "")
-
-                    # Extract additional properties based on type
-                    snippet_parts = []
-                    if description:
-                        snippet_parts.append(description)
-
-                    # Company-specific fields
-                    if entity_type == "company":
-                        inception = result.get("inception", {}).get("value", "")
-                        if inception:
-                            # Format date (YYYY-MM-DD -> YYYY年)
-                            year = inception[:4] if len(inception) >= 4 else inception
-                            snippet_parts.append(f"成立: {year}年")
-
-                        headquarters = result.get("headquartersLabel", {}).get("value", "")
-                        if headquarters:
-                            snippet_parts.append(f"總部: {headquarters}")
-
-                        ceo = result.get("ceoLabel", {}).get("value", "")
-                        if ceo:
-                            snippet_parts.append(f"CEO: {ceo}")
-
-                        industry = result.get("industryLabel", {}).get("value", "")
-                        if industry:
-                            snippet_parts.append(f"產業: {industry}")
-
-                    # Person-specific fields
-                    elif entity_type == "person":
-                        birth_date = result.get("birthDate", {}).get("value", "")
-                        if birth_date:
-                            year = birth_date[:4] if len(birth_date) >= 4 else birth_date
-                            snippet_parts.append(f"出生: {year}年")
-
-                        occupation = result.get("occupationLabel", {}).get("value", "")
-                        if occupation:
-                            snippet_parts.append(f"職業: {occupation}")
-
-                        nationality = result.get("nationalityLabel", {}).get("value", "")
-                        if nationality:
-                            snippet_parts.append(f"國籍: {nationality}")
-
-                    snippet = " | ".join(snippet_parts) if snippet_parts else "無詳細資料"
-
-                    # Convert Wikidata URI to Wikipedia-style link
-                    entity_id = entity_uri.split("/")[-1] if entity_uri else ""
-                    link = f"https://www.wikidata.org/wiki/{entity_id}" if entity_id else entity_uri
-
-                    return {
-                        'title': f"[Wikidata] {entity_label}",
-                        'snippet': snippet,
-                        'link': link,
-                        'tier': 6,
-                        'type': 'company_global',
-                        'source': 'wikidata'
-                    }
+            headers = {
+                "Accept": "application/sparql-results+json",
+                "User-Agent": USER_AGENT
+            }
+
+            status, data = await get_http_client().get_json(
+                "wikidata",
+                WIKIDATA_SPARQL_URL,
+                params={"query": sparql, "format": "json"},
+                headers=headers,
+                timeout=self._timeout
+            )
+            if status != 200:
+                logger.warning(f"Wikidata API returned status {status}")
+                return None
+
+            # Parse results
+            bindings = data.get("results", {}).get("bindings", [])
+            if not bindings:
+                logger.debug(f"Wikidata: No results for '{name}'")
+                return None
+
+            # Get first result
+            result = bindings[0]
+
+            # Extract fields
+            entity_label = result.get("itemLabel", {}).get("value", name)
+            description = result.get("itemDescription", {}).get("value", "")
+            entity_uri = result.get("item", {}).get("value", "")
+
+            # Extract additional properties based on type
+            snippet_parts = []
+            if description:
+                snippet_parts.append(description)
+
+            # Company-specific fields
+            if entity_type == "company":
+                inception = result.get("inception", {}).get("value", "")
+                if inception:
+                    # Format date (YYYY-MM-DD -> YYYY年)
+                    year = inception[:4] if len(inception) >= 4 else inception
+                    snippet_parts.append(f"成立: {year}年")
+
+                headquarters = result.get("headquartersLabel", {}).get("value", "")
+                if headquarters:
+                    snippet_parts.append(f"總部: {headquarters}")
+
+                ceo = result.get("ceoLabel", {}).get("value", "")
+                if ceo:
+                    snippet_parts.append(f"CEO: {ceo}")
+
+                industry = result.get("industryLabel", {}).get("value", "")
+                if industry:
+                    snippet_parts.append(f"產業: {industry}")
+
+            # Person-specific fields
+            elif entity_type == "person":
+                birth_date = result.get("birthDate", {}).get("value", "")
+                if birth_date:
+                    year = birth_date[:4] if len(birth_date) >= 4 else birth_date
+                    snippet_parts.append(f"出生: {year}年")
+
+                occupation = result.get("occupationLabel", {}).get("value", "")
+                if occupation:
+                    snippet_parts.append(f"職業: {occupation}")
+
+                nationality = result.get("nationalityLabel", {}).get("value", "")
+                if nationality:
+                    snippet_parts.append(f"國籍: {nationality}")
+
+            snippet = " | ".join(snippet_parts) if snippet_parts else "無詳細資料"
+
+            # Convert Wikidata URI to Wikipedia-style link
+            entity_id = entity_uri.split("/")[-1] if entity_uri else ""
+            link = f"https://www.wikidata.org/wiki/{entity_id}" if entity_id else entity_uri
+
+            return {
+                'title': f"[Wikidata] {entity_label}",
+                'snippet': snippet,
+                'link': link,
+                'tier': 6,
+                'type': 'company_global',
+                'source': 'wikidata'
+            }
 
         except aiohttp.ClientError as e:
             logger.warning(f"Wikidata API client error: {e}")
@@ -326,23 +308,6 @@ class WikidataClient:
         LIMIT 1
         """
 
-    def _update_cache(self, cache_key: str, result: Dict) -> None:
-        """
-        Update cache with LRU eviction if needed.
-
-        Args:
-            cache_key: Cache key
-            result: Entity data to cache
-        """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug("Wikidata cache evicted oldest entry")
-
-        self._cache[cache_key] = (result, datetime.now())
-        logger.debug(f"Wikidata cache UPDATED: '{cache_key}'")
-
     def clear_cache(self) -> int:
         """
         Clear all cached results.
@@ -350,8 +315,7 @@ class WikidataClient:
         Returns:
             Number of entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self._cache.clear() if self._cache is not None else 0
         logger.info(f"Wikidata cache cleared ({count} entries)")
         return count
 
@@ -362,12 +326,9 @@ class WikidataClient:
         Returns:
             Dict with cache stats
         """
-        return {
-            "enabled": self._cache_enabled,
-            "size": len(self._cache),
-            "max_size": self._cache_max_size,
-            "ttl_hours": self._cache_ttl.total_seconds() / 3600
-        }
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
 
     def is_available(self) -> bool:
         """
@@ -16,9 +16,9 @@ Features:
 import asyncio
 import json
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 from core.config import CONFIG
+from core.tier6_cache import get_tier6_cache
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("wikipedia_client")
@@ -71,16 +71,12 @@ class WikipediaClient:
         # Set Wikipedia language
         wikipedia.set_lang(self._language)
 
-        # Cache configuration
-        cache_config = wiki_config.get("cache", {})
-        self._cache: Dict[str, Tuple[List, datetime]] = {}
-        self._cache_enabled = cache_config.get("enabled", True)
-        self._cache_ttl = timedelta(hours=cache_config.get("ttl_hours", 24))  # Wikipedia content changes less often
-        self._cache_max_size = cache_config.get("max_size", 200)
+        # Shared cache (core/tier6_cache.py): per-client TTL, stale-while-revalidate
+        self._cache = get_tier6_cache("wikipedia", default_ttl_hours=24, default_max_size=200)
 
         logger.info(
             f"Initialized WikipediaClient (enabled={self._enabled}, "
-            f"lang={self._language}, cache={self._cache_enabled})"
+            f"lang={self._language}, cache={self._cache is not None})"
         )
 
     async def search(
@@ -116,39 +112,25 @@ class WikipediaClient:
         results = []
 
         try:
-            # Check cache first
+            # Shared cache: fresh or stale hits (stale ones refresh in the background),
+            # concurrent misses for the same key share one upstream call
             cache_key = f"{query}:{max_results}:{self._language}"
-            if self._cache_enabled and cache_key in self._cache:
-                cached_results, timestamp = self._cache[cache_key]
-                if datetime.now() - timestamp < self._cache_ttl:
-                    cache_hit = True
-                    logger.info(f"Wikipedia cache HIT for query: '{query}' ({len(cached_results)} results)")
-                    results = cached_results
-                else:
-                    del self._cache[cache_key]
-                    logger.debug(f"Wikipedia cache EXPIRED for query: '{query}'")
-
-            # Cache miss - perform actual search with timeout
-            if not cache_hit:
-                try:
-                    results = await asyncio.wait_for(
-                        self._do_search(query, max_results),
-                        timeout=timeout
-                    )
 
-                    # Update cache
-                    if self._cache_enabled and results:
-                        self._update_cache(cache_key, results)
+            async def fetch():
+                return await asyncio.wait_for(self._do_search(query, max_results), timeout=timeout)
 
-                except asyncio.TimeoutError:
-                    timeout_occurred = True
-                    logger.warning(f"Wikipedia search TIMEOUT after {timeout}s for query: '{query}'")
+            try:
+                if self._cache is not None:
+                    results, cache_status = await self._cache.get_or_fetch(cache_key, fetch)
+                    cache_hit = cache_status in ("hit", "stale")
+                    if cache_hit:
+                        logger.info(f"Wikipedia cache {cache_status.upper()} for query: '{query}'")
+                else:
+                    results = await fetch()
 
-                    # Try to return stale cache as fallback
-                    if cache_key in self._cache:
-                        stale_results, _ = self._cache[cache_key]
-                        logger.info(f"Returning stale Wikipedia cache ({len(stale_results)} results)")
-                        results = stale_results
+            except asyncio.TimeoutError:
+                timeout_occurred = True
+                logger.warning(f"Wikipedia search TIMEOUT after {timeout}s for query: '{query}'")
 
             return results
 
@@ -262,23 +244,6 @@ class WikipediaClient:
 
         return result
 
-    def _update_cache(self, cache_key: str, results: List[Dict]) -> None:
-        """
-        Update cache with LRU eviction if needed.
-
-        Args:
-            cache_key: Cache key
-            results: Search results to cache
-        """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug(f"Wikipedia cache evicted oldest entry")
-
-        self._cache[cache_key] = (results, datetime.now())
-        logger.debug(f"Wikipedia cache UPDATED: '{cache_key}' ({len(results)} results)")
-
     def clear_cache(self) -> int:
         """
         Clear all cached results.
@@ -286,8 +251,7 @@ class WikipediaClient:
         Returns:
             Number of entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self._cache.clear() if self._cache is not None else 0
         logger.info(f"Wikipedia cache cleared ({count} entries)")
         return count
 
@@ -298,13 +262,9 @@ class WikipediaClient:
         Returns:
             Dict with cache stats
         """
-        return {
-            "enabled": self._cache_enabled,
-            "size": len(self._cache),
-            "max_size": self._cache_max_size,
-            "ttl_hours": self._cache_ttl.total_seconds() / 3600,
-            "language": self._language
-        }
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats(), "language": self._language}
 
     def is_available(self) -> bool:
         """
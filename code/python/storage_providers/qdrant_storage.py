@@ -135,7 +135,7 @@ class QdrantStorageProvider(StorageProvider):
             if embedding is None:
                 # Combine user prompt and response for better context
                 conversation_text = f"User: {user_prompt}\nAssistant: {response}"
-                embedding = await get_embedding(conversation_text)
+                embedding = await get_embedding(conversation_text, use_cache=False)
             
             # Create conversation entry
             entry = ConversationEntry(
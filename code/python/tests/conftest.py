@@ -0,0 +1,22 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _current_event_loop():
+    """
+    Give every test its own current event loop, closed afterwards.
+
+    asyncio.run() and IsolatedAsyncioTestCase clear the current loop when they
+    finish, which breaks later tests that still call asyncio.get_event_loop().
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
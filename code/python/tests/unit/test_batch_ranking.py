@@ -0,0 +1,125 @@
+"""
+Tests for batched multi-document LLM ranking (Ranking.rankBatch).
+
+A. One ask_llm call ranks a whole batch; scores map back by id
+B. Items the batched response drops fall back to per-item rankItem calls
+C. A failed batch call falls back to per-item ranking for every item
+D. Analytics log_ranking_score still fires once per ranked item
+E. do() in batch mode issues ceil(N / batch_size) batched calls
+"""
+
+import sys
+import os
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core import ranking as ranking_module
+from core.ranking import Ranking
+
+
+def _item(i):
+    return {
+        'url': f'https://ltn.com.tw/news/{i}',
+        'schema_json': json.dumps({'@type': 'NewsArticle', 'headline': f'新聞 {i}'}),
+        'title': f'新聞 {i}',
+        'site': 'ltn',
+    }
+
+
+def _handler():
+    handler = MagicMock()
+    handler.site = 'ltn'
+    handler.item_type = 'NewsArticle'
+    handler.query = '台積電'
+    handler.query_id = 'q1'
+    handler.required_item_type = None
+    handler.generate_mode = 'unified'  # no early send
+    handler.connection_alive_event.is_set.return_value = True
+    return handler
+
+
+def _make_ranking(items, batch_size=8):
+    rk = Ranking(_handler(), items, ranking_type=Ranking.REGULAR_TRACK)
+    rk.batch_mode = True
+    rk.batch_size = batch_size
+    return rk
+
+
+class TestParseBatchResponse(unittest.TestCase):
+
+    def test_drops_bad_entries(self):
+        response = {'results': [
+            {'id': 0, 'score': 80, 'description': 'a'},
+            {'id': '1', 'score': '65', 'description': 'b'},
+            {'id': 7, 'score': 90},           # out of range
+            {'id': 2, 'score': 'high'},       # non-numeric
+            {'score': 50},                    # no id
+        ]}
+        parsed = Ranking._parse_batch_response(response, 3)
+        self.assertEqual(parsed, {0: {'score': 80, 'description': 'a'},
+                                  1: {'score': 65, 'description': 'b'}})
+
+
+class TestRankBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.query_logger = MagicMock()
+        patcher = patch.object(ranking_module, 'get_query_logger', return_value=self.query_logger)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_single_call_with_fallback_for_dropped_items(self):
+        items = [_item(i) for i in range(3)]
+        rk = _make_ranking(items)
+        batch_response = {'results': [
+            {'id': 0, 'score': 80, 'description': 'zero'},
+            {'id': 2, 'score': 30, 'description': 'two'},
+        ]}
+        single_response = {'score': 70, 'description': 'one'}
+        with patch.object(ranking_module, 'ask_llm',
+                          AsyncMock(side_effect=[batch_response, single_response])) as ask:
+            results = asyncio.run(rk.rankBatch(items))
+
+        self.assertEqual(ask.await_count, 2)
+        scores = {r['url']: r['ranking']['score'] for r in results}
+        self.assertEqual(scores, {items[0]['url']: 80, items[1]['url']: 70, items[2]['url']: 30})
+        self.assertEqual(self.query_logger.log_ranking_score.call_count, 3)
+
+    def test_failed_batch_call_ranks_every_item_individually(self):
+        items = [_item(i) for i in range(2)]
+        rk = _make_ranking(items)
+        ask = AsyncMock(side_effect=[RuntimeError("timeout"),
+                                     {'score': 60, 'description': 'x'},
+                                     {'score': 61, 'description': 'y'}])
+        with patch.object(ranking_module, 'ask_llm', ask):
+            results = asyncio.run(rk.rankBatch(items))
+
+        self.assertEqual(ask.await_count, 3)
+        self.assertEqual(len(results), 2)
+
+    def test_do_issues_one_call_per_batch(self):
+        items = [_item(i) for i in range(5)]
+        rk = _make_ranking(items, batch_size=2)
+        rk.handler.pre_checks_done_event.wait = AsyncMock()
+        rk.sendAnswers = AsyncMock()
+
+        async def fake_ask(prompt, *args, **kwargs):
+            n = prompt.count('新聞')
+            return {'results': [{'id': i, 'score': 10, 'description': ''} for i in range(n)]}
+
+        with patch.object(ranking_module, 'ask_llm', AsyncMock(side_effect=fake_ask)) as ask, \
+                patch('core.config.CONFIG.xgboost_params', {'enabled': False}), \
+                patch('core.config.CONFIG.mmr_params', {'enabled': False}):
+            asyncio.run(rk.do())
+
+        self.assertEqual(ask.await_count, 3)
+        self.assertEqual(len(rk.rankedAnswers), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for the prebuilt BM25 inverted index (core.bm25.BM25Index).
+
+A. Scores match BM25Scorer when the candidate set is the whole corpus
+B. Document frequencies are corpus-wide, not candidate-set-wide
+C. Incremental add / replace / remove keep scores consistent with a rebuild
+D. save() / load() round-trips the index
+E. Unindexed candidates fall back to scoring their text
+F. get_bm25_index picks up an index built after a miss, and rebuilds
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.bm25 import BM25Index, BM25Scorer, get_bm25_index
+
+CORPUS = [
+    ("u0", "台積電營收創新高 TSMC revenue"),
+    ("u1", "颱風來襲 台北停班停課"),
+    ("u2", "台積電 美國設廠 Arizona"),
+    ("u3", "經濟部 電價調漲 台電"),
+    ("u4", "TSMC Arizona fab delay"),
+]
+
+
+def _reference_scores(query_tokens, docs):
+    scorer = BM25Scorer()
+    avg_len, term_doc_counts = scorer.calculate_corpus_stats(
+        [{'name': '', 'description': text} for _, text in docs]
+    )
+    return [
+        scorer.calculate_score(query_tokens, f" {text}", avg_len, len(docs), term_doc_counts)
+        for _, text in docs
+    ]
+
+
+class TestBM25Index(unittest.TestCase):
+
+    def setUp(self):
+        self.query = BM25Scorer().tokenize("台積電 Arizona")
+        self.index = BM25Index()
+        self.index.add_documents(CORPUS)
+
+    def test_matches_scorer_on_full_corpus(self):
+        expected = _reference_scores(self.query, CORPUS)
+        scores = self.index.score(self.query, [k for k, _ in CORPUS])
+        np.testing.assert_allclose(scores, expected)
+
+    def test_scores_aligned_with_candidate_order(self):
+        expected = _reference_scores(self.query, CORPUS)
+        scores = self.index.score(self.query, ["u4", "missing", "u0"])
+        np.testing.assert_allclose(scores, [expected[4], 0.0, expected[0]])
+
+    def test_document_frequency_is_corpus_wide(self):
+        self.assertEqual(self.index.doc_frequency("台積"), 2)
+        self.assertEqual(self.index.doc_frequency("arizona"), 2)
+        self.assertEqual(self.index.corpus_size, 5)
+
+    def test_incremental_updates_match_rebuild(self):
+        self.index.compact()
+        self.index.add_document("u5", "台積電 台積電 Arizona")
+        self.index.add_document("u1", "Arizona 颱風")  # replace
+        self.index.remove_document("u3")
+        self.index.compact()
+
+        rebuilt = BM25Index()
+        rebuilt.add_documents([CORPUS[0], ("u1", "Arizona 颱風"), CORPUS[2], CORPUS[4],
+                               ("u5", "台積電 台積電 Arizona")])
+        keys = ["u0", "u1", "u2", "u4", "u5"]
+        np.testing.assert_allclose(self.index.score(self.query, keys), rebuilt.score(self.query, keys))
+        self.assertNotIn("u3", self.index)
+
+    def test_save_load_round_trip(self):
+        self.index.add_document("u5", "Arizona")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bm25.npz")
+            self.index.save(path)
+            loaded = BM25Index.load(path)
+        keys = [k for k, _ in CORPUS] + ["u5"]
+        np.testing.assert_allclose(loaded.score(self.query, keys), self.index.score(self.query, keys))
+        self.assertEqual(loaded.vocabulary_size, self.index.vocabulary_size)
+
+    def test_unindexed_candidate_scored_from_text(self):
+        scores = self.index.score(self.query, ["new"], texts=["台積電 Arizona"])
+        self.assertGreater(scores[0], 0.0)
+
+    def test_get_index_reloads_after_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bm25.npz")
+            self.assertIsNone(get_bm25_index(path))
+
+            self.index.save(path)
+            first = get_bm25_index(path)
+            self.assertEqual(first.vocabulary_size, self.index.vocabulary_size)
+            self.assertIs(get_bm25_index(path), first)
+
+            self.index.add_document("u5", "Zzyzx Nevada")
+            self.index.save(path)
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            reloaded = get_bm25_index(path)
+            self.assertGreater(reloaded.vocabulary_size, first.vocabulary_size)
+            self.assertEqual(reloaded.vocabulary_size, self.index.vocabulary_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
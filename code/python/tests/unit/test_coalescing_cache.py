@@ -0,0 +1,101 @@
+"""
+Tests for the shared cache base (core/coalescing_cache.py).
+
+A. Concurrent callers on one event loop share the leader's result
+B. Waiters get "retry" when the leader raises or shares RETRY
+C. The LRU honours both the entry and the byte bound
+D. SqliteCacheStore keeps namespaces apart and purges by stamp
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.coalescing_cache import RETRY, CoalescingCache, SqliteCacheStore
+
+
+class _SizedCache(CoalescingCache):
+
+    def _entry_size(self, entry):
+        return len(entry[0])
+
+
+class TestCoalesce(unittest.IsolatedAsyncioTestCase):
+
+    async def test_waiters_share_leader_result(self):
+        cache = CoalescingCache(max_entries=10)
+        calls = 0
+
+        async def lead():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result", "shared"
+
+        results = await asyncio.gather(*(cache._coalesce("k", lead) for _ in range(4)))
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(sorted(results), [("result", "leader")] + [("shared", "coalesced")] * 3)
+        self.assertEqual(cache._base_stats()["coalesced"], 3)
+        self.assertEqual(cache._base_stats()["inflight"], 0)
+
+    async def test_waiters_retry_after_failure_or_retry_share(self):
+        cache = CoalescingCache(max_entries=10)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        async def unshareable():
+            await asyncio.sleep(0.01)
+            return "result", RETRY
+
+        for lead in (failing, unshareable):
+            leader = asyncio.ensure_future(cache._coalesce("k", lead))
+            await asyncio.sleep(0)
+            waiter = await cache._coalesce("k", lead)
+            await asyncio.gather(leader, return_exceptions=True)
+            self.assertEqual(waiter, (None, "retry"))
+
+
+class TestMemoryTier(unittest.TestCase):
+
+    def test_entry_and_byte_bounds(self):
+        cache = _SizedCache(max_entries=3, max_bytes=10)
+        cache._memory_put("a", ("xxxx",))
+        cache._memory_put("b", ("xxxx",))
+        cache._memory_get("a")
+        cache._memory_put("c", ("xxxx",))
+        cache._memory_put("huge", ("x" * 11,))
+
+        self.assertEqual(list(cache._memory), ["a", "c"])
+        self.assertEqual(cache._base_stats()["memory_bytes"], 8)
+        self.assertEqual(cache._base_stats()["evictions"], 1)
+
+
+class TestSqliteCacheStore(unittest.TestCase):
+
+    def test_namespaces_and_purge(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SqliteCacheStore(os.path.join(tmp, "cache", "store.sqlite"), "test_cache")
+            store.put("k", "old", 100.0, namespace="twse")
+            store.put("k", b"\x00\x01", 200.0, namespace="wikipedia")
+
+            self.assertEqual(store.get("k", "twse"), ("old", 100.0))
+            self.assertEqual(store.get("k", "wikipedia"), (b"\x00\x01", 200.0))
+            self.assertIsNone(store.get("k"))
+
+            store.purge(150.0)
+            self.assertIsNone(store.get("k", "twse"))
+            store.clear("wikipedia")
+            self.assertIsNone(store.get("k", "wikipedia"))
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
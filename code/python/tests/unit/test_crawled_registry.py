@@ -0,0 +1,149 @@
+"""
+Tests for CrawledRegistry's buffered marks and Bloom-filter lookup front.
+
+A. Marks are visible immediately but written in one flush (batch threshold, close)
+B. The Bloom filter rejects unknown URLs and picks up other writers' rows
+C. A full filter is rebuilt off to the side and published only when filled
+D. A successful mark clears the URL's earlier failure record
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from crawler.core import crawled_registry
+from crawler.core.crawled_registry import CrawledRegistry, _BloomFilter
+
+
+class _RegistryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "test_registry.db"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _count_rows(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            return conn.execute("SELECT COUNT(*) FROM crawled_articles").fetchone()[0]
+        finally:
+            conn.close()
+
+
+class TestBufferedMarks(_RegistryTestCase):
+
+    def test_marks_buffered_until_flush(self):
+        registry = CrawledRegistry(self.db_path, flush_interval=3600, flush_batch=1000)
+
+        for i in range(3):
+            registry.mark_crawled(f"https://cna.com.tw/news/{i}", "cna")
+
+        self.assertTrue(registry.is_crawled("https://cna.com.tw/news/1"))
+        self.assertEqual(self._count_rows(), 0)
+
+        self.assertEqual(registry.flush_crawled(), 3)
+        self.assertEqual(self._count_rows(), 3)
+        self.assertTrue(registry.is_crawled("https://cna.com.tw/news/1"))
+
+        registry.close()
+
+    def test_batch_threshold_and_close_flush(self):
+        registry = CrawledRegistry(self.db_path, flush_interval=3600, flush_batch=2)
+
+        registry.mark_crawled("https://ltn.com.tw/news/1", "ltn")
+        registry.mark_crawled("https://ltn.com.tw/news/2", "ltn")
+        self.assertEqual(self._count_rows(), 2)
+
+        registry.mark_crawled("https://ltn.com.tw/news/3", "ltn")
+        registry.close()
+        self.assertEqual(self._count_rows(), 3)
+
+    def test_flush_clears_older_failure(self):
+        registry = CrawledRegistry(self.db_path, flush_interval=3600)
+
+        url = "https://www.cna.com.tw/news/aipl/202610160001.aspx"
+        registry.mark_failed(url, "cna", "fetch_error")
+        registry.mark_crawled(url, "cna")
+
+        self.assertEqual(registry.get_failed_urls(source_id="cna"), [])
+
+        registry.close()
+
+
+class TestBloomFilter(_RegistryTestCase):
+
+    def test_bloom_filter_sees_other_writers(self):
+        registry = CrawledRegistry(self.db_path, flush_interval=3600)
+        other = CrawledRegistry(self.db_path, flush_interval=3600)
+
+        self.assertFalse(registry.is_crawled("https://udn.com/news/story/1/100"))
+        self.assertNotIn("https://udn.com/news/story/1/100", registry._bloom)
+
+        other.mark_crawled("https://udn.com/news/story/1/100", "udn")
+        other.flush_crawled()
+
+        registry.mark_crawled("https://udn.com/news/story/1/200", "udn")
+        registry.flush_crawled()
+        self.assertTrue(registry.is_crawled("https://udn.com/news/story/1/100"))
+
+        other.close()
+        registry.close()
+
+    def test_bloom_filter_refreshed_without_local_marks(self):
+        registry = CrawledRegistry(self.db_path, flush_interval=0.05)
+        other = CrawledRegistry(self.db_path, flush_interval=3600)
+
+        url = "https://udn.com/news/story/1/300"
+        self.assertFalse(registry.is_crawled(url))
+
+        other.mark_crawled(url, "udn")
+        other.flush_crawled()
+
+        deadline = time.monotonic() + 5
+        while url not in registry._bloom and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertTrue(registry.is_crawled(url))
+
+        other.close()
+        registry.close()
+
+    def test_bloom_rebuild_published_only_when_filled(self):
+        registry = CrawledRegistry(self.db_path, flush_interval=3600)
+        for i in range(3):
+            registry.mark_crawled(f"https://cna.com.tw/news/{i}", "cna")
+        registry.flush_crawled()
+
+        with patch.object(crawled_registry.settings, "REGISTRY_BLOOM_MIN_CAPACITY", 2):
+            registry._bloom = _BloomFilter(1)
+            registry._bloom.add("https://cna.com.tw/news/0")
+            registry._bloom_rowid = 1
+
+            published = []
+            real_add = _BloomFilter.add
+
+            def add(bloom, url):
+                published.append(registry._bloom is bloom)
+                real_add(bloom, url)
+
+            with patch.object(_BloomFilter, "add", add):
+                registry._refresh_bloom()
+
+        self.assertEqual(published, [False, False, False])
+        self.assertEqual(registry._bloom.capacity, 6)
+        self.assertTrue(all(registry.is_crawled(f"https://cna.com.tw/news/{i}") for i in range(3)))
+
+        registry.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
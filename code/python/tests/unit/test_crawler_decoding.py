@@ -0,0 +1,78 @@
+"""
+Tests for crawler response decoding.
+
+A. UTF-8 and hinted pages decode without statistical detection
+B. Charsets declared in headers or <meta> are learned for later responses
+C. Undeclared non-UTF-8 pages fall back to detection off the event loop
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from crawler.core import decoding
+from crawler.core.decoding import ResponseDecoder, declared_charset
+
+BIG5_PAGE = (
+    '<html><body><p>台積電今日召開法說會，公布第三季財報。'
+    '董事長表示，人工智慧相關需求強勁，預期明年營收將持續成長，'
+    '先進製程產能仍供不應求，資本支出維持高檔。</p></body></html>'
+).encode('big5')
+
+
+class TestDecodeFast(unittest.TestCase):
+
+    def test_utf8_fast_path(self):
+        text, method = ResponseDecoder().decode_fast('中央社'.encode('utf-8'))
+        self.assertEqual((text, method), ('中央社', 'utf-8'))
+
+    def test_source_hint(self):
+        text, method = ResponseDecoder('big5').decode_fast(BIG5_PAGE)
+        self.assertEqual(method, 'hint')
+        self.assertIn('台積電', text)
+
+    def test_declared_charset_is_learned(self):
+        decoder = ResponseDecoder()
+        meta_page = b'<meta charset="big5">' + BIG5_PAGE
+        self.assertEqual(decoder.decode_fast(meta_page)[1], 'declared')
+        self.assertEqual(decoder.learned_charset, 'big5')
+        self.assertEqual(decoder.decode_fast(BIG5_PAGE)[1], 'learned')
+
+    def test_declared_charset_sources(self):
+        self.assertEqual(declared_charset(b'', 'text/html; charset=Big5'), 'big5')
+        self.assertEqual(declared_charset(b"<meta http-equiv='Content-Type' content='text/html; charset=big5'>", None), 'big5')
+        # Latin-1 decodes any bytes, so a server default of ISO-8859-1 is ignored
+        self.assertIsNone(declared_charset(b'', 'text/html; charset=ISO-8859-1'))
+
+    def test_undeclared_non_utf8_needs_detection(self):
+        self.assertEqual(ResponseDecoder().decode_fast(BIG5_PAGE), (None, 'detect'))
+
+
+class TestDecodeAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_detection_runs_in_executor(self):
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, 'run_in_executor', wraps=loop.run_in_executor) as executor:
+            text, method, elapsed = await ResponseDecoder().decode(BIG5_PAGE, 'text/html', loop)
+
+        executor.assert_called_once_with(None, decoding.detect_and_decode, BIG5_PAGE)
+        self.assertEqual(method, 'detect')
+        self.assertIn('台積電', text)
+        self.assertGreaterEqual(elapsed, 0.0)
+
+    async def test_fast_path_skips_executor(self):
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, 'run_in_executor') as executor:
+            text, method, _ = await ResponseDecoder().decode(b'<html></html>', None, loop)
+
+        executor.assert_not_called()
+        self.assertEqual((text, method), ('<html></html>', 'utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for the crawler parse stage.
+
+A. parse_html runs parser, date fallback and trafilatura fallback in one call
+B. CrawlerEngine._parse uses the thread pool or the process pool and tracks queue depth
+C. ParsePool round-trips through a real worker process; the shared pool only grows, and
+   close_parse_pool shuts it
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from crawler.core import parse_pool
+from crawler.core.engine import CrawlerEngine
+from crawler.core.parse_pool import ParsePool, parse_html, _parse_in_worker
+
+
+class _FakeParser:
+    source_name = 'cna'
+
+    def __init__(self, result):
+        self.result = result
+
+    async def parse(self, html, url):
+        return dict(self.result) if self.result is not None else None
+
+
+ARTICLE = {'headline': '台積電法說會', 'datePublished': '2026-10-01T10:00:00'}
+
+
+class TestParseHtml(unittest.TestCase):
+
+    def test_parser_success(self):
+        data, via = parse_html(_FakeParser(ARTICLE), '<html></html>', 'https://cna/1')
+        self.assertEqual((data, via), (ARTICLE, 'parser'))
+
+    def test_missing_date_without_fallback(self):
+        with patch.object(parse_pool, 'find_date', return_value=None):
+            data, via = parse_html(_FakeParser({'headline': 'x'}), '<html></html>', 'u', fallback=False)
+        self.assertEqual((data, via), (None, 'no_date'))
+
+    def test_htmldate_fills_date(self):
+        with patch.object(parse_pool, 'find_date', return_value='2026-10-02'):
+            data, via = parse_html(_FakeParser({'headline': 'x'}), '<html></html>', 'u')
+        self.assertEqual(via, 'parser')
+        self.assertEqual(data['datePublished'], '2026-10-02T00:00:00')
+
+    def test_trafilatura_rescue(self):
+        rescued = {'headline': 't', 'datePublished': '2026-10-03T00:00:00'}
+        with patch.object(parse_pool, 'trafilatura_extract', return_value=rescued):
+            data, via = parse_html(_FakeParser(None), '<html></html>', 'u')
+        self.assertEqual((data, via), (rescued, 'trafilatura'))
+
+    def test_worker_reuses_parser_instance(self):
+        parser = _FakeParser(ARTICLE)
+        with patch.dict(parse_pool._worker_parsers, {'cna': parser}):
+            self.assertEqual(_parse_in_worker('cna', '<html></html>', 'u', True), (ARTICLE, 'parser'))
+
+
+class TestEngineParse(unittest.IsolatedAsyncioTestCase):
+
+    def _engine(self, parse_workers):
+        engine = object.__new__(CrawlerEngine)
+        engine.parser = _FakeParser(ARTICLE)
+        engine.parse_workers = parse_workers
+        engine._parse_inflight = 0
+        return engine
+
+    async def test_thread_pool_by_default(self):
+        engine = self._engine(0)
+        with patch('crawler.core.engine.get_parse_pool') as get_pool:
+            data, via = await engine._parse('<html></html>', 'u')
+        get_pool.assert_not_called()
+        self.assertEqual((data, via), (ARTICLE, 'parser'))
+        self.assertEqual(engine._parse_inflight, 0)
+
+    async def test_process_pool_when_configured(self):
+        engine = self._engine(2)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_parse(source_name, html, url, fallback):
+            started.set()
+            await release.wait()
+            return ARTICLE, 'parser'
+
+        pool = MagicMock(parse=fake_parse)
+        with patch('crawler.core.engine.get_parse_pool', return_value=pool) as get_pool:
+            task = asyncio.create_task(engine._parse('<html></html>', 'u'))
+            await started.wait()
+            self.assertEqual(engine._parse_inflight, 1)
+            release.set()
+            self.assertEqual(await task, (ARTICLE, 'parser'))
+
+        get_pool.assert_called_once_with(2)
+        self.assertEqual(engine._parse_inflight, 0)
+
+
+class TestParsePool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_worker_process_round_trip(self):
+        pool = ParsePool(1)
+        try:
+            result = await pool.parse('no_such_source', '<html></html>', 'u')
+        finally:
+            pool.shutdown()
+        self.assertEqual(result, (None, 'parse_error'))
+        self.assertEqual(pool.pending, 0)
+
+
+class TestSharedPool(unittest.TestCase):
+
+    def test_close_shuts_down_shared_pool(self):
+        with patch.object(parse_pool, 'ParsePool') as pool_cls:
+            pool_cls.return_value.workers = 2
+            pool = parse_pool.get_parse_pool(2)
+            self.assertIs(parse_pool.get_parse_pool(2), pool)
+            parse_pool.close_parse_pool()
+        pool.shutdown.assert_called_once_with()
+        self.assertIsNone(parse_pool._parse_pool)
+
+    def test_pool_sized_by_largest_request(self):
+        def make_pool(workers):
+            pool = MagicMock()
+            pool.workers = workers
+            return pool
+
+        with patch.object(parse_pool, 'ParsePool', side_effect=make_pool):
+            small = parse_pool.get_parse_pool(2)
+            large = parse_pool.get_parse_pool(4)
+            self.assertIs(parse_pool.get_parse_pool(2), large)
+            parse_pool.close_parse_pool()
+
+        small.shutdown.assert_called_once_with(cancel_pending=False)
+        self.assertEqual(large.workers, 4)
+        large.shutdown.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the query embedding cache (core/embedding_cache.py).
+
+A. Keys normalize whitespace and full-width characters but keep provider/model apart
+B. Cached vectors are read-only float32 arrays; hits record saved provider latency;
+   put() stores vectors computed elsewhere
+C. Concurrent identical requests await a single provider call
+D. A failing provider call is not cached and waiters retry
+E. The SQLite tier serves a fresh instance (warm restart)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.embedding_cache import EmbeddingCache
+
+
+def _counting_compute(vector, delay=0.0, fail=False):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("provider down")
+        return vector
+
+    return compute, calls
+
+
+class TestKeys(unittest.TestCase):
+
+    def test_normalized_text_shares_key(self):
+        key = EmbeddingCache.make_key("openrouter", "qwen3", "台積電  營收")
+        self.assertEqual(key, EmbeddingCache.make_key("openrouter", "qwen3", " 台積電 營收\n"))
+        self.assertEqual(
+            EmbeddingCache.make_key("openrouter", "qwen3", "ＡＩ晶片"),
+            EmbeddingCache.make_key("openrouter", "qwen3", "AI晶片"),
+        )
+        self.assertNotEqual(key, EmbeddingCache.make_key("openai", "qwen3", "台積電 營收"))
+        self.assertNotEqual(key, EmbeddingCache.make_key("openrouter", "bge-m3", "台積電 營收"))
+
+
+class TestGetOrCompute(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hit_returns_readonly_float32(self):
+        cache = EmbeddingCache()
+        compute, calls = _counting_compute([0.1, 0.2, 0.3], delay=0.01)
+
+        first = await cache.get_or_compute("k", compute)
+        second = await cache.get_or_compute("k", compute)
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(first, second)
+        self.assertEqual(second.dtype, np.float32)
+        self.assertFalse(second.flags.writeable)
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertGreater(stats["saved_seconds"], 0)
+
+    async def test_concurrent_requests_coalesce(self):
+        cache = EmbeddingCache()
+        compute, calls = _counting_compute([1.0, 2.0], delay=0.05)
+
+        results = await asyncio.gather(*[cache.get_or_compute("k", compute) for _ in range(8)])
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(np.array_equal(r, [1.0, 2.0]) for r in results))
+        self.assertEqual(cache.get_stats()["coalesced"], 7)
+
+    async def test_failure_not_cached_and_waiters_retry(self):
+        cache = EmbeddingCache()
+        failing, fail_calls = _counting_compute(None, delay=0.02, fail=True)
+        working, ok_calls = _counting_compute([1.0])
+
+        leader = asyncio.ensure_future(cache.get_or_compute("k", failing))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_compute("k", working))
+
+        with self.assertRaises(RuntimeError):
+            await leader
+        self.assertTrue(np.array_equal(await waiter, [1.0]))
+        self.assertEqual((len(fail_calls), len(ok_calls)), (1, 1))
+
+    async def test_put_stores_precomputed_vector(self):
+        cache = EmbeddingCache()
+        self.assertIsNone(cache.lookup("k"))
+
+        stored = await cache.put("k", [0.25, 0.75], latency=0.2)
+        compute, calls = _counting_compute([9.0])
+        served = await cache.get_or_compute("k", compute)
+
+        self.assertEqual(calls, [])
+        self.assertIs(served, stored)
+        self.assertFalse(stored.flags.writeable)
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual((stats["provider_seconds"], stats["saved_seconds"]), (0.2, 0.2))
+
+    async def test_lru_bound(self):
+        cache = EmbeddingCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_compute(key, _counting_compute([1.0])[0])
+        stats = cache.get_stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (2, 1))
+
+    async def test_sqlite_tier_warm_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "emb.sqlite")
+            compute, calls = _counting_compute([0.5, -0.5])
+            await EmbeddingCache(sqlite_path=path).get_or_compute("k", compute)
+
+            cache = EmbeddingCache(sqlite_path=path)
+            vector = await cache.get_or_compute("k", compute)
+
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(np.array_equal(vector, np.array([0.5, -0.5], dtype=np.float32)))
+            self.assertEqual(cache.get_stats()["disk_hits"], 1)
+            cache._db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
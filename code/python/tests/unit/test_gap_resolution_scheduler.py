@@ -0,0 +1,135 @@
+"""
+Tests for concurrent Stage 5 gap resolution.
+
+A. Steps run concurrently and each provider stays under its concurrency cap
+B. At the time budget slow steps are cancelled and finished calls are kept
+C. Results merge into context/source_map in step order, not completion order
+"""
+
+import sys
+import os
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from reasoning import orchestrator
+from reasoning.orchestrator import DeepResearchOrchestrator
+from reasoning.schemas_enhanced import GapResolutionType
+from reasoning.utils.gap_scheduler import GapResolutionScheduler
+
+
+def _delayed(delays):
+    """fetch(item) that sleeps delays[item] and returns one document for the item."""
+    async def fetch(item):
+        await asyncio.sleep(delays[item])
+        return [{"url": item}]
+    return fetch
+
+
+class TestScheduler(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_under_provider_cap(self):
+        scheduler = GapResolutionScheduler(time_budget=5.0, provider_limits={"twse": 2})
+        in_flight = peak = 0
+
+        async def fetch(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return [{"url": item}]
+
+        scheduler.add("STOCK_TW", scheduler.map("STOCK_TW", "twse", ["a", "b", "c", "d"], fetch))
+        scheduler.add("WIKIPEDIA", scheduler.map("WIKIPEDIA", "wikipedia", ["w"], _delayed({"w": 0.1})))
+
+        started = time.perf_counter()
+        results = await scheduler.run()
+
+        self.assertEqual(peak, 2)
+        self.assertLess(time.perf_counter() - started, 0.18)  # sequential would take 0.2s
+        self.assertEqual([d["url"] for d in results], ["a", "b", "c", "d", "w"])
+        self.assertEqual(scheduler.timed_out, [])
+
+    async def test_deadline_keeps_partial_results(self):
+        scheduler = GapResolutionScheduler(time_budget=0.1)
+        scheduler.add("WEB_SEARCH", scheduler.map("WEB_SEARCH", "web_search", ["fast", "slow"],
+                                                  _delayed({"fast": 0.01, "slow": 10})))
+        scheduler.add("STOCK_GLOBAL", scheduler.map("STOCK_GLOBAL", "yfinance", ["x"], _delayed({"x": 0.01})))
+
+        started = time.perf_counter()
+        results = await scheduler.run()
+
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual([d["url"] for d in results], ["fast", "x"])
+        self.assertEqual(scheduler.timed_out, ["WEB_SEARCH"])
+
+    async def test_failed_call_leaves_empty_slot(self):
+        scheduler = GapResolutionScheduler(time_budget=1.0)
+
+        async def fetch(item):
+            if item == "bad":
+                raise RuntimeError("boom")
+            return [{"url": item}]
+
+        per_item = await scheduler.map("COMPANY_TW", "tw_company", ["bad", "ok"], fetch)
+        self.assertEqual(per_item, [[], [{"url": "ok"}]])
+
+    def test_from_config(self):
+        scheduler = GapResolutionScheduler.from_config({
+            "gap_resolution": {"time_budget": 3.0, "default_max_concurrency": 5},
+            "web_search": {"max_concurrency": 2, "timeout": 3.0},
+            "enrichment_strategy": "parallel",
+        })
+        self.assertEqual(scheduler.time_budget, 3.0)
+        self.assertEqual(scheduler.provider_limits, {"web_search": 2})
+        self.assertEqual(scheduler.default_limit, 5)
+
+
+class TestProcessGapResolutions(unittest.IsolatedAsyncioTestCase):
+
+    def _orchestrator(self):
+        orch = object.__new__(DeepResearchOrchestrator)
+        orch.logger = MagicMock()
+        orch.source_map = {1: {"url": "existing"}}
+        orch._send_progress = AsyncMock()
+        return orch
+
+    async def test_merge_order_is_stable(self):
+        orch = self._orchestrator()
+        gaps = [
+            SimpleNamespace(resolution=GapResolutionType.STOCK_TW, api_params={"symbol": "2330"}, search_query=None),
+            SimpleNamespace(resolution=GapResolutionType.WIKIPEDIA, api_params=None, search_query="台積電"),
+            SimpleNamespace(resolution=GapResolutionType.STOCK_TW, api_params={"symbol": "2317"}, search_query=None),
+        ]
+
+        # Wikipedia answers first and 2330 last; citation IDs must not follow that
+        async def twse_search(symbol, query_id=None):
+            await asyncio.sleep(0.05 if symbol == "2330" else 0.01)
+            return [{"url": f"twse:{symbol}"}]
+
+        twse = MagicMock(is_available=MagicMock(return_value=True))
+        twse.search = twse_search
+        wiki = MagicMock(is_available=MagicMock(return_value=True))
+        wiki.search = AsyncMock(return_value=[{"link": "wiki:台積電", "title": "台積電"}])
+
+        context = [{"url": "existing"}]
+        tier_6 = {"gap_resolution": {"time_budget": 2.0}}
+        with patch("retrieval_providers.twse_client.TwseClient", return_value=twse), \
+             patch("retrieval_providers.wikipedia_client.WikipediaClient", return_value=wiki), \
+             patch.object(orchestrator.CONFIG, "reasoning_params", {"tier_6": tier_6}):
+            await orch._process_gap_resolutions(
+                SimpleNamespace(gap_resolutions=gaps), "discovery", context, enable_web_search=False)
+
+        expected = ["existing", "twse:2330", "twse:2317", "wiki:台積電"]
+        self.assertEqual([d["url"] for d in context], expected)
+        self.assertEqual([orch.source_map[i]["url"] for i in sorted(orch.source_map)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
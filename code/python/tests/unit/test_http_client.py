@@ -0,0 +1,103 @@
+"""
+Tests for the shared pooled HTTP client used by retrieval_providers.
+
+A. Calls reuse one pooled session and record per-provider latency histograms
+B. Retryable statuses are retried; other statuses return without a body or raise
+C. Tier 6 clients fetch through the shared manager
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.http_client import HttpClientManager, HttpStatusError
+from retrieval_providers import twse_client
+from retrieval_providers.twse_client import TwseClient
+
+
+class TestHttpClientManager(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.calls = {"flaky": 0}
+
+        async def ok(request):
+            return web.json_response({"q": request.query.get("q")})
+
+        async def flaky(request):
+            self.calls["flaky"] += 1
+            if self.calls["flaky"] == 1:
+                return web.Response(status=503)
+            return web.json_response({"ok": True})
+
+        async def missing(request):
+            return web.Response(status=404)
+
+        app = web.Application()
+        app.router.add_get("/ok", ok)
+        app.router.add_get("/flaky", flaky)
+        app.router.add_get("/missing", missing)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.manager = HttpClientManager(max_retries=1, retry_backoff=0.01)
+
+    async def asyncTearDown(self):
+        await self.manager.close()
+        await self.server.close()
+
+    async def test_pooled_session_and_histogram(self):
+        url = str(self.server.make_url("/ok"))
+        status, data = await self.manager.get_json("twse", url, params={"q": "2330"})
+        session = self.manager._session
+        await self.manager.get_json("twse", url, params={"q": "2317"})
+
+        self.assertEqual((status, data), (200, {"q": "2330"}))
+        self.assertIs(self.manager._session, session)
+        stats = self.manager.get_stats()["providers"]["twse"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["outcomes"], {"ok": 2})
+        self.assertEqual(sum(stats["latency_histogram"].values()), 2)
+
+    async def test_retry_then_success(self):
+        status, data = await self.manager.get_json("cwb_weather", str(self.server.make_url("/flaky")))
+
+        self.assertEqual((status, data), (200, {"ok": True}))
+        self.assertEqual(self.calls["flaky"], 2)
+        self.assertEqual(self.manager.get_stats()["providers"]["cwb_weather"]["retries"], 1)
+
+    async def test_non_success_status(self):
+        url = str(self.server.make_url("/missing"))
+        self.assertEqual(await self.manager.get_json("openweathermap", url), (404, None))
+        with self.assertRaises(HttpStatusError):
+            await self.manager.get_json("google_search", url, raise_for_status=True)
+
+    async def test_close(self):
+        await self.manager.get_json("twse", str(self.server.make_url("/ok")))
+        session = self.manager._session
+        await self.manager.close()
+        self.assertTrue(session.closed)
+
+
+class TestClientsUseSharedManager(unittest.IsolatedAsyncioTestCase):
+
+    async def test_twse_fetch(self):
+        manager = MagicMock()
+        manager.get_json = AsyncMock(return_value=(200, {"msgArray": [{"n": "台積電", "z": "1000", "y": "990", "v": "100"}]}))
+        client = object.__new__(TwseClient)
+        client._timeout = 3.0
+
+        with patch.object(twse_client, "get_http_client", return_value=manager):
+            result = await client._fetch_from_exchange("2330", twse_client.TWSE_API_URL, "TWSE")
+
+        self.assertEqual(manager.get_json.await_args.args[:2], ("twse", twse_client.TWSE_API_URL))
+        self.assertEqual(result["title"], "[台股-上市] 台積電 (2330)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for the core-provider batch path in indexing/embedding.py.
+
+A. Texts are packed into batches bounded by count and token budget
+B. Results land in one preallocated float32 matrix in input order (0 rows when empty)
+C. 429 responses halve concurrency and the batch is retried
+D. The persistent runner reuses one event loop across calls
+E. OpenRouter keeps one HTTP client per event loop and closes it with the loop
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from indexing import embedding as indexing_embedding
+from indexing.embedding import _AdaptiveLimiter, _pack_batches
+
+_CONFIG = {
+    'concurrency': 4,
+    'batch_size': 3,
+    'token_budget': 1000,
+    'retry_attempts': 3,
+    'retry_delay_ms': 0,
+}
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class TestPackBatches(unittest.TestCase):
+
+    def test_bounded_by_count_and_tokens(self):
+        texts = ["a" * 10] * 7
+        self.assertEqual(_pack_batches(texts, 3, 1000), [(0, 3), (3, 6), (6, 7)])
+        self.assertEqual(_pack_batches(texts, 10, 25), [(0, 2), (2, 4), (4, 6), (6, 7)])
+
+    def test_oversized_text_gets_own_batch(self):
+        self.assertEqual(_pack_batches(["a", "b" * 500, "c"], 10, 100), [(0, 1), (1, 2), (2, 3)])
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+
+    def test_halves_on_throttle_and_recovers(self):
+        limiter = _AdaptiveLimiter(8)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(limiter.limit, 2)
+        for _ in range(2):
+            limiter.on_success()
+        self.assertEqual(limiter.limit, 3)
+
+
+@patch.object(indexing_embedding, '_get_api_config', return_value=_CONFIG)
+class TestEmbedTextsViaCore(unittest.TestCase):
+
+    def test_matrix_in_input_order(self, _):
+        calls = []
+
+        async def fake_batch(texts):
+            calls.append(len(texts))
+            return [[float(t), float(t) * 2] for t in texts]
+
+        texts = [str(i) for i in range(8)]
+        with patch('core.embedding.batch_get_embeddings', side_effect=fake_batch):
+            out = indexing_embedding._embed_texts_via_core(texts)
+
+        self.assertEqual(out.dtype, np.float32)
+        self.assertEqual(out.shape, (8, 2))
+        np.testing.assert_array_equal(out[:, 0], np.arange(8, dtype=np.float32))
+        self.assertEqual(sorted(calls), [2, 3, 3])
+
+    def test_empty_input_returns_empty_matrix(self, _):
+        with patch('core.embedding.batch_get_embeddings') as batch, \
+             patch.object(indexing_embedding, 'get_embedding_dimension', return_value=4):
+            out = indexing_embedding._embed_texts_via_core([])
+
+        batch.assert_not_called()
+        self.assertEqual(out.dtype, np.float32)
+        self.assertEqual(out.shape, (0, 4))
+
+    def test_rate_limit_retried_with_lower_concurrency(self, _):
+        attempts = []
+
+        async def flaky_batch(texts):
+            attempts.append(texts[0])
+            if len(attempts) == 1:
+                raise RateLimited("429 Too Many Requests")
+            return [[1.0]] * len(texts)
+
+        with patch('core.embedding.batch_get_embeddings', side_effect=flaky_batch), \
+             patch.object(_AdaptiveLimiter, 'on_throttle', autospec=True,
+                          side_effect=_AdaptiveLimiter.on_throttle) as throttle:
+            out = indexing_embedding._embed_texts_via_core(["x", "y"])
+
+        self.assertEqual(out.shape, (2, 1))
+        self.assertEqual(len(attempts), 2)
+        throttle.assert_called_once()
+
+    def test_runner_reuses_event_loop(self, _):
+        import asyncio
+
+        loops = []
+
+        async def fake_batch(texts):
+            loops.append(asyncio.get_running_loop())
+            return [[0.0]] * len(texts)
+
+        with patch('core.embedding.batch_get_embeddings', side_effect=fake_batch):
+            indexing_embedding._embed_texts_via_core(["a"])
+            indexing_embedding._embed_texts_via_core(["b"])
+
+        self.assertIs(loops[0], loops[1])
+
+
+class TestOpenRouterClient(unittest.TestCase):
+
+    def test_client_reused_per_loop_and_closed_at_shutdown(self):
+        import asyncio
+        from embedding_providers import openrouter_embedding
+
+        async def two_lookups():
+            first = await openrouter_embedding._get_client()
+            second = await openrouter_embedding._get_client()
+            self.assertIs(first, second)
+            self.assertFalse(first.is_closed)
+            return first
+
+        client_a = asyncio.run(two_lookups())
+        client_b = asyncio.run(two_lookups())
+
+        self.assertIsNot(client_a, client_b)
+        self.assertTrue(client_a.is_closed)
+        self.assertTrue(client_b.is_closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Tests for the append-only pipeline checkpoint.
+
+A. Saves append to the log and rewrite only the small header; reload restores state
+B. Log bytes past the header's log_size or a torn last line are ignored; compaction keeps only needed
+   entries in a new log generation that the header switches to
+C. process_tsv_resumable seeks to the byte offset on resume and converts legacy checkpoints
+"""
+
+import sys
+import os
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from indexing.checkpoint_log import PipelineCheckpoint, url_key
+from indexing.pipeline import IndexingPipeline
+
+
+def _url(i: int) -> str:
+    return f"https://www.cna.com.tw/news/{i}"
+
+
+class TestPipelineCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "cp.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_appends_and_reload(self):
+        cp = PipelineCheckpoint.open(self.path, "a.tsv")
+        cp.mark_processed(_url(0), 0)
+        cp.mark_failed(_url(1), 1, "bad\tdate\n")
+        cp.save(2, 120)
+        log_after_first = cp.log_path.stat().st_size
+
+        cp.mark_processed(_url(2), 2)
+        cp.save(3, 180)
+        self.assertEqual(cp.log_path.read_text(encoding='utf-8').count('\n'), 3)
+        self.assertGreater(cp.log_path.stat().st_size, log_after_first)
+
+        header = json.loads(self.path.read_text(encoding='utf-8'))
+        self.assertNotIn('processed_urls', header)
+        self.assertEqual((header['line_num'], header['byte_offset']), (3, 180))
+
+        loaded = PipelineCheckpoint.open(self.path, "a.tsv")
+        self.assertTrue(loaded.is_processed(_url(0)))
+        self.assertTrue(loaded.is_processed(_url(2)))
+        self.assertFalse(loaded.is_processed(_url(1)))
+        self.assertEqual(loaded.failed_count, 1)
+        self.assertEqual(loaded._failed[url_key(_url(1))], (1, "bad\tdate\n"))
+        self.assertEqual((loaded.line_num, loaded.byte_offset), (3, 180))
+
+    def test_torn_log_tail_ignored(self):
+        cp = PipelineCheckpoint.open(self.path, "a.tsv")
+        cp.mark_processed(_url(0), 0)
+        cp.save(1, 60)
+        with open(cp.log_path, 'a', encoding='utf-8') as f:
+            f.write(f"P\t1\t{url_key(_url(1))}\nP\t2\t12")
+
+        loaded = PipelineCheckpoint.open(self.path, "a.tsv")
+        self.assertTrue(loaded.is_processed(_url(0)))
+        self.assertFalse(loaded.is_processed(_url(1)))
+        self.assertEqual(cp.log_path.read_text(encoding='utf-8').count('\n'), 1)
+
+    def test_compaction_drops_entries_before_resume_line(self):
+        cp = PipelineCheckpoint.open(self.path, "a.tsv", compact_threshold=5)
+        for i in range(5):
+            cp.mark_processed(_url(i), i)
+        cp.mark_processed(_url(7), 7)  # Finished ahead of the resume line
+        cp.mark_failed(_url(2), 2, "boom")
+        cp.save(5, 300)
+
+        entries = cp.log_path.read_text(encoding='utf-8').splitlines()
+        self.assertEqual(sorted(e[0] for e in entries), ['F', 'P'])
+
+        loaded = PipelineCheckpoint.open(self.path, "a.tsv")
+        self.assertTrue(loaded.is_processed(_url(7)))
+        self.assertFalse(loaded.is_processed(_url(0)))
+        self.assertEqual(loaded.failed_count, 1)
+
+    def test_compaction_switches_log_generation(self):
+        cp = PipelineCheckpoint.open(self.path, "a.tsv", compact_threshold=3)
+        for i in range(3):
+            cp.mark_processed(_url(i), i)
+        cp.save(2, 120)
+
+        first_log = self.path.with_name("cp.json.log")
+        self.assertEqual(cp.log_path.name, "cp.json.log.1")
+        self.assertFalse(first_log.exists())
+        header = json.loads(self.path.read_text(encoding='utf-8'))
+        self.assertEqual(header['log_generation'], 1)
+        self.assertEqual(header['log_size'], cp.log_path.stat().st_size)
+
+        # Crash after writing generation 2 but before the header switched to it
+        self.path.with_name("cp.json.log.2").write_text("P\t9\tdeadbeef\n", encoding='utf-8')
+        loaded = PipelineCheckpoint.open(self.path, "a.tsv")
+        self.assertTrue(loaded.is_processed(_url(2)))
+        self.assertFalse(loaded.is_processed(_url(0)))
+        self.assertNotIn("deadbeef", loaded._processed)
+        self.assertFalse(self.path.with_name("cp.json.log.2").exists())
+
+    def test_partial_and_unreadable_entries_skipped(self):
+        cp = PipelineCheckpoint.open(self.path, "a.tsv")
+        cp.mark_processed(_url(0), 0)
+        cp.save(1, 60)
+        # Header covering a garbled entry and a torn last line
+        with open(cp.log_path, 'ab') as f:
+            f.write(f"P\tx\t{url_key(_url(1))}\nP\t2\t{url_key(_url(2))}\nP\t3\t12".encode('utf-8'))
+        header = json.loads(self.path.read_text(encoding='utf-8'))
+        header['log_size'] = cp.log_path.stat().st_size
+        self.path.write_text(json.dumps(header), encoding='utf-8')
+
+        loaded = PipelineCheckpoint.open(self.path, "a.tsv")
+        self.assertTrue(loaded.is_processed(_url(0)))
+        self.assertFalse(loaded.is_processed(_url(1)))
+        self.assertTrue(loaded.is_processed(_url(2)))
+        self.assertEqual(loaded.processed_count, 2)
+        self.assertTrue(cp.log_path.read_bytes().endswith(b"\n"))
+
+    def test_delete_removes_log(self):
+        cp = PipelineCheckpoint.open(self.path, "a.tsv")
+        cp.mark_processed(_url(0), 0)
+        cp.save(1, 60)
+        cp.delete()
+        self.assertFalse(self.path.exists())
+        self.assertFalse(cp.log_path.exists())
+
+
+class TestResumableOffsets(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.tsv = self.dir / "articles.tsv"
+        with open(self.tsv, 'w', encoding='utf-8') as f:
+            for i in range(6):
+                f.write(f"{_url(i)}\t{{\"headline\": \"新聞 {i}\"}}\n")
+        self.checkpoint_file = self.dir / "cp.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, pipeline):
+        seen = []
+
+        def process(cdm, site_override):
+            seen.append(cdm.url)
+            return 1
+
+        with patch.object(pipeline, '_process_article', side_effect=process):
+            pipeline.process_tsv_resumable(self.tsv, checkpoint_file=self.checkpoint_file)
+        return seen
+
+    def _pipeline(self):
+        pipeline = IndexingPipeline.__new__(IndexingPipeline)
+        pipeline.ingestion = MagicMock()
+        pipeline.ingestion.parse_tsv_line.side_effect = lambda line: MagicMock(url=line.split('\t')[0])
+        pipeline.upload_to_qdrant = False
+        pipeline._chunk_buffer = []
+        pipeline.checkpoint = None
+        pipeline.checkpoint_interval = 2
+        pipeline.checkpoint_compact_threshold = 10000
+        pipeline._flush_qdrant_buffer = MagicMock(return_value=0)
+        return pipeline
+
+    def test_resume_seeks_to_offset(self):
+        lines = self.tsv.read_bytes().splitlines(keepends=True)
+        cp = PipelineCheckpoint.open(self.checkpoint_file, str(self.tsv))
+        cp.mark_processed(_url(4), 4)
+        cp.save(3, sum(len(l) for l in lines[:3]))
+
+        seen = self._run(self._pipeline())
+        self.assertEqual(seen, [_url(3), _url(5)])
+        self.assertFalse(self.checkpoint_file.exists())
+
+    def test_legacy_checkpoint_resumes_by_line(self):
+        self.checkpoint_file.write_text(json.dumps({
+            'tsv_path': str(self.tsv),
+            'processed_urls': [_url(0), _url(1), _url(3)],
+            'failed_urls': {},
+            'last_processed_line': 2,
+        }), encoding='utf-8')
+
+        seen = self._run(self._pipeline())
+        self.assertEqual(seen, [_url(2), _url(4), _url(5)])
+
+    def test_mismatched_offset_falls_back_to_line_scan(self):
+        cp = PipelineCheckpoint.open(self.checkpoint_file, str(self.tsv))
+        cp.save(4, 7)  # Not a line boundary
+
+        seen = self._run(self._pipeline())
+        self.assertEqual(seen, [_url(4), _url(5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
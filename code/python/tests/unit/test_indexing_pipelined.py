@@ -0,0 +1,169 @@
+"""
+Tests for the pipelined (staged) indexing mode.
+
+A. Stages apply backpressure through bounded queues and batch by weight
+B. Every article reaches the vault and the vector store; stage stats are reported
+C. After an upload failure the checkpoint covers only uploaded articles, so resume completes the rest
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from indexing.checkpoint_log import PipelineCheckpoint
+from indexing.dual_storage import VaultConfig, VaultStorage
+from indexing.pipeline import IndexingPipeline
+from indexing.pipeline_stages import Stage, StageRunner
+
+BODY = "臺灣半導體產業持續擴張，晶圓代工龍頭宣布在高雄興建新廠，預計帶動上下游供應鏈投資。" * 6
+
+
+def _write_tsv(path: Path, count: int) -> list[str]:
+    urls = []
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            url = f"https://www.cna.com.tw/news/{i}"
+            doc = {
+                "@type": "NewsArticle",
+                "headline": f"新聞標題 {i}",
+                "articleBody": f"第{i}篇。" + BODY,
+                "datePublished": "2026-10-01T08:00:00",
+            }
+            f.write(f"{url}\t{json.dumps(doc, ensure_ascii=False)}\n")
+            urls.append(url)
+    return urls
+
+
+class _FakeQdrant:
+    """Records upserted article URLs; optionally fails on the Nth upsert."""
+
+    def __init__(self, fail_on_call=None):
+        self.fail_on_call = fail_on_call
+        self.calls = 0
+        self.urls = set()
+        self._lock = threading.Lock()
+
+    def embed_chunks(self, chunks):
+        return np.zeros((len(chunks), 4), dtype=np.float32)
+
+    def upsert_embedded(self, chunks, embeddings, site, payloads=None):
+        assert len(chunks) == len(embeddings) == len(payloads)
+        with self._lock:
+            self.calls += 1
+            if self.calls == self.fail_on_call:
+                raise ConnectionError("qdrant unavailable")
+            self.urls.update(c.article_url for c in chunks)
+        return len(chunks)
+
+
+class TestStageRunner(unittest.TestCase):
+
+    def test_backpressure_and_weighted_batches(self):
+        batches = []
+
+        def slow_sink(items):
+            batches.append(list(items))
+            time.sleep(0.01)
+            return []
+
+        runner = StageRunner([
+            Stage('produce', lambda items: items, queue_size=1),
+            Stage('sink', slow_sink, queue_size=1, batch_limit=4, weight=len),
+        ])
+        runner.start()
+        for i in range(20):
+            runner.submit([i, i])  # weight 2 each → at most 2 per sink batch
+        runner.finish()
+
+        stats = runner.get_stats()
+        self.assertEqual(stats['sink']['items'], 20)
+        self.assertTrue(all(len(b) <= 2 for b in batches))
+        self.assertLessEqual(stats['sink']['max_queue_depth'], 1)
+        self.assertGreater(stats['produce']['blocked_seconds'], 0)
+
+    def test_stage_error_aborts(self):
+        def boom(items):
+            raise RuntimeError("stage failed")
+
+        runner = StageRunner([Stage('a', lambda items: items), Stage('b', boom)])
+        runner.start()
+        for i in range(5):
+            if not runner.submit(i):
+                break
+        with self.assertRaises(RuntimeError):
+            runner.finish()
+
+
+@patch.object(IndexingPipeline, '_truncate_buffer_file')
+class TestPipelinedIndexing(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.tsv = self.dir / "articles.tsv"
+        self.urls = _write_tsv(self.tsv, 30)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _pipeline(self, qdrant):
+        vault = VaultStorage(VaultConfig(db_path=self.dir / "vault.db"))
+        pipeline = IndexingPipeline(vault=vault)
+        pipeline.upload_to_qdrant = True
+        pipeline.qdrant = qdrant
+        pipeline.batch_size = 8
+        pipeline.checkpoint_interval = 3
+        pipeline.stage_config = {'prepare_workers': 3, 'queue_size': 2}
+        return pipeline
+
+    def _vault_urls(self, pipeline):
+        conn = pipeline.vault._get_connection()
+        return {row[0] for row in conn.execute("SELECT DISTINCT article_url FROM article_chunks")}
+
+    def test_all_articles_flow_through_stages(self, _truncate):
+        qdrant = _FakeQdrant()
+        pipeline = self._pipeline(qdrant)
+        result = pipeline.process_tsv_pipelined(self.tsv)
+
+        self.assertEqual(result.success, 30)
+        self.assertEqual(qdrant.urls, set(self.urls))
+        self.assertEqual(self._vault_urls(pipeline), set(self.urls))
+        self.assertEqual(list(result.stage_stats), ['prepare', 'vault', 'embed', 'upload'])
+        self.assertEqual(result.stage_stats['upload']['items'], 30)
+        self.assertFalse(Path(f"{self.tsv}.checkpoint.json").exists())
+        pipeline.vault.close()
+
+    def test_resume_after_upload_failure(self, _truncate):
+        checkpoint_file = self.dir / "cp.json"
+        first = _FakeQdrant(fail_on_call=3)
+        pipeline = self._pipeline(first)
+        with self.assertRaises(ConnectionError):
+            pipeline.process_tsv_pipelined(self.tsv, checkpoint_file=checkpoint_file)
+
+        saved = PipelineCheckpoint.open(checkpoint_file, str(self.tsv))
+        self.assertTrue({url for url in self.urls if saved.is_processed(url)} <= first.urls)
+        for url in self.urls[:saved.line_num]:
+            self.assertIn(url, first.urls)
+
+        second = _FakeQdrant()
+        pipeline.qdrant = second
+        result = pipeline.process_tsv_pipelined(self.tsv, checkpoint_file=checkpoint_file)
+
+        self.assertEqual(first.urls | second.urls, set(self.urls))
+        self.assertEqual(result.success + result.skipped, 30 - saved.line_num)
+        pipeline.vault.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Tests for the content-addressed ask_llm response cache (core/llm_cache.py).
+
+A. Keys differ by provider, model, prompt and schema; schema key order is irrelevant
+B. Hits return a fresh copy, so callers mutating the response can't corrupt the cache
+C. Concurrent identical requests collapse into one upstream call
+D. None results (timeouts / provider errors) are not cached
+E. Expired entries and LRU overflow are evicted
+F. The SQLite tier serves hits to a fresh process-level instance
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.llm_cache import LLMResponseCache
+
+
+def _counting_fetch(result, delay=0.0):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        return result
+
+    return fetch, calls
+
+
+class TestKeys(unittest.TestCase):
+
+    def test_key_components(self):
+        base = LLMResponseCache.make_key("openai", "gpt-4o-mini", "p", {"a": 1, "b": 2}, 512)
+        self.assertEqual(base, LLMResponseCache.make_key("openai", "gpt-4o-mini", "p", {"b": 2, "a": 1}, 512))
+        self.assertNotEqual(base, LLMResponseCache.make_key("azure_openai", "gpt-4o-mini", "p", {"a": 1, "b": 2}, 512))
+        self.assertNotEqual(base, LLMResponseCache.make_key("openai", "gpt-5.1", "p", {"a": 1, "b": 2}, 512))
+        self.assertNotEqual(base, LLMResponseCache.make_key("openai", "gpt-4o-mini", "q", {"a": 1, "b": 2}, 512))
+        self.assertNotEqual(base, LLMResponseCache.make_key("openai", "gpt-4o-mini", "p", {"a": 1}, 512))
+
+    def test_ttl_for_site_falls_back_to_default(self):
+        cache = LLMResponseCache(ttl_seconds={"default": 600, "ranking": 60})
+        self.assertEqual(cache.ttl_for("ranking"), 60)
+        self.assertEqual(cache.ttl_for("unknown"), 600)
+
+    def test_unlisted_sites_not_cached_by_default(self):
+        cache = LLMResponseCache(ttl_seconds={"ranking": 300})
+        self.assertEqual(cache.ttl_for("ranking"), 300)
+        self.assertEqual(cache.ttl_for("default"), 0)
+        self.assertEqual(LLMResponseCache().ttl_for("router"), 0)
+
+
+class TestGetOrCall(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hit_returns_independent_copy(self):
+        cache = LLMResponseCache()
+        fetch, calls = _counting_fetch({"score": 80, "description": "颱風"})
+
+        first = await cache.get_or_call("k", 60, fetch)
+        first["score"] = 0
+        second = await cache.get_or_call("k", 60, fetch)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second["score"], 80)
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertGreater(stats["bytes_served"], 0)
+
+    async def test_concurrent_identical_requests_coalesce(self):
+        cache = LLMResponseCache()
+        fetch, calls = _counting_fetch({"score": 42}, delay=0.05)
+
+        results = await asyncio.gather(*[cache.get_or_call("k", 60, fetch) for _ in range(5)])
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r["score"] for r in results], [42] * 5)
+        self.assertEqual(cache.get_stats()["coalesced"], 4)
+
+    async def test_none_result_not_cached(self):
+        cache = LLMResponseCache()
+        fetch, calls = _counting_fetch(None)
+
+        self.assertIsNone(await cache.get_or_call("k", 60, fetch))
+        self.assertIsNone(await cache.get_or_call("k", 60, fetch))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    async def test_expired_entry_refetched(self):
+        cache = LLMResponseCache()
+        fetch, calls = _counting_fetch({"score": 1})
+
+        with patch("core.llm_cache.time.time", return_value=1000.0):
+            await cache.get_or_call("k", 10, fetch)
+        with patch("core.llm_cache.time.time", return_value=1011.0):
+            await cache.get_or_call("k", 10, fetch)
+
+        self.assertEqual(len(calls), 2)
+
+    async def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            fetch, _ = _counting_fetch({"k": key})
+            await cache.get_or_call(key, 60, fetch)
+        # Touch "a" so "b" becomes least recently used
+        await cache.get_or_call("a", 60, _counting_fetch(None)[0])
+        await cache.get_or_call("c", 60, _counting_fetch({"k": "c"})[0])
+
+        fetch_b, calls_b = _counting_fetch({"k": "b"})
+        await cache.get_or_call("b", 60, fetch_b)
+        self.assertEqual(len(calls_b), 1)
+        self.assertGreaterEqual(cache.get_stats()["evictions"], 1)
+
+    async def test_sqlite_tier_survives_new_instance(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "llm_cache.sqlite")
+            fetch, calls = _counting_fetch({"rewritten": "台積電 營收"})
+            await LLMResponseCache(sqlite_path=path).get_or_call("k", 60, fetch)
+
+            cache = LLMResponseCache(sqlite_path=path)
+            result = await cache.get_or_call("k", 60, fetch)
+
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(result["rewritten"], "台積電 營收")
+            self.assertEqual(cache.get_stats()["disk_hits"], 1)
+            cache._db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
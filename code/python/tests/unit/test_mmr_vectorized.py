@@ -0,0 +1,113 @@
+"""
+Tests for vectorized MMR selection.
+
+A. rerank() selects the same items with the same MMR scores as the scalar selection loop
+B. Diversity metrics passed to the mmr_metrics log match the scalar computation
+C. rerank_batch() equals rerank() for each λ, including fallbacks and non-vector fill
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.mmr import MMRReranker
+
+
+def _scalar_select(sim_matrix, scores, lambda_param, top_k):
+    """Selection loop of the previous rerank(), kept as the reference."""
+    max_score, min_score = max(scores), min(scores)
+    score_range = max_score - min_score if max_score != min_score else 1.0
+    selected, mmr_scores = [0], [(scores[0] - min_score) / score_range]
+    for _ in range(1, min(top_k, len(scores))):
+        best_mmr_score, best_idx = -float('inf'), None
+        for idx in range(len(scores)):
+            if idx in selected:
+                continue
+            relevance = (scores[idx] - min_score) / score_range
+            max_similarity = 0.0
+            for sel_idx in selected:
+                similarity = float(sim_matrix[idx, sel_idx])
+                if similarity > max_similarity:
+                    max_similarity = similarity
+            mmr_score = lambda_param * relevance - (1 - lambda_param) * max_similarity
+            if mmr_score > best_mmr_score:
+                best_mmr_score, best_idx = mmr_score, idx
+        selected.append(best_idx)
+        mmr_scores.append(best_mmr_score)
+    return selected, mmr_scores
+
+
+def _results(rng, n, dim=8, duplicates=0):
+    vectors = rng.normal(size=(n, dim)).astype(np.float32)
+    # Near-identical vectors and tied scores exercise tie-breaking
+    vectors[1:1 + duplicates] = vectors[0]
+    scores = sorted((int(s) for s in rng.integers(40, 95, size=n)), reverse=True)
+    return [
+        {'name': f"doc {i}", 'url': f"u{i}", 'ranking': {'score': scores[i]}, 'vector': vectors[i]}
+        for i in range(n)
+    ]
+
+
+class TestVectorizedMMR(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(MMRReranker, '_log_diversity_metrics')
+        self.log_metrics = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_scalar_selection(self):
+        rng = np.random.default_rng(11)
+        for n, top_k, lam, dup in [(30, 10, 0.7, 0), (50, 20, 0.5, 5), (12, 12, 0.0, 3), (8, 25, 1.0, 2)]:
+            results = _results(rng, n, duplicates=dup)
+            reranker = MMRReranker(lambda_param=lam)
+            reranked, mmr_scores = reranker.rerank(results, top_k=top_k)
+
+            sim = reranker._precompute_similarity_matrix([r['vector'] for r in results])
+            expected, expected_scores = _scalar_select(sim, [r['ranking']['score'] for r in results], lam, top_k)
+            self.assertEqual([r['url'] for r in reranked], [f"u{i}" for i in expected])
+            self.assertEqual(mmr_scores, expected_scores)
+            self.assertTrue(all(isinstance(s, float) for s in mmr_scores))
+
+    def test_diversity_metrics_match(self):
+        results = _results(np.random.default_rng(5), 20, duplicates=4)
+        reranker = MMRReranker(lambda_param=0.6)
+        reranked, _ = reranker.rerank(results, top_k=6)
+
+        sim = reranker._precompute_similarity_matrix([r['vector'] for r in results])
+        selected = [int(r['url'][1:]) for r in reranked]
+        orig = [float(sim[i, j]) for i in range(6) for j in range(i + 1, 6)]
+        chosen = [float(sim[selected[i], selected[j]]) for i in range(6) for j in range(i + 1, 6)]
+
+        avg_orig, avg_mmr, reduction = self.log_metrics.call_args[0]
+        self.assertEqual(avg_orig, np.mean(orig))
+        self.assertEqual(avg_mmr, np.mean(chosen))
+        self.assertEqual(reduction, np.mean(orig) - np.mean(chosen))
+
+    def test_batch_matches_single(self):
+        results = _results(np.random.default_rng(2), 40, duplicates=3)
+        results += [{'name': 'no vec', 'url': 'nv', 'ranking': {'score': 10}, 'vector': None}]
+        lambdas = [0.3, 0.5, 0.7, 0.8]
+
+        batch = MMRReranker().rerank_batch(results, lambdas, top_k=45)
+        self.assertEqual(len(batch), len(lambdas))
+        for lam, (reranked, mmr_scores) in zip(lambdas, batch):
+            single, single_scores = MMRReranker(lambda_param=lam).rerank(results, top_k=45)
+            self.assertEqual([r['url'] for r in reranked], [r['url'] for r in single])
+            self.assertEqual(mmr_scores, single_scores)
+        self.assertEqual(batch[0][0][-1]['url'], 'nv')
+
+    def test_batch_fallback(self):
+        results = _results(np.random.default_rng(1), 3)
+        batch = MMRReranker().rerank_batch(results, [0.5, 0.8], top_k=2)
+        self.assertEqual([[r['url'] for r in b[0]] for b in batch], [['u0', 'u1'], ['u0', 'u1']])
+        self.assertEqual(MMRReranker().rerank_batch(results, []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
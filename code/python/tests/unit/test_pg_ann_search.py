@@ -0,0 +1,106 @@
+"""
+Tests for tunable ANN search in PgVectorClient.
+
+A. ann_settings() resolves profiles, per-request overrides and the ef_search >= LIMIT floor
+B. Iterative scan settings are only emitted for pgvector >= 0.8; IVFFlat follows the configured mode
+C. search() applies settings transaction-locally and keeps the threshold out of the ANN subquery
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from retrieval_providers import postgres_client
+from retrieval_providers.postgres_client import PgVectorClient, ann_settings, parse_pgvector_version
+
+_ANN_PARAMS = {
+    'profile': 'balanced',
+    'profiles': {
+        'fast': {'probes': 20, 'ef_search': 40},
+        'balanced': {'probes': 50, 'ef_search': 100},
+    },
+    'iterative_scan': 'relaxed_order',
+    'max_scan_tuples': 20000,
+    'max_probes': 200,
+}
+
+
+@patch.object(postgres_client.CONFIG, 'ann_params', _ANN_PARAMS, create=True)
+class TestAnnSettings(unittest.TestCase):
+
+    def test_default_profile(self):
+        settings = dict(ann_settings(10))
+        self.assertEqual(settings, {'ivfflat.probes': '50', 'hnsw.ef_search': '100'})
+
+    def test_profile_and_overrides(self):
+        self.assertEqual(dict(ann_settings(10, ann_profile='fast'))['ivfflat.probes'], '20')
+        settings = dict(ann_settings(10, ann_profile='fast', ef_search=300, probes=80))
+        self.assertEqual((settings['hnsw.ef_search'], settings['ivfflat.probes']), ('300', '80'))
+
+    def test_ef_search_not_below_limit(self):
+        self.assertEqual(dict(ann_settings(150, ann_profile='fast'))['hnsw.ef_search'], '150')
+        self.assertEqual(dict(ann_settings(5000))['hnsw.ef_search'], '1000')
+
+    def test_iterative_scan_requires_pgvector_0_8(self):
+        self.assertNotIn('hnsw.iterative_scan', dict(ann_settings(10, parse_pgvector_version('0.7.4'))))
+        settings = dict(ann_settings(10, parse_pgvector_version('0.8.0')))
+        self.assertEqual(settings['hnsw.iterative_scan'], 'relaxed_order')
+        self.assertEqual(settings['ivfflat.max_probes'], '200')
+
+    def test_iterative_scan_mode_per_index_type(self):
+        for configured, ivfflat in (('relaxed_order', 'relaxed_order'), ('strict_order', 'relaxed_order'),
+                                    ('off', 'off')):
+            with patch.dict(_ANN_PARAMS, {'iterative_scan': configured}):
+                settings = dict(ann_settings(10, (0, 8, 0)))
+            self.assertEqual(settings['hnsw.iterative_scan'], configured)
+            self.assertEqual(settings['ivfflat.iterative_scan'], ivfflat)
+
+    def test_parse_version(self):
+        self.assertEqual(parse_pgvector_version('0.8.0'), (0, 8, 0))
+        self.assertIsNone(parse_pgvector_version(None))
+
+
+@patch.object(postgres_client.CONFIG, 'ann_params', _ANN_PARAMS, create=True)
+class TestSearchSql(unittest.IsolatedAsyncioTestCase):
+
+    async def test_settings_local_and_threshold_outside_subquery(self):
+        client = object.__new__(PgVectorClient)
+        client._pgvector_version = (0, 8, 0)
+
+        cur = MagicMock()
+        cur.execute = AsyncMock()
+        cur.fetchall = AsyncMock(return_value=[])
+        cur.__aenter__ = AsyncMock(return_value=cur)
+        cur.__aexit__ = AsyncMock(return_value=False)
+        conn = MagicMock()
+        conn.cursor.return_value = cur
+
+        async def run(query_func):
+            return await query_func(conn)
+
+        client._execute_with_retry = run
+        with patch.object(postgres_client, 'get_embedding', AsyncMock(return_value=[0.1, 0.2])), \
+             patch.object(postgres_client, 'get_query_logger', MagicMock()):
+            await client.search("颱風", "cna", num_results=20, ann_profile='fast',
+                                filters=[{"field": "datePublished", "operator": "gte", "value": "2026-01-01"}])
+
+        set_sql, set_params = cur.execute.await_args_list[0].args
+        self.assertIn("set_config(%s, %s, true)", set_sql)
+        self.assertEqual(dict(zip(set_params[::2], set_params[1::2]))['hnsw.ef_search'], '40')
+
+        search_sql, search_params = cur.execute.await_args_list[1].args
+        inner, outer = search_sql.split(") ann")
+        self.assertNotIn(">= %s::", inner)
+        self.assertIn("a.source IN (%s)", inner)
+        self.assertIn("a.date_published >= %s", inner)
+        self.assertTrue(outer.lstrip().startswith("WHERE 1 - ann.distance >= %s"))
+        self.assertEqual(search_params[1:3], ["cna", "2026-01-01"])
+        self.assertEqual(search_params[4], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Tests for PostgreSQLUploader's binary COPY bulk loader.
+
+bulk_upload_batch() stages articles and chunks into temp tables with
+COPY ... FROM STDIN (FORMAT BINARY) and merges them with one set-based
+upsert per table. These tests run against a mocked psycopg connection and
+check:
+
+A. In-batch title+source duplicates are aliased to the first article
+B. Duplicated articles are not staged, but their chunks are (last wins)
+C. Embeddings are written as float32 numpy rows (binary pgvector), not text
+D. A failing merge rolls back and reports 0 uploaded articles
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from indexing import postgresql_uploader
+from indexing.chunking_engine import Chunk
+from indexing.ingestion_engine import CanonicalDataModel
+from indexing.postgresql_uploader import PostgreSQLUploader, _dedup_batch_titles
+
+
+def _article(url, title, source="ltn"):
+    return CanonicalDataModel(url=url, headline=title, article_body="body", source_id=source)
+
+
+def _chunks(url, n):
+    return [
+        Chunk(
+            chunk_id=f"{url}::chunk::{i}", article_url=url, chunk_index=i,
+            sentences=[], full_text=f"{url} text {i}", summary="",
+            char_start=0, char_end=0,
+        )
+        for i in range(n)
+    ]
+
+
+class FakeCursor:
+    """Records executed SQL and rows written through COPY."""
+
+    def __init__(self, merge_rows, fail_on=None):
+        self.executed = []
+        self.copies = {}
+        self._merge_rows = merge_rows
+        self._fail_on = fail_on
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self._fail_on and self._fail_on in sql:
+            raise RuntimeError("merge failed")
+        self.executed.append(sql)
+
+    def fetchall(self):
+        return self._merge_rows
+
+    @contextmanager
+    def copy(self, sql):
+        table = sql.split()[1]
+        rows = self.copies.setdefault(table, [])
+        copy = MagicMock()
+        copy.write_row.side_effect = rows.append
+        yield copy
+
+
+def _make_uploader(cursor):
+    uploader = PostgreSQLUploader(connection_string="postgresql://x:y@localhost/db")
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    uploader._conn = conn
+    uploader._connected = True
+    uploader._vector_registered = True
+    return uploader, conn
+
+
+def _fake_embed(texts):
+    return np.arange(len(texts) * 4, dtype=np.float32).reshape(len(texts), 4)
+
+
+class TestDedupBatchTitles(unittest.TestCase):
+
+    def test_same_title_same_source_aliases_to_first(self):
+        rows = [
+            {"title": "颱風", "source": "ltn"},
+            {"title": "颱風", "source": "udn"},
+            {"title": "颱風", "source": "ltn"},
+            {"title": "", "source": "ltn"},
+            {"title": "", "source": "ltn"},
+        ]
+        self.assertEqual(_dedup_batch_titles(rows), {2: 0})
+
+
+@patch.object(postgresql_uploader, "_embed_texts", side_effect=_fake_embed)
+class TestBulkUploadBatch(unittest.TestCase):
+
+    def test_stages_canonical_articles_and_all_chunks(self, _):
+        batch = [
+            (_article("u1", "A"), _chunks("u1", 2)),
+            (_article("u2", "A"), _chunks("u2", 1)),  # title dup of u1
+            (_article("u3", "B"), _chunks("u3", 1)),
+        ]
+        cursor = FakeCursor(merge_rows=[
+            {"idx": 0, "article_id": 10, "title_dedup": False},
+            {"idx": 2, "article_id": 30, "title_dedup": True},
+        ])
+        uploader, conn = _make_uploader(cursor)
+
+        uploaded = uploader.bulk_upload_batch(batch)
+
+        self.assertEqual(uploaded, 3)
+        conn.commit.assert_called_once()
+        staged = cursor.copies["_bulk_articles"]
+        self.assertEqual([r[0] for r in staged], [0, 2])
+
+        chunk_rows = cursor.copies["_bulk_chunks"]
+        self.assertEqual([(r[1], r[2]) for r in chunk_rows], [(10, 0), (10, 1), (10, 0), (30, 0)])
+        # seq increases with batch order so the later duplicate wins the merge
+        self.assertEqual([r[0] for r in chunk_rows], [0, 1, 2, 3])
+
+        stats = uploader.last_bulk_stats
+        self.assertEqual(stats.chunks, 4)
+        self.assertEqual(stats.title_deduped, 2)
+
+    def test_embeddings_copied_as_float32_arrays(self, _):
+        cursor = FakeCursor(merge_rows=[{"idx": 0, "article_id": 1, "title_dedup": False}])
+        uploader, _conn = _make_uploader(cursor)
+
+        uploader.bulk_upload_batch([(_article("u1", "A"), _chunks("u1", 1))])
+
+        emb = cursor.copies["_bulk_chunks"][0][4]
+        self.assertIsInstance(emb, np.ndarray)
+        self.assertEqual(emb.dtype, np.float32)
+
+    def test_merge_failure_rolls_back(self, _):
+        cursor = FakeCursor(merge_rows=[], fail_on="INSERT INTO chunks")
+        uploader, conn = _make_uploader(cursor)
+
+        uploaded = uploader.bulk_upload_batch([(_article("u1", "A"), _chunks("u1", 1))])
+
+        self.assertEqual(uploaded, 0)
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -233,33 +233,33 @@ class TestPostgresClientHasUrlDedup(unittest.TestCase):
 
     def test_search_method_has_url_dedup_logic(self):
         """
-        Inspect postgres_client.py source to verify URL dedup is implemented.
-        This test reads the source file and checks for URL dedup markers.
+        The hybrid SQL keeps one chunk per article (articles.url is unique),
+        the highest fused score.
         """
-        import inspect
-        from retrieval_providers import postgres_client
-        source = inspect.getsource(postgres_client)
+        from retrieval_providers.postgres_client import hybrid_search_sql
+        sql = hybrid_search_sql([])
 
-        # The implementation should group by URL and keep best score
         self.assertIn(
-            'url_best',
-            source,
-            "postgres_client.py must contain 'url_best' dict for URL deduplication"
+            'DISTINCT ON (m.article_id)',
+            sql,
+            "postgres_client.py hybrid SQL must deduplicate per article"
         )
+        self.assertIn('ORDER BY m.article_id, m.score DESC', sql)
 
     def test_search_method_filters_by_cosine_threshold(self):
         """
-        Inspect postgres_client.py source to verify cosine threshold WHERE clause.
+        The cosine threshold is applied to the ANN candidates, outside the
+        ORDER BY distance LIMIT subquery that uses the vector index.
         """
-        import inspect
-        from retrieval_providers import postgres_client
-        source = inspect.getsource(postgres_client)
+        from retrieval_providers.postgres_client import vector_search_sql
+        sql = vector_search_sql()
 
         self.assertIn(
-            '(c.embedding <=> %s::vector) >= %s',
-            source,
+            '1 - ann.distance >= %s',
+            sql,
             "postgres_client.py vector SQL must contain cosine threshold WHERE clause"
         )
+        self.assertGreater(sql.index('1 - ann.distance >= %s'), sql.index('LIMIT %s'))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,125 @@
+"""
+Tests for the single-statement hybrid search in PgVectorClient.
+
+A. hybrid_search_sql() fuses with RRF or weighted scores and dedups per article in SQL
+B. Placeholders line up with the vector + text params search() passes
+C. A ProgrammingError from pg_bigm rolls back and retries vector-only
+D. Rows map to result tuples with the fused score and float32 vectors for every row
+"""
+
+import sys
+import os
+import datetime
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import psycopg
+from pgvector import Vector
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from retrieval_providers import postgres_client
+from retrieval_providers.postgres_client import PgVectorClient, hybrid_search_sql
+
+_HYBRID_PARAMS = {'fusion': 'rrf', 'rrf_k': 60, 'vector_weight': 1.0, 'text_weight': 1.0, 'text_score_min': 0.05}
+
+
+def _placeholders(sql):
+    return sql.replace("%%", "").count("%s")
+
+
+def _mock_conn(rows, fail_first=False):
+    cur = MagicMock()
+    calls = []
+
+    async def execute(sql, params=None, **kwargs):
+        calls.append((sql, params))
+        if fail_first and "likequery" in sql:
+            raise psycopg.errors.UndefinedFunction("function likequery(unknown) does not exist")
+
+    cur.execute = execute
+    cur.fetchall = AsyncMock(return_value=rows)
+    cur.__aenter__ = AsyncMock(return_value=cur)
+    cur.__aexit__ = AsyncMock(return_value=False)
+    conn = MagicMock()
+    conn.cursor.return_value = cur
+    conn.rollback = AsyncMock()
+    return conn, calls
+
+
+class TestHybridSql(unittest.TestCase):
+
+    def test_rrf_and_weighted_fusion(self):
+        rrf = hybrid_search_sql([], rrf_k=60, vector_weight=1.0, text_weight=0.5)
+        self.assertIn("COALESCE(1.0 / (60.0 + v.vector_rank), 0)", rrf)
+        self.assertIn("COALESCE(0.5 / (60.0 + t.text_rank), 0)", rrf)
+
+        weighted = hybrid_search_sql([], fusion="weighted", vector_weight=0.7, text_weight=0.3)
+        self.assertIn("0.7 * COALESCE(v.vector_score, 0) + 0.3 * COALESCE(t.text_score, 0)", weighted)
+
+    def test_metadata_only_joined_after_dedup(self):
+        sql = hybrid_search_sql(["a.source IN (%s)"], include_vectors=True)
+        fused_end = sql.index("SELECT f.chunk_id")
+        self.assertEqual(sql.count("a.metadata"), 1)
+        self.assertGreater(sql.index("a.metadata"), fused_end)
+        self.assertGreater(sql.index("vector_send(c.embedding)"), fused_end)
+
+    def test_placeholders_match_params(self):
+        clauses = ["a.source IN (%s, %s)", "a.date_published >= %s"]
+        # vector: emb, 3 filters, emb, limit, min; text: query, query, 3 filters, limit, min
+        self.assertEqual(_placeholders(hybrid_search_sql(clauses)), 7 + 7)
+        self.assertEqual(_placeholders(hybrid_search_sql(clauses, with_text=False)), 7)
+
+
+@patch.object(postgres_client.CONFIG, 'hybrid_params', _HYBRID_PARAMS, create=True)
+class TestSearch(unittest.IsolatedAsyncioTestCase):
+
+    def _client(self, conn):
+        client = object.__new__(PgVectorClient)
+
+        async def run(query_func):
+            return await query_func(conn)
+
+        client._execute_with_retry = run
+        return client
+
+    async def _search(self, conn, **kwargs):
+        with patch.object(postgres_client, 'get_embedding', AsyncMock(return_value=[0.1, 0.2])):
+            return await self._client(conn).search("颱風 停班", "all", num_results=10, **kwargs)
+
+    async def test_one_statement_and_row_mapping(self):
+        row = {
+            'chunk_id': 7, 'vector_score': 0.0, 'text_score': 0.4, 'score': 0.016,
+            'chunk_text': "颱風來襲", 'url': "https://example.com/a", 'title': "颱風", 'author': None,
+            'source': "cna", 'date_published': datetime.datetime(2026, 1, 2), 'metadata': {},
+            'embedding': Vector([0.5, 0.5]).to_binary(),
+        }
+        conn, calls = _mock_conn([row])
+
+        results = await self._search(conn, include_vectors=True)
+
+        search_calls = [c for c in calls if "WITH vec AS" in c[0]]
+        self.assertEqual(len(search_calls), 1)
+        self.assertEqual(_placeholders(search_calls[0][0]), len(search_calls[0][1]))
+        # Text-only hits now carry their vector for MMR
+        self.assertEqual(results[0][:4], [row['url'], results[0][1], "颱風", "cna"])
+        self.assertEqual(results[0][4].dtype, np.float32)
+        self.assertEqual(results[0][4].tolist(), [0.5, 0.5])
+
+    async def test_text_failure_falls_back_to_vector_only(self):
+        conn, calls = _mock_conn([], fail_first=True)
+
+        self.assertEqual(await self._search(conn), [])
+
+        conn.rollback.assert_awaited_once()
+        last_sql, last_params = calls[-1]
+        self.assertNotIn("likequery", last_sql)
+        self.assertEqual(_placeholders(last_sql), len(last_params))
+        # ANN settings are re-applied in the new transaction
+        self.assertIn("set_config", calls[-2][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for multi-query batched retrieval (search_with_expansion).
+
+A. multi_hybrid_search_sql runs every query variant through LATERAL top-k, partitioned by ordinal
+B. PgVectorClient.search_multi embeds once, runs one statement and splits rows per query
+C. get_query_embeddings serves cache hits and embeds the misses in one batch request
+D. search_with_expansion merges per-query lists by URL, primary first
+"""
+
+import sys
+import os
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core import embedding, retriever
+from core.embedding_cache import EmbeddingCache
+from retrieval_providers import postgres_client
+from retrieval_providers.postgres_client import PgVectorClient, multi_hybrid_search_sql
+
+
+def _row(ord_, url, score):
+    return {
+        "ord": ord_, "chunk_id": 1, "vector_score": 0.8, "text_score": 0.1, "score": score,
+        "chunk_text": "t", "url": url, "title": url, "author": None, "source": "cna",
+        "date_published": datetime(2026, 1, 1, tzinfo=timezone.utc), "metadata": {},
+    }
+
+
+class TestMultiSql(unittest.TestCase):
+
+    def test_lateral_per_query(self):
+        sql = multi_hybrid_search_sql(["a.source IN (%s)"])
+        self.assertIn("unnest(%s::text[], %s::text[], %s::int[]) WITH ORDINALITY", sql)
+        self.assertEqual(sql.count("CROSS JOIN LATERAL"), 2)
+        self.assertIn("LIMIT q.k", sql)
+        self.assertIn("DISTINCT ON (m.ord, m.article_id)", sql)
+        self.assertIn("t.ord = v.ord AND t.chunk_id = v.chunk_id", sql)
+        self.assertEqual(sql.count("%s"), 3 + 2 + 2)
+
+    def test_vector_only(self):
+        sql = multi_hybrid_search_sql([], with_text=False)
+        self.assertNotIn("likequery", sql)
+        self.assertEqual(sql.count("%s"), 4)
+
+
+class TestSearchMulti(unittest.IsolatedAsyncioTestCase):
+
+    async def test_one_statement_split_per_query(self):
+        client = object.__new__(PgVectorClient)
+        client._pgvector_version = None
+
+        cur = MagicMock()
+        cur.execute = AsyncMock()
+        cur.fetchall = AsyncMock(return_value=[
+            _row(1, "https://x/1", 0.03), _row(2, "https://x/2", 0.02), _row(2, "https://x/1", 0.01)])
+        cur.__aenter__ = AsyncMock(return_value=cur)
+        cur.__aexit__ = AsyncMock(return_value=False)
+        conn = MagicMock()
+        conn.cursor.return_value = cur
+
+        async def run(query_func):
+            return await query_func(conn)
+
+        client._execute_with_retry = run
+        get_embeddings = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+        handler = SimpleNamespace(query_id="q1")
+        query_logger = MagicMock()
+        with patch.object(postgres_client, 'get_query_embeddings', get_embeddings), \
+             patch.object(postgres_client, 'get_query_logger', MagicMock(return_value=query_logger)):
+            per_query = await client.search_multi(["颱風", "颱風 路徑"], "cna", [50, 20], handler=handler)
+
+        get_embeddings.assert_awaited_once()
+        self.assertEqual(cur.execute.await_count, 2)  # ANN settings + one search statement
+        search_sql, params = cur.execute.await_args_list[1].args
+        self.assertIn("WITH ORDINALITY", search_sql)
+        self.assertEqual(params[0], ["[0.1,0.2]", "[0.3,0.4]"])
+        self.assertEqual(params[1:4], [["颱風", "颱風 路徑"], [50, 20], "cna"])
+        self.assertEqual([[r[0] for r in rows] for rows in per_query], [["https://x/1"], ["https://x/2", "https://x/1"]])
+        self.assertEqual(query_logger.log_retrieved_document.call_count, 1)
+
+
+class TestQueryEmbeddings(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hits_from_cache_misses_in_one_batch(self):
+        cache = EmbeddingCache(max_entries=10)
+        provider = embedding.CONFIG.preferred_embedding_provider
+        model = embedding.CONFIG.get_embedding_provider(provider).model
+        await cache.get_or_compute(cache.make_key(provider, model, "a"), AsyncMock(return_value=[1.0, 0.0]))
+        batch = AsyncMock(return_value=[[0.0, 1.0], [0.5, 0.5]])
+
+        with patch.object(embedding, 'get_embedding_cache', return_value=cache), \
+             patch.object(embedding, 'batch_get_embeddings', batch):
+            vectors = await embedding.get_query_embeddings(["a", "b", "c", "b"])
+
+        batch.assert_awaited_once()
+        self.assertEqual(batch.await_args.args[0], ["b", "c"])
+        self.assertEqual(vectors, [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5], [0.0, 1.0]])
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 3))
+        self.assertIsNotNone(cache.lookup(cache.make_key(provider, model, "c")))
+
+
+class TestVectorDBClientSearchMulti(unittest.IsolatedAsyncioTestCase):
+
+    async def test_single_endpoint_results_capped_per_query(self):
+        rows = [[f"https://x/{i}", "{}", str(i), "cna"] for i in range(8)]
+        client = MagicMock()
+        client.search_multi = AsyncMock(return_value=[rows, rows])
+        vdb = retriever.VectorDBClient.__new__(retriever.VectorDBClient)
+        vdb.enabled_endpoints = {"postgres": None}
+        vdb.get_client = AsyncMock(return_value=client)
+
+        per_query = await vdb.search_multi(["q", "q2"], "cna", [5, 3])
+
+        self.assertEqual([len(r) for r in per_query], [5, 3])
+
+
+class TestSearchWithExpansion(unittest.IsolatedAsyncioTestCase):
+
+    async def test_merge_primary_first(self):
+        client = MagicMock()
+        client.search_multi = AsyncMock(return_value=[
+            [["https://x/1", "{}", "1", "cna"]],
+            [["https://x/1", "{}", "1b", "cna"], ["https://x/2", "{}", "2", "cna"]],
+        ])
+        with patch.object(retriever, 'get_vector_db_client', return_value=client):
+            merged = await retriever.search_with_expansion("q", ["q2"], "cna", num_results=30, num_per_expansion=10)
+
+        queries, site, limits = client.search_multi.await_args.args
+        self.assertEqual((queries, site, limits), (["q", "q2"], "cna", [30, 10]))
+        self.assertEqual([item[2] for item in merged], ["1", "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
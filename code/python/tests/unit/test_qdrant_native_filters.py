@@ -0,0 +1,149 @@
+"""
+Tests for server-side date/author filtering in QdrantVectorClient.
+
+A. Generic filters split into native Range/MatchValue conditions and post-filters
+B. Dates normalize to the article's own calendar day; date-only "lte" covers the whole day
+C. Collections without the payload indexes fall back to post-filtering
+D. MapPayload carries the normalized date_published/author fields
+E. An empty natively date-filtered search is retried without the date range
+F. Filter indexes are created on new collections or after backfill-filters, never on existing ones
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.qdrant_payload import date_to_epoch, filter_fields_from_schema, split_native_filters
+from indexing.chunking_engine import Chunk
+from indexing import qdrant_uploader
+from indexing.dual_storage import MapPayload
+from retrieval_providers import qdrant
+from retrieval_providers.qdrant import QdrantVectorClient
+
+_DATE_FILTERS = [
+    {"field": "datePublished", "operator": "gte", "value": "2026-01-01"},
+    {"field": "datePublished", "operator": "lte", "value": "2026-01-31"},
+]
+_INDEXED = {"date_published", "author", "site"}
+
+
+class TestNormalization(unittest.TestCase):
+
+    def test_date_keeps_calendar_day(self):
+        self.assertEqual(date_to_epoch("2026-01-01T01:00:00+08:00"), date_to_epoch("2026-01-01") + 3600)
+        self.assertEqual(date_to_epoch("2026-01-01T00:00:00Z"), date_to_epoch("2026-01-01"))
+        self.assertIsNone(date_to_epoch("not a date"))
+
+    def test_split_filters(self):
+        native, remaining = split_native_filters(_DATE_FILTERS + [
+            {"field": "author", "operator": "contains", "value": "王小明"},
+            {"field": "author", "operator": "eq", "value": " Jane Doe "},
+        ])
+        self.assertEqual(native["date_gte"], date_to_epoch("2026-01-01"))
+        self.assertEqual(native["date_lte"], date_to_epoch("2026-02-01") - 1)
+        self.assertEqual(native["author_eq"], "jane doe")
+        self.assertEqual(remaining, [{"field": "author", "operator": "contains", "value": "王小明"}])
+
+    def test_map_payload_fields(self):
+        chunk = Chunk("https://example.com/a::chunk::0", "https://example.com/a", 0, [], "t", "s", 0, 1)
+        payload = MapPayload.from_chunk(chunk, "cna", date_published="2026-01-05T08:00:00+08:00",
+                                        author="記者 王小明").to_dict()
+        self.assertEqual(payload["date_published"], date_to_epoch("2026-01-05T08:00:00"))
+        self.assertEqual(payload["author"], "記者 王小明")
+        self.assertEqual(filter_fields_from_schema("{bad"), {"date_published": None, "author": None})
+
+
+class TestBuildSearchFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.client = object.__new__(QdrantVectorClient)
+
+    def test_native_range_and_site(self):
+        query_filter, remaining, native = self.client._build_search_filter("cna", _DATE_FILTERS, _INDEXED)
+        self.assertEqual(remaining, [])
+        keys = [c.key for c in query_filter.must]
+        self.assertEqual(keys, ["site", "date_published"])
+        self.assertEqual(query_filter.must[1].range.gte, native["date_gte"])
+
+    def test_unindexed_collection_post_filters(self):
+        query_filter, remaining, native = self.client._build_search_filter("all", _DATE_FILTERS, {"site"})
+        self.assertIsNone(query_filter)
+        self.assertEqual(remaining, _DATE_FILTERS)
+        self.assertEqual(native, {})
+
+
+class TestSearchRelaxesDates(unittest.IsolatedAsyncioTestCase):
+
+    async def test_empty_native_date_search_retried_unfiltered(self):
+        client = object.__new__(QdrantVectorClient)
+        client.default_collection_name = "nlweb"
+        client.api_endpoint = None
+        point = SimpleNamespace(score=0.8, vector=None, payload={
+            "url": "https://example.com/a", "name": "a", "site": "cna", "schema_json": "{}"})
+        qdrant_client = MagicMock()
+        qdrant_client.search = AsyncMock(side_effect=[[], [point]])
+        handler = SimpleNamespace()
+
+        with patch.object(qdrant, 'get_embedding', AsyncMock(return_value=[0.1, 0.2])), \
+             patch.object(client, '_get_qdrant_client', AsyncMock(return_value=qdrant_client)), \
+             patch.object(client, 'ensure_collection_exists', AsyncMock(return_value=True)), \
+             patch.object(client, '_get_indexed_fields', AsyncMock(return_value=_INDEXED)):
+            results = await client.search("123", "all", num_results=5, filters=_DATE_FILTERS, handler=handler)
+
+        first, second = qdrant_client.search.await_args_list
+        self.assertEqual(first.kwargs["query_filter"].must[0].key, "date_published")
+        self.assertIsNone(second.kwargs["query_filter"])
+        self.assertTrue(handler.time_filter_relaxed)
+        self.assertEqual(len(results), 1)
+
+
+class TestFilterIndexCreation(unittest.TestCase):
+
+    def _uploader(self, existing):
+        client = MagicMock()
+        client.get_collections.return_value = SimpleNamespace(
+            collections=[SimpleNamespace(name="nlweb")] if existing else [])
+        client.scroll.return_value = ([], None)
+        with patch.object(qdrant_uploader, 'QdrantClient', return_value=client), \
+             patch.object(qdrant_uploader, 'get_embedding_dimension', return_value=4), \
+             patch.object(qdrant_uploader.QdrantUploader, 'rebuild_site_catalog'):
+            qdrant_uploader.QdrantUploader(qdrant_uploader.QdrantConfig(collection_name="nlweb"))
+        return client
+
+    def test_existing_collection_not_indexed_until_backfill(self):
+        client = MagicMock()
+        client.get_collections.return_value = SimpleNamespace(collections=[SimpleNamespace(name="nlweb")])
+        point = SimpleNamespace(id=1, payload={"schema_json": '{"datePublished": "2026-01-05"}'})
+        client.scroll.return_value = ([point], None)
+        with patch.object(qdrant_uploader, 'QdrantClient', return_value=client):
+            uploader = qdrant_uploader.QdrantUploader(qdrant_uploader.QdrantConfig(collection_name="nlweb"))
+        client.create_payload_index.assert_not_called()
+
+        self.assertEqual(uploader.backfill_filter_fields(), 1)
+        calls = [c[0] for c in client.method_calls if c[0] in ("set_payload", "create_payload_index")]
+        self.assertEqual(calls[0], "set_payload")
+        self.assertEqual(calls.count("create_payload_index"), 3)
+
+    def test_new_collection_indexed(self):
+        client = self._uploader(existing=False)
+        self.assertEqual(client.create_payload_index.call_count, 3)
+
+    def test_provider_existing_collection_not_indexed(self):
+        client = object.__new__(QdrantVectorClient)
+        qdrant_client = MagicMock(collection_exists=AsyncMock(return_value=True))
+        with patch.object(client, '_get_qdrant_client', AsyncMock(return_value=qdrant_client)), \
+             patch.object(client, '_ensure_text_indexes', AsyncMock()), \
+             patch.object(client, '_ensure_filter_indexes', AsyncMock()) as ensure_filter:
+            created = asyncio.run(client.create_collection("nlweb"))
+        self.assertFalse(created)
+        ensure_filter.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main()
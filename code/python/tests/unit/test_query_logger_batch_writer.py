@@ -0,0 +1,154 @@
+"""
+Tests for QueryLogger's batched analytics writer.
+
+The worker drains the bounded queue in micro-batches, groups rows by table
+and writes each batch in one transaction on a persistent connection. These
+tests run against a temporary SQLite analytics database and check:
+
+A. Batches are grouped per table, inserts parents-first, updates last
+B. Queued rows land in the DB in few transactions (batches << rows)
+C. Queued updates apply after the inserts they target
+D. A full queue drops rows instead of blocking the caller
+E. A failing table group is isolated; other groups in the batch still commit
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.analytics_db import AnalyticsDB
+from core.query_logger import QueryLogger
+
+
+def _make_logger(tmp_dir, **overrides):
+    env = {k: v for k, v in os.environ.items()
+           if k not in ('POSTGRES_CONNECTION_STRING', 'DATABASE_URL', 'ANALYTICS_DATABASE_URL')}
+    with patch.dict(os.environ, env, clear=True):
+        db = AnalyticsDB(db_path=os.path.join(tmp_dir, "query_logs.db"))
+    logger_cls = type("TunedQueryLogger", (QueryLogger,), overrides)
+    with patch.object(AnalyticsDB, 'get_instance', return_value=db):
+        return logger_cls(), db
+
+
+def _count(db, table):
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestGroupBatch(unittest.TestCase):
+
+    def test_groups_by_table_and_orders_parents_first(self):
+        batch = [
+            {"table": "ranking_scores", "data": {"ranking_position": 0}, "where": {"query_id": "q1"}},
+            {"table": "ranking_scores", "data": {"query_id": "q1", "doc_url": "u1"}},
+            {"table": "retrieved_documents", "data": {"query_id": "q1", "doc_url": "u1"}},
+            {"table": "queries", "data": {"query_id": "q1"}},
+            {"table": "ranking_scores", "data": {"query_id": "q1", "doc_url": "u2"}},
+            {"table": "not_a_table", "data": {"query_id": "q1"}},
+        ]
+        groups = QueryLogger._group_batch(batch)
+
+        self.assertEqual(
+            [(g[0], g[2]) for g in groups],
+            [("queries", ()), ("retrieved_documents", ()), ("ranking_scores", ()),
+             ("ranking_scores", ("query_id",))],
+        )
+        self.assertEqual(groups[2][3], [["q1", "u1"], ["q1", "u2"]])
+        self.assertEqual(groups[3][3], [[0, "q1"]])
+
+
+class TestBatchWriter(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_rows_written_in_batches(self):
+        ql, db = _make_logger(self._tmp.name, FLUSH_INTERVAL=0.5)
+        ql.log_query_start("q1", "user", "颱風 停班", "all", "list")
+        for i in range(60):
+            ql.log_retrieved_document("q1", f"https://example.com/{i}", "t", "d", i)
+        ql.shutdown()
+
+        self.assertEqual(_count(db, "queries"), 1)
+        self.assertEqual(_count(db, "retrieved_documents"), 60)
+        stats = ql.get_writer_stats()
+        self.assertEqual(stats["rows_written"], 61)
+        self.assertLess(stats["batches"], 5)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_updates_applied_after_inserts(self):
+        ql, db = _make_logger(self._tmp.name)
+        ql.is_running = False
+        ql.worker_thread.join(timeout=5)
+        ql.log_query_start("q1", "user", "query", "all", "list")
+        ql.log_ranking_score("q1", "u1", ranking_position=-1)
+        ql.log_ranking_score("q1", "u2", ranking_position=-1)
+        ql.update_ranking_positions("q1", [("u2", 0), ("u1", 1)])
+        ql.log_query_complete("q1", latency_total_ms=120.0, num_results_returned=2)
+
+        batch = []
+        while not ql.log_queue.empty():
+            batch.append(ql.log_queue.get_nowait())
+        ql._write_batch(batch)
+        ql._close_worker_conn()
+
+        conn = sqlite3.connect(str(db.db_path))
+        try:
+            positions = conn.execute(
+                "SELECT doc_url, ranking_position FROM ranking_scores ORDER BY doc_url"
+            ).fetchall()
+            completed = conn.execute(
+                "SELECT latency_total_ms, num_results_returned FROM queries WHERE query_id = 'q1'"
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(positions, [("u1", 1), ("u2", 0)])
+        self.assertEqual(completed, (120.0, 2))
+        self.assertEqual(ql.get_writer_stats()["batches"], 1)
+
+    def test_full_queue_drops_without_blocking(self):
+        ql, _db = _make_logger(self._tmp.name, QUEUE_MAXSIZE=2)
+        ql.is_running = False
+        ql.worker_thread.join(timeout=5)
+
+        for i in range(5):
+            ql.log_retrieved_document("q1", f"u{i}", "t", "d", i)
+
+        self.assertEqual(ql.get_writer_stats()["dropped"], 3)
+        self.assertEqual(ql.log_queue.qsize(), 2)
+
+    def test_failing_group_isolated(self):
+        ql, db = _make_logger(self._tmp.name)
+        ql.is_running = False
+        ql.worker_thread.join(timeout=5)
+
+        batch = [
+            {"table": "queries", "data": {"query_id": "q1", "timestamp": 0.0, "user_id": "user",
+                                          "query_text": "query", "site": "all", "mode": "list"}},
+            {"table": "retrieved_documents", "data": {"query_id": "q1", "doc_url": "u1", "retrieval_position": 0}},
+            # query_text is an allowed column but does not exist on tier_6_enrichment
+            {"table": "tier_6_enrichment", "data": {"query_id": "q1", "query_text": "x"}},
+        ]
+        ql._write_batch(batch)
+        ql._close_worker_conn()
+
+        self.assertEqual(_count(db, "queries"), 1)
+        self.assertEqual(_count(db, "retrieved_documents"), 1)
+        stats = ql.get_writer_stats()
+        self.assertEqual((stats["rows_written"], stats["rows_failed"]), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the maintained site catalog behind get_sites().
+
+A. summarize_sites/merge_site_entry compute per-site counts and widen date ranges
+B. PgVectorClient.get_sites reads site_catalog and falls back to DISTINCT when unmigrated
+C. QdrantVectorClient.get_sites reads the catalog collection, or rebuilds it from one scroll
+D. Deleting a site drops its catalog entry and invalidates the sites cache
+"""
+
+import sys
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import psycopg
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.qdrant_payload import merge_site_entry, site_catalog_collection, summarize_sites
+from retrieval_providers.postgres_client import PgVectorClient
+from retrieval_providers.qdrant import QdrantVectorClient
+
+
+class TestCatalogHelpers(unittest.TestCase):
+
+    def test_summarize_sites(self):
+        summary = summarize_sites([
+            {"site": "cna", "date_published": 200},
+            {"site": "cna", "date_published": 100},
+            {"site": "cna"},
+            {"site": "ltn", "date_published": 50},
+            {"url": "no-site"},
+        ])
+        self.assertEqual(summary, {"cna": (3, 100, 200), "ltn": (1, 50, 50)})
+
+    def test_merge_widens_existing_range(self):
+        existing = {"site": "cna", "doc_count": 2, "first_published": 10, "last_published": 150}
+        entry = merge_site_entry(existing, "cna", 5, 100, 200)
+        self.assertEqual(entry, {"site": "cna", "doc_count": 5, "first_published": 10, "last_published": 200})
+        self.assertIsNone(merge_site_entry(None, "x", 1, None, None)["first_published"])
+
+
+def _pg_client(execute):
+    client = object.__new__(PgVectorClient)
+    client._site_catalog_available = True
+
+    cur = MagicMock()
+    cur.execute = AsyncMock(side_effect=execute)
+    cur.fetchall = AsyncMock(return_value=[("cna", 3, None, None), ("ltn", 1, None, None)])
+    cur.__aenter__ = AsyncMock(return_value=cur)
+    cur.__aexit__ = AsyncMock(return_value=False)
+    conn = MagicMock()
+    conn.cursor.return_value = cur
+    conn.rollback = AsyncMock()
+
+    async def run(query_func):
+        return await query_func(conn)
+
+    client._execute_with_retry = run
+    return client, cur
+
+
+class TestPgSites(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reads_catalog(self):
+        client, cur = _pg_client(None)
+        self.assertEqual(await client.get_sites(), ["cna", "ltn"])
+        self.assertIn("FROM site_catalog", cur.execute.await_args.args[0])
+        self.assertEqual(cur.execute.await_count, 1)
+
+    async def test_falls_back_without_table(self):
+        def execute(sql, *args):
+            if "site_catalog" in sql:
+                raise psycopg.errors.UndefinedTable("relation does not exist")
+
+        client, cur = _pg_client(execute)
+        self.assertEqual(await client.get_sites(), ["cna", "ltn"])
+        self.assertIn("SELECT DISTINCT source", cur.execute.await_args.args[0])
+        self.assertFalse(client._site_catalog_available)
+
+
+def _qdrant_client(existing_collections):
+    client = object.__new__(QdrantVectorClient)
+    client.default_collection_name = "nlweb"
+    client.api_endpoint = None
+    client._sites_cache = ["stale"]
+    client._sites_cache_time = 1.0
+    qdrant_client = MagicMock()
+    qdrant_client.collection_exists = AsyncMock(side_effect=lambda name: name in existing_collections)
+    for method in ("scroll", "delete_collection", "create_collection", "upsert", "count", "delete"):
+        setattr(qdrant_client, method, AsyncMock())
+    client._get_qdrant_client = AsyncMock(return_value=qdrant_client)
+    return client, qdrant_client
+
+
+class TestQdrantSites(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reads_catalog_collection(self):
+        client, qdrant_client = _qdrant_client({"nlweb", site_catalog_collection("nlweb")})
+        qdrant_client.scroll.return_value = (
+            [SimpleNamespace(payload={"site": "ltn", "doc_count": 1}),
+             SimpleNamespace(payload={"site": "cna", "doc_count": 3})], None)
+
+        self.assertEqual(await client.get_sites(), ["cna", "ltn"])
+        self.assertEqual(qdrant_client.scroll.await_args.kwargs["collection_name"], "nlweb__site_catalog")
+
+    async def test_rebuilds_missing_catalog(self):
+        client, qdrant_client = _qdrant_client({"nlweb"})
+        qdrant_client.scroll.return_value = (
+            [SimpleNamespace(payload={"site": "cna", "date_published": 5}),
+             SimpleNamespace(payload={"site": "cna", "date_published": 9})], None)
+
+        self.assertEqual(await client.get_sites(), ["cna"])
+        create_kwargs = qdrant_client.create_collection.await_args.kwargs
+        self.assertEqual(create_kwargs["collection_name"], "nlweb__site_catalog")
+        point = qdrant_client.upsert.await_args.kwargs["points"][0]
+        self.assertEqual(point.payload, {"site": "cna", "doc_count": 2, "first_published": 5, "last_published": 9})
+
+    async def test_delete_site_drops_entry(self):
+        client, qdrant_client = _qdrant_client({"nlweb", site_catalog_collection("nlweb")})
+        qdrant_client.count.return_value = SimpleNamespace(count=3)
+
+        self.assertEqual(await client.delete_documents_by_site("cna"), 3)
+        catalog_delete = qdrant_client.delete.await_args_list[1].kwargs
+        self.assertEqual(catalog_delete["collection_name"], "nlweb__site_catalog")
+        self.assertIsNone(client._sites_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Tests for speculative retrieval in NLWebHandler.prepare.
+
+A. A kept speculation hands its provider flags and buffered analytics to the handler
+B. A discarded speculation cancels the search and drops its analytics
+C. Only first-turn queries speculate; the plan comes from the regex fast path
+D. Speculations searched without the boosts QueryUnderstanding later sets are not kept,
+   unless the backend ignores those boosts
+E. prepare() sends the retrieval count on a hit and cancels the speculation when retrieval raises
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core import baseHandler, speculative_retrieval
+from core.baseHandler import NLWebHandler
+from core.speculative_retrieval import SpeculativeRetrieval
+
+
+def _handler(**attrs):
+    defaults = dict(query_id="q1", site="cna", query_params={}, time_filter_relaxed=False,
+                    author_search_no_results=False)
+    defaults.update(attrs)
+    return SimpleNamespace(**defaults)
+
+
+class TestSpeculativeRetrieval(unittest.IsolatedAsyncioTestCase):
+
+    async def test_take_adopts_flags_and_analytics(self):
+        async def fake_search(query, site, handler=None, **kwargs):
+            handler.time_filter_relaxed = True
+            handler.query_logger.log_retrieved_document(query_id=handler.query_id, doc_url="https://x/1")
+            return [["https://x/1", "{}", "t", "cna"]]
+
+        handler = _handler()
+        query_logger = MagicMock()
+        with patch.object(speculative_retrieval, 'search', fake_search), \
+             patch.object(speculative_retrieval, 'get_query_logger', return_value=query_logger):
+            spec = SpeculativeRetrieval(handler, "颱風", 50, None, True).start()
+            self.assertTrue(spec.matches("颱風", 50, [], True))
+            self.assertFalse(spec.matches("颱風", 100, None, True))
+            results = await spec.take()
+
+        self.assertEqual(results[0][0], "https://x/1")
+        self.assertTrue(handler.time_filter_relaxed)
+        query_logger.log_retrieved_document.assert_called_once_with(query_id="q1", doc_url="https://x/1")
+        self.assertEqual(spec.outcome, "hit")
+        self.assertIsNotNone(spec.search_seconds)
+
+    async def test_cancel_discards(self):
+        started = asyncio.Event()
+
+        async def slow_search(query, site, handler=None, **kwargs):
+            handler.query_logger.log_retrieved_document(query_id=handler.query_id, doc_url="u")
+            started.set()
+            await asyncio.sleep(10)
+
+        with patch.object(speculative_retrieval, 'search', slow_search):
+            spec = SpeculativeRetrieval(_handler(), "q", 50, None, True).start()
+            await started.wait()
+            spec.cancel("blocked")
+            await asyncio.sleep(0)
+
+        self.assertTrue(spec.task.cancelled())
+        self.assertEqual(spec.proxy._retrieval_logs, [])
+        self.assertEqual(spec.outcome, "blocked")
+
+    @patch.object(speculative_retrieval, 'reads_provider_state', return_value=True)
+    def test_boost_state_must_match(self, _reads):
+        handler = _handler()
+        spec = SpeculativeRetrieval(handler, "颱風", 50, None, True)
+        self.assertTrue(spec.matches("颱風", 50, None, True))
+
+        handler.domain_context = {'detected': True, 'boost_keywords': ['颱風假']}
+        self.assertFalse(spec.matches("颱風", 50, None, True))
+
+        handler.domain_context = {'detected': False, 'boost_keywords': []}
+        handler.temporal_range = {'is_temporal': True}
+        self.assertFalse(spec.matches("颱風", 50, None, True))
+
+        handler.temporal_range = {'is_temporal': False}
+        self.assertTrue(spec.matches("颱風", 50, None, True))
+
+    def test_boost_state_ignored_by_stateless_backend(self):
+        handler = _handler(domain_context={'detected': True, 'boost_keywords': ['颱風假']},
+                           temporal_range={'is_temporal': True})
+        spec = SpeculativeRetrieval(handler, "颱風", 50, None, True)
+        client = SimpleNamespace(enabled_endpoints={"postgres": SimpleNamespace(db_type="postgres")})
+        with patch.object(speculative_retrieval, 'get_vector_db_client', return_value=client):
+            self.assertTrue(spec.matches("颱風", 50, None, True))
+            client.enabled_endpoints["qdrant"] = SimpleNamespace(db_type="qdrant")
+            self.assertFalse(spec.matches("颱風", 50, None, True))
+
+
+class _NoOp:
+    def __init__(self, handler):
+        pass
+
+    async def do(self):
+        pass
+
+
+class TestPrepareSpeculation(unittest.IsolatedAsyncioTestCase):
+
+    def _handler(self, speculation):
+        handler = object.__new__(NLWebHandler)
+        handler.query_params = {}
+        handler.query_done = False
+        handler.site = "cna"
+        handler.decontextualized_query = "颱風"
+        handler.free_conversation = False
+        handler.include_private_sources = False
+        handler.pre_checks_done_event = asyncio.Event()
+        handler.retrieval_done_event = asyncio.Event()
+        handler.state = MagicMock()
+        handler.message_sender = MagicMock(send_progress=AsyncMock(), send_message=AsyncMock())
+        handler.decontextualizeQuery = lambda: _NoOp(handler)
+        handler._start_speculative_retrieval = lambda: speculation
+        handler._retrieval_plan = lambda temporal_range, author_search: (50, None)
+        handler._include_vectors = lambda: True
+        handler._report_retrieval_timing = MagicMock()
+        return handler
+
+    async def _prepare(self, handler, send_count=None):
+        with patch.object(baseHandler.query_understanding, 'QueryUnderstanding', _NoOp), \
+             patch.object(baseHandler.router, 'ToolSelector', _NoOp), \
+             patch.object(baseHandler.relevance_detection, 'RelevanceDetection', _NoOp), \
+             patch.object(baseHandler.prompt_guardrails, 'PromptGuardrails', _NoOp), \
+             patch.object(baseHandler.memory, 'Memory', _NoOp), \
+             patch.object(baseHandler, 'site_supports_standard_retrieval', return_value=True), \
+             patch.object(baseHandler, '_send_retrieval_count', send_count or AsyncMock()):
+            await handler.prepare()
+
+    async def test_hit_sends_retrieval_count(self):
+        items = [["https://x/1", "{}", "t", "cna"]]
+        speculation = MagicMock(matches=MagicMock(return_value=True), take=AsyncMock(return_value=items))
+        handler = self._handler(speculation)
+        send_count = AsyncMock()
+        await self._prepare(handler, send_count)
+
+        send_count.assert_awaited_once_with(handler, "颱風", "cna", items, 50)
+        self.assertEqual(handler.final_retrieved_items, items)
+
+    async def test_cancelled_when_retrieval_raises(self):
+        speculation = MagicMock(matches=MagicMock(return_value=True))
+        handler = self._handler(speculation)
+        handler.message_sender.send_progress = AsyncMock(side_effect=RuntimeError("stream closed"))
+
+        with self.assertRaises(RuntimeError):
+            await self._prepare(handler)
+        speculation.cancel.assert_called_once_with("unused")
+
+
+class TestStartSpeculation(unittest.TestCase):
+
+    def _handler(self, query, prev_queries):
+        handler = object.__new__(NLWebHandler)
+        handler.query = query
+        handler.decontextualized_query = ""
+        handler.prev_queries = prev_queries
+        handler.free_conversation = False
+        handler.site = "cna"
+        return handler
+
+    def test_first_turn_uses_regex_plan(self):
+        handler = self._handler("最近7天 颱風", [])
+        with patch.object(SpeculativeRetrieval, 'start', lambda self: self):
+            spec = handler._start_speculative_retrieval()
+
+        self.assertEqual(spec.query, "最近7天 颱風")
+        self.assertEqual(spec.num_results, 100)
+        self.assertEqual([f["operator"] for f in spec.filters], ["gte", "lte"])
+
+    def test_follow_up_does_not_speculate(self):
+        handler = self._handler("那後續呢", ["颱風"])
+        self.assertIsNone(handler._start_speculative_retrieval())
+
+
+if __name__ == '__main__':
+    unittest.main()
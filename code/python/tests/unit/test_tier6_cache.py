@@ -0,0 +1,121 @@
+"""
+Tests for the shared Tier 6 data cache.
+
+A. Fresh hits, O(1) LRU eviction and per-client stats
+B. Stale entries are served while one background fetch refreshes them
+C. Concurrent misses for one key share a single upstream call
+D. The SQLite tier serves entries after a restart
+E. Tier 6 clients read through the shared cache
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core import tier6_cache
+from core.coalescing_cache import SqliteCacheStore
+from core.tier6_cache import Tier6Cache
+from retrieval_providers.twse_client import TwseClient
+
+
+class TestTier6Cache(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hit_and_lru_eviction(self):
+        cache = Tier6Cache("twse", ttl_seconds=60, max_entries=2)
+        for key in ("a", "b"):
+            await cache.get_or_fetch(key, AsyncMock(return_value={"k": key}))
+        value, status = await cache.get_or_fetch("a", AsyncMock())
+        await cache.get_or_fetch("c", AsyncMock(return_value={"k": "c"}))
+
+        self.assertEqual((value, status), ({"k": "a"}, "hit"))
+        self.assertEqual(list(cache._memory), ["a", "c"])  # "b" was least recently used
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 3, 1))
+
+    async def test_empty_results_not_cached(self):
+        cache = Tier6Cache("wikipedia", ttl_seconds=60)
+        fetch = AsyncMock(return_value=[])
+        await cache.get_or_fetch("q", fetch)
+        await cache.get_or_fetch("q", fetch)
+        self.assertEqual(fetch.await_count, 2)
+
+    async def test_stale_while_revalidate(self):
+        cache = Tier6Cache("cwb_weather", ttl_seconds=60, stale_seconds=600)
+        cache._memory["台北"] = ('{"t": "old"}', tier6_cache.time.time() - 120)
+
+        refreshed = asyncio.Event()
+
+        async def fetch():
+            refreshed.set()
+            return {"t": "new"}
+
+        value, status = await cache.get_or_fetch("台北", fetch)
+        self.assertEqual((value, status), ({"t": "old"}, "stale"))
+        await asyncio.wait_for(refreshed.wait(), 1)
+        await asyncio.sleep(0)
+
+        value, status = await cache.get_or_fetch("台北", AsyncMock())
+        self.assertEqual((value, status), ({"t": "new"}, "hit"))
+        self.assertEqual(cache.get_stats()["revalidations"], 1)
+
+    async def test_expired_past_stale_window_is_refetched(self):
+        cache = Tier6Cache("twse", ttl_seconds=60, stale_seconds=60)
+        cache._memory["2330"] = ('{"p": 1}', tier6_cache.time.time() - 500)
+        value, status = await cache.get_or_fetch("2330", AsyncMock(return_value={"p": 2}))
+        self.assertEqual((value, status), ({"p": 2}, "miss"))
+
+    async def test_concurrent_misses_coalesce(self):
+        cache = Tier6Cache("wikidata", ttl_seconds=60)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"name": "TSMC"}
+
+        results = await asyncio.gather(*(cache.get_or_fetch("company:TSMC", fetch) for _ in range(5)))
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(sorted(status for _, status in results), ["coalesced"] * 4 + ["miss"])
+        self.assertTrue(all(value == {"name": "TSMC"} for value, _ in results))
+
+    async def test_sqlite_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tier6.sqlite")
+            first = Tier6Cache("tw_company", ttl_seconds=3600, db=SqliteCacheStore(path, "tier6_cache"))
+            await first.get_or_fetch("台積電", AsyncMock(return_value={"ubn": "22099131"}))
+
+            restarted = Tier6Cache("tw_company", ttl_seconds=3600, db=SqliteCacheStore(path, "tier6_cache"))
+            fetch = AsyncMock()
+            value, status = await restarted.get_or_fetch("台積電", fetch)
+
+        fetch.assert_not_awaited()
+        self.assertEqual((value, status), ({"ubn": "22099131"}, "hit"))
+        self.assertEqual(restarted.get_stats()["disk_hits"], 1)
+
+
+class TestClientUsesSharedCache(unittest.IsolatedAsyncioTestCase):
+
+    async def test_twse_instances_share_cache(self):
+        shared = Tier6Cache("twse", ttl_seconds=300)
+        with patch.object(tier6_cache, "_tier6_caches", {"twse": shared}):
+            first, second = TwseClient(), TwseClient()
+        first._enabled = second._enabled = True
+        first._fetch_stock_data = AsyncMock(return_value={"title": "2330"})
+        second._fetch_stock_data = AsyncMock()
+
+        self.assertEqual(await first.search("2330"), [{"title": "2330"}])
+        self.assertEqual(await second.search("2330"), [{"title": "2330"}])
+        second._fetch_stock_data.assert_not_awaited()
+        self.assertEqual(second.get_cache_stats()["hits"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Tests for Vault dictionary compression and batched reads.
+
+A. Trained source dictionaries apply to new writes (version 3); version 2 rows still decode
+B. get_article_chunks / get_chunks_by_ids decompress in batches, including mixed dictionaries and raw rows
+C. Vaults created before dict_id are migrated; compressors are reused per thread
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from indexing.chunking_engine import Chunk
+from indexing.dual_storage import VaultConfig, VaultStorage, source_of
+
+BODY = "行政院今日召開記者會，說明半導體產業補助方案與人才培育計畫，預計明年起分階段實施。"
+
+
+def _chunk(url: str, index: int, text: str) -> Chunk:
+    return Chunk(
+        chunk_id=f"{url}::chunk::{index}",
+        article_url=url,
+        chunk_index=index,
+        sentences=[text],
+        full_text=text,
+        summary=text[:20],
+        char_start=0,
+        char_end=len(text),
+    )
+
+
+def _articles(domain: str, count: int, start: int = 0) -> list[Chunk]:
+    return [
+        _chunk(f"https://www.{domain}/news/{i}", 0, f"第{i}則。{BODY}記者{i % 7}報導，編號{i * 37}。")
+        for i in range(start, start + count)
+    ]
+
+
+class TestVaultCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "vault.db"
+        self.vault = VaultStorage(VaultConfig(db_path=self.db_path, dict_size=4096, dict_min_samples=50))
+
+    def tearDown(self):
+        self.vault.close()
+        self.tmp.cleanup()
+
+    def _rows(self):
+        conn = self.vault._get_connection()
+        return conn.execute("SELECT chunk_id, version, dict_id FROM article_chunks").fetchall()
+
+    def test_source_of(self):
+        self.assertEqual(source_of("https://www.cna.com.tw/news/1"), "cna.com.tw")
+        self.assertEqual(source_of("https://news.ltn.com.tw/a"), "news.ltn.com.tw")
+
+    def test_dictionary_for_new_writes_and_old_rows_decode(self):
+        old = _articles("cna.com.tw", 120)
+        self.vault.store_chunks(old)
+        self.assertEqual({r[1] for r in self._rows()}, {2})
+
+        dict_id = self.vault.train_dictionary("cna.com.tw")
+        self.assertIsNotNone(dict_id)
+
+        new = _articles("cna.com.tw", 5, start=500)
+        other = _articles("udn.com", 2)
+        self.vault.store_chunks(new + other)
+        versions = {r[0]: (r[1], r[2]) for r in self._rows()}
+        self.assertEqual(versions[new[0].chunk_id], (3, dict_id))
+        self.assertEqual(versions[other[0].chunk_id], (2, None))
+
+        # Fresh instance: dictionaries load from the vault
+        reopened = VaultStorage(VaultConfig(db_path=self.db_path))
+        self.assertEqual(reopened.get_chunk(old[0].chunk_id), old[0].full_text)
+        self.assertEqual(reopened.get_chunk(new[0].chunk_id), new[0].full_text)
+        reopened.close()
+
+    def test_dictionary_shrinks_short_chunks(self):
+        self.vault.store_chunks(_articles("cna.com.tw", 200))
+        before = self.vault.get_compression_stats("cna.com.tw")
+        self.vault.train_dictionary("cna.com.tw")
+        self.assertEqual(self.vault.recompress_source("cna.com.tw"), 200)
+
+        after = self.vault.get_compression_stats("cna.com.tw")
+        self.assertEqual(after['versions'], {3: 200})
+        self.assertLess(after['stored_bytes'], before['stored_bytes'] * 0.7)
+
+    def test_too_few_samples(self):
+        self.vault.store_chunks(_articles("cna.com.tw", 10))
+        self.assertIsNone(self.vault.train_dictionary("cna.com.tw"))
+
+    def test_batched_reads_mixed_rows(self):
+        chunks = _articles("cna.com.tw", 100)
+        self.vault.store_chunks(chunks)
+        self.vault.train_dictionary("cna.com.tw")
+        url = "https://www.cna.com.tw/news/multi"
+        article = [_chunk(url, i, f"段落{i}。{BODY}") for i in range(4)]
+        self.vault.store_chunks(article[:2])
+        self.vault._active_dicts.clear()  # Remaining chunks without dictionary
+        self.vault.store_chunks(article[2:])
+
+        # Raw UTF-8 row (written without zstd)
+        raw = _chunk(url, 4, "未壓縮段落")
+        conn = self.vault._get_connection()
+        conn.execute("""
+            INSERT INTO article_chunks (chunk_id, article_url, chunk_index, full_text_compressed)
+            VALUES (?, ?, ?, ?)
+        """, (raw.chunk_id, url, 4, raw.full_text.encode('utf-8')))
+        conn.commit()
+
+        expected = [c.full_text for c in article] + [raw.full_text]
+        self.assertEqual(self.vault.get_article_chunks(url), expected)
+
+        ids = {c.chunk_id for c in chunks[:30]} | {raw.chunk_id}
+        by_id = {r['chunk_id']: r['full_text'] for r in self.vault.get_chunks_by_ids(ids)}
+        self.assertEqual(by_id[chunks[0].chunk_id], chunks[0].full_text)
+        self.assertEqual(by_id[raw.chunk_id], raw.full_text)
+        self.assertEqual(len(by_id), 31)
+
+    def test_migrates_vault_without_dict_id(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("""
+            CREATE TABLE article_chunks (
+                chunk_id TEXT PRIMARY KEY, article_url TEXT NOT NULL, chunk_index INTEGER NOT NULL,
+                full_text_compressed BLOB NOT NULL, original_length INTEGER, compressed_length INTEGER,
+                version INTEGER DEFAULT 2, is_deleted INTEGER DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP, deleted_at TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO article_chunks (chunk_id, article_url, chunk_index, full_text_compressed) VALUES (?, ?, ?, ?)",
+            ("u::chunk::0", "https://cna.com.tw/u", 0, "舊資料".encode('utf-8')),
+        )
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self.vault.get_chunk("u::chunk::0"), "舊資料")
+        self.vault.store_chunk(_chunk("https://cna.com.tw/v", 0, BODY))
+        self.assertEqual(self.vault.get_chunk("https://cna.com.tw/v::chunk::0"), BODY)
+
+    def test_compressor_reused_per_thread(self):
+        first = self.vault._compressor(3, None)
+        self.assertIs(self.vault._compressor(3, None), first)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.vault._compressor(3, None)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], first)
+
+
+if __name__ == '__main__':
+    unittest.main()
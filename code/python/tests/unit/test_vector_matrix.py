@@ -0,0 +1,78 @@
+"""
+Tests for float32 candidate-vector plumbing from pgvector to MMR.
+
+A. embedding_rows decodes binary pgvector payloads into views of one float32 matrix
+B. Missing embeddings stay None; non-binary values (lists, pgvector objects) are still accepted
+C. MMR gives the same order for matrix rows as for Python float lists
+"""
+
+import sys
+import os
+import unittest
+
+import numpy as np
+from pgvector import Vector
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.mmr import MMRReranker, stack_vectors
+from retrieval_providers.postgres_client import embedding_rows
+
+
+class TestEmbeddingRows(unittest.TestCase):
+
+    def test_binary_payloads_share_one_matrix(self):
+        vectors = [[0.25, -1.5, 3.0], [1.0, 2.0, 4.0], [0.0, 0.5, -0.125]]
+        rows = embedding_rows([Vector(v).to_binary() for v in vectors])
+
+        self.assertTrue(all(r.dtype == np.float32 for r in rows))
+        self.assertEqual([r.tolist() for r in rows], vectors)
+        base = rows[0].base
+        self.assertEqual(base.shape, (3, 3))
+        self.assertTrue(base.flags['C_CONTIGUOUS'])
+        self.assertTrue(all(r.base is base for r in rows))
+
+    def test_none_and_dimension_mismatch(self):
+        rows = embedding_rows([None, Vector([1.0, 2.0]).to_binary(), None])
+        self.assertIsNone(rows[0])
+        self.assertEqual(rows[1].tolist(), [1.0, 2.0])
+        self.assertEqual(embedding_rows([None]), [None])
+
+        with self.assertRaises(ValueError):
+            embedding_rows([Vector([1.0, 2.0]).to_binary(), Vector([1.0, 2.0, 3.0]).to_binary()])
+
+    def test_non_binary_values(self):
+        rows = embedding_rows([[1.0, 0.0], Vector([0.0, 1.0]), np.array([0.5, 0.5])])
+        self.assertEqual([r.tolist() for r in rows], [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+        self.assertTrue(all(r.dtype == np.float32 for r in rows))
+
+
+class TestMMRWithMatrixRows(unittest.TestCase):
+
+    def _results(self, vectors):
+        return [
+            {'name': f"doc {i}", 'url': f"u{i}", 'ranking': {'score': 90 - i}, 'vector': v}
+            for i, v in enumerate(vectors)
+        ]
+
+    def test_same_order_as_lists(self):
+        rng = np.random.default_rng(3)
+        lists = [[float(x) for x in rng.normal(size=16)] for _ in range(12)]
+        rows = embedding_rows([Vector(v).to_binary() for v in lists])
+
+        reranker = MMRReranker(lambda_param=0.6)
+        from_lists, _ = reranker.rerank(self._results(lists), top_k=8)
+        from_rows, _ = reranker.rerank(self._results(rows), top_k=8)
+        self.assertEqual([r['url'] for r in from_rows], [r['url'] for r in from_lists])
+
+    def test_stack_vectors(self):
+        rows = embedding_rows([Vector([1.0, 2.0]).to_binary(), Vector([3.0, 4.0]).to_binary()])
+        matrix = stack_vectors(rows)
+        self.assertEqual(matrix.dtype, np.float32)
+        self.assertEqual(matrix.tolist(), [[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(stack_vectors([[1, 2], [3, 4]]).dtype, np.float32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Tests for columnar XGBoost feature extraction and the shared ranker.
+
+A. build_feature_matrix() matches the per-document extract_*_features() helpers
+B. Tied LLM scores get the same percentile as sorted().index()
+C. get_xgboost_ranker() returns one instance per config
+D. predict() runs one batched inplace_predict over the whole matrix
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# Add code/python to sys.path so we can import the module under test
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core import xgboost_ranker
+from core.xgboost_ranker import XGBoostRanker, get_xgboost_ranker
+from training.feature_engineering import (
+    FEATURE_IDX_SCORE_PERCENTILE,
+    extract_document_features,
+    extract_mmr_features,
+    extract_query_doc_features,
+    extract_query_features,
+    extract_ranking_features,
+)
+
+_DISABLED = {'enabled': False, 'model_path': 'models/none.json', 'use_shadow_mode': True}
+
+
+def _result(i, score, **overrides):
+    result = {
+        'name': f"颱風 停班 第{i}則",
+        'url': f"https://example.com/news/{i}",
+        'schema_object': {
+            'description': "颱風 來襲 北市 停班 停課" if i % 2 else "",
+            'datePublished': "2025-01-20T10:00:00Z" if i % 3 else None,
+            'author': "記者" if i % 2 else None,
+        },
+        'retrieval_scores': {
+            'vector_score': 0.5 + i / 100, 'bm25_score': 3.0 * i, 'keyword_boost': 0.1,
+            'temporal_boost': 0.2, 'final_retrieval_score': 0.7,
+        },
+        'ranking': {'score': score},
+    }
+    result.update(overrides)
+    return result
+
+
+def _reference_features(results, query):
+    """Per-document feature rows, as extract_features() built them before."""
+    q = extract_query_features(query)
+    all_scores = [r['ranking']['score'] for r in results]
+    rows = []
+    for i, r in enumerate(results):
+        so, rs = r['schema_object'], r['retrieval_scores']
+        d = extract_document_features(r['name'], so['description'], so['datePublished'], so['author'], r['url'])
+        qd = extract_query_doc_features(
+            query, r['name'], so['description'], rs['bm25_score'], rs['vector_score'],
+            rs['keyword_boost'], rs['temporal_boost'], rs['final_retrieval_score'])
+        rk = extract_ranking_features(i, i, r['ranking']['score'], all_scores)
+        m = extract_mmr_features(None, 'BALANCED')
+        rows.append(list(q.values()) + list(d.values()) + list(qd.values()) + list(rk.values()) + list(m.values()))
+    return np.array(rows, dtype=np.float64)
+
+
+class TestFeatureMatrix(unittest.TestCase):
+
+    def test_matches_per_document_helpers(self):
+        results = [_result(i, s) for i, s in enumerate([90, 85, 85, 60, 0, 72])]
+        query = "颱風 停班"
+
+        features = XGBoostRanker(_DISABLED).extract_features(results, query)
+
+        self.assertEqual(features.shape, (6, 29))
+        np.testing.assert_allclose(features, _reference_features(results, query))
+
+    def test_tied_scores_share_percentile(self):
+        results = [_result(i, s) for i, s in enumerate([80, 80, 50])]
+        features = XGBoostRanker(_DISABLED).extract_features(results, "query")
+        np.testing.assert_allclose(features[:, FEATURE_IDX_SCORE_PERCENTILE], [50.0, 50.0, 0.0])
+
+    def test_empty_candidates(self):
+        self.assertEqual(XGBoostRanker(_DISABLED).extract_features([], "q").shape, (0, 29))
+
+
+class TestSharedRanker(unittest.TestCase):
+
+    def setUp(self):
+        xgboost_ranker._RANKER_CACHE.clear()
+
+    def test_one_instance_per_config(self):
+        first = get_xgboost_ranker(dict(_DISABLED))
+        self.assertIs(first, get_xgboost_ranker(dict(_DISABLED)))
+        self.assertIsNot(first, get_xgboost_ranker(dict(_DISABLED, model_path='models/other.json')))
+
+    def test_predict_batches_whole_matrix(self):
+        ranker = XGBoostRanker(_DISABLED)
+        ranker.model = MagicMock()
+        ranker.model.inplace_predict.return_value = np.array([0.9, 0.5, 0.1], dtype=np.float32)
+        features = XGBoostRanker(_DISABLED).extract_features(
+            [_result(i, s) for i, s in enumerate([90, 80, 70])], "q")
+
+        scores, confidences = ranker.predict(features)
+
+        ranker.model.inplace_predict.assert_called_once()
+        self.assertEqual(ranker.model.inplace_predict.call_args[0][0].dtype, np.float32)
+        np.testing.assert_allclose(scores, [0.9, 0.5, 0.1], rtol=1e-6)
+        np.testing.assert_allclose(confidences, [0.8, 0.0, 0.8], atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
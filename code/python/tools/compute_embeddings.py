@@ -54,7 +54,8 @@ class EmbeddingProcessor:
                 text=text,
                 provider="azure_openai",  # Use Azure OpenAI
                 model=self.model,
-                timeout=60  # Increase timeout for Azure
+                timeout=60,  # Increase timeout for Azure
+                use_cache=False
             )
             
             if embedding and isinstance(embedding, list):
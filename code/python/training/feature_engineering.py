@@ -14,7 +14,9 @@ Backwards compatibility is not guaranteed at this time.
 import re
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Sequence, Tuple, Optional, Any
+
+import numpy as np
 from misc.logger.logging_config_helper import get_configured_logger
 
 logger = get_configured_logger("feature_engineering")
@@ -364,6 +366,131 @@ def extract_mmr_features(
     }
 
 
+# === Columnar Feature Extraction (online inference) ===
+
+_INTENT_CODES = {'SPECIFIC': 0, 'EXPLORATORY': 1, 'BALANCED': 2}
+
+
+def _recency_days(published_date: Any) -> int:
+    """Days since publication, matching extract_document_features()."""
+    if not published_date:
+        return MISSING_RECENCY_DAYS
+    try:
+        pub_dt = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
+        return (datetime.now(pub_dt.tzinfo) - pub_dt).days
+    except Exception:
+        return MISSING_RECENCY_DAYS
+
+
+def _text_len(value: Any) -> int:
+    return len(value) if value else 0
+
+
+def build_feature_matrix(
+    query_text: str,
+    titles: Sequence[str],
+    descriptions: Sequence[str],
+    urls: Sequence[str],
+    published_dates: Sequence[Optional[str]],
+    authors: Sequence[Any],
+    vector_scores: Sequence[float],
+    bm25_scores: Sequence[float],
+    keyword_boosts: Sequence[float],
+    temporal_boosts: Sequence[float],
+    final_retrieval_scores: Sequence[float],
+    retrieval_positions: Sequence[int],
+    llm_scores: Sequence[float],
+    mmr_scores: Sequence[Optional[float]],
+    detected_intents: Sequence[Optional[str]],
+) -> np.ndarray:
+    """
+    Build the (n, 29) feature matrix for a whole candidate set at once.
+
+    Produces the same values as calling the extract_*_features() helpers per
+    document, but fills each feature column in one pass: query features are
+    broadcast, score/position features are computed with NumPy over the
+    column, and only the per-document string features (lengths, keyword
+    overlap, date parsing) touch Python objects.
+
+    Ranking position is the row index (candidates are in LLM-ranked order).
+    """
+    n = len(titles)
+    features = np.zeros((n, TOTAL_FEATURES_PHASE_A), dtype=np.float64)
+    if n == 0:
+        return features
+
+    # Query features (0-5): identical for every row
+    query_feats = extract_query_features(query_text)
+    features[:, FEATURE_IDX_QUERY_LENGTH] = query_feats['query_length']
+    features[:, FEATURE_IDX_WORD_COUNT] = query_feats['word_count']
+    features[:, FEATURE_IDX_HAS_QUOTES] = query_feats['has_quotes']
+    features[:, FEATURE_IDX_HAS_NUMBERS] = query_feats['has_numbers']
+    features[:, FEATURE_IDX_HAS_QUESTION_WORDS] = query_feats['has_question_words']
+    features[:, FEATURE_IDX_KEYWORD_COUNT] = query_feats['keyword_count']
+
+    # Document features (6-13)
+    features[:, FEATURE_IDX_DOC_LENGTH] = [len(d.split()) if d else 0 for d in descriptions]
+    features[:, FEATURE_IDX_RECENCY_DAYS] = [_recency_days(d) for d in published_dates]
+    has_author = np.array([1 if (a and len(a) > 0) else 0 for a in authors], dtype=np.float64)
+    has_date = np.array([1 if d else 0 for d in published_dates], dtype=np.float64)
+    features[:, FEATURE_IDX_HAS_AUTHOR] = has_author
+    features[:, FEATURE_IDX_HAS_PUBLICATION_DATE] = has_date
+    title_len = np.array([_text_len(t) for t in titles], dtype=np.float64)
+    desc_len = np.array([_text_len(d) for d in descriptions], dtype=np.float64)
+    url_len = np.array([_text_len(u) for u in urls], dtype=np.float64)
+    populated = (
+        (title_len > 0).astype(np.float64)
+        + (desc_len > 0)
+        + np.array([1 if d and len(str(d)) > 0 else 0 for d in published_dates])
+        + np.array([1 if a and len(str(a)) > 0 else 0 for a in authors])
+        + (url_len > 0)
+    )
+    features[:, FEATURE_IDX_SCHEMA_COMPLETENESS] = populated / 5
+    features[:, FEATURE_IDX_TITLE_LENGTH] = title_len
+    features[:, FEATURE_IDX_DESCRIPTION_LENGTH] = desc_len
+    features[:, FEATURE_IDX_URL_LENGTH] = url_len
+
+    # Query-document features (14-20)
+    features[:, FEATURE_IDX_VECTOR_SIMILARITY] = vector_scores
+    features[:, FEATURE_IDX_BM25_SCORE] = bm25_scores
+    features[:, FEATURE_IDX_KEYWORD_BOOST] = keyword_boosts
+    features[:, FEATURE_IDX_TEMPORAL_BOOST] = temporal_boosts
+    features[:, FEATURE_IDX_FINAL_RETRIEVAL_SCORE] = final_retrieval_scores
+    query_lower = query_text.lower()
+    query_keywords = set(query_lower.split())
+    if query_keywords:
+        features[:, FEATURE_IDX_KEYWORD_OVERLAP_RATIO] = [
+            len(query_keywords.intersection((t + " " + d).lower().split())) / len(query_keywords)
+            for t, d in zip(titles, descriptions)
+        ]
+    features[:, FEATURE_IDX_TITLE_EXACT_MATCH] = [
+        1 if (t and query_lower in t.lower()) else 0 for t in titles
+    ]
+
+    # Ranking features (21-26)
+    retrieval_pos = np.asarray(retrieval_positions, dtype=np.float64)
+    ranking_pos = np.arange(n, dtype=np.float64)
+    scores = np.asarray(llm_scores, dtype=np.float64)
+    features[:, FEATURE_IDX_RETRIEVAL_POSITION] = retrieval_pos
+    features[:, FEATURE_IDX_RANKING_POSITION] = ranking_pos
+    features[:, FEATURE_IDX_LLM_FINAL_SCORE] = scores
+    top = scores.max()
+    features[:, FEATURE_IDX_RELATIVE_SCORE_TO_TOP] = scores / top if top > 0 else 1.0
+    if n > 1:
+        # Rank of the first equal score in ascending order, as sorted().index() does
+        rank = np.searchsorted(np.sort(scores), scores, side='left')
+        features[:, FEATURE_IDX_SCORE_PERCENTILE] = rank / (n - 1) * 100
+    else:
+        features[:, FEATURE_IDX_SCORE_PERCENTILE] = 50.0
+    features[:, FEATURE_IDX_POSITION_CHANGE] = retrieval_pos - ranking_pos
+
+    # MMR features (27-28)
+    features[:, FEATURE_IDX_MMR_DIVERSITY_SCORE] = [m if m is not None else 0.0 for m in mmr_scores]
+    features[:, FEATURE_IDX_DETECTED_INTENT] = [_INTENT_CODES.get(i, 2) for i in detected_intents]
+
+    return features
+
+
 # === Batch Feature Extraction from Database ===
 
 def populate_feature_vectors(
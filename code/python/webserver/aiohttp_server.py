@@ -193,6 +193,13 @@ class AioHTTPServer:
         if app['client_session']:
             await app['client_session'].close()
 
+        # Close the pooled session shared by retrieval_providers API clients
+        try:
+            from core.http_client import close_http_client
+            await close_http_client()
+        except Exception:
+            pass
+
         # Close auth DB connection pool
         try:
             from auth.auth_db import AuthDB
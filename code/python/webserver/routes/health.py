@@ -15,6 +15,9 @@ def setup_health_routes(app: web.Application):
     """Setup health check routes"""
     app.router.add_get('/health', health_check)
     app.router.add_get('/ready', readiness_check)
+    app.router.add_get('/health/caches', cache_stats)
+    app.router.add_get('/health/query-logger', query_logger_stats)
+    app.router.add_get('/health/http-clients', http_client_stats)
 
 
 async def health_check(request: web.Request) -> web.Response:
@@ -31,6 +34,43 @@ async def health_check(request: web.Request) -> web.Response:
     })
 
 
+async def cache_stats(request: web.Request) -> web.Response:
+    """Hit rates for the LLM, query embedding and Tier 6 data caches"""
+    from core.embedding_cache import get_embedding_cache
+    from core.llm_cache import get_llm_cache
+    from core.tier6_cache import get_tier6_cache_stats
+
+    embedding_cache = get_embedding_cache()
+    llm_cache = get_llm_cache()
+
+    return web.json_response({
+        'embedding': embedding_cache.get_stats() if embedding_cache else {'enabled': False},
+        'llm': llm_cache.get_stats() if llm_cache else {'enabled': False},
+        'tier6': get_tier6_cache_stats(),
+        'timestamp': datetime.utcnow().isoformat()
+    })
+
+
+async def query_logger_stats(request: web.Request) -> web.Response:
+    """Queue depth, batch size and flush latency of the analytics batch writer"""
+    from core.query_logger import get_query_logger
+
+    return web.json_response({
+        'writer': get_query_logger().get_writer_stats(),
+        'timestamp': datetime.utcnow().isoformat()
+    })
+
+
+async def http_client_stats(request: web.Request) -> web.Response:
+    """Per-provider request outcomes and latency histograms of the shared HTTP client"""
+    from core.http_client import get_http_client
+
+    return web.json_response({
+        'http_client': get_http_client().get_stats(),
+        'timestamp': datetime.utcnow().isoformat()
+    })
+
+
 async def readiness_check(request: web.Request) -> web.Response:
     """Readiness check - verifies all dependencies are available"""
     
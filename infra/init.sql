@@ -48,9 +48,11 @@ CREATE TABLE chunks (
 --   probes=20: R@10=97.0%, R@50=91.2%, avg 21ms
 --   probes=50: R@10=98.7%, R@50=97.1%, avg 29ms  <-- recommended
 --   probes=100: R@10=98.7%, R@50=98.2%, avg 31ms
--- Set at query time: SET ivfflat.probes = 50;
--- Note: Do NOT create HNSW index — same size as IVFFlat (~930MB for 118K chunks)
+-- Set per query from config_retrieval.yaml ann_params (balanced profile: probes=50).
+-- Note: Do NOT create HNSW index alongside IVFFlat — same size (~930MB for 118K chunks)
 --       and HNSW rebuild requires large shared memory allocation.
+--       To switch index type, compare with benchmark/bench_pg_ann.py, then
+--       python -m indexing.pg_vector_index build --type hnsw --drop-others
 CREATE INDEX idx_chunks_embedding_ivf
     ON chunks
     USING ivfflat (embedding vector_cosine_ops)
@@ -82,6 +84,102 @@ CREATE INDEX idx_articles_author
 CREATE INDEX idx_chunks_article_id
     ON chunks (article_id);
 
+-- =============================================================================
+-- Site Catalog
+-- =============================================================================
+
+-- Per-source counts and date ranges for get_sites (O(#sources) instead of
+-- SELECT DISTINCT over articles). Maintained by statement-level triggers, so
+-- row upserts, bulk COPY merges and deletes all keep it current.
+-- Date ranges only widen; a source is dropped when its doc_count reaches 0.
+CREATE TABLE site_catalog (
+    source          TEXT PRIMARY KEY,
+    doc_count       BIGINT NOT NULL DEFAULT 0,
+    first_published TIMESTAMPTZ,
+    last_published  TIMESTAMPTZ,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE FUNCTION site_catalog_on_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO site_catalog AS c (source, doc_count, first_published, last_published)
+    SELECT source, count(*), min(date_published), max(date_published)
+    FROM new_rows
+    GROUP BY source
+    ON CONFLICT (source) DO UPDATE SET
+        doc_count = c.doc_count + EXCLUDED.doc_count,
+        first_published = LEAST(c.first_published, EXCLUDED.first_published),
+        last_published = GREATEST(c.last_published, EXCLUDED.last_published),
+        updated_at = NOW();
+    RETURN NULL;
+END $$;
+
+CREATE FUNCTION site_catalog_on_delete() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE site_catalog c
+    SET doc_count = c.doc_count - d.n, updated_at = NOW()
+    FROM (SELECT source, count(*) AS n FROM old_rows GROUP BY source) d
+    WHERE c.source = d.source;
+    DELETE FROM site_catalog WHERE doc_count <= 0;
+    RETURN NULL;
+END $$;
+
+-- Upserts of existing URLs fire UPDATE; only source moves change counts
+CREATE FUNCTION site_catalog_on_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE site_catalog c
+    SET doc_count = c.doc_count - d.n, updated_at = NOW()
+    FROM (
+        SELECT o.source, count(*) AS n
+        FROM old_rows o JOIN new_rows n ON n.id = o.id
+        WHERE n.source IS DISTINCT FROM o.source
+        GROUP BY o.source
+    ) d
+    WHERE c.source = d.source;
+
+    INSERT INTO site_catalog AS c (source, doc_count, first_published, last_published)
+    SELECT n.source,
+           count(*) FILTER (WHERE n.source IS DISTINCT FROM o.source),
+           min(n.date_published), max(n.date_published)
+    FROM new_rows n JOIN old_rows o ON o.id = n.id
+    WHERE n.source IS DISTINCT FROM o.source
+       OR n.date_published IS DISTINCT FROM o.date_published
+    GROUP BY n.source
+    ON CONFLICT (source) DO UPDATE SET
+        doc_count = c.doc_count + EXCLUDED.doc_count,
+        first_published = LEAST(c.first_published, EXCLUDED.first_published),
+        last_published = GREATEST(c.last_published, EXCLUDED.last_published),
+        updated_at = NOW();
+
+    DELETE FROM site_catalog WHERE doc_count <= 0;
+    RETURN NULL;
+END $$;
+
+CREATE FUNCTION site_catalog_on_truncate() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM site_catalog;
+    RETURN NULL;
+END $$;
+
+CREATE TRIGGER trg_site_catalog_insert AFTER INSERT ON articles
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_insert();
+
+CREATE TRIGGER trg_site_catalog_delete AFTER DELETE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_delete();
+
+CREATE TRIGGER trg_site_catalog_update AFTER UPDATE ON articles
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_update();
+
+CREATE TRIGGER trg_site_catalog_truncate AFTER TRUNCATE ON articles
+    FOR EACH STATEMENT EXECUTE FUNCTION site_catalog_on_truncate();
+
 -- =============================================================================
 -- Sample Hybrid Search Query (for reference)
 -- =============================================================================